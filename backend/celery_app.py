@@ -34,7 +34,8 @@ def make_celery(app_name=__name__):
             'hourly-db-backup': {
                 'task': 'tasks.run_scheduled_backup',
                 'schedule': crontab(minute=0),
-                'kwargs': {'backup_type': 'database_only', 'upload_to_cloud': True},
+                # Artımlı: yalnızca değişen veritabanı parçaları yazılır
+                'kwargs': {'backup_type': 'incremental', 'upload_to_cloud': True},
             },
         }
     )
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Asenkron, Toplu (Batched) Veritabanı Yazıcısı
+
+Log ve audit kayıtları istek thread'inde tek tek INSERT + COMMIT yapmak
+yerine bir kuyruğa bırakılır. Arka plandaki yazıcı thread'i kuyruğu
+boyut (batch_size) veya süre (flush_interval) dolunca boşaltır ve aynı
+SQL'e sahip kayıtları tek transaction içinde `executemany` ile yazar.
+
+Kuyruk doluysa kayıt düşürülür (veya çağıran belirli bir süre bekler);
+düşen, yazılan ve hatalı kayıtlar sayaçlarda tutulur. Süreç kapanırken
+(atexit / gunicorn worker_exit) kuyruk boşaltılır.
+
+Kullanım:
+    writer = get_writer(db_path)
+    writer.submit("INSERT INTO t (a, b) VALUES (?, ?)", (1, 2))
+    writer.flush()  # bekleyen kayıtlar yazılana kadar bekle
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+
+DEFAULT_QUEUE_SIZE = int(os.environ.get('SUSTAINAGE_DB_WRITER_QUEUE', '10000'))
+DEFAULT_BATCH_SIZE = int(os.environ.get('SUSTAINAGE_DB_WRITER_BATCH', '200'))
+DEFAULT_FLUSH_INTERVAL = float(os.environ.get('SUSTAINAGE_DB_WRITER_INTERVAL', '1.0'))
+
+# Yazıcının kendi hataları DBLogHandler'a geri dönmesin diye ayrı logger adı
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class AsyncDBWriter:
+    """Kuyruk + arka plan thread'i ile toplu INSERT yazıcısı"""
+
+    def __init__(self, db_path: str, max_queue: int = DEFAULT_QUEUE_SIZE,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL) -> None:
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = None
+        self._closed = False
+        self._stats = {
+            'submitted': 0,
+            'written': 0,
+            'dropped': 0,
+            'errors': 0,
+            'batches': 0,
+            'max_batch': 0,
+            'last_batch_ms': 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Üretici tarafı
+    # ------------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        # fork sonrası ebeveynin thread'i alt süreçte yoktur; pid değişince yeniden başlat
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name=f'db-writer-{os.path.basename(self.db_path)}',
+                                            daemon=True)
+            self._thread.start()
+
+    def submit(self, sql: str, params: Tuple, block: bool = False, timeout: Optional[float] = None) -> bool:
+        """
+        Kaydı yazma kuyruğuna ekle.
+
+        Args:
+            sql: Parametreli INSERT ifadesi
+            params: Parametreler
+            block: Kuyruk doluysa beklensin mi (varsayılan: hemen düşür)
+            timeout: block=True iken en fazla bekleme süresi (sn)
+
+        Returns:
+            bool: Kuyruğa alındıysa True, düşürüldüyse False
+        """
+        if self._closed:
+            return self._drop()
+        self._ensure_thread()
+        try:
+            self._queue.put((sql, params), block=block, timeout=timeout)
+        except queue.Full:
+            return self._drop()
+        with self._lock:
+            self._stats['submitted'] += 1
+        return True
+
+    def _drop(self) -> bool:
+        with self._lock:
+            self._stats['dropped'] += 1
+        return False
+
+    def write_now(self, sql: str, params: Tuple) -> bool:
+        """Kuyruğu atlayıp kaydı hemen yaz (kuyruk doluyken kaybedilmemesi gereken kayıtlar için)"""
+        conn = db_connect(self.db_path)
+        try:
+            conn.execute(sql, params)
+            conn.commit()
+            with self._lock:
+                self._stats['written'] += 1
+            return True
+        except Exception as e:
+            conn.rollback()
+            with self._lock:
+                self._stats['errors'] += 1
+            logger.error(f"DB writer doğrudan yazma hatası: {e}")
+            return False
+        finally:
+            conn.close()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Bu çağrıdan önce kuyruğa alınan tüm kayıtlar yazılana kadar bekle"""
+        if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+            return self._queue.empty()
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Kuyruğu boşalt ve thread'i durdur"""
+        if self._closed:
+            return
+        self._closed = True
+        thread = self._thread
+        if thread is None or self._pid != os.getpid() or not thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("DB writer kapanışta kuyruk dolu; bekleyen kayıtlar yazılamayabilir")
+            return
+        thread.join(timeout)
+
+    def get_stats(self) -> Dict:
+        """Sayaçlar ve anlık kuyruk derinliği"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['queue_depth'] = self._queue.qsize()
+        stats['queue_capacity'] = self._queue.maxsize
+        return stats
+
+    # ------------------------------------------------------------------
+    # Yazıcı thread'i
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        q = self._queue
+        while True:
+            batch = []
+            waiters = []
+            stop = False
+            deadline = None
+
+            item = q.get()
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    # flush isteği: o ana kadar toplananları hemen yaz
+                    waiters.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write_batch(batch)
+            for event in waiters:
+                event.set()
+            if stop:
+                # Kapanış: kalanları da yaz
+                rest = []
+                while True:
+                    try:
+                        item = q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if isinstance(item, threading.Event):
+                        item.set()
+                    elif item is not _STOP:
+                        rest.append(item)
+                if rest:
+                    self._write_batch(rest)
+                return
+
+    def _write_batch(self, batch) -> None:
+        start = time.perf_counter()
+        # Sıra korunarak ardışık aynı SQL'ler tek executemany'de
+        groups = []
+        for sql, params in batch:
+            if groups and groups[-1][0] == sql:
+                groups[-1][1].append(params)
+            else:
+                groups.append((sql, [params]))
+
+        written = errors = 0
+        conn = None
+        try:
+            conn = db_connect(self.db_path)
+            try:
+                for sql, rows in groups:
+                    conn.executemany(sql, rows)
+                conn.commit()
+                written = len(batch)
+            except Exception as e:
+                conn.rollback()
+                logger.warning(f"DB writer toplu yazma başarısız, satır satır deneniyor: {e}")
+                for sql, rows in groups:
+                    for params in rows:
+                        try:
+                            conn.execute(sql, params)
+                            conn.commit()
+                            written += 1
+                        except Exception:
+                            conn.rollback()
+                            errors += 1
+        except Exception as e:
+            errors = len(batch) - written
+            logger.error(f"DB writer bağlantı hatası: {e}")
+        finally:
+            if conn is not None:
+                conn.close()
+
+        with self._lock:
+            self._stats['written'] += written
+            self._stats['errors'] += errors
+            self._stats['batches'] += 1
+            self._stats['max_batch'] = max(self._stats['max_batch'], len(batch))
+            self._stats['last_batch_ms'] = round((time.perf_counter() - start) * 1000, 2)
+
+
+# ----------------------------------------------------------------------
+# Süreç başına, DB yolu başına tek yazıcı
+# ----------------------------------------------------------------------
+
+_writers: Dict[str, AsyncDBWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_writer(db_path: str) -> AsyncDBWriter:
+    """db_path için paylaşılan yazıcıyı getir (log ve audit aynı thread'i kullanır)"""
+    key = os.path.abspath(db_path)
+    writer = _writers.get(key)
+    if writer is None or writer._closed:
+        with _writers_lock:
+            writer = _writers.get(key)
+            if writer is None or writer._closed:
+                writer = AsyncDBWriter(db_path)
+                _writers[key] = writer
+    return writer
+
+
+def flush_all(timeout: float = 5.0) -> None:
+    """Tüm yazıcıların kuyruğunu boşalt"""
+    for writer in list(_writers.values()):
+        writer.flush(timeout)
+
+
+def shutdown_writers(timeout: float = 5.0) -> None:
+    """Süreç kapanışı: tüm yazıcıları boşaltıp durdur"""
+    for writer in list(_writers.values()):
+        writer.close(timeout)
+
+
+def get_writer_stats() -> Dict[str, Dict]:
+    """İzleme sayfası için yazıcı bazında sayaçlar"""
+    return {os.path.basename(path): writer.get_stats() for path, writer in list(_writers.items())}
+
+
+atexit.register(shutdown_writers)
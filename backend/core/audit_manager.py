@@ -3,6 +3,7 @@ import logging
 from datetime import datetime
 from typing import Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 class AuditManager:
     def __init__(self, db_path: str = DB_PATH):
@@ -22,7 +23,7 @@ class AuditManager:
             company_id: Şirket ID (varsa) - Multi-tenant izolasyon için
             resource_id: Etkilenen kaynağın ID'si (varsa)
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             # Check schema columns
@@ -65,7 +66,7 @@ class AuditManager:
             conn.close()
 
     def get_logs(self, limit: int = 50, offset: int = 0, company_id: Optional[int] = None):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             # Check available columns for selection
@@ -105,7 +106,7 @@ class AuditManager:
             conn.close()
 
     def get_logs_count(self, company_id: Optional[int] = None) -> int:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             query = "SELECT COUNT(*) FROM audit_logs WHERE 1=1"
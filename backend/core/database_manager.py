@@ -17,6 +17,7 @@ import threading
 from contextlib import contextmanager
 from typing import Any, Generator, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -287,7 +288,7 @@ class LegacyDatabaseWrapper:
     Eski kodlarla uyumluluk için wrapper
     
     Kullanım (Eski kod):
-        conn = sqlite3.connect(DB_PATH)
+        conn = db_connect(DB_PATH)
     
     Yeni kod:
         from core.database_manager import get_connection
@@ -2,17 +2,42 @@
 import logging
 import sqlite3
 import datetime
+import time
 from flask import session, request
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
+try:
+    from core.async_db_writer import get_writer
+except ImportError:
+    from backend.core.async_db_writer import get_writer
+
+INSERT_LOG_SQL = """
+    INSERT INTO system_logs (level, module, message, user_id, company_id, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
 
 class DBLogHandler(logging.Handler):
-    def __init__(self, db_path):
+    """
+    system_logs tablosuna yazan handler. emit() yalnızca kaydı kuyruğa
+    bırakır; yazma arka plandaki AsyncDBWriter tarafından toplu yapılır.
+    Kuyruk doluysa kayıt düşürülür (writer 'dropped' sayacı).
+    """
+
+    def __init__(self, db_path, writer=None):
         super().__init__()
         self.db_path = db_path
-        self._ensure_table()
+        ensure_schema(self.db_path, self._ensure_table)
+        self.writer = writer or get_writer(db_path)
 
     def _ensure_table(self):
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS system_logs (
@@ -33,7 +58,8 @@ class DBLogHandler(logging.Handler):
     def emit(self, record):
         try:
             # Skip db logging for some logger names to avoid recursion or noise
-            if record.name.startswith('werkzeug') or record.name.startswith('sqlalchemy'):
+            if record.name.startswith('werkzeug') or record.name.startswith('sqlalchemy') \
+                    or record.name.endswith('utils.db_pool') or record.name.endswith('core.async_db_writer'):
                 return
 
             msg = self.format(record)
@@ -50,13 +76,17 @@ class DBLogHandler(logging.Handler):
             except Exception:
                 pass # Not in request context or session unavailable
 
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO system_logs (level, module, message, user_id, company_id, created_at)
-                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """, (level, module, msg, user_id, company_id))
-            conn.commit()
-            conn.close()
+            # Yazım gecikmeli olduğundan zaman damgası kayıt anından (UTC, CURRENT_TIMESTAMP biçimi)
+            created_at = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(record.created))
+            self.writer.submit(INSERT_LOG_SQL, (level, module, msg, user_id, company_id, created_at))
         except Exception:
             self.handleError(record)
+
+    def flush(self):
+        self.writer.flush()
+
+    def close(self):
+        try:
+            self.writer.flush()
+        finally:
+            super().close()
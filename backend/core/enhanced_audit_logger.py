@@ -19,6 +19,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
+from core.async_db_writer import get_writer
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -49,6 +52,18 @@ class AuditCategory(Enum):
 # Thread-local storage for correlation ID
 _thread_local = threading.local()
 
+INSERT_AUDIT_SQL = """
+    INSERT INTO enhanced_audit_log (
+        correlation_id, timestamp, datetime_str, level, category, action,
+        actor_id, actor_username, actor_ip, target_type, target_id,
+        details, is_critical, duration_ms, status, error_message, session_id
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Kuyruk doluyken audit kaydı için en fazla bekleme (sn)
+AUDIT_QUEUE_TIMEOUT = 2.0
+
 
 class EnhancedAuditLogger:
     """
@@ -73,15 +88,16 @@ class EnhancedAuditLogger:
         'backup_create', 'backup_restore', 'database_schema_change'
     }
 
-    def __init__(self, db_path: str = DB_PATH):
+    def __init__(self, db_path: str = DB_PATH, writer=None):
         """Init"""
         self.db_path = db_path
-        self._init_tables()
+        ensure_schema(self.db_path, self._init_tables)
+        self.writer = writer or get_writer(db_path)
 
     def _init_tables(self) -> None:
         """Genişletilmiş audit tabloları oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Ana audit log tablosu
@@ -199,9 +215,6 @@ class EnhancedAuditLogger:
             bool: Başarılı ise True
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
             # Korrelasyon ID al
             correlation_id = self.get_correlation_id()
 
@@ -215,28 +228,29 @@ class EnhancedAuditLogger:
             # Details JSON
             details_json = json.dumps(details or {}, ensure_ascii=False)
 
-            cursor.execute("""
-                INSERT INTO enhanced_audit_log (
-                    correlation_id, timestamp, datetime_str, level, category, action,
-                    actor_id, actor_username, actor_ip, target_type, target_id,
-                    details, is_critical, duration_ms, status, error_message, session_id
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            params = (
                 correlation_id, timestamp, datetime_str, level.value, category.value, action,
                 actor_id, actor_username, actor_ip, target_type, target_id,
                 details_json, is_critical, duration_ms, status, error_message, session_id
-            ))
-
-            conn.commit()
-            conn.close()
-
-            return True
+            )
+
+            # Kayıt arka planda toplu yazılır; kuyruk doluysa kısa süre beklenir.
+            # Kritik aksiyonlar düşürülmez, kuyruk hâlâ doluysa doğrudan yazılır.
+            if self.writer.submit(INSERT_AUDIT_SQL, params, block=True, timeout=AUDIT_QUEUE_TIMEOUT):
+                return True
+            if is_critical or level in (AuditLevel.CRITICAL, AuditLevel.SECURITY):
+                return self.writer.write_now(INSERT_AUDIT_SQL, params)
+            logging.warning(f" Audit kuyruğu dolu, kayıt düşürüldü: {action}")
+            return False
 
         except Exception as e:
             logging.error(f" Audit log yazma hatası: {e}")
             return False
 
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Kuyruktaki audit kayıtlarının yazılmasını bekle"""
+        return self.writer.flush(timeout)
+
     def log_critical_action(self, action: str, actor_username: str, **kwargs) -> bool:
         """Kritik aksiyon logla (kısa yol)"""
         return self.log(
@@ -285,8 +299,10 @@ class EnhancedAuditLogger:
         Returns:
             List[Dict]: Log kayıtları
         """
+        # Henüz kuyrukta bekleyen kayıtlar da sonuca girsin
+        self.flush()
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
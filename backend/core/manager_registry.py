@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Manager Registry
+Manager sınıflarını ilk kullanımda import edip oluşturan tembel (lazy) kayıt.
+
+web_app.py eskiden tüm manager modüllerini import anında yükleyip her
+gunicorn worker'ında oluşturuyordu. Kayıt yalnızca modül yolu ve sınıf adını
+tutar; bir route `MANAGERS.get('tsrs')` dediğinde modül import edilir,
+nesne bir kez (thread-safe) oluşturulur ve süreç boyunca paylaşılır.
+"""
+
+import importlib
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+_CLASS_RE = re.compile(r'^class\s+(\w*Manager\w*)\s*[:(]', re.MULTILINE)
+
+
+class ManagerSpec:
+    """Bir manager'ın nasıl yükleneceği bilgisi"""
+
+    __slots__ = ('key', 'module', 'class_name', 'factory', 'post_init')
+
+    def __init__(self, key: str, module: str, class_name: str,
+                 factory: Optional[Callable[[type], Any]] = None,
+                 post_init: Optional[Callable[[Any], None]] = None) -> None:
+        self.key = key
+        self.module = module
+        self.class_name = class_name
+        self.factory = factory
+        self.post_init = post_init
+
+
+class ManagerRegistry(MutableMapping):
+    """
+    Dict arayüzlü tembel manager kaydı.
+
+    `get`/`[]` ilk erişimde manager'ı oluşturur; oluşturma hatası eski
+    `_init_managers()` davranışındaki gibi loglanır ve anahtar None döner.
+    `keys()`/`in` hiçbir şey yüklemez.
+    """
+
+    def __init__(self, default_factory: Callable[[type], Any]) -> None:
+        self._default_factory = default_factory
+        self._specs: Dict[str, ManagerSpec] = {}
+        self._instances: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+        self._timings: Dict[str, Dict[str, Any]] = {}
+
+    # --- kayıt ---------------------------------------------------------
+
+    def register(self, key: str, module: str, class_name: str,
+                 factory: Optional[Callable[[type], Any]] = None,
+                 post_init: Optional[Callable[[Any], None]] = None,
+                 replace: bool = True) -> None:
+        """Manager'ı yüklemeden kaydet"""
+        with self._registry_lock:
+            if not replace and key in self._specs:
+                return
+            self._specs[key] = ManagerSpec(key, module, class_name, factory, post_init)
+            self._locks.setdefault(key, threading.Lock())
+            self._instances.pop(key, None)
+
+    def discover(self, modules_dir: str, package: str = 'modules',
+                 factory: Optional[Callable[[type], Any]] = None) -> int:
+        """
+        `modules_dir` altındaki *manager*.py dosyalarını import etmeden tarar
+        ve içlerindeki `...Manager` sınıflarını kaydeder (mevcut anahtarlar
+        korunur). Anahtar kuralı eski otomatik yükleyiciyle aynıdır:
+        WasteManager -> 'waste'.
+        """
+        found = 0
+        for root, _dirs, files in os.walk(modules_dir):
+            for file in files:
+                if not file.endswith('.py') or file.startswith('__') or 'manager' not in file.lower():
+                    continue
+                full_path = os.path.join(root, file)
+                rel = os.path.relpath(full_path, modules_dir)[:-3].replace(os.sep, '.')
+                try:
+                    with open(full_path, encoding='utf-8') as f:
+                        source = f.read()
+                except OSError as e:
+                    logging.warning(f"Failed to scan {file}: {e}")
+                    continue
+                for class_name in _CLASS_RE.findall(source):
+                    if class_name == 'Manager':
+                        continue
+                    key = class_name.lower().replace('manager', '').replace('enhanced', '')
+                    self.register(key, f"{package}.{rel}", class_name,
+                                  factory=factory, replace=False)
+                    found += 1
+        return found
+
+    # --- yükleme -------------------------------------------------------
+
+    def _load(self, key: str) -> Any:
+        spec = self._specs[key]
+        lock = self._locks[key]
+        with lock:
+            if key in self._instances:
+                return self._instances[key]
+
+            timing = {'module': spec.module, 'class': spec.class_name,
+                      'import_ms': 0.0, 'init_ms': 0.0, 'error': None}
+            instance = None
+            try:
+                started = time.perf_counter()
+                mod = importlib.import_module(spec.module)
+                cls = getattr(mod, spec.class_name)
+                imported = time.perf_counter()
+                instance = (spec.factory or self._default_factory)(cls)
+                if spec.post_init is not None:
+                    spec.post_init(instance)
+                timing['import_ms'] = round((imported - started) * 1000, 2)
+                timing['init_ms'] = round((time.perf_counter() - imported) * 1000, 2)
+            except Exception as e:
+                logging.error(f"{spec.class_name} init: {e}")
+                timing['error'] = str(e)
+                instance = None
+
+            self._timings[key] = timing
+            self._instances[key] = instance
+            return instance
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._instances:
+            return self._instances[key]
+        if key not in self._specs:
+            raise KeyError(key)
+        return self._load(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._registry_lock:
+            self._locks.setdefault(key, threading.Lock())
+            self._instances[key] = value
+            if key not in self._specs:
+                self._specs[key] = ManagerSpec(key, type(value).__module__, type(value).__name__)
+
+    def __delitem__(self, key: str) -> None:
+        with self._registry_lock:
+            del self._specs[key]
+            self._instances.pop(key, None)
+            self._timings.pop(key, None)
+
+    def __iter__(self):
+        return iter(list(self._specs))
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._specs
+
+    def is_loaded(self, key: str) -> bool:
+        return key in self._instances
+
+    def get_class(self, key: str) -> Optional[type]:
+        """Sınıfı nesne oluşturmadan döndür (sınıf sabitleri için)"""
+        spec = self._specs.get(key)
+        if spec is None:
+            return None
+        try:
+            return getattr(importlib.import_module(spec.module), spec.class_name)
+        except Exception as e:
+            logging.error(f"{spec.class_name} import: {e}")
+            return None
+
+    def warm_up(self, keys: Optional[Iterable[str]] = None) -> List[str]:
+        """Verilen (None ise tüm) manager'ları önceden yükle"""
+        loaded = []
+        for key in (list(self._specs) if keys is None else keys):
+            key = key.strip()
+            if key in self._specs and self[key] is not None:
+                loaded.append(key)
+        return loaded
+
+    # --- rapor ---------------------------------------------------------
+
+    def get_startup_report(self) -> List[Dict[str, Any]]:
+        """Yüklenen manager'ların import ve oluşturma maliyetleri (pahalıdan ucuza)"""
+        report = [{'key': key, **timing} for key, timing in self._timings.items()]
+        report.sort(key=lambda r: r['import_ms'] + r['init_ms'], reverse=True)
+        return report
+
+    def get_stats(self) -> Dict[str, Any]:
+        report = self.get_startup_report()
+        return {
+            'registered': len(self._specs),
+            'loaded': sum(1 for v in self._instances.values() if v is not None),
+            'failed': sum(1 for r in report if r['error']),
+            'import_ms_total': round(sum(r['import_ms'] for r in report), 2),
+            'init_ms_total': round(sum(r['init_ms'] for r in report), 2),
+        }
+
+
+def parse_warm_up_list(value: Optional[str]) -> Tuple[bool, List[str]]:
+    """SUSTAINAGE_WARM_MANAGERS değerini çöz: '*' => hepsi, 'sdg,gri' => liste"""
+    if not value:
+        return False, []
+    value = value.strip()
+    if value in ('*', 'all'):
+        return True, []
+    return False, [k.strip() for k in value.split(',') if k.strip()]
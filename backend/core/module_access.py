@@ -9,8 +9,9 @@ MODÜL ERİŞİM KONTROLÜ
 
 import logging
 import sqlite3
-from typing import Dict, List
+from typing import Callable, Dict, FrozenSet, List, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -33,7 +34,7 @@ def is_module_enabled_for_company(db_path: str, company_id: int, module_code: st
     if is_super_admin:
         return True
 
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     cur = conn.cursor()
 
     try:
@@ -92,7 +93,7 @@ def get_enabled_modules_for_company(db_path: str, company_id: int, is_super_admi
         ]
     """
     # Super admin için tüm modüller
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     cur = conn.cursor()
 
     try:
@@ -155,6 +156,29 @@ MODULE_FUNCTION_MAP = {
     'management': 'show_management',
 }
 
+# --- YETKİ ÇÖZÜCÜ ---
+# Web uygulaması UserManager.get_permission_set'i kaydeder; böylece decorator'lar
+# ve şablonlar aynı süreç içi frozenset cache'ini kullanır.
+_permission_resolver: Optional[Callable[[int], FrozenSet[str]]] = None
+
+
+def set_permission_resolver(resolver: Optional[Callable[[int], FrozenSet[str]]]) -> None:
+    """user_id -> yetki kümesi döndüren fonksiyonu kaydet"""
+    global _permission_resolver
+    _permission_resolver = resolver
+
+
+def get_session_permissions(session_data) -> FrozenSet[str]:
+    """Oturumdaki kullanıcının yetki kümesi (çözücü yoksa oturumdaki liste)"""
+    user_id = session_data.get('user_id')
+    if _permission_resolver is not None and user_id:
+        try:
+            return _permission_resolver(user_id)
+        except Exception as e:
+            logging.error(f"[WARN] Yetki çözümleme hatası (user_id={user_id}): {e}")
+    return frozenset(session_data.get('permissions', []))
+
+
 # --- FLASK DECORATORS ---
 try:
     from functools import wraps
@@ -179,7 +203,7 @@ else:
                     return f(*args, **kwargs)
                 
                 # Check specific permission
-                permissions = session.get('permissions', [])
+                permissions = get_session_permissions(session)
                 if permission_name not in permissions:
                      # For now, we are lenient if permissions list is empty to avoid locking everyone out during dev
                      # But strictly, we should return 403.
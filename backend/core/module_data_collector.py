@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Modül bazlı veri toplayıcı (birleşik KPI snapshot'ı ve rapor verisi)
+
+Modül çıkarıcıları (carbon, water, sdg, ...) sınırlı bir thread havuzunda
+eşzamanlı çalışır; WAL kipindeki havuz bağlantıları okuyucuları birbirine
+bekletmez. Her modülün çıktısı (şirket, dönem, modül) anahtarıyla saklanır ve
+o modülün veri sürümüyle (module_data_versions) doğrulanır: modülün
+tablolarındaki her INSERT/UPDATE/DELETE tetikleyiciyle yalnızca o modülün
+sürümünü artırır. Böylece tek alan düzenlendikten sonra yeniden üretilen
+rapor yalnızca değişen modülü yeniden sorgular.
+
+Kullanım:
+    collector = get_collector(self.db_path, 'ai_kpis')
+    results = collector.collect(company_id, period, {
+        'carbon': lambda: self._export_carbon_kpis(company_id, year),
+        ...
+    })
+
+MODULE_DATA_TABLES'ta olmayan modüller önbelleğe alınmaz, her seferinde çalışır.
+"""
+
+import copy
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    from utils.db_pool import connect as db_connect
+    from utils.generation_triggers import GenerationTriggers
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+    from backend.utils.generation_triggers import GenerationTriggers
+
+# Havuz bağlantı sınırının (10) altında kalır
+DEFAULT_MAX_WORKERS = 4
+MAX_CACHE_ENTRIES = 1024
+
+# Modül -> çıkarıcılarının okuduğu tablolar (her tablo tek modüle ait olmalı).
+# Aynı modül adı AIManager (ai_kpis) ve ReportingService (reporting) tarafından
+# farklı manager metotlarıyla toplanır; liste ikisinin sorguladığı tabloların
+# birleşimidir (ör. WaterManager.calculate_water_kpis water_quality'yi de okur).
+MODULE_DATA_TABLES = {
+    'sdg': ('sdg_goals', 'sdg_targets', 'sdg_indicators', 'sdg_question_bank',
+            'sdg_question_responses', 'sdg_validation_rules', 'sdg_validation_results'),
+    'gri': ('gri_standards', 'gri_indicators', 'gri_responses', 'gri_kpis'),
+    'tsrs': ('tsrs_standards', 'tsrs_indicators', 'tsrs_responses'),
+    'issb': ('issb_data',),
+    'csrd': ('csrd_materiality',),
+    'carbon': ('scope1_emissions', 'scope2_emissions', 'scope3_emissions'),
+    'energy': ('energy_consumption', 'renewable_energy'),
+    'water': ('water_consumption', 'water_recycling', 'water_quality'),
+    'waste': ('waste_generation', 'waste_recycling'),
+    'biodiversity': ('biodiversity_projects', 'biodiversity_species', 'habitat_areas'),
+    'social': ('hr_employees', 'ohs_incidents', 'training_records',
+               'employee_satisfaction', 'community_investment'),
+    'governance': ('board_members', 'governance_committees', 'governance_policies',
+                   'ethics_compliance'),
+    'supply_chain': ('supplier_profiles', 'supplier_assessments', 'supplier_audits', 'supplier_risks'),
+    'mapping': ('standard_mappings',),
+}
+
+# Modül tablolarındaki her INSERT/UPDATE/DELETE yalnızca o modülün sürümünü artırır
+MODULE_VERSIONS = GenerationTriggers(
+    'module_data_versions', 'module', 'version',
+    {table: module for module, tables in MODULE_DATA_TABLES.items() for table in tables},
+    'module_version',
+)
+
+
+def install_module_versions(conn) -> None:
+    """Sürüm tablosunu ve mevcut modül tablolarının tetikleyicilerini kur (commit çağırana aittir)"""
+    MODULE_VERSIONS.install(conn)
+
+
+class ModuleDataCollector:
+    """Modül çıkarıcılarını paralel çalıştıran, sürüm doğrulamalı önbellek"""
+
+    def __init__(self, db_path: str, max_workers: int = DEFAULT_MAX_WORKERS,
+                 max_entries: int = MAX_CACHE_ENTRIES) -> None:
+        self.db_path = db_path
+        self.max_workers = max_workers
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple[int, str, str], Tuple[int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'errors': 0, 'collections': 0}
+
+    def module_versions(self) -> Dict[str, int]:
+        """Modül -> veri sürümü; eksik tetikleyiciler önce kurulur"""
+        conn = db_connect(self.db_path)
+        try:
+            try:
+                existing, tracked = conn.execute(MODULE_VERSIONS.tracking_sql).fetchone()
+                if existing == tracked:
+                    return dict(conn.execute(MODULE_VERSIONS.values_sql))
+            except sqlite3.OperationalError:
+                pass
+            install_module_versions(conn)
+            conn.commit()
+            return dict(conn.execute(MODULE_VERSIONS.values_sql))
+        except sqlite3.Error as e:
+            conn.rollback()
+            logging.warning(f"Module data versions unavailable: {e}")
+            return {}
+        finally:
+            conn.close()
+
+    def collect(self, company_id: int, period: Any,
+                extractors: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """
+        Çıkarıcıları çalıştır; sürümü değişmemiş modüller önbellekten döner.
+        Hata veren modül None döner ve önbelleğe alınmaz.
+        """
+        versions = self.module_versions()
+        period_key = str(period)
+        results: Dict[str, Any] = {}
+        pending = []
+        with self._lock:
+            self._stats['collections'] += 1
+            for module in extractors:
+                version = versions.get(module)
+                entry = self._cache.get((company_id, period_key, module))
+                if version is not None and entry is not None and entry[0] == version:
+                    self._cache.move_to_end((company_id, period_key, module))
+                    results[module] = entry[1]
+                    self._stats['hits'] += 1
+                else:
+                    pending.append(module)
+                    self._stats['misses'] += 1
+
+        if len(pending) > 1 and self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as pool:
+                futures = {module: pool.submit(extractors[module]) for module in pending}
+                outcomes = {module: self._outcome(module, future.result) for module, future in futures.items()}
+        else:
+            outcomes = {module: self._outcome(module, extractors[module]) for module in pending}
+
+        with self._lock:
+            for module, (ok, value) in outcomes.items():
+                results[module] = value
+                version = versions.get(module)
+                if ok and version is not None:
+                    self._cache[(company_id, period_key, module)] = (version, value)
+                    self._cache.move_to_end((company_id, period_key, module))
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+        # Çağıranlar sonucu değiştirebilir; önbellekteki nesne paylaşılmaz
+        return {module: copy.deepcopy(results[module]) for module in extractors}
+
+    def _outcome(self, module: str, call: Callable[[], Any]) -> Tuple[bool, Any]:
+        try:
+            return True, call()
+        except Exception as e:
+            logging.error(f"Module data collection error ({module}): {e}")
+            with self._lock:
+                self._stats['errors'] += 1
+            return False, None
+
+    def invalidate(self, company_id: Optional[int] = None) -> None:
+        """Önbelleği (veya yalnızca bir şirketin girdilerini) düşür"""
+        with self._lock:
+            if company_id is None:
+                self._cache.clear()
+                return
+            for key in [key for key in self._cache if key[0] == company_id]:
+                del self._cache[key]
+
+    def get_stats(self) -> Dict:
+        """İzleme sayfası için sayaçlar"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._cache)
+        reads = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / reads, 3) if reads else 0.0
+        return stats
+
+
+_collectors: Dict[Tuple[str, str], ModuleDataCollector] = {}
+_collectors_lock = threading.Lock()
+
+
+def get_collector(db_path: str, namespace: str) -> ModuleDataCollector:
+    """
+    DB yolu ve tüketici başına süreç içi toplayıcı. Aynı modül adı farklı
+    tüketicilerde farklı biçimde veri döndürdüğü için önbellekler ayrıdır.
+    """
+    key = (db_path, namespace)
+    collector = _collectors.get(key)
+    if collector is None:
+        with _collectors_lock:
+            collector = _collectors.setdefault(key, ModuleDataCollector(db_path))
+    return collector
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Worker'lar Arası Paylaşılan Rate Limit Deposu
+
+Gunicorn'un tüm worker süreçleri aynı, ayrı bir WAL modundaki SQLite
+dosyasını kullanır (varsayılan: data/cache/rate_limits.sqlite). Harici bir
+Redis gerekmez ve limitler süreç başına değil gerçekten uygulama genelinde
+sayılır. Testlerde (pytest veya TESTING ortam değişkeni) sayaçlar süreç
+sonunda silinen geçici bir dosyada tutulur.
+
+- Token bucket (RateLimiter): kova dolumu, jeton harcama ve sonuç tek bir
+  atomik `INSERT ... ON CONFLICT DO UPDATE ... RETURNING` ifadesiyle yapılır.
+- Sabit pencere sayaçları (Flask-Limiter): `limits` kütüphanesine
+  `sustainage-sqlite://<yol>` şemasıyla kayıtlı depolama sınıfı.
+
+Süresi dolan satırlar (dolmuş kova = hiç olmayan kova) arka plandaki
+temizlik thread'i tarafından indeksli DELETE ile silinir; istek yolunda
+tarama yapılmaz.
+"""
+
+import atexit
+import logging
+import math
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+
+try:
+    from limits.storage import Storage as _LimitsStorage
+except ImportError:  # Flask-Limiter kurulu değilse yalnızca RateLimiter kullanılır
+    _LimitsStorage = None
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _default_db_path() -> str:
+    if os.environ.get('SUSTAINAGE_RATE_LIMIT_DB'):
+        return os.environ['SUSTAINAGE_RATE_LIMIT_DB']
+    if os.environ.get('TESTING') or 'pytest' in sys.modules:
+        # Test sayaçları depoda kalıcı dosyaya yazılmaz ve koşular arasında taşınmaz
+        tmp_dir = tempfile.mkdtemp(prefix='sustainage_rate_limits_')
+        atexit.register(shutil.rmtree, tmp_dir, True)
+        return os.path.join(tmp_dir, 'rate_limits.sqlite')
+    return os.path.join(_PROJECT_ROOT, 'data', 'cache', 'rate_limits.sqlite')
+
+
+RATE_LIMIT_DB_PATH = _default_db_path()
+CLEANUP_INTERVAL = 60.0
+STORAGE_SCHEME = 'sustainage-sqlite'
+
+SCHEMA_DDL = (
+    """CREATE TABLE IF NOT EXISTS token_buckets (
+        scope TEXT NOT NULL,
+        identifier TEXT NOT NULL,
+        tokens REAL NOT NULL,
+        capacity REAL NOT NULL,
+        refill_rate REAL NOT NULL,
+        allowed INTEGER NOT NULL DEFAULT 1,
+        denied_count INTEGER NOT NULL DEFAULT 0,
+        first_seen REAL NOT NULL,
+        updated_at REAL NOT NULL,
+        expires_at REAL NOT NULL,
+        PRIMARY KEY (scope, identifier)
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_token_buckets_expires ON token_buckets(expires_at)",
+    "CREATE INDEX IF NOT EXISTS idx_token_buckets_updated ON token_buckets(updated_at)",
+    """CREATE TABLE IF NOT EXISTS window_counters (
+        counter_key TEXT PRIMARY KEY,
+        count INTEGER NOT NULL,
+        expires_at REAL NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_window_counters_expires ON window_counters(expires_at)",
+)
+
+# Kullanılabilir jeton: son güncellemeden bu yana dolan miktar, kapasiteyle sınırlı
+_AVAILABLE = "MIN(:capacity, tokens + MAX(:now - updated_at, 0) * :rate)"
+
+CONSUME_SQL = f"""
+    INSERT INTO token_buckets
+        (scope, identifier, tokens, capacity, refill_rate, allowed, denied_count, first_seen, updated_at, expires_at)
+    VALUES (:scope, :identifier, :capacity - :cost, :capacity, :rate, 1, 0, :now, :now, :now + :window)
+    ON CONFLICT(scope, identifier) DO UPDATE SET
+        tokens = CASE WHEN {_AVAILABLE} >= :cost THEN {_AVAILABLE} - :cost ELSE {_AVAILABLE} END,
+        allowed = ({_AVAILABLE} >= :cost),
+        denied_count = denied_count + ({_AVAILABLE} < :cost),
+        capacity = :capacity,
+        refill_rate = :rate,
+        updated_at = :now,
+        expires_at = :now + :window
+    RETURNING tokens, allowed
+"""
+
+INCR_SQL = """
+    INSERT INTO window_counters (counter_key, count, expires_at) VALUES (:key, :amount, :now + :expiry)
+    ON CONFLICT(counter_key) DO UPDATE SET
+        count = CASE WHEN expires_at <= :now THEN :amount ELSE count + :amount END,
+        expires_at = CASE WHEN expires_at <= :now OR :elastic THEN :now + :expiry ELSE expires_at END
+    RETURNING count
+"""
+
+
+class SharedRateLimitStore:
+    """Tek SQLite dosyası üzerinde süreçler arası token bucket ve pencere sayaçları"""
+
+    def __init__(self, db_path: str = RATE_LIMIT_DB_PATH, cleanup_interval: float = CLEANUP_INTERVAL) -> None:
+        self.db_path = db_path
+        self.cleanup_interval = cleanup_interval
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        self._cleaner: Optional[threading.Thread] = None
+        self._cleaner_pid = None
+        self._stats = {'allowed': 0, 'denied': 0, 'errors': 0, 'cleaned': 0}
+
+    # ------------------------------------------------------------------
+    # Bağlantı ve şema
+    # ------------------------------------------------------------------
+
+    def _connect(self):
+        if not self._schema_ready:
+            with self._lock:
+                if not self._schema_ready:
+                    directory = os.path.dirname(self.db_path)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    conn = db_connect(self.db_path)
+                    try:
+                        for statement in SCHEMA_DDL:
+                            conn.execute(statement)
+                        conn.commit()
+                    finally:
+                        conn.close()
+                    self._schema_ready = True
+        self._ensure_cleaner()
+        return db_connect(self.db_path)
+
+    def _ensure_cleaner(self) -> None:
+        # fork sonrası ebeveynin thread'i alt süreçte yoktur; pid değişince yeniden başlat
+        if not self.cleanup_interval:
+            return
+        if self._cleaner is not None and self._cleaner_pid == os.getpid() and self._cleaner.is_alive():
+            return
+        with self._lock:
+            if self._cleaner is not None and self._cleaner_pid == os.getpid() and self._cleaner.is_alive():
+                return
+            self._cleaner_pid = os.getpid()
+            self._cleaner = threading.Thread(target=self._cleanup_loop, name='rate-limit-cleanup', daemon=True)
+            self._cleaner.start()
+
+    def _cleanup_loop(self) -> None:
+        while True:
+            time.sleep(self.cleanup_interval)
+            try:
+                self.cleanup()
+            except Exception as e:
+                logging.warning(f"Rate limit temizliği başarısız: {e}")
+
+    # ------------------------------------------------------------------
+    # Token bucket
+    # ------------------------------------------------------------------
+
+    def consume(self, scope: str, identifier: str, capacity: int, window_seconds: float,
+                cost: float = 1.0) -> Tuple[bool, float, float]:
+        """
+        Kovadan `cost` jeton harca. Kova `window_seconds` içinde boştan
+        `capacity` değerine dolar.
+
+        Returns:
+            (izin verildi mi, kalan jeton, tekrar denemeye / tam dolmaya kalan sn)
+        """
+        capacity = float(max(capacity, 1))
+        rate = capacity / max(float(window_seconds), 1e-3)
+        now = time.time()
+        conn = self._connect()
+        try:
+            row = conn.execute(CONSUME_SQL, {
+                'scope': scope, 'identifier': identifier, 'capacity': capacity, 'rate': rate,
+                'cost': cost, 'now': now, 'window': float(window_seconds),
+            }).fetchone()
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            with self._lock:
+                self._stats['errors'] += 1
+            raise
+        finally:
+            conn.close()
+
+        tokens, allowed = float(row[0]), bool(row[1])
+        wait = (cost - tokens) / rate if not allowed else (capacity - tokens) / rate
+        with self._lock:
+            self._stats['allowed' if allowed else 'denied'] += 1
+        return allowed, tokens, max(wait, 0.0)
+
+    def reset(self, scope: str, identifier: str) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM token_buckets WHERE scope = ? AND identifier = ?", (scope, identifier))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def recent_buckets(self, seconds: float = 3600) -> List[Dict]:
+        """Son `seconds` içinde kullanılan kovalar (izleme sayfası için)"""
+        conn = self._connect()
+        try:
+            rows = conn.execute("""
+                SELECT scope, identifier, capacity - tokens, first_seen, allowed, denied_count, updated_at
+                FROM token_buckets
+                WHERE updated_at > ?
+                ORDER BY updated_at DESC
+            """, (time.time() - seconds,)).fetchall()
+        finally:
+            conn.close()
+        return [{
+            'scope': scope,
+            'identifier': identifier,
+            'used': max(int(math.ceil(used - 1e-9)), 0),
+            'first_seen': datetime.fromtimestamp(first_seen).strftime('%Y-%m-%d %H:%M:%S'),
+            'blocked': not allowed,
+            'denied_count': denied_count,
+        } for scope, identifier, used, first_seen, allowed, denied_count, _ in rows]
+
+    # ------------------------------------------------------------------
+    # Sabit pencere sayaçları (Flask-Limiter)
+    # ------------------------------------------------------------------
+
+    def incr(self, key: str, expiry: float, amount: int = 1, elastic_expiry: bool = False) -> int:
+        """Sayaç artır; elastic_expiry her artışta pencere bitişini yeniler"""
+        conn = self._connect()
+        try:
+            row = conn.execute(INCR_SQL, {'key': key, 'amount': amount, 'now': time.time(),
+                                          'expiry': float(expiry), 'elastic': int(elastic_expiry)}).fetchone()
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        return int(row[0])
+
+    def get_counter(self, key: str) -> Tuple[int, float]:
+        """(sayaç, bitiş zamanı); süresi dolmuş veya olmayan anahtar için (0, şimdi)"""
+        now = time.time()
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT count, expires_at FROM window_counters WHERE counter_key = ? AND expires_at > ?",
+                               (key, now)).fetchone()
+        finally:
+            conn.close()
+        return (int(row[0]), float(row[1])) if row else (0, now)
+
+    def clear_counter(self, key: str) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM window_counters WHERE counter_key = ?", (key,))
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Bakım
+    # ------------------------------------------------------------------
+
+    def cleanup(self) -> int:
+        """Süresi dolmuş kova ve sayaçları sil (indeksli aralık silme)"""
+        now = time.time()
+        conn = self._connect()
+        try:
+            deleted = conn.execute("DELETE FROM token_buckets WHERE expires_at < ?", (now,)).rowcount
+            deleted += conn.execute("DELETE FROM window_counters WHERE expires_at < ?", (now,)).rowcount
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        with self._lock:
+            self._stats['cleaned'] += deleted
+        return deleted
+
+    def clear(self) -> int:
+        """Tüm limitleri sıfırla"""
+        conn = self._connect()
+        try:
+            deleted = conn.execute("DELETE FROM token_buckets").rowcount
+            deleted += conn.execute("DELETE FROM window_counters").rowcount
+            conn.commit()
+        finally:
+            conn.close()
+        return deleted
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return dict(self._stats)
+
+
+# ----------------------------------------------------------------------
+# Süreç başına, DB yolu başına tek depo
+# ----------------------------------------------------------------------
+
+_stores: Dict[str, SharedRateLimitStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(db_path: Optional[str] = None) -> SharedRateLimitStore:
+    """db_path için paylaşılan depoyu getir"""
+    key = os.path.abspath(db_path or RATE_LIMIT_DB_PATH)
+    store = _stores.get(key)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(key)
+            if store is None:
+                store = SharedRateLimitStore(key)
+                _stores[key] = store
+    return store
+
+
+def storage_uri(db_path: Optional[str] = None) -> str:
+    """Flask-Limiter için storage_uri"""
+    return f"{STORAGE_SCHEME}://{os.path.abspath(db_path or RATE_LIMIT_DB_PATH)}"
+
+
+if _LimitsStorage is not None:
+
+    class SQLiteLimitsStorage(_LimitsStorage):
+        """`limits` depolama arka ucu; sabit pencere stratejisi için (Flask-Limiter varsayılanı)"""
+
+        STORAGE_SCHEME = [STORAGE_SCHEME]
+
+        def __init__(self, uri: Optional[str] = None, wrap_exceptions: bool = False, **options) -> None:
+            path = uri.split('://', 1)[1] if uri and '://' in uri else ''
+            self.store = get_store(path or None)
+            super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+        @property
+        def base_exceptions(self):
+            return sqlite3.Error
+
+        def incr(self, key: str, expiry: int, elastic_expiry: bool = False, amount: int = 1, **kwargs) -> int:
+            # limits 3.x (flask-limiter 3.5) elastic_expiry'yi de geçirir; 4.x+ yalnızca amount
+            return self.store.incr(key, expiry, amount, elastic_expiry=elastic_expiry)
+
+        def get(self, key: str) -> int:
+            return self.store.get_counter(key)[0]
+
+        def get_expiry(self, key: str) -> float:
+            return self.store.get_counter(key)[1]
+
+        def check(self) -> bool:
+            try:
+                self.store.get_counter('__health__')
+                return True
+            except sqlite3.Error:
+                return False
+
+        def reset(self) -> Optional[int]:
+            return self.store.clear()
+
+        def clear(self, key: str) -> None:
+            self.store.clear_counter(key)
@@ -12,17 +12,19 @@ import sqlite3
 import os
 from typing import Dict, List, Any, Tuple
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 class ReportingJourneyManager:
     """Raporlama yolculuğu ve ilerleme takibi"""
 
     def __init__(self, db_path: str = DB_PATH) -> None:
         self.db_path = db_path
-        self._init_tables()
+        ensure_schema(self.db_path, self._init_tables)
 
     def _init_tables(self) -> None:
         """Gerekli tabloları oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
@@ -196,7 +198,7 @@ class ReportingJourneyManager:
 
     def _get_stored_progress(self, company_id: int) -> Dict[int, str]:
         """DB'den kayıtlı ilerlemeyi çeker"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         progress = {}
         try:
@@ -213,7 +215,7 @@ class ReportingJourneyManager:
     def _check_real_status(self, company_id: int) -> Dict[str, bool]:
         """Sistemdeki gerçek verilere bakarak adımların tamamlanıp tamamlanmadığını kontrol eder"""
         status = {}
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
@@ -304,7 +306,7 @@ class ReportingJourneyManager:
 
     def _sync_progress(self, company_id: int, journey: List[Dict]) -> None:
         """Hesaplanan durumu DB'ye kaydeder"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             for step in journey:
@@ -321,7 +323,7 @@ class ReportingJourneyManager:
 
     def mark_step_completed(self, company_id: int, step_number: int) -> bool:
         """Bir adımı manuel olarak tamamlandı işaretle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -3,6 +3,7 @@ import sqlite3
 import logging
 from typing import List, Dict, Optional, Union
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 class RoleManager:
     """
@@ -14,7 +15,7 @@ class RoleManager:
         self.logger = logging.getLogger(__name__)
 
     def get_connection(self):
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def check_permission(self, user_id: int, permission_name: str) -> bool:
         """
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Önceden sıkıştırılmış çeviri paketleri (/api/v1/translations)
+
+Her dil (ve isteğe bağlı ad alanı seçimi) için JSON gövdesi bir kez üretilir;
+gzip ve (varsa) brotli baytları ile içerik özetinden türetilen güçlü bir ETag
+saklanır. Sıkıştırılmış baytlar içerik özetine göre diskte de tutulur; böylece
+yeni worker'lar yeniden sıkıştırmaz ve deploy sırasında
+`tools/build_translation_bundles.py` en yüksek kalitede önceden üretebilir.
+
+Ad alanı, anahtarın ilk '_' öncesindeki modül önekidir (ör. 'cbam_title' -> 'cbam').
+Ad alanı seçimi istemciden geldiği için yalnızca dilde var olan ad alanları kabul
+edilir; alt paketler diske yazılmaz ve bellekte sınırlı bir LRU'da tutulur.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # brotli opsiyonel; yoksa yalnızca gzip sunulur
+    brotli = None
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BUNDLE_CACHE_DIR = os.environ.get(
+    'SUSTAINAGE_TRANSLATION_BUNDLE_DIR', os.path.join(_PROJECT_ROOT, 'data', 'cache', 'translations')
+)
+# İstek yolunda hızlı; deploy aracı en yüksek kaliteyi kullanır
+RUNTIME_GZIP_LEVEL = 6
+RUNTIME_BROTLI_QUALITY = 9
+# Ad alanı seçimine göre üretilen alt paket sayısı üst sınırı
+MAX_SUB_BUNDLES = 64
+
+
+class UnknownNamespaceError(ValueError):
+    """İstenen ad alanı dilde yok"""
+
+
+def namespace_of(key: str) -> str:
+    """Anahtarın modül öneki"""
+    return key.split('_', 1)[0].split('.', 1)[0]
+
+
+@dataclass(frozen=True)
+class TranslationBundle:
+    lang: str
+    namespaces: Tuple[str, ...]
+    digest: str
+    raw: bytes
+    gzip: bytes
+    br: Optional[bytes]
+
+    @property
+    def etag(self) -> str:
+        return self.digest
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """Kodlama başına güçlü ETag: gövde baytları farklı olduğu için ayrı değer"""
+        return f"{self.digest}-{encoding}" if encoding else self.digest
+
+    def body_for(self, accept_encoding: str) -> Tuple[bytes, Optional[str]]:
+        """İstemcinin kabul ettiği en küçük gövde ve Content-Encoding değeri"""
+        accepted = {part.split(';', 1)[0].strip().lower() for part in (accept_encoding or '').split(',')}
+        if self.br is not None and 'br' in accepted:
+            return self.br, 'br'
+        if 'gzip' in accepted:
+            return self.gzip, 'gzip'
+        return self.raw, None
+
+
+class TranslationBundleStore:
+    """Dil + ad alanı seçimi başına süreç içi paket cache'i"""
+
+    def __init__(self, translations: Dict[str, Dict], cache_dir: Optional[str] = BUNDLE_CACHE_DIR,
+                 gzip_level: int = RUNTIME_GZIP_LEVEL, brotli_quality: int = RUNTIME_BROTLI_QUALITY) -> None:
+        self.translations = translations
+        self.cache_dir = cache_dir
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self._bundles: Dict[str, TranslationBundle] = {}
+        self._sub_bundles: "OrderedDict[Tuple[str, Tuple[str, ...]], TranslationBundle]" = OrderedDict()
+        self._namespaces: Dict[str, Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def namespaces(self, lang: str) -> Tuple[str, ...]:
+        """Dildeki mevcut ad alanları"""
+        cached = self._namespaces.get(lang)
+        if cached is None:
+            cached = tuple(sorted({namespace_of(key) for key in self.translations.get(lang, {})}))
+            self._namespaces[lang] = cached
+        return cached
+
+    def get(self, lang: str, namespaces: Optional[Iterable[str]] = None) -> TranslationBundle:
+        """
+        Paketi getir; ilk istekte üretilir (tam paket diskten de yüklenebilir).
+        Dilde olmayan ad alanı istenirse UnknownNamespaceError.
+        """
+        ns_key = tuple(sorted(set(namespaces))) if namespaces else ()
+        if not ns_key:
+            bundle = self._bundles.get(lang)
+            if bundle is None:
+                with self._lock:
+                    bundle = self._bundles.get(lang)
+                    if bundle is None:
+                        bundle = self._build(lang, ())
+                        self._bundles[lang] = bundle
+            return bundle
+
+        unknown = set(ns_key) - set(self.namespaces(lang))
+        if unknown:
+            raise UnknownNamespaceError(f"Bilinmeyen ad alanı: {', '.join(sorted(unknown))}")
+
+        key = (lang, ns_key)
+        with self._lock:
+            bundle = self._sub_bundles.get(key)
+            if bundle is not None:
+                self._sub_bundles.move_to_end(key)
+                return bundle
+            bundle = self._build(lang, ns_key, persist=False)
+            self._sub_bundles[key] = bundle
+            while len(self._sub_bundles) > MAX_SUB_BUNDLES:
+                self._sub_bundles.popitem(last=False)
+        return bundle
+
+    def warm(self, langs: Optional[Iterable[str]] = None) -> int:
+        """Tam dil paketlerini önceden üret"""
+        count = 0
+        for lang in (langs or list(self.translations)):
+            self.get(lang)
+            count += 1
+        return count
+
+    def _build(self, lang: str, namespaces: Tuple[str, ...], persist: bool = True) -> TranslationBundle:
+        translations = self.translations.get(lang, {})
+        if namespaces:
+            wanted = set(namespaces)
+            translations = {k: v for k, v in translations.items() if namespace_of(k) in wanted}
+        payload = {'lang': lang, 'translations': translations}
+        if namespaces:
+            payload['namespaces'] = list(namespaces)
+        raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha256(raw).hexdigest()[:32]
+
+        # Alt paketler diske yazılmaz (istemci seçimi disk cache'ini büyütmesin)
+        gz = self._load(digest, 'gz') if persist else None
+        if gz is None:
+            gz = gzip.compress(raw, compresslevel=self.gzip_level, mtime=0)
+            if persist:
+                self._store(digest, 'gz', gz)
+        br = None
+        if brotli is not None:
+            br = self._load(digest, 'br') if persist else None
+            if br is None:
+                br = brotli.compress(raw, quality=self.brotli_quality)
+                if persist:
+                    self._store(digest, 'br', br)
+        return TranslationBundle(lang=lang, namespaces=namespaces, digest=digest, raw=raw, gzip=gz, br=br)
+
+    # ------------------------------------------------------------------
+    # İçerik özetine göre disk cache'i
+    # ------------------------------------------------------------------
+
+    def _path(self, digest: str, ext: str) -> Optional[str]:
+        return os.path.join(self.cache_dir, f"{digest}.json.{ext}") if self.cache_dir else None
+
+    def _load(self, digest: str, ext: str) -> Optional[bytes]:
+        path = self._path(digest, ext)
+        if not path:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _store(self, digest: str, ext: str, data: bytes) -> None:
+        path = self._path(digest, ext)
+        if not path:
+            return
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"Çeviri paketi diske yazılamadı ({path}): {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def prune(self) -> int:
+        """Bu süreçte üretilmiş tam dil paketlerine ait olmayan disk dosyalarını sil"""
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return 0
+        live = {bundle.digest for bundle in self._bundles.values()}
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            if name.split('.', 1)[0] not in live:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
@@ -25,6 +25,14 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle, PageBreak
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 # Try to import font registration, if fails, define dummy
 try:
@@ -199,13 +207,13 @@ class AdvancedReportTemplates:
     def __init__(self, db_path: str = None):
         self.db_path = db_path or 'data/sdg_desktop.db'
         self.templates = {}
-        self._create_tables()
+        ensure_schema(self.db_path, self._create_tables)
         self._load_default_templates()
 
     def _create_tables(self):
         """Raporlama tablolarını oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Rapor şablonları
@@ -360,7 +368,7 @@ class AdvancedReportTemplates:
     def _save_section(self, section: ReportSection):
         """Bölümü kaydet"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR REPLACE INTO report_sections
@@ -379,7 +387,7 @@ class AdvancedReportTemplates:
     def delete_section(self, section_id: str) -> bool:
         """Bölümü sil (Zorunlu bölümler silinemez)"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             
             # Kontrol et
@@ -406,7 +414,7 @@ class AdvancedReportTemplates:
     def _save_template(self, template: ReportTemplate):
         """Şablonu kaydet"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -863,7 +871,7 @@ class AdvancedReportTemplates:
     def _save_generation_log(self, company_id: int, template_id: str, report_name: str, file_path: str):
         """Rapor oluşturma geçmişini kaydet"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             import uuid
             log_id = f"log_{company_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}"
@@ -880,7 +888,7 @@ class AdvancedReportTemplates:
     def get_available_templates(self) -> List[Dict[str, Any]]:
         """Mevcut şablonları getir"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM report_templates WHERE is_active = 1 ORDER BY category, language, template_name")
             templates = []
@@ -24,6 +24,11 @@ except ImportError:
     except ImportError as e:
         logging.error(f"Error importing managers in ReportingService: {e}")
 
+try:
+    from backend.core.module_data_collector import get_collector
+except ImportError:
+    from core.module_data_collector import get_collector
+
 class ReportingService:
     def __init__(self, db_path: str):
         self.db_path = db_path
@@ -56,27 +61,37 @@ class ReportingService:
             'modules': {}
         }
 
+        # Modüller paralel toplanır; veri sürümü değişmeyenler önbellekten gelir
+        environmental = {
+            'carbon': lambda: self._get_carbon_data(company_id, period),
+            'water': lambda: self._get_water_data(company_id, period),
+            'waste': lambda: self._get_waste_data(company_id, period),
+            'biodiversity': lambda: self._get_biodiversity_data(company_id, period)
+        }
+        extractors = {}
+        if scope in ['full', 'environmental']:
+            extractors.update(environmental)
+        if scope in ['full', 'social']:
+            extractors['social'] = lambda: self._get_social_data(company_id, period)
+        if scope in ['full', 'governance']:
+            extractors['governance'] = lambda: self._get_governance_data(company_id, period)
+        # Supply Chain (Usually part of full or specific scope, putting in full for now)
+        if scope == 'full':
+            extractors['supply_chain'] = lambda: self._get_supply_chain_data(company_id, period)
+
         try:
+            results = get_collector(self.db_path, 'reporting').collect(company_id, period, extractors)
+
             # Environmental
             if scope in ['full', 'environmental']:
                 data['modules']['environmental'] = {
-                    'carbon': self._get_carbon_data(company_id, period),
-                    'water': self._get_water_data(company_id, period),
-                    'waste': self._get_waste_data(company_id, period),
-                    'biodiversity': self._get_biodiversity_data(company_id, period)
+                    module: results[module] if results[module] is not None else {}
+                    for module in environmental
                 }
 
-            # Social
-            if scope in ['full', 'social']:
-                data['modules']['social'] = self._get_social_data(company_id, period)
-
-            # Governance
-            if scope in ['full', 'governance']:
-                data['modules']['governance'] = self._get_governance_data(company_id, period)
-                
-            # Supply Chain (Usually part of full or specific scope, putting in full for now)
-            if scope == 'full':
-                data['modules']['supply_chain'] = self._get_supply_chain_data(company_id, period)
+            for module in ('social', 'governance', 'supply_chain'):
+                if module in results:
+                    data['modules'][module] = results[module] if results[module] is not None else {}
 
         except Exception as e:
             logging.error(f"Error collecting report data: {e}")
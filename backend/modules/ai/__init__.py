@@ -9,7 +9,10 @@ __version__ = "1.0.0"
 __author__ = "SUSTAINAGE SDG Team"
 
 from .ai_manager import AIManager
-from .ai_module_gui import AIModuleGUI
+try:
+    from .ai_module_gui import AIModuleGUI
+except ImportError:
+    AIModuleGUI = None
 
 __all__ = ['AIModuleGUI', 'AIManager']
 
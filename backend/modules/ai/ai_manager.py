@@ -10,6 +10,8 @@ import os
 import sqlite3
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 try:
     from backend.core.language_manager import LanguageManager
@@ -21,6 +23,11 @@ except ImportError:
             def __init__(self, base_dir=None): pass
             def get_text(self, key, lang=None, default=None): return default or key
 
+try:
+    from backend.core.module_data_collector import get_collector as get_module_collector
+except ImportError:
+    from core.module_data_collector import get_collector as get_module_collector
+
 from modules.reporting.advanced_report_manager import AdvancedReportManager
 from modules.ai.prompts import get_prompt
 from config.database import DB_PATH
@@ -62,12 +69,12 @@ class AIManager:
         self.validator = ReportValidator()
 
         # Initialize Tables
-        self._init_ai_tables()
+        ensure_schema(self.db_path, self._init_ai_tables)
 
     def _init_ai_tables(self):
         """AI log ve feedback tablolarini olustur"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             
             # AI Logs
@@ -210,7 +217,7 @@ class AIManager:
             year = datetime.now().year
         snapshot["period"] = {"year": year, "label": str(reporting_period)}
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             company_info: Dict[str, Any] = {}
@@ -236,79 +243,33 @@ class AIManager:
         except Exception as e:
             logging.error(f"Unified KPI snapshot connection error: {e}")
         modules = selected_modules or []
-        try:
-            sdg_kpis = self._export_sdg_kpis(company_id)
-            if sdg_kpis:
-                snapshot["kpis"].extend(sdg_kpis)
-        except Exception as e:
-            logging.error(f"Unified KPI snapshot SDG export error: {e}")
-        try:
-            gri_kpis = self._export_gri_kpis(company_id)
-            if gri_kpis:
-                snapshot["kpis"].extend(gri_kpis)
-        except Exception as e:
-            logging.error(f"Unified KPI snapshot GRI export error: {e}")
-        try:
-            tsrs_kpis = self._export_tsrs_kpis(company_id, reporting_period)
-            if tsrs_kpis:
-                snapshot["kpis"].extend(tsrs_kpis)
-        except Exception as e:
-            logging.error(f"Unified KPI snapshot TSRS export error: {e}")
-        try:
-            issb_kpis = self._export_issb_kpis(company_id, year)
-            if issb_kpis:
-                snapshot["kpis"].extend(issb_kpis)
-        except Exception as e:
-            logging.error(f"Unified KPI snapshot ISSB export error: {e}")
-        try:
-            csrd_kpis = self._export_csrd_kpis(company_id, year)
-            if csrd_kpis:
-                snapshot["kpis"].extend(csrd_kpis)
-        except Exception as e:
-            logging.error(f"Unified KPI snapshot CSRD export error: {e}")
-        try:
-            carbon_kpis = self._export_carbon_kpis(company_id, year)
-            if carbon_kpis:
-                snapshot["kpis"].extend(carbon_kpis)
-        except Exception as e:
-            logging.error(f"Unified KPI snapshot carbon export error: {e}")
-        try:
-            energy_kpis = self._export_energy_kpis(company_id)
-            if energy_kpis:
-                snapshot["kpis"].extend(energy_kpis)
-        except Exception as e:
-            logging.error(f"Unified KPI snapshot energy export error: {e}")
-        try:
-            water_kpis = self._export_water_kpis(company_id, year)
-            if water_kpis:
-                snapshot["kpis"].extend(water_kpis)
-        except Exception as e:
-            logging.error(f"Unified KPI snapshot water export error: {e}")
-        try:
-            waste_kpis = self._export_waste_kpis(company_id, year)
-            if waste_kpis:
-                snapshot["kpis"].extend(waste_kpis)
-        except Exception as e:
-            logging.error(f"Unified KPI snapshot waste export error: {e}")
-        try:
-            sc_kpis = self._export_supply_chain_kpis(company_id)
-            if sc_kpis:
-                snapshot["kpis"].extend(sc_kpis)
-        except Exception as e:
-            logging.error(f"Unified KPI snapshot supply-chain export error: {e}")
-        try:
-            social_kpis = self._export_social_kpis(company_id, year)
-            if social_kpis:
-                snapshot["kpis"].extend(social_kpis)
-        except Exception as e:
-            logging.error(f"Unified KPI snapshot social export error: {e}")
-        try:
+
+        def load_mappings():
             from modules.mapping.mapping_manager import MappingManager
-            mapping_manager = MappingManager(self.db_path)
-            mappings = mapping_manager.get_all_mappings({"verified_only": True})
-            snapshot["alignments"]["standard_mappings"] = mappings
-        except Exception as e:
-            logging.error(f"Unified KPI snapshot alignment load error: {e}")
+            return MappingManager(self.db_path).get_all_mappings({"verified_only": True})
+
+        # Modüller paralel toplanır; veri sürümü değişmeyenler önbellekten gelir
+        extractors = {
+            "sdg": lambda: self._export_sdg_kpis(company_id),
+            "gri": lambda: self._export_gri_kpis(company_id),
+            "tsrs": lambda: self._export_tsrs_kpis(company_id, reporting_period),
+            "issb": lambda: self._export_issb_kpis(company_id, year),
+            "csrd": lambda: self._export_csrd_kpis(company_id, year),
+            "carbon": lambda: self._export_carbon_kpis(company_id, year),
+            "energy": lambda: self._export_energy_kpis(company_id),
+            "water": lambda: self._export_water_kpis(company_id, year),
+            "waste": lambda: self._export_waste_kpis(company_id, year),
+            "supply_chain": lambda: self._export_supply_chain_kpis(company_id),
+            "social": lambda: self._export_social_kpis(company_id, year),
+            "mapping": load_mappings
+        }
+        results = get_module_collector(self.db_path, "ai_kpis").collect(
+            company_id, reporting_period, extractors)
+        for module in extractors:
+            if module != "mapping" and results.get(module):
+                snapshot["kpis"].extend(results[module])
+        if results.get("mapping") is not None:
+            snapshot["alignments"]["standard_mappings"] = results["mapping"]
         try:
             snapshots_dir = os.path.join(self.base_dir, "ai_snapshots")
             os.makedirs(snapshots_dir, exist_ok=True)
@@ -334,7 +295,7 @@ class AIManager:
         kpis: List[Dict[str, Any]] = []
         goal_titles: Dict[int, Dict[str, Any]] = {}
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             try:
                 cursor.execute("SELECT id, code, title_tr FROM sdg_goals")
@@ -1028,7 +989,7 @@ class AIManager:
             # Log to DB
             log_id = None
             try:
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cursor = conn.cursor()
                 cursor.execute("""
                     INSERT INTO ai_logs (company_id, module, prompt, response, model, tokens)
@@ -1048,7 +1009,7 @@ class AIManager:
     def submit_feedback(self, log_id: int, rating: int, comment: str, user_id: Optional[int] = None) -> bool:
         """Kullanici geri bildirimi kaydet"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO ai_feedback (log_id, rating, comment, user_id)
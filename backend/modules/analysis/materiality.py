@@ -9,6 +9,14 @@ import logging
 import os
 import sqlite3
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class MaterialityAnalysis:
@@ -29,11 +37,11 @@ class MaterialityAnalysis:
 
     def __init__(self, db_path: str = None) -> None:
         self.db_path = db_path or os.path.join(os.getcwd(), 'data', 'sdg_desktop.sqlite')
-        self._ensure_tables()
+        ensure_schema(self.db_path, self._ensure_tables)
 
     def _ensure_tables(self) -> None:
         """Materialite tabloları"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -63,7 +71,7 @@ class MaterialityAnalysis:
             stakeholder: Paydaş önemi (1-10)
             business: İş etkisi (1-10)
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -84,7 +92,7 @@ class MaterialityAnalysis:
 
     def get_matrix(self, company_id: int, year: int) -> List[Dict]:
         """Materialite matrisi al"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
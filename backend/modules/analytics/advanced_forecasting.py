@@ -11,8 +11,12 @@ import os
 import sqlite3
 import statistics
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class AdvancedForecasting:
@@ -23,11 +27,11 @@ class AdvancedForecasting:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_forecast_tables()
+        ensure_schema(self.db_path, self._init_forecast_tables)
 
     def _init_forecast_tables(self) -> None:
         """Tahmin tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -398,7 +402,7 @@ class AdvancedForecasting:
     def _save_target_forecast(self, company_id: int, metric_code: str,
                              forecast_data: Dict) -> None:
         """Hedef tahminini kaydet"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -441,7 +445,7 @@ class AdvancedForecasting:
         Returns:
             Senaryo sonuçları
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         results = []
 
@@ -527,7 +531,7 @@ class AdvancedForecasting:
                 "statistics": {...}
             }
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -633,7 +637,7 @@ class AdvancedForecasting:
     def save_forecast(self, company_id: int, metric_code: str,
                      forecasts: List[Dict]) -> None:
         """Tahmin sonuçlarını kaydet"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -661,7 +665,7 @@ class AdvancedForecasting:
     def get_forecast_accuracy(self, company_id: int, metric_code: str,
                              actual_year: int) -> Dict:
         """Tahmin doğruluğunu hesapla"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -712,3 +716,191 @@ class AdvancedForecasting:
             return {}
         finally:
             conn.close()
+
+    # =====================================================
+    # 9. TOPLU TAHMİN (NUMPY, ÇOK METRİK)
+    # =====================================================
+
+    def batch_forecast(self, values, years, mask=None, forecast_years: int = 3,
+                       window_size: int = 3, alpha: float = 0.3) -> Dict:
+        """
+        Çok metrik için tüm yöntemlerle vektörel tahmin
+
+        Args:
+            values: (metrik × yıl) dizisi; NaN değerler eksik kabul edilir
+            years: Sütun yılları
+            mask: Geçerli hücreler (None ise NaN olmayan hücreler)
+            forecast_years / window_size / alpha: Tekil yöntemlerle aynı parametreler
+
+        Returns:
+            Yöntem başına (metrik × ufuk) dizileri; 'valid' yöntemin hesaplanabildiği
+            metrikleri gösterir. Değerler yuvarlanmamıştır (kaydederken yuvarlanır).
+        """
+        values = np.atleast_2d(np.asarray(values, dtype=float))
+        years = np.asarray(years, dtype=float)
+        order = np.argsort(years, kind='stable')
+        years, values = years[order], values[:, order]
+        valid = np.isfinite(values)
+        if mask is not None:
+            valid &= np.atleast_2d(np.asarray(mask, dtype=bool))[:, order]
+
+        rows = values.shape[0]
+        zeros = np.zeros(rows)
+        v = np.where(valid, values, 0.0)
+        x = np.where(valid, years, 0.0)
+        n = valid.sum(axis=1)
+        steps = np.arange(1, forecast_years + 1)
+        last_year = np.where(n > 0, np.where(valid, years, -np.inf).max(axis=1), 0)
+        horizon = (last_year[:, None] + steps).astype(int)
+
+        # Geçerli noktalar sondan sıralanır: 1 = son gözlem
+        rank = np.cumsum(valid[:, ::-1], axis=1)[:, ::-1]
+        last_value = np.where(valid & (rank == 1), v, 0.0).sum(axis=1)
+        first_value = np.where(valid & (rank == n[:, None]), v, 0.0).sum(axis=1)
+
+        # Linear regression: y = mx + b, standart hata metrik başına bir kez
+        sum_x, sum_y = x.sum(axis=1), v.sum(axis=1)
+        denom = n * (x * x).sum(axis=1) - sum_x * sum_x
+        lr_valid = (n >= 2) & (denom != 0)
+        slope = np.divide(n * (x * v).sum(axis=1) - sum_x * sum_y, denom, out=zeros.copy(), where=lr_valid)
+        intercept = np.divide(sum_y - slope * sum_x, n, out=zeros.copy(), where=lr_valid)
+        residuals = np.where(valid, v - (slope[:, None] * years + intercept[:, None]), 0.0)
+        std_error = np.sqrt(np.divide((residuals ** 2).sum(axis=1), n - 2, out=zeros.copy(), where=n >= 3))
+        lr_forecast = slope[:, None] * horizon + intercept[:, None]
+        lr_margin = (1.96 * std_error)[:, None]
+
+        # Moving average: son window_size gözlemin ortalaması + trend
+        in_window = valid & (rank <= window_size)
+        ma_valid = (n >= window_size) & (n > 0)
+        window_first = np.where(valid & (rank == window_size), v, 0.0).sum(axis=1)
+        ma_avg = np.where(in_window, v, 0.0).sum(axis=1) / max(window_size, 1)
+        ma_trend = (last_value - window_first) / max(window_size, 1)
+        ma_std = (np.sqrt(np.where(in_window, (v - ma_avg[:, None]) ** 2, 0.0).sum(axis=1) / (window_size - 1))
+                  if window_size > 1 else zeros)
+        ma_forecast = ma_avg[:, None] + ma_trend[:, None] * steps
+        ma_margin = (1.96 * ma_std)[:, None]
+
+        # Exponential smoothing: yıllar üzerinde tek döngü, metrikler vektörel
+        smoothed, previous, started = zeros.copy(), zeros.copy(), np.zeros(rows, dtype=bool)
+        for j in range(values.shape[1]):
+            col = valid[:, j]
+            update = col & started
+            previous = np.where(update, smoothed, previous)
+            smoothed = np.where(update, alpha * v[:, j] + (1 - alpha) * smoothed,
+                                np.where(col, v[:, j], smoothed))
+            started |= col
+        es_valid = n >= 2
+        es_trend = np.where(es_valid, smoothed - previous, 0.0)
+        es_forecast = smoothed[:, None] + es_trend[:, None] * steps
+
+        # Ensemble: yuvarlanmış yöntem tahminleri, eksik yöntem 0 (ensemble_forecast ile aynı)
+        ensemble = (0.4 * np.where(lr_valid[:, None], np.round(lr_forecast, 2), 0.0)
+                    + 0.3 * np.where(ma_valid[:, None], np.round(ma_forecast, 2), 0.0)
+                    + 0.3 * np.where(es_valid[:, None], np.round(es_forecast, 2), 0.0))
+
+        return {
+            'years': horizon,
+            'data_points': n,
+            'last_year': last_year.astype(int),
+            'annual_change': np.divide(last_value - first_value, n - 1, out=zeros.copy(), where=n >= 2),
+            'params': {'forecast_years': forecast_years, 'window_size': window_size, 'alpha': alpha},
+            'linear_regression': {
+                'forecast': lr_forecast, 'lower': lr_forecast - lr_margin, 'upper': lr_forecast + lr_margin,
+                'slope': slope, 'intercept': intercept, 'std_error': std_error, 'valid': lr_valid
+            },
+            'moving_average': {
+                'forecast': ma_forecast, 'lower': ma_forecast - ma_margin, 'upper': ma_forecast + ma_margin,
+                'trend': ma_trend, 'valid': ma_valid
+            },
+            'exponential_smoothing': {
+                'forecast': es_forecast, 'trend': es_trend, 'valid': es_valid
+            },
+            'ensemble': {
+                'forecast': ensemble, 'valid': lr_valid | ma_valid | es_valid
+            },
+        }
+
+    def load_trend_matrix(self, company_id: int, metric_codes: Optional[List[str]] = None,
+                          start_year: Optional[int] = None, end_year: Optional[int] = None) -> Tuple:
+        """
+        trend_data kayıtlarını tek sorguda (metrik × yıl) dizisine çevir
+
+        Returns:
+            (metric_codes, years, values, mask)
+        """
+        query = "SELECT metric_code, year, actual_value FROM trend_data WHERE company_id = ?"
+        params: List = [company_id]
+        if metric_codes:
+            query += f" AND metric_code IN ({','.join('?' * len(metric_codes))})"
+            params.extend(metric_codes)
+        if start_year is not None:
+            query += " AND year >= ?"
+            params.append(start_year)
+        if end_year is not None:
+            query += " AND year <= ?"
+            params.append(end_year)
+
+        conn = db_connect(self.db_path)
+        try:
+            rows = conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+
+        codes = list(metric_codes) if metric_codes else sorted({row[0] for row in rows})
+        years = sorted({row[1] for row in rows})
+        code_index = {code: i for i, code in enumerate(codes)}
+        year_index = {year: j for j, year in enumerate(years)}
+        values = np.full((len(codes), len(years)), np.nan)
+        for code, year, value in rows:
+            values[code_index[code], year_index[year]] = value
+        return codes, years, values, np.isfinite(values)
+
+    def save_batch_forecast(self, company_id: int, metric_codes: List[str], result: Dict) -> int:
+        """batch_forecast sonuçlarını tek executemany ile forecast_results'a yaz"""
+        params = result['params']
+        methods = (
+            ('linear_regression', "Linear Regression"),
+            ('moving_average', f"Moving Average ({params['window_size']} yil)"),
+            ('exponential_smoothing', f"Exponential Smoothing (alpha={params['alpha']})"),
+            ('ensemble', "Ensemble (Weighted Average)"),
+        )
+        years = result['years'].tolist()
+        records = []
+        for key, label in methods:
+            method = result[key]
+            forecast = np.round(method['forecast'], 2).tolist()
+            lower = np.round(method['lower'], 2).tolist() if 'lower' in method else None
+            upper = np.round(method['upper'], 2).tolist() if 'upper' in method else None
+            for i in np.flatnonzero(method['valid']).tolist():
+                for h, year in enumerate(years[i]):
+                    records.append((
+                        company_id, metric_codes[i], year, forecast[i][h], label,
+                        lower[i][h] if lower else None, upper[i][h] if upper else None
+                    ))
+
+        conn = db_connect(self.db_path)
+        try:
+            conn.executemany("""
+                INSERT OR REPLACE INTO forecast_results
+                (company_id, metric_code, forecast_year, forecast_value,
+                 forecast_method, confidence_interval_lower, confidence_interval_upper)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, records)
+            conn.commit()
+            return len(records)
+        except Exception as e:
+            conn.rollback()
+            logging.error(f"Toplu tahmin kaydetme hatasi: {e}")
+            return 0
+        finally:
+            conn.close()
+
+    def forecast_all_metrics(self, company_id: int, metric_codes: Optional[List[str]] = None,
+                             forecast_years: int = 3, save: bool = True) -> Dict:
+        """Şirketin tüm metriklerini tek geçişte tahmin et (ve kaydet)"""
+        codes, years, values, mask = self.load_trend_matrix(company_id, metric_codes)
+        if not codes or not years:
+            return {'metric_codes': codes, 'history_years': years, 'forecast': {}, 'saved': 0}
+        result = self.batch_forecast(values, years, mask, forecast_years)
+        saved = self.save_batch_forecast(company_id, codes, result) if save else 0
+        return {'metric_codes': codes, 'history_years': years, 'forecast': result, 'saved': saved}
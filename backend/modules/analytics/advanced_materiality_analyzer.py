@@ -13,6 +13,8 @@ from datetime import datetime
 from typing import Any, Dict, List
 from config.database import DB_PATH
 from backend.modules.prioritization.prioritization_manager import PrioritizationManager
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 @dataclass
@@ -48,12 +50,12 @@ class AdvancedMaterialityAnalyzer:
         except Exception as e:
             logging.error(f"PrioritizationManager baslatilamadi: {e}")
 
-        self._init_advanced_tables()
+        ensure_schema(self.db_path, self._init_advanced_tables)
         self._init_stakeholder_weights()
 
     def _init_advanced_tables(self) -> None:
         """İleri seviye materialite tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -165,7 +167,7 @@ class AdvancedMaterialityAnalyzer:
             ("Rakip Firmalar", 0.02, "Düşük", "Çeyreklik")
         ]
 
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -189,7 +191,7 @@ class AdvancedMaterialityAnalyzer:
         if year is None:
             year = datetime.now().year
 
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -287,7 +289,7 @@ class AdvancedMaterialityAnalyzer:
         if year is None:
             year = datetime.now().year
 
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -507,7 +509,7 @@ class AdvancedMaterialityAnalyzer:
                                      stakeholder_priority: float, business_impact: float,
                                      materiality_level: str, quadrant: str) -> None:
         """Materialite matrisi girişini kaydet"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -602,7 +604,7 @@ class AdvancedMaterialityAnalyzer:
 
     def _analyze_materiality_changes(self, company_id: int, prev_year: int, current_year: int) -> Dict[str, Any]:
         """Materialite değişikliklerini analiz et"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -688,7 +690,7 @@ class AdvancedMaterialityAnalyzer:
     def _log_materiality_update(self, company_id: int, update_type: str,
                                previous_score: float, new_score: float, change_reason: str) -> None:
         """Materialite güncelleme kaydını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
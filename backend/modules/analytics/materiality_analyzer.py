@@ -10,6 +10,14 @@ import json
 import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class MaterialityAnalyzer:
@@ -17,11 +25,11 @@ class MaterialityAnalyzer:
 
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
-        self._init_database()
+        ensure_schema(self.db_path, self._init_database)
 
     def _init_database(self) -> None:
         """Veritabanı tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Materialite konuları
@@ -85,7 +93,7 @@ class MaterialityAnalyzer:
                          created_by: Optional[int] = None) -> Optional[int]:
         """Yeni materialite değerlendirmesi oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -108,7 +116,7 @@ class MaterialityAnalyzer:
                  description: str = "") -> Optional[int]:
         """Materialite konusu ekle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -135,7 +143,7 @@ class MaterialityAnalyzer:
             # Final skor: Ortalama veya ağırlıklı ortalama
             final_score = (stakeholder_importance + business_impact) / 2
 
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -156,7 +164,7 @@ class MaterialityAnalyzer:
     def get_materiality_matrix(self, assessment_id: int) -> List[Dict]:
         """Materialite matrisini al"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -215,7 +223,7 @@ class MaterialityAnalyzer:
                               stakeholder_name: str, responses: Dict) -> bool:
         """Paydaş anketi ekle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
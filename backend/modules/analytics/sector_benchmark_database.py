@@ -10,6 +10,8 @@ import os
 import sqlite3
 from typing import Dict, List, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class SectorBenchmarkDatabase:
@@ -64,12 +66,12 @@ class SectorBenchmarkDatabase:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_benchmark_tables()
+        ensure_schema(self.db_path, self._init_benchmark_tables)
         self._populate_benchmark_data()
 
     def _init_benchmark_tables(self) -> None:
         """Benchmark tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -171,7 +173,7 @@ class SectorBenchmarkDatabase:
 
     def get_all_metrics_for_sector(self, sector_code: str, data_year: int = 2024) -> Dict[str, Dict]:
         """Sektörün tüm metriklerini getirir (Trend bilgisi ile birlikte)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -201,7 +203,7 @@ class SectorBenchmarkDatabase:
 
     def _populate_benchmark_data(self) -> None:
         """Benchmark verilerini doldur - GERÇEK VERİLER"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -463,7 +465,7 @@ class SectorBenchmarkDatabase:
     def get_sector_benchmark(self, sector_code: str, metric_code: str,
                             data_year: int = 2024) -> Optional[Dict]:
         """Sektör benchmark verisi getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -488,7 +490,7 @@ class SectorBenchmarkDatabase:
                          company_metrics: Dict[str, float],
                          comparison_year: int = 2024) -> Dict:
         """Şirketi sektör ile karşılaştır"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -584,7 +586,7 @@ class SectorBenchmarkDatabase:
     def get_sector_trend(self, sector_code: str, metric_code: str,
                         start_year: int = 2020, end_year: int = 2024) -> List[Dict]:
         """Sektör trendini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
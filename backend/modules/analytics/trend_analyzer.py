@@ -9,6 +9,10 @@ import logging
 import sqlite3
 import statistics
 from typing import Dict, List, Optional
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 class TrendAnalyzer:
@@ -21,7 +25,7 @@ class TrendAnalyzer:
                         metric_name: str, years: List[int]) -> List[Dict]:
         """Metrik trendini al"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             placeholders = ','.join('?' * len(years))
@@ -132,7 +136,7 @@ class TrendAnalyzer:
                      metric_name: str, year1: int, year2: int) -> Dict:
         """İki yılı karşılaştır"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             query = f"""
@@ -1,5 +1,8 @@
 # Auditor Module
-from .auditor_gui import AuditorGUI
+try:
+    from .auditor_gui import AuditorGUI
+except ImportError:
+    AuditorGUI = None
 from .auditor_system import AuditorSystem
 
 __all__ = ['AuditorSystem', 'AuditorGUI']
@@ -13,6 +13,8 @@ import sqlite3
 from datetime import datetime
 from typing import Dict, List
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class AuditorSystem:
@@ -61,11 +63,11 @@ class AuditorSystem:
         # Kanıt dizinini oluştur
         os.makedirs(self.evidence_dir, exist_ok=True)
 
-        self._init_auditor_tables()
+        ensure_schema(self.db_path, self._init_auditor_tables)
 
     def _init_auditor_tables(self) -> None:
         """Denetçi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -229,7 +231,7 @@ class AuditorSystem:
     def create_auditor(self, user_id: int, role: str, organization: str,
                       certification: str = "", cert_number: str = "") -> bool:
         """Yeni denetçi oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -257,7 +259,7 @@ class AuditorSystem:
                                data_item: str, data_value: str,
                                evidence_ids: List[int] = None) -> int:
         """Veriyi doğrulama için gönder"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -287,7 +289,7 @@ class AuditorSystem:
                    status: str, notes: str = "",
                    confidence: str = "yuksek") -> bool:
         """Veriyi doğrula"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -321,7 +323,7 @@ class AuditorSystem:
                        document_type: str, related_item: str = "",
                        description: str = "", uploaded_by: int = 1) -> int:
         """Kanıt belgesi yükle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -372,7 +374,7 @@ class AuditorSystem:
 
     def get_evidence_documents(self, company_id: int, module_code: str = None) -> List[Dict]:
         """Kanıt belgelerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -407,7 +409,7 @@ class AuditorSystem:
                      signer_role: str, signature_type: str = "approval",
                      remarks: str = "", ip_address: str = "") -> bool:
         """Belgeyi dijital olarak imzala"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -444,7 +446,7 @@ class AuditorSystem:
 
     def verify_signature(self, signature_id: int) -> Dict:
         """İmza doğruluğunu kontrol et"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -481,7 +483,7 @@ class AuditorSystem:
                       description: str, recommendation: str = "",
                       created_by: int = 1) -> int:
         """Denetim bulgusu oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -508,7 +510,7 @@ class AuditorSystem:
     def get_audit_findings(self, company_id: int,
                           severity: str = None) -> List[Dict]:
         """Denetim bulgularını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -543,7 +545,7 @@ class AuditorSystem:
                              report_title: str, summary: str,
                              overall_opinion: str, created_by: int) -> int:
         """Denetim raporu oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -584,7 +586,7 @@ class AuditorSystem:
 
     def get_auditor_dashboard(self, auditor_id: int) -> Dict:
         """Denetçi dashboard verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
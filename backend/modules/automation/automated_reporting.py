@@ -15,7 +15,13 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
-from services.email_service import EmailService
+# Kök dizindeki 'services' paketi backend/services'i gölgelediği için önce tam yol
+try:
+    from backend.services.email_service import EmailService
+except ImportError:
+    from services.email_service import EmailService
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 @dataclass
 class ReportSchedule:
@@ -54,12 +60,12 @@ class AutomatedReportingSystem:
     def __init__(self, db_path: str = None):
         self.db_path = db_path or 'data/sdg_desktop.db'
         self.email_service = EmailService(self.db_path)
-        self._create_tables()
+        ensure_schema(self.db_path, self._create_tables)
 
     def _create_tables(self):
         """Otomatik raporlama tablolarını oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Rapor zamanlamaları
@@ -177,7 +183,7 @@ class AutomatedReportingSystem:
             # Sonraki gönderim zamanını hesapla
             next_send = self._calculate_next_send(frequency, day_of_week, day_of_month, hour, minute)
 
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -315,7 +321,7 @@ SUSTAINAGE SDG Ekibi
         try:
             stakeholder_id = f"stakeholder_{company_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -379,7 +385,7 @@ SUSTAINAGE SDG Ekibi
     def _get_schedule_data(self, schedule_id: str) -> Optional[Dict[str, Any]]:
         """Zamanlama verilerini al"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -473,7 +479,7 @@ SUSTAINAGE SDG Ekibi
 
     def _get_company_info(self, company_id: int) -> Dict[str, Any]:
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT COALESCE(ticari_unvan, sirket_adi), email, telefon FROM company_info WHERE company_id = ?",
@@ -497,7 +503,7 @@ SUSTAINAGE SDG Ekibi
         try:
             history_id = f"history_{schedule_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -521,7 +527,7 @@ SUSTAINAGE SDG Ekibi
     def _update_next_send_time(self, schedule_id: str):
         """Sonraki gönderim zamanını güncelle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Mevcut zamanlamayı al
@@ -552,7 +558,7 @@ SUSTAINAGE SDG Ekibi
     def get_pending_reports(self) -> List[Dict[str, Any]]:
         """Bekleyen raporları getir"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -6,10 +6,17 @@ CBAM (Carbon Border Adjustment Mechanism) Hesaplayıcı
 """
 
 import os
-from typing import Dict
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
 
 from backend.utils import get_db_cursor, log_error, log_info
 
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+
 
 class CBAMCalculator:
     """
@@ -41,118 +48,205 @@ class CBAMCalculator:
                 'summary': Dict
             }
         """
-        with get_db_cursor(self.db_path) as cursor:
-            try:
-                # EU ETS fiyatını al
-                eu_ets_price = self._get_eu_ets_price(cursor, period)
+        return self.compute_cbam_savings_batch(company_id, [period])['periods'][int(period)]
 
-                if eu_ets_price == 0:
-                    log_error(f"EU ETS fiyatı bulunamadı: {period}", module='CBAM')
-                    return {'error': 'EU ETS fiyatı tanımlı değil', 'total_saving_eur': 0}
+    def compute_cbam_savings_batch(self, company_id: int, periods: Iterable[int],
+                                   eu_ets_prices: Optional[Iterable[float]] = None) -> Dict:
+        """
+        Birden çok dönem ve EU ETS fiyat senaryosu için CBAM tasarrufu (toplu mod)
 
-                # İnovasyon oranını al
-                innovation_ratio = self._get_innovation_ratio(cursor, company_id, period)
+        Ürünler inovasyon bağlantılarıyla tek sorguda okunur; E_post, maliyet ve
+        tasarruflar sütun bazında (NumPy) hesaplanır ve hesaplanan E_post değerleri
+        tek executemany ile yazılır. Maliyet fiyatla doğrusal olduğundan fiyat
+        senaryoları dönem maruziyeti (tCO2) × fiyat vektörüyle aynı geçişte çıkar.
+
+        Args:
+            company_id: Firma ID
+            periods: Yıllar
+            eu_ets_prices: Duyarlılık tablosu için fiyat senaryoları (EUR/tCO2)
+
+        Returns:
+            Dict: {
+                'periods': {period: compute_cbam_savings sonucu},
+                'sensitivity': [{'period', 'eu_ets_price', 'total_cost_baseline_eur',
+                                 'total_cost_post_eur', 'total_saving_eur'}]
+            }
+        """
+        periods = list(dict.fromkeys(int(p) for p in periods))
+        scenario_prices = np.asarray(list(eu_ets_prices or []), dtype=float)
+        result = {'company_id': company_id, 'periods': {}, 'sensitivity': []}
+        if not periods:
+            return result
+
+        conn = db_connect(self.db_path)
+        try:
+            marks = ','.join('?' * len(periods))
+            ets_prices = dict(conn.execute(
+                f"SELECT period, eu_ets_price_eur_per_tco2 FROM cbam_factors WHERE period IN ({marks})",
+                periods
+            ).fetchall())
+            company_ratios = self._get_innovation_ratios(conn, company_id, periods)
+
+            # Fiyatı olmayan dönemlerin ürünleri yalnızca senaryo tablosu için gerekir
+            load_periods = periods if scenario_prices.size else [p for p in periods if ets_prices.get(p)]
+            rows = conn.execute(f"""
+                SELECT p.id, p.period, p.product_code, p.cbam_sector, p.baseline_emission_intensity,
+                       p.post_innovation_emission_intensity, p.trade_volume_tons,
+                       p.domestic_carbon_price_eur_per_tco2,
+                       l.id IS NOT NULL, l.innovation_share_ratio, COALESCE(l.attenuation_factor, 0.6)
+                FROM cbam_products p
+                LEFT JOIN cbam_innovation_links l
+                    ON l.company_id = p.company_id AND l.period = p.period AND l.product_code = p.product_code
+                WHERE p.company_id = ? AND p.period IN ({','.join('?' * len(load_periods))})
+                ORDER BY p.period, p.product_code
+            """, (company_id, *load_periods)).fetchall()
+
+            products = self._product_savings_frame(rows, company_ratios)
+
+            # Hesaplanan E_post değerlerini tek transaction'da kaydet
+            priced = np.isin(products['period'], [p for p in periods if ets_prices.get(p)])
+            if priced.any():
+                stamp = self._product_timestamp_column(conn)
+                conn.executemany(
+                    f"UPDATE cbam_products SET post_innovation_emission_intensity=?"
+                    f"{f', {stamp}=CURRENT_TIMESTAMP' if stamp else ''} WHERE id=?",
+                    zip(products['e_post'][priced].tolist(), products['id'][priced].tolist())
+                )
+                conn.commit()
+        except Exception as e:
+            conn.rollback()
+            log_error(f"CBAM hesaplama hatası: {e}", module='CBAM', company_id=company_id)
+            result['periods'] = {period: {'error': str(e), 'total_saving_eur': 0} for period in periods}
+            return result
+        finally:
+            conn.close()
+
+        for period in periods:
+            mask = products['period'] == period
+            eu_ets_price = ets_prices.get(period) or 0
+            if eu_ets_price == 0:
+                log_error(f"EU ETS fiyatı bulunamadı: {period}", module='CBAM')
+                result['periods'][period] = {'error': 'EU ETS fiyatı tanımlı değil', 'total_saving_eur': 0}
+            else:
+                result['periods'][period] = self._period_result(
+                    products, mask, period, eu_ets_price, company_ratios.get(period, 0)
+                )
+                log_info(f"CBAM tasarruf hesaplandı: {result['periods'][period]['total_saving_eur']:.2f} EUR",
+                         module='CBAM', company_id=company_id)
+
+            # Fiyat duyarlılığı: dönem toplam maruziyeti × senaryo fiyatları
+            if scenario_prices.size:
+                exposure_base = float(products['exposure_base'][mask].sum())
+                exposure_post = float(products['exposure_post'][mask].sum())
+                for price, cost_base, cost_post in zip(scenario_prices.tolist(),
+                                                       (exposure_base * scenario_prices).tolist(),
+                                                       (exposure_post * scenario_prices).tolist()):
+                    result['sensitivity'].append({
+                        'period': period,
+                        'eu_ets_price': price,
+                        'total_cost_baseline_eur': round(cost_base, 2),
+                        'total_cost_post_eur': round(cost_post, 2),
+                        'total_saving_eur': round(cost_base - cost_post, 2)
+                    })
+
+        return result
+
+    @staticmethod
+    def _product_savings_frame(rows, company_ratios: Dict[int, float]) -> Dict[str, np.ndarray]:
+        """
+        Ürün satırlarından sütun dizileri. Bağlantısı olmayan ürünler şirket
+        geneli inovasyon oranını ve 0.6 zayıflatma faktörünü kullanır.
+        """
+        columns = list(zip(*rows)) if rows else [()] * 11
+
+        def floats(values):
+            return np.array([v if v is not None else 0.0 for v in values], dtype=float)
+
+        period = np.array(columns[1], dtype=np.int64)
+        e_base = floats(columns[4])
+        stored_post = np.array([v if v is not None else np.nan for v in columns[5]], dtype=float)
+        volume = floats(columns[6])
+        domestic = floats(columns[7])
+        has_link = np.array(columns[8], dtype=bool)
+        default_ratio = np.array([company_ratios.get(p, 0) for p in columns[1]], dtype=float)
+        link_ratio = np.array([v if v is not None else np.nan for v in columns[9]], dtype=float)
+
+        ratio = np.where(has_link, link_ratio, default_ratio)
+        attenuation = np.where(has_link, floats(columns[10]), 0.6)
+
+        # E_post = E_base × [1 - oran × zayıflatma] (kayıtlı değer yoksa)
+        missing = np.isnan(stored_post) | (stored_post == 0)
+        e_post = np.where(missing, e_base * (1 - ratio * attenuation), stored_post)
 
-                # Ürünleri al
-                cursor.execute("""
-                    SELECT id, product_code, cbam_sector, baseline_emission_intensity,
-                           post_innovation_emission_intensity, trade_volume_tons,
-                           domestic_carbon_price_eur_per_tco2
-                    FROM cbam_products
-                    WHERE company_id=? AND period=?
-                """, (company_id, period))
-
-                products_data = []
-                total_saving = 0
-
-                for row in cursor.fetchall():
-                    product_result = self._calculate_product_saving(
-                        row, eu_ets_price, innovation_ratio, cursor, company_id, period
-                    )
-                    products_data.append(product_result)
-                    total_saving += product_result['saving_eur']
-
-                log_info(f"CBAM tasarruf hesaplandı: {total_saving:.2f} EUR",
-                        module='CBAM', company_id=company_id)
-
-                return {
-                    'total_saving_eur': round(total_saving, 2),
-                    'eu_ets_price': eu_ets_price,
-                    'innovation_ratio': innovation_ratio,
-                    'products': products_data,
-                    'product_count': len(products_data),
-                    'period': period
-                }
-
-            except Exception as e:
-                log_error(f"CBAM hesaplama hatası: {e}", module='CBAM', company_id=company_id)
-                return {'error': str(e), 'total_saving_eur': 0}
-
-    def _calculate_product_saving(self, row, eu_ets_price: float, default_innovation_ratio: float,
-                                  cursor, company_id: int, period: int) -> Dict:
-        """Tek ürün için CBAM tasarrufu"""
-
-        product_id, product_code, sector, e_base, e_post, volume, domestic_price = row
-
-        # Innovation link var mı?
-        cursor.execute("""
-            SELECT innovation_share_ratio, attenuation_factor
-            FROM cbam_innovation_links
-            WHERE company_id=? AND period=? AND product_code=?
-        """, (company_id, period, product_code))
-
-        link = cursor.fetchone()
-
-        if link:
-            innovation_ratio = link[0]
-            attenuation = link[1]
-        else:
-            # Varsayılan: şirket geneli
-            innovation_ratio = default_innovation_ratio
-            attenuation = 0.6
-
-        # E_post hesapla (eğer yoksa)
-        if e_post is None or e_post == 0:
-            e_post = e_base * (1 - innovation_ratio * attenuation)
-
-        # CBAM maliyetleri
-        cbam_cost_baseline = max(e_base - domestic_price, 0) * eu_ets_price * volume
-        cbam_cost_post = max(e_post - domestic_price, 0) * eu_ets_price * volume
-
-        # Tasarruf
-        saving = cbam_cost_baseline - cbam_cost_post
-
-        # Güncelle (hesaplanan e_post'u kaydet)
-        cursor.execute("""
-            UPDATE cbam_products 
-            SET post_innovation_emission_intensity=?, last_updated=CURRENT_TIMESTAMP
-            WHERE id=?
-        """, (e_post, product_id))
+        # Maliyet = fazla × fiyat × hacim; fazla × hacim fiyat başına maruziyettir
+        excess_base = np.maximum(e_base - domestic, 0)
+        excess_post = np.maximum(e_post - domestic, 0)
 
         return {
-            'product_code': product_code,
-            'sector': sector,
-            'e_baseline': round(e_base, 3),
-            'e_post_innovation': round(e_post, 3),
-            'emission_reduction_pct': round((e_base - e_post) / e_base * 100, 2) if e_base > 0 else 0,
-            'trade_volume_tons': volume,
-            'cbam_cost_baseline_eur': round(cbam_cost_baseline, 2),
-            'cbam_cost_post_eur': round(cbam_cost_post, 2),
-            'saving_eur': round(saving, 2),
-            'innovation_ratio': innovation_ratio,
-            'attenuation_factor': attenuation
+            'id': np.array(columns[0], dtype=np.int64),
+            'period': period,
+            'product_code': list(columns[2]),
+            'sector': list(columns[3]),
+            'e_base': e_base,
+            'e_post': e_post,
+            'volume': list(columns[6]),
+            'volume_tons': volume,
+            'ratio': ratio,
+            'attenuation': attenuation,
+            'excess_base': excess_base,
+            'excess_post': excess_post,
+            'exposure_base': excess_base * volume,
+            'exposure_post': excess_post * volume,
         }
 
-    def _get_eu_ets_price(self, cursor, period: int) -> float:
-        """EU ETS fiyatını al"""
-        cursor.execute("""
-            SELECT eu_ets_price_eur_per_tco2 
-            FROM cbam_factors 
-            WHERE period=?
-        """, (period,))
+    @staticmethod
+    def _period_result(products: Dict, mask: np.ndarray, period: int, eu_ets_price: float,
+                       innovation_ratio: float) -> Dict:
+        """Bir dönemin ürün listesi ve toplamı (compute_cbam_savings biçiminde)"""
+        e_base = products['e_base'][mask]
+        e_post = products['e_post'][mask]
+        volume = products['volume_tons'][mask]
+        cost_base = products['excess_base'][mask] * eu_ets_price * volume
+        cost_post = products['excess_post'][mask] * eu_ets_price * volume
+        reduction = np.divide(e_base - e_post, e_base, out=np.zeros_like(e_base), where=e_base > 0) * 100
+        indices = np.flatnonzero(mask).tolist()
+
+        products_data = []
+        for i, base, post, red, c_base, c_post, ratio, attenuation in zip(
+                indices, e_base.tolist(), e_post.tolist(), reduction.tolist(), cost_base.tolist(),
+                cost_post.tolist(), products['ratio'][mask].tolist(), products['attenuation'][mask].tolist()):
+            products_data.append({
+                'product_code': products['product_code'][i],
+                'sector': products['sector'][i],
+                'e_baseline': round(base, 3),
+                'e_post_innovation': round(post, 3),
+                'emission_reduction_pct': round(red, 2) if base > 0 else 0,
+                'trade_volume_tons': products['volume'][i],
+                'cbam_cost_baseline_eur': round(c_base, 2),
+                'cbam_cost_post_eur': round(c_post, 2),
+                'saving_eur': round(c_base - c_post, 2),
+                'innovation_ratio': ratio,
+                'attenuation_factor': attenuation
+            })
+
+        total_saving = sum(p['saving_eur'] for p in products_data)
+        return {
+            'total_saving_eur': round(total_saving, 2),
+            'eu_ets_price': eu_ets_price,
+            'innovation_ratio': innovation_ratio,
+            'products': products_data,
+            'product_count': len(products_data),
+            'period': period
+        }
 
-        row = cursor.fetchone()
-        return row[0] if row else 0
+    @staticmethod
+    def _product_timestamp_column(conn) -> Optional[str]:
+        """cbam_products şema sürümüne göre güncelleme zamanı sütunu"""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(cbam_products)")}
+        for name in ('last_updated', 'updated_at'):
+            if name in columns:
+                return name
+        return None
 
     def _get_innovation_ratio(self, cursor, company_id: int, period: int) -> float:
         """Şirket inovasyon oranını al"""
@@ -168,6 +262,18 @@ class CBAMCalculator:
         except Exception:
             return 0
 
+    def _get_innovation_ratios(self, conn, company_id: int, periods: List[int]) -> Dict[int, float]:
+        """Dönem başına şirket inovasyon oranı (tek sorgu)"""
+        try:
+            rows = conn.execute(f"""
+                SELECT period, sustainability_innovation_ratio
+                FROM innovation_metrics
+                WHERE company_id=? AND period IN ({','.join('?' * len(periods))})
+            """, (company_id, *[str(p) for p in periods])).fetchall()
+        except Exception:
+            return {}
+        return {int(period): (ratio / 100.0) if ratio else 0 for period, ratio in rows}
+
     def save_cbam_product(self, company_id: int, period: int, product_code: str,
                          cbam_sector: str, baseline_emission: float,
                          trade_volume: float, **kwargs) -> int:
@@ -11,6 +11,8 @@ import sys
 from datetime import datetime
 from typing import Dict, List
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class CBAMManager:
@@ -31,7 +33,7 @@ class CBAMManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
             self.db_path = os.path.join(base_dir, 'data', 'sdg_desktop.sqlite')
 
-        self._ensure_schema()
+        ensure_schema(self.db_path, self._ensure_schema)
 
         # CBAM kapsamındaki sektörler
         self.covered_sectors = {
@@ -106,7 +108,7 @@ class CBAMManager:
 
     def _ensure_schema(self) -> None:
         """Veritabanı şemasını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -197,7 +199,7 @@ class CBAMManager:
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def _ensure_cbam_factors_table(self, cursor) -> None:
         cursor.execute(
@@ -584,7 +586,7 @@ class CBAMManager:
     def add_emission_data(self, emission_data: Dict) -> bool:
         """Emisyon verisi ekle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -616,7 +618,7 @@ class CBAMManager:
 
     def get_emissions(self, company_id: int, period: str = None) -> List[Dict]:
         """Emisyon verilerini al"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         query = """
@@ -646,7 +648,7 @@ class CBAMManager:
 
     def get_imports(self, company_id: int, period: str = None) -> List[Dict]:
         """İthalat verilerini al"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         query = """
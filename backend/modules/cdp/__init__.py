@@ -1,5 +1,8 @@
 # CDP (Carbon Disclosure Project) Module
-from .cdp_gui import CDPGUI
+try:
+    from .cdp_gui import CDPGUI
+except ImportError:
+    CDPGUI = None
 from .cdp_manager import CDPManager
 from .cdp_scoring import CDPScoringSystem
 
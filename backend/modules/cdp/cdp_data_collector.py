@@ -9,6 +9,7 @@ import os
 import sqlite3
 from typing import Any, Dict
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class CDPDataCollector:
@@ -22,7 +23,7 @@ class CDPDataCollector:
 
     def collect_climate_data(self, company_id: int, year: int) -> Dict[str, Any]:
         """İklim değişikliği verileri topla"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         data = {
@@ -115,7 +116,7 @@ class CDPDataCollector:
 
     def collect_water_data(self, company_id: int, year: int) -> Dict[str, Any]:
         """Su güvenliği verileri topla"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         data = {
@@ -172,7 +173,7 @@ class CDPDataCollector:
 
     def collect_forests_data(self, company_id: int, year: int) -> Dict[str, Any]:
         """Ormanlar verileri topla"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         data = {
@@ -206,7 +207,7 @@ class CDPDataCollector:
         return data
 
     def collect_company_info(self, company_id: int) -> Dict[str, Any]:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         info: Dict[str, Any] = {}
         try:
@@ -13,6 +13,8 @@ from datetime import datetime
 from typing import Dict, List
 from utils.language_manager import LanguageManager
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class CDPManager:
@@ -24,13 +26,13 @@ class CDPManager:
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
         self.lm = LanguageManager()
-        self._init_cdp_tables()
+        ensure_schema(self.db_path, self._init_cdp_tables)
         self._populate_cdp_questionnaires()
         self._populate_cdp_categories()
 
     def _init_cdp_tables(self) -> None:
         """CDP tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -144,7 +146,7 @@ class CDPManager:
 
     def _populate_cdp_questionnaires(self) -> None:
         """CDP anketlerini JSON dosyasından doldur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         json_path = os.path.join(os.path.dirname(__file__), 'cdp_questions.json')
@@ -198,7 +200,7 @@ class CDPManager:
 
     def get_weighting_scheme(self, company_id: int, reporting_year: int = 2024) -> str:
         """Şirketin puanlama ağırlıklandırma şemasını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             # Check for any existing record first
@@ -217,7 +219,7 @@ class CDPManager:
 
     def update_weighting_scheme(self, company_id: int, scheme: str, reporting_year: int = 2024) -> bool:
         """Puanlama ağırlıklandırma şemasını güncelle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             # Update all scoring records for this year
@@ -244,7 +246,7 @@ class CDPManager:
 
     def update_question_weight(self, questionnaire_type: str, company_id: int, question_id: str, weight: float, reporting_year: int = 2024) -> bool:
         """Soru puanlama ağırlığını güncelle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             table_mapping = {
@@ -277,7 +279,7 @@ class CDPManager:
             return False
             
         # Then reload weights from template (company_id=0)
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             table_mapping = {
@@ -308,7 +310,7 @@ class CDPManager:
 
     def _populate_cdp_categories(self) -> None:
         """CDP kategorilerini doldur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             # Kategori tanımları
@@ -344,7 +346,7 @@ class CDPManager:
 
     def ensure_company_questions(self, company_id: int, reporting_year: int = 2024) -> None:
         """Şirket için soru kayıtlarının oluşturulduğundan emin ol"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -381,7 +383,7 @@ class CDPManager:
         # Ensure questions exist first
         self.ensure_company_questions(company_id, reporting_year)
         
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -457,7 +459,7 @@ class CDPManager:
     def save_response(self, questionnaire_type: str, company_id: int, question_id: str,
                      response: str, evidence: str = "", reporting_year: int = 2024) -> bool:
         """Soru yanıtını kaydet"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -489,7 +491,7 @@ class CDPManager:
     def get_company_responses(self, questionnaire_type: str, company_id: int,
                              reporting_year: int = 2024) -> List[Dict]:
         """Şirket yanıtlarını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -616,7 +618,7 @@ class CDPManager:
     def _save_scoring(self, questionnaire_type: str, company_id: int,
                      reporting_year: int, scores: Dict) -> None:
         """Skorları veritabanına kaydet"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
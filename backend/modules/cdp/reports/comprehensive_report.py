@@ -18,6 +18,10 @@ from docx.shared import Pt, Cm
 from .climate_change_report import ClimateChangeReport
 from .forests_report import ForestsReport
 from .water_security_report import WaterSecurityReport
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 def _add_turkish_paragraph(doc, text: str, style: str | None = None, font_name: str = 'Calibri', font_size: int = 11):
@@ -94,7 +98,7 @@ class ComprehensiveReport:
         """Raporun başına şirket logosunu ekle"""
         try:
             # 1. Veritabanından logo yolunu al
-            conn = sqlite3.connect(self.climate_report.collector.db_path)
+            conn = db_connect(self.climate_report.collector.db_path)
             cursor = conn.cursor()
             cursor.execute("SELECT logo_path FROM company_profiles WHERE company_id = ?", (company_id,))
             result = cursor.fetchone()
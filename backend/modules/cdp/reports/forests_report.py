@@ -17,6 +17,10 @@ from docx.shared import Pt, Cm
 
 from ..ai_analyzer import CDPAIAnalyzer
 from ..cdp_data_collector import CDPDataCollector
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 def _add_turkish_paragraph(doc, text, style=None, font_name='Calibri', font_size=11):
@@ -84,7 +88,7 @@ class ForestsReport:
         """Raporun başına şirket logosunu ekle"""
         try:
             # 1. Veritabanından logo yolunu al
-            conn = sqlite3.connect(self.collector.db_path)
+            conn = db_connect(self.collector.db_path)
             cursor = conn.cursor()
             cursor.execute("SELECT logo_path FROM company_profiles WHERE company_id = ?", (company_id,))
             result = cursor.fetchone()
@@ -17,6 +17,10 @@ import matplotlib.pyplot as plt
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Inches, Pt, Cm
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 matplotlib.use('Agg')
 
@@ -94,7 +98,7 @@ class WaterSecurityReport:
         """Raporun başına şirket logosunu ekle"""
         try:
             # 1. Veritabanından logo yolunu al
-            conn = sqlite3.connect(self.collector.db_path)
+            conn = db_connect(self.collector.db_path)
             cursor = conn.cursor()
             cursor.execute("SELECT logo_path FROM company_profiles WHERE company_id = ?", (company_id,))
             result = cursor.fetchone()
@@ -3,6 +3,14 @@ import logging
 import json
 from datetime import datetime
 from typing import Dict, List, Any, Optional
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 class GenericDataManager:
     """
@@ -12,11 +20,11 @@ class GenericDataManager:
     
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self._ensure_table()
+        ensure_schema(self.db_path, self._ensure_table)
         
     def _ensure_table(self):
         """Genel veri tablosunu oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         # generic_module_data tablosu
@@ -48,7 +56,7 @@ class GenericDataManager:
         
     def add_record(self, company_id: int, module_type: str, data: Dict[str, Any]) -> bool:
         """Yeni kayıt ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
@@ -81,7 +89,7 @@ class GenericDataManager:
             
     def get_records(self, company_id: int, module_type: str, limit: int = 50) -> List[Dict]:
         """Kayıtları getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -103,7 +111,7 @@ class GenericDataManager:
             
     def get_stats(self, company_id: int, module_type: str) -> Dict[str, Any]:
         """Basit istatistikler"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         stats = {
@@ -13,6 +13,8 @@ from typing import Dict, List, Optional, Tuple
 
 from backend.modules.tsrs.tsrs_manager import TSRSManager
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class CompanyManager:
@@ -30,11 +32,11 @@ class CompanyManager:
         self.companies_dir = os.path.join(self.base_dir, "data", "companies")
         os.makedirs(self.companies_dir, exist_ok=True)
 
-        self._ensure_company_tables()
+        ensure_schema(self.db_path, self._ensure_company_tables)
 
     def _ensure_company_tables(self):
         """Sirket tablolarini olustur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -93,7 +95,7 @@ class CompanyManager:
 
     def get_all_companies(self) -> List[Tuple[int, str, bool]]:
         """Tum sirketleri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -113,7 +115,7 @@ class CompanyManager:
 
     def get_company_info(self, company_id: int) -> Optional[Dict]:
         """Sirket bilgilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -135,7 +137,7 @@ class CompanyManager:
 
     def create_company(self, company_data: Dict) -> Optional[int]:
         """Yeni sirket olustur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -223,7 +225,7 @@ class CompanyManager:
                 from modules.issb.issb_manager import ISSBManager
                 ISSBManager(company_db)
                 # ISSB Reporting Status (Main DB)
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cur = conn.cursor()
                 # Check if table exists
                 cur.execute("CREATE TABLE IF NOT EXISTS issb_reporting_status (company_id INTEGER, reporting_period TEXT, status TEXT, PRIMARY KEY(company_id, reporting_period))")
@@ -272,7 +274,7 @@ class CompanyManager:
         # Sirket veritabani
         company_db = os.path.join(company_dir, "company.db")
         if not os.path.exists(company_db):
-            conn = sqlite3.connect(company_db)
+            conn = db_connect(company_db)
             conn.execute("CREATE TABLE IF NOT EXISTS metadata (key TEXT, value TEXT)")
             conn.execute("INSERT INTO metadata VALUES ('created_at', ?)", (datetime.now().isoformat(),))
             conn.commit()
@@ -282,7 +284,7 @@ class CompanyManager:
 
     def update_company(self, company_id: int, company_data: Dict) -> bool:
         """Sirket bilgilerini guncelle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -355,7 +357,7 @@ class CompanyManager:
             logging.info("[UYARI] Varsayilan sirket silinemez!")
             return False
 
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -397,7 +399,7 @@ class CompanyManager:
             logging.info("[UYARI] Varsayilan sirket silinemez!")
             return False
 
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -12,6 +12,8 @@ from typing import Dict, Optional
 
 from PIL import Image
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class CompanyProfileManager:
@@ -27,11 +29,11 @@ class CompanyProfileManager:
         # Logo dizinini oluştur
         os.makedirs(self.logo_dir, exist_ok=True)
 
-        self._init_profile_tables()
+        ensure_schema(self.db_path, self._init_profile_tables)
 
     def _init_profile_tables(self) -> None:
         """Profil tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -104,7 +106,7 @@ class CompanyProfileManager:
                 logging.error(f"[WARNING] Logo yedeklenirken hata: {e}")
 
             # Veritabanını güncelle
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -132,7 +134,7 @@ class CompanyProfileManager:
 
     def get_logo_path(self, company_id: int) -> Optional[str]:
         """Firma logosunun yolunu getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -160,7 +162,7 @@ class CompanyProfileManager:
 
     def get_company_profile(self, company_id: int) -> Dict:
         """Firma profil bilgilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -191,7 +193,7 @@ class CompanyProfileManager:
 
     def update_profile(self, company_id: int, profile_data: Dict) -> bool:
         """Firma profil bilgilerini güncelle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -259,7 +261,7 @@ class CompanyProfileManager:
                 os.remove(logo_path)
 
             # Veritabanından kaldır
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -17,6 +17,7 @@ from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class TSRSReportGenerator:
@@ -29,7 +30,7 @@ class TSRSReportGenerator:
         self.db_path = db_path
 
     def get_company_info(self, company_id: int) -> Dict[str, Any]:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -1,5 +1,8 @@
 # CSRD Compliance Module
 from .csrd_compliance_manager import CSRDComplianceManager
-from .csrd_gui import CSRDGUI
+try:
+    from .csrd_gui import CSRDGUI
+except ImportError:
+    CSRDGUI = None
 
 __all__ = ['CSRDComplianceManager', 'CSRDGUI']
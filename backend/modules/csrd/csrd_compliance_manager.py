@@ -3,17 +3,19 @@ import sqlite3
 import os
 from typing import Dict, List, Optional, Tuple
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 class CSRDComplianceManager:
     """CSRD Compliance Manager"""
     
     def __init__(self, db_path: str = DB_PATH):
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
         
     def _init_db_tables(self):
         """Initialize CSRD tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         try:
             cursor = conn.cursor()
             cursor.execute("""
@@ -50,7 +52,7 @@ class CSRDComplianceManager:
 
     def get_recent_records(self, company_id: int, limit: int = 50) -> List[Dict]:
         """Get recent materiality assessments"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         records = []
         try:
@@ -71,7 +73,7 @@ class CSRDComplianceManager:
     def add_materiality_assessment(self, company_id: int, code: str, name: str, 
                                  impact: int, financial: int, rationale: str) -> bool:
         """Add materiality assessment"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         try:
             cursor = conn.cursor()
             cursor.execute("""
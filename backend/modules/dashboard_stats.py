@@ -1,86 +1,133 @@
 import sqlite3
 import logging
+import threading
+try:
+    from utils.db_pool import connect as db_connect
+    from utils.cache import SimpleCache
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+    from backend.utils.cache import SimpleCache
+
+# Şirket bazlı sonuç cache'i (süreç başına). Veri yazan istekler
+# invalidate_module_stats() ile ilgili şirketin kaydını siler; diğer
+# worker'larda en fazla TTL kadar eski değer görülebilir.
+MODULE_STATS_TTL = 60
+_stats_cache = SimpleCache(ttl=MODULE_STATS_TTL)
+
+# db_path -> (schema_version, sql, keys, params_per_company)
+_query_cache = {}
+_query_lock = threading.Lock()
+
+
+def invalidate_module_stats(company_id=None):
+    """Modül tamamlanma cache'ini sil (company_id None ise tümü)."""
+    if company_id is None:
+        _stats_cache.clear()
+    else:
+        for key in [k for k in list(_stats_cache.cache) if k[1] == company_id]:
+            _stats_cache.delete(key)
+
 
 class DashboardStatsManager:
+    # Mapping: module_key -> (table_name, target_count)
+    # target_count is a heuristic for 100% completion.
+    # If target_count is None, just presence (>0) means 100%.
+    MODULE_CONFIG = {
+        'carbon': ('carbon_emissions', 4),       # Quarterly data?
+        'energy': ('energy_consumption', 4),
+        'waste': ('waste_generation', 4),
+        'water': ('water_consumption', 4),
+        'biodiversity': ('biodiversity_sites', 1),
+
+        'social': ('social_employees', 1),       # Basic HR data
+        'governance': ('board_members', 3),      # At least 3 board members
+        'supply_chain': ('suppliers', 5),        # At least 5 suppliers
+        'economic': ('economic_value_distribution', 1),
+
+        'esg': ('esg_scores', 1),
+        'cbam': ('cbam_reports', 1),
+        'csrd': ('csrd_compliance_checklist', 10), # 10 checklist items?
+        'taxonomy': ('eu_taxonomy_alignment', 1),
+        'gri': ('gri_responses', 10),            # 10 indicators reported
+        'sdg': ('sdg_progress', 1),              # Goals selected/progress
+        'esrs': ('esrs_assessments', 5),
+
+        'prioritization': ('materiality_topics', 5), # Top 5 topics
+        'ifrs': ('issb_reporting_status', 1),
+        'tcfd': ('tcfd_disclosures', 4),         # 4 pillars
+        'tnfd': ('tnfd_disclosures', 4),
+        'cdp': ('cdp_scoring', 1)
+    }
+
     def __init__(self, db_path):
         self.db_path = db_path
 
-    def get_module_stats(self, company_id):
+    def _get_query(self, cursor):
         """
-        Calculates completion percentage for each module.
-        Returns a dictionary {module_key: percentage_int}.
+        Tüm modül sayımlarını tek UNION ALL sorgusunda toplayan SQL.
+        Tablo/kolon bilgisi süreç başına bir kez okunur ve yalnızca
+        `PRAGMA schema_version` değiştiğinde yeniden hesaplanır.
         """
-        stats = {}
-        # Mapping: module_key -> (table_name, target_count)
-        # target_count is a heuristic for 100% completion.
-        # If target_count is None, just presence (>0) means 100%.
-        
-        module_config = {
-            'carbon': ('carbon_emissions', 4),       # Quarterly data?
-            'energy': ('energy_consumption', 4),
-            'waste': ('waste_generation', 4),
-            'water': ('water_consumption', 4),
-            'biodiversity': ('biodiversity_sites', 1),
-            
-            'social': ('social_employees', 1),       # Basic HR data
-            'governance': ('board_members', 3),      # At least 3 board members
-            'supply_chain': ('suppliers', 5),        # At least 5 suppliers
-            'economic': ('economic_value_distribution', 1),
-            
-            'esg': ('esg_scores', 1),
-            'cbam': ('cbam_reports', 1),
-            'csrd': ('csrd_compliance_checklist', 10), # 10 checklist items?
-            'taxonomy': ('eu_taxonomy_alignment', 1),
-            'gri': ('gri_responses', 10),            # 10 indicators reported
-            'sdg': ('sdg_progress', 1),              # Goals selected/progress
-            'esrs': ('esrs_assessments', 5),
-            
-            'prioritization': ('materiality_topics', 5), # Top 5 topics
-            'ifrs': ('issb_reporting_status', 1),
-            'tcfd': ('tcfd_disclosures', 4),         # 4 pillars
-            'tnfd': ('tnfd_disclosures', 4),
-            'cdp': ('cdp_scoring', 1)
-        }
-        
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Check which tables exist to avoid errors
+        schema_version = cursor.execute("PRAGMA schema_version").fetchone()[0]
+        cached = _query_cache.get(self.db_path)
+        if cached and cached[0] == schema_version:
+            return cached
+
+        with _query_lock:
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
             existing_tables = {row[0] for row in cursor.fetchall()}
-            
-            for key, (table, target) in module_config.items():
+
+            parts = []
+            keys = []
+            company_params = 0
+            for key, (table, _target) in self.MODULE_CONFIG.items():
                 if table not in existing_tables:
-                    stats[key] = 0
                     continue
-                    
-                try:
-                    # Try to filter by company_id if possible
-                    # We first check if company_id column exists by selecting 1 row
-                    # Or simpler: try/except the query with company_id
-                    try:
-                        cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE company_id=?", (company_id,))
-                        count = cursor.fetchone()[0]
-                    except sqlite3.OperationalError:
-                        # Column company_id might not exist
-                        cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                        count = cursor.fetchone()[0]
-                    
-                    if target is None:
-                        percentage = 100 if count > 0 else 0
-                    else:
-                        percentage = min(int((count / target) * 100), 100)
-                    
-                    stats[key] = percentage
-                    
-                except Exception as e:
-                    logging.error(f"Error calculating stats for {key} ({table}): {e}")
-                    stats[key] = 0
-            
-            conn.close()
-            
+                columns = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+                if 'company_id' in columns:
+                    parts.append(f"SELECT COUNT(*) FROM {table} WHERE company_id=?")
+                    company_params += 1
+                else:
+                    # company_id kolonu yoksa filtresiz sayım (eski davranış)
+                    parts.append(f"SELECT COUNT(*) FROM {table}")
+                keys.append(key)
+
+            sql = "SELECT " + ", ".join(f"({p})" for p in parts) if parts else None
+            cached = (schema_version, sql, keys, company_params)
+            _query_cache[self.db_path] = cached
+            return cached
+
+    def get_module_stats(self, company_id):
+        """
+        Calculates completion percentage for each module.
+        Returns a dictionary {module_key: percentage_int}.
+        """
+        cache_key = (self.db_path, company_id)
+        stats = _stats_cache.get(cache_key)
+        if stats is not None:
+            return dict(stats)
+
+        stats = {key: 0 for key in self.MODULE_CONFIG}
+        try:
+            conn = db_connect(self.db_path)
+            try:
+                cursor = conn.cursor()
+                _version, sql, keys, company_params = self._get_query(cursor)
+                if sql:
+                    counts = cursor.execute(sql, (company_id,) * company_params).fetchone()
+                    for key, count in zip(keys, counts):
+                        target = self.MODULE_CONFIG[key][1]
+                        if target is None:
+                            stats[key] = 100 if count > 0 else 0
+                        else:
+                            stats[key] = min(int((count / target) * 100), 100)
+            finally:
+                conn.close()
+            _stats_cache.set(cache_key, stats)
+
         except Exception as e:
+            # Şema yarışında (tablo silindi vb.) bir sonraki çağrıda yeniden kurulur
+            _query_cache.pop(self.db_path, None)
             logging.error(f"DashboardStatsManager error: {e}")
-            
-        return stats
+
+        return dict(stats)
@@ -6,13 +6,69 @@ Veri Import Sistemi
 Excel ve CSV formatlarından toplu veri yükleme
 """
 
+import csv
 import json
 import os
 import sqlite3
+from contextlib import closing
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
+import openpyxl
 import pandas as pd
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
+
+from .expression import ExpressionError, compile_expression
+
+# import_data executemany parça büyüklüğü
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+        return True
+    except TypeError:
+        return False
+
+
+def _is_int_like(value: Any) -> bool:
+    """Eski eval yolunda int sonuç üreten girdi: tamsayı veya tamsayı metni"""
+    if isinstance(value, (bool, np.bool_)):
+        return False
+    if isinstance(value, (int, np.integer)):
+        return True
+    return isinstance(value, str) and value.strip().lstrip('+-').isdigit()
+
+
+def _excel_columns(header: tuple) -> List[str]:
+    """Başlık satırını pandas.read_excel ile aynı sütun adlarına çevir"""
+    columns: List[str] = []
+    seen: Dict[str, int] = {}
+    for i, name in enumerate(header):
+        name = f"Unnamed: {i}" if name is None or name == '' else name
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        columns.append(name)
+    return columns
+
+
+def _to_python(value: Any) -> Any:
+    """numpy skalerlerini sqlite3'ün bağlayabileceği Python tiplerine çevir"""
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
 
 
 class DataImporter:
@@ -24,11 +80,11 @@ class DataImporter:
             db_path: Veritabanı yolu
         """
         self.db_path = db_path
-        self._init_database()
+        ensure_schema(self.db_path, self._init_database)
 
     def _init_database(self) -> None:
         """Veritabanı tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Import işlemleri tablosu
@@ -168,8 +224,14 @@ class DataImporter:
                 raise Exception(f"CSV okuma hatası: {e}")
 
     def get_excel_sheets(self, file_path: str) -> List[str]:
-        """Excel dosyasındaki sayfa adlarını al"""
+        """Excel dosyasındaki sayfa adlarını al (sayfa içerikleri okunmaz)"""
         try:
+            if os.path.splitext(file_path)[1].lower() == '.xlsx':
+                workbook = openpyxl.load_workbook(file_path, read_only=True)
+                try:
+                    return list(workbook.sheetnames)
+                finally:
+                    workbook.close()
             excel_file = pd.ExcelFile(file_path)
             return excel_file.sheet_names
         except Exception as e:
@@ -179,6 +241,9 @@ class DataImporter:
         """
         Dosya önizlemesi
         
+        Dosyanın yalnızca ilk `rows` satırı okunur; bellek kullanımı dosya
+        boyutundan bağımsızdır.
+        
         Args:
             file_path: Dosya yolu
             rows: Önizleme satır sayısı
@@ -186,17 +251,116 @@ class DataImporter:
         Returns:
             (DataFrame önizleme, sütun adları)
         """
-        # Dosya tipine göre oku
-        ext = os.path.splitext(file_path)[1].lower()
+        # Üreteç kapatılınca açık CSV okuyucu / çalışma kitabı da kapanır
+        with closing(self.iter_chunks(file_path, chunk_size=max(1, rows))) as chunks:
+            df = next(chunks, None)
+        if df is None:
+            df = pd.DataFrame()
+        return df.head(rows), list(df.columns)
 
-        if ext in ['.xlsx', '.xls']:
-            df = self.read_excel(file_path)
-        elif ext == '.csv':
-            df = self.read_csv(file_path)
+    # ============================================
+    # AKIŞLI (CHUNKED) OKUMA
+    # ============================================
+
+    def iter_chunks(self, file_path: str, chunk_size: int = DEFAULT_BATCH_SIZE,
+                    sheet_name: Optional[str] = None, encoding: str = 'utf-8',
+                    delimiter: str = ',') -> Iterator[pd.DataFrame]:
+        """
+        Dosyayı `chunk_size` satırlık DataFrame parçaları halinde oku.
+        
+        CSV için `read_csv(chunksize=...)`, xlsx için read-only openpyxl satır
+        iterasyonu kullanılır; bellekte aynı anda tek parça tutulur. Parça
+        index'leri dosyadaki veri satırı sırasını (0'dan) korur.
+        
+        Args:
+            file_path: Dosya yolu
+            chunk_size: Parça başına satır sayısı
+            sheet_name: Excel sayfa adı (opsiyonel, ilk sayfa okunur)
+            encoding: CSV karakter kodlaması
+            delimiter: CSV ayırıcı karakteri
+        """
+        ext = os.path.splitext(file_path)[1].lower()
+        chunk_size = max(1, int(chunk_size))
+
+        if ext == '.csv':
+            yield from self._iter_csv_chunks(file_path, chunk_size, encoding, delimiter)
+        elif ext == '.xlsx':
+            yield from self._iter_xlsx_chunks(file_path, chunk_size, sheet_name)
+        elif ext == '.xls':
+            # Eski format akışlı okunamıyor; tamamı okunup parçalanır
+            df = self.read_excel(file_path, sheet_name)
+            for start in range(0, len(df), chunk_size):
+                yield df.iloc[start:start + chunk_size]
         else:
             raise Exception(f"Desteklenmeyen dosya tipi: {ext}")
 
-        return df.head(rows), list(df.columns)
+    def _iter_csv_chunks(self, file_path: str, chunk_size: int,
+                         encoding: str, delimiter: str) -> Iterator[pd.DataFrame]:
+        started = False
+        try:
+            with pd.read_csv(file_path, encoding=encoding, delimiter=delimiter,
+                             chunksize=chunk_size) as reader:
+                for chunk in reader:
+                    started = True
+                    yield chunk
+            return
+        except UnicodeDecodeError as e:
+            if started:
+                raise Exception(f"CSV okuma hatası: {e}")
+        except Exception as e:
+            if started:
+                raise
+            if isinstance(e, pd.errors.EmptyDataError):
+                return
+        # Farklı encoding dene
+        try:
+            with pd.read_csv(file_path, encoding='latin-1', delimiter=delimiter,
+                             chunksize=chunk_size) as reader:
+                yield from reader
+        except pd.errors.EmptyDataError:
+            return
+        except Exception as e:
+            raise Exception(f"CSV okuma hatası: {e}")
+
+    def _iter_xlsx_chunks(self, file_path: str, chunk_size: int,
+                          sheet_name: Optional[str]) -> Iterator[pd.DataFrame]:
+        try:
+            workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        except Exception as e:
+            raise Exception(f"Excel okuma hatası: {e}")
+
+        try:
+            worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+            rows = worksheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = _excel_columns(header)
+            width = len(columns)
+
+            buffer: List[tuple] = []
+            pending_blank = 0
+            position = 0
+            for row in rows:
+                row = tuple(row[:width]) + (None,) * (width - len(row))
+                if all(v is None or v == '' for v in row):
+                    # Boş satırlar yalnızca arkasından veri gelirse tutulur (pandas gibi)
+                    pending_blank += 1
+                    continue
+                for _ in range(pending_blank):
+                    buffer.append((None,) * width)
+                pending_blank = 0
+                buffer.append(row)
+                if len(buffer) >= chunk_size:
+                    yield pd.DataFrame(buffer, columns=columns,
+                                       index=range(position, position + len(buffer)))
+                    position += len(buffer)
+                    buffer = []
+            if buffer:
+                yield pd.DataFrame(buffer, columns=columns,
+                                   index=range(position, position + len(buffer)))
+        finally:
+            workbook.close()
 
     def _normalize_record(self, rec: Dict[str, Any]) -> Dict[str, Any]:
         out = {}
@@ -244,19 +408,26 @@ class DataImporter:
                 out_path = file_path.replace('.json', '_normalized.json')
                 with open(out_path, 'w', encoding='utf-8') as f:
                     json.dump(rows, f, ensure_ascii=False, indent=2)
-            elif ext in ['.csv']:
-                df = self.read_csv(file_path)
-                for _, row in df.iterrows():
-                    rec = {k: (None if pd.isna(v) else v) for k, v in row.to_dict().items()}
-                    nrec = self._normalize_record(rec)
-                    ok, msg = self._validate_record(nrec)
-                    if not ok:
-                        errors.append(msg)
-                    rows.append(nrec)
-                import pandas as pd
-                ndf = pd.DataFrame(rows)
-                out_path = file_path.replace('.csv', '_normalized.csv')
-                ndf.to_csv(out_path, index=False, encoding='utf-8-sig')
+            elif ext in ['.csv', '.xlsx', '.xls']:
+                # Parça parça oku ve normalize edilmiş CSV'ye ekleyerek yaz
+                out_path = os.path.splitext(file_path)[0] + '_normalized.csv'
+                count = 0
+                first = True
+                for df in self.iter_chunks(file_path):
+                    chunk_rows = []
+                    for rec in df.astype(object).where(df.notna(), None).to_dict('records'):
+                        nrec = self._normalize_record(rec)
+                        ok, msg = self._validate_record(nrec)
+                        if not ok:
+                            errors.append(msg)
+                        chunk_rows.append(nrec)
+                    pd.DataFrame(chunk_rows).to_csv(out_path, index=False, mode='w' if first else 'a',
+                                                    header=first, encoding='utf-8-sig' if first else 'utf-8')
+                    first = False
+                    count += len(chunk_rows)
+                if first:
+                    pd.DataFrame().to_csv(out_path, index=False, encoding='utf-8-sig')
+                return {'ok': True, 'count': count, 'errors': errors}
             else:
                 return {'ok': False, 'error': 'Desteklenmeyen format'}
             return {'ok': True, 'count': len(rows), 'errors': errors}
@@ -286,10 +457,18 @@ class DataImporter:
                    target_table: str,
                    transformation_rules: Optional[Dict[str, Any]] = None,
                    validate_fn: Optional[callable] = None,
-                   imported_by: Optional[int] = None) -> Dict:
+                   imported_by: Optional[int] = None,
+                   batch_size: int = DEFAULT_BATCH_SIZE,
+                   progress_callback: Optional[Callable[[int, int], None]] = None,
+                   sheet_name: Optional[str] = None) -> Dict:
         """
         Veriyi import et
         
+        Dönüşümler sütun bazında (pandas) uygulanır, satırlar `batch_size`
+        büyüklüğündeki parçalar halinde tek bir transaction içinde
+        `executemany` ile yazılır. Hatalı bir parça geri alınıp satır satır
+        yeniden denenir; böylece yalnızca hatalı satırlar düşer.
+        
         Args:
             company_id: Şirket ID
             file_path: Dosya yolu
@@ -299,6 +478,10 @@ class DataImporter:
             transformation_rules: Dönüşüm kuralları
             validate_fn: Validasyon fonksiyonu
             imported_by: Import eden kullanıcı ID
+            batch_size: executemany parça büyüklüğü
+            progress_callback: Her parçadan sonra (işlenen_satır, tahmini_toplam) ile
+                çağrılır; toplam bilinmiyorsa (.xls) None gelir
+            sheet_name: Excel sayfa adı (opsiyonel, ilk sayfa okunur)
         
         Returns:
             {
@@ -318,81 +501,52 @@ class DataImporter:
         )
 
         try:
-            # Dosyayı oku
-            ext = os.path.splitext(file_path)[1].lower()
-            if ext in ['.xlsx', '.xls']:
-                df = self.read_excel(file_path)
-            elif ext == '.csv':
-                df = self.read_csv(file_path)
-            else:
-                raise Exception(f"Desteklenmeyen dosya tipi: {ext}")
-
-            total_rows = len(df)
-            successful_rows = 0
-            failed_rows = 0
-            errors = []
-
-            # Her satırı işle
-            for index, row in df.iterrows():
+            # Dosyayı parça parça oku (bellek kullanımı dosya boyutundan bağımsız)
+            chunks = self.iter_chunks(file_path, chunk_size=batch_size, sheet_name=sheet_name)
+            estimated_total = self._estimate_row_count(file_path, sheet_name)
+            state = {'successful': 0, 'failed': 0, 'errors': [], 'error_rows': []}
+            total_rows = 0
+
+            conn = db_connect(self.db_path)
+            conn.isolation_level = None  # BEGIN/SAVEPOINT elle yönetilir
+            try:
+                conn.execute("BEGIN IMMEDIATE")
                 try:
-                    # Sütunları eşleştir
-                    mapped_data = {}
-                    for excel_col, db_col in column_mapping.items():
-                        if excel_col in row:
-                            value = row[excel_col]
-
-                            # NaN kontrolü
-                            if pd.isna(value):
-                                value = None
-
-                            # Dönüşüm kuralları uygula
-                            if transformation_rules and db_col in transformation_rules:
-                                value = self._apply_transformation(value, transformation_rules[db_col])
-
-                            mapped_data[db_col] = value
-
-                    # Company ID ekle
-                    mapped_data['company_id'] = company_id
-
-                    # Validasyon
-                    if validate_fn:
-                        is_valid, error_msg = validate_fn(mapped_data, index + 2)  # +2 for header and 1-based index
-                        if not is_valid:
-                            raise ValueError(error_msg)
-
-                    # Veritabanına kaydet
-                    self._insert_row(target_table, mapped_data)
-                    successful_rows += 1
-
-                except Exception as e:
-                    failed_rows += 1
-                    error_msg = str(e)
-                    errors.append(f"Satır {index + 2}: {error_msg}")
-
-                    # Hata kaydı
-                    self._log_import_error(
-                        import_id=import_id,
-                        row_number=index + 2,
-                        error_type='import_error',
-                        error_message=error_msg,
-                        row_data=json.dumps(row.to_dict(), default=str, ensure_ascii=False)
-                    )
+                    for chunk in chunks:
+                        self._import_chunk(conn, chunk, company_id, column_mapping, target_table,
+                                           transformation_rules, validate_fn, state)
+                        total_rows += len(chunk)
+                        if progress_callback:
+                            progress_callback(total_rows, estimated_total)
+
+                    if state['error_rows']:
+                        conn.executemany("""
+                            INSERT INTO import_errors 
+                            (import_id, row_number, error_type, error_message, row_data, created_at)
+                            VALUES (?, ?, ?, ?, ?, ?)
+                        """, [(import_id,) + row for row in state['error_rows']])
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            finally:
+                conn.close()
 
             # Import kaydını güncelle
             self._update_import_record(
                 import_id=import_id,
-                status='completed' if failed_rows == 0 else 'completed_with_errors',
+                status='completed' if state['failed'] == 0 else 'completed_with_errors',
                 total_rows=total_rows,
-                successful_rows=successful_rows,
-                failed_rows=failed_rows
+                successful_rows=state['successful'],
+                failed_rows=state['failed']
             )
 
             return {
                 'import_id': import_id,
                 'total_rows': total_rows,
-                'successful': successful_rows,
-                'failed': failed_rows,
-                'errors': errors
+                'successful': state['successful'],
+                'failed': state['failed'],
+                'errors': state['errors']
             }
 
         except Exception as e:
@@ -405,6 +559,188 @@ class DataImporter:
 
             raise Exception(f"Import hatası: {e}")
 
+    def _estimate_row_count(self, file_path: str, sheet_name: Optional[str] = None,
+                            encoding: str = 'utf-8', delimiter: str = ',') -> Optional[int]:
+        """
+        İlerleme için toplam veri satırı: xlsx'te içe aktarılan sayfanın boyutu,
+        CSV'de kayıt sayımı (.xls ve okunamayan dosyalar: None)
+        """
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == '.csv':
+            return self._count_csv_rows(file_path, encoding, delimiter)
+        if ext != '.xlsx':
+            return None
+        try:
+            workbook = openpyxl.load_workbook(file_path, read_only=True)
+            try:
+                worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+                max_row = worksheet.max_row
+            finally:
+                workbook.close()
+            return max(0, max_row - 1) if max_row else None
+        except Exception:
+            return None
+
+    def _count_csv_rows(self, file_path: str, encoding: str, delimiter: str) -> Optional[int]:
+        """
+        Başlık hariç CSV kayıt sayısı. csv modülüyle tek geçiş yapılır; tırnak
+        içindeki satır sonları ve boş satırlar read_csv ile aynı sayılır.
+        """
+        for enc in (encoding, 'latin-1'):
+            try:
+                with open(file_path, newline='', encoding=enc) as f:
+                    records = sum(1 for row in csv.reader(f, delimiter=delimiter) if row)
+                return max(0, records - 1)
+            except UnicodeDecodeError:
+                continue
+            except (OSError, csv.Error):
+                return None
+        return None
+
+    def _import_chunk(self, conn: sqlite3.Connection, chunk: pd.DataFrame, company_id: int,
+                      column_mapping: Dict[str, str], target_table: str,
+                      transformation_rules: Optional[Dict[str, Any]],
+                      validate_fn: Optional[callable], state: Dict) -> None:
+        """Bir DataFrame parçasını dönüştür, doğrula ve SAVEPOINT içinde yaz"""
+        mapped = self._map_columns(chunk, column_mapping, transformation_rules)
+        mapped['company_id'] = company_id
+        validate_columns = list(mapped.columns)
+        # Ekleme tarihini ekle
+        if 'created_at' not in mapped.columns:
+            mapped['created_at'] = datetime.now().isoformat()
+
+        columns = list(mapped.columns)
+        query = (f"INSERT INTO {target_table} ({', '.join(columns)}) "
+                 f"VALUES ({', '.join(['?'] * len(columns))})")
+        records = [[_to_python(v) for v in row] for row in mapped.itertuples(index=False, name=None)]
+
+        rows = []
+        for index, values in zip(chunk.index, records):
+            if validate_fn:
+                try:
+                    row_data = dict(zip(validate_columns, values))
+                    is_valid, error_msg = validate_fn(row_data, index + 2)  # +2 for header and 1-based index
+                    if not is_valid:
+                        raise ValueError(error_msg)
+                except Exception as e:
+                    self._record_row_error(chunk, index, str(e), state)
+                    continue
+            rows.append((index, values))
+
+        if not rows:
+            return
+
+        conn.execute("SAVEPOINT import_chunk")
+        try:
+            conn.executemany(query, [values for _index, values in rows])
+            conn.execute("RELEASE import_chunk")
+            state['successful'] += len(rows)
+            return
+        except sqlite3.Error:
+            conn.execute("ROLLBACK TO import_chunk")
+            conn.execute("RELEASE import_chunk")
+
+        # Parça hatalı: hatalı satırları ayırmak için tek tek dene
+        for index, values in rows:
+            try:
+                conn.execute(query, values)
+                state['successful'] += 1
+            except sqlite3.Error as e:
+                self._record_row_error(chunk, index, str(e), state)
+
+    def _record_row_error(self, chunk: pd.DataFrame, index: Any, error_msg: str, state: Dict) -> None:
+        state['failed'] += 1
+        state['errors'].append(f"Satır {index + 2}: {error_msg}")
+        # Hata kaydı (transaction sonunda toplu yazılır)
+        state['error_rows'].append((
+            index + 2,
+            'import_error',
+            error_msg,
+            json.dumps(chunk.loc[index].to_dict(), default=str, ensure_ascii=False),
+            datetime.now().isoformat()
+        ))
+
+    def _map_columns(self, df: pd.DataFrame, column_mapping: Dict[str, str],
+                     transformation_rules: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """Sütunları eşleştir ve dönüşüm kurallarını sütun bazında uygula"""
+        mapped = {}
+        for excel_col, db_col in column_mapping.items():
+            if excel_col in df.columns:
+                # NaN -> None
+                series = df[excel_col].astype(object).where(df[excel_col].notna(), None)
+
+                # Dönüşüm kuralları uygula
+                if transformation_rules and db_col in transformation_rules:
+                    series = self._transform_series(series, transformation_rules[db_col])
+
+                mapped[db_col] = series
+        return pd.DataFrame(mapped, index=df.index)
+
+    def _transform_series(self, series: pd.Series, rules: Dict) -> pd.Series:
+        """
+        `_apply_transformation` kurallarının vektörel karşılığı. Vektörel
+        dönüşümün çözemediği değerler satır bazlı yola düşer; sonuç satır
+        bazlı uygulamayla aynıdır.
+        """
+        present = series.notna()
+        series = series.astype(object)
+
+        # Tip dönüşümü
+        target_type = rules.get('type')
+        if target_type in ('int', 'float'):
+            numbers = pd.to_numeric(series, errors='coerce')
+            ok = numbers.notna() & present
+            if target_type == 'int':
+                converted = [int(v) for v in np.trunc(numbers[ok].to_numpy(dtype=float))]
+            else:
+                converted = numbers[ok].astype(float).tolist()
+            series[ok] = pd.Series(converted, index=series.index[ok], dtype=object)
+            series = self._fallback_transform(series, present & ~ok, {'type': target_type})
+        elif target_type in ('date', 'datetime'):
+            dates = pd.to_datetime(series, errors='coerce', format='mixed')
+            ok = dates.notna() & present
+            fmt = '%Y-%m-%d' if target_type == 'date' else '%Y-%m-%d %H:%M:%S'
+            series[ok] = dates[ok].dt.strftime(fmt).astype(object)
+            series = self._fallback_transform(series, present & ~ok, {'type': target_type})
+        elif target_type == 'str':
+            series[present] = series[present].map(str)
+
+        # Değer eşleştirme
+        if 'mapping' in rules:
+            value_map = rules['mapping']
+            series[present] = series[present].map(lambda v: value_map.get(v, v) if _hashable(v) else v)
+
+        # Formül
+        if 'formula' in rules:
+            try:
+                expression = compile_expression(rules['formula'])
+            except ExpressionError as e:
+                logging.error(f"Silent error caught: {str(e)}")
+            else:
+                numbers = pd.to_numeric(series, errors='coerce')
+                candidates = numbers.notna() & present
+                if candidates.any():
+                    results = expression.evaluate_array(numbers[candidates].to_numpy(dtype=float))
+                    finite = np.isfinite(results)
+                    targets = series.index[candidates][finite]
+                    values = results[finite].tolist()
+                    if expression.preserves_int:
+                        # Tamsayı girdiler tamsayı sonuç verir (eski eval davranışı)
+                        int_like = series[targets].map(_is_int_like).to_numpy(dtype=bool)
+                        values = [int(v) if keep else v for v, keep in zip(values, int_like)]
+                    series[targets] = pd.Series(values, index=targets, dtype=object)
+
+        # Varsayılan değer
+        if 'default' in rules:
+            series[present & series.isna()] = rules['default']
+
+        return series
+
+    def _fallback_transform(self, series: pd.Series, mask: pd.Series, rules: Dict) -> pd.Series:
+        if mask.any():
+            series[mask] = series[mask].map(lambda v: self._apply_transformation(v, rules))
+        return series
+
     def _apply_transformation(self, value: Any, rules: Dict) -> Any:
         """Dönüşüm kurallarını uygula"""
         if value is None:
@@ -435,7 +771,10 @@ class DataImporter:
         if 'formula' in rules:
             # Basit formül desteği (örn: value * 100)
             try:
-                value = eval(rules['formula'].replace('value', str(value)))
+                expression = compile_expression(rules['formula'])
+                result = expression.evaluate(float(value))
+                if np.isfinite(result):
+                    value = int(result) if expression.preserves_int and _is_int_like(value) else float(result)
             except Exception as e:
                 logging.error(f"Silent error caught: {str(e)}")
 
@@ -447,7 +786,7 @@ class DataImporter:
 
     def _insert_row(self, table: str, data: Dict) -> None:
         """Veritabanına satır ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Ekleme tarihini ekle
@@ -466,7 +805,7 @@ class DataImporter:
     def _create_import_record(self, company_id: int, file_path: str,
                              import_type: str, imported_by: Optional[int]) -> int:
         """Import kaydı oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -492,7 +831,7 @@ class DataImporter:
                              total_rows: int = 0, successful_rows: int = 0,
                              failed_rows: int = 0, error_log: str = None) -> None:
         """Import kaydını güncelle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -517,7 +856,7 @@ class DataImporter:
                          error_type: str, error_message: str,
                          row_data: str) -> None:
         """Import hatasını kaydet"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -556,7 +895,7 @@ class DataImporter:
             Başarılı ise True
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -583,7 +922,7 @@ class DataImporter:
     def get_mapping(self, mapping_name: str) -> Optional[Dict]:
         """Kaydedilmiş mapping'i al"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -610,7 +949,7 @@ class DataImporter:
     def list_mappings(self, import_type: Optional[str] = None) -> List[Dict]:
         """Mapping'leri listele"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             if import_type:
@@ -649,7 +988,7 @@ class DataImporter:
     def get_import_history(self, company_id: int, limit: int = 50) -> List[Dict]:
         """Import geçmişini al"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -685,7 +1024,7 @@ class DataImporter:
     def get_import_errors(self, import_id: int) -> List[Dict]:
         """Import hatalarını al"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Güvenli Formül Değerlendirici
+Import dönüşüm kurallarındaki `formula` ifadeleri (örn. "value * 100")
+için `eval()` yerine kullanılır.
+
+İfade bir kez AST'ye çevrilip doğrulanır; yalnızca sayılar, `value`
+değişkeni, aritmetik operatörler ve birkaç güvenli fonksiyon kabul edilir.
+Derlenen ifade hem tek bir değerle hem de numpy dizisi / pandas Series ile
+(sütun bazında, vektörel) çalıştırılabilir.
+
+Sabitler float olarak hesaplanır ve üs yalnızca |üs| <= MAX_EXPONENT olan bir
+sayı sabiti olabilir; böylece `9**9**9` gibi ifadeler büyük tamsayı hesabıyla
+worker'ı kilitleyemez. Tamsayı girdiyle tamsayı sonuç veren ifadeler
+(`preserves_int`) için çağıran taraf eski `eval` davranışındaki int tipini korur.
+"""
+
+import ast
+import operator
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+MAX_EXPONENT = 10
+
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+_FUNCTIONS = {
+    'abs': np.abs,
+    'round': np.round,
+    'min': np.minimum,
+    'max': np.maximum,
+}
+
+
+class ExpressionError(ValueError):
+    """Formül derlenemedi veya izin verilmeyen öğe içeriyor"""
+
+
+class SafeExpression:
+    """Derlenmiş, yan etkisiz aritmetik ifade"""
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        try:
+            tree = ast.parse(source.strip(), mode='eval')
+        except SyntaxError as e:
+            raise ExpressionError(f"Geçersiz formül: {source}") from e
+        # Python eval'deki gibi int girdiyle int sonuç üretir mi (bölme, float sabit, negatif üs yok)
+        self.preserves_int = True
+        self._validate(tree.body)
+        self._body = tree.body
+
+    def _validate(self, node: ast.AST) -> None:
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+                raise ExpressionError(f"Formülde yalnızca sayı kullanılabilir: {self.source}")
+            if isinstance(node.value, float):
+                self.preserves_int = False
+        elif isinstance(node, ast.Name):
+            if node.id != 'value':
+                raise ExpressionError(f"Bilinmeyen değişken '{node.id}': {self.source}")
+        elif isinstance(node, ast.BinOp):
+            if type(node.op) not in _BIN_OPS:
+                raise ExpressionError(f"İzin verilmeyen operatör: {self.source}")
+            if isinstance(node.op, ast.Div):
+                self.preserves_int = False
+            if isinstance(node.op, ast.Pow) and self._exponent(node.right) < 0:
+                self.preserves_int = False
+            self._validate(node.left)
+            self._validate(node.right)
+        elif isinstance(node, ast.UnaryOp):
+            if type(node.op) not in _UNARY_OPS:
+                raise ExpressionError(f"İzin verilmeyen operatör: {self.source}")
+            self._validate(node.operand)
+        elif isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in _FUNCTIONS or node.keywords:
+                raise ExpressionError(f"İzin verilmeyen fonksiyon: {self.source}")
+            for arg in node.args:
+                self._validate(arg)
+        else:
+            raise ExpressionError(f"İzin verilmeyen ifade: {self.source}")
+
+    def _exponent(self, node: ast.AST) -> float:
+        """Üs yalnızca küçük bir sayı sabiti olabilir (isteğe bağlı işaretli)"""
+        sign = 1
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+            sign = -1 if isinstance(node.op, ast.USub) else 1
+            node = node.operand
+        if (not isinstance(node, ast.Constant) or isinstance(node.value, bool)
+                or not isinstance(node.value, (int, float)) or abs(node.value) > MAX_EXPONENT):
+            raise ExpressionError(f"Üs en fazla {MAX_EXPONENT} olan bir sayı olmalı: {self.source}")
+        return sign * node.value
+
+    def _eval(self, node: ast.AST, value: Any) -> Any:
+        if isinstance(node, ast.Constant):
+            return float(node.value)
+        if isinstance(node, ast.Name):
+            return value
+        if isinstance(node, ast.BinOp):
+            return _BIN_OPS[type(node.op)](self._eval(node.left, value), self._eval(node.right, value))
+        if isinstance(node, ast.UnaryOp):
+            return _UNARY_OPS[type(node.op)](self._eval(node.operand, value))
+        func = _FUNCTIONS[node.func.id]
+        args = [self._eval(arg, value) for arg in node.args]
+        if func is np.round and len(args) == 2:
+            return np.round(args[0], int(args[1]))
+        return func(*args)
+
+    def evaluate(self, value: Any) -> Any:
+        """Tek değer veya numpy dizisi için ifadeyi hesapla"""
+        return self._eval(self._body, value)
+
+    def evaluate_array(self, values: np.ndarray) -> np.ndarray:
+        """
+        Float dizisi üzerinde vektörel hesaplama. Sıfıra bölme vb. durumlarda
+        hata yerine inf/NaN üretir; çağıran taraf sonlu olmayanları eler.
+        """
+        with np.errstate(all='ignore'):
+            result = self._eval(self._body, values.astype(float))
+        return np.broadcast_to(np.asarray(result, dtype=float), values.shape)
+
+
+@lru_cache(maxsize=256)
+def compile_expression(source: str) -> SafeExpression:
+    """Aynı formül her satırda/sütunda yeniden çözülmesin diye önbellekli derleme"""
+    return SafeExpression(source)
@@ -13,6 +13,14 @@ import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 @dataclass
@@ -46,12 +54,12 @@ class AdvancedDashboard:
         self.db_path = db_path or 'data/sdg_desktop.db'
         self.widgets = {}
         self.data_sources = {}
-        self._create_tables()
+        ensure_schema(self.db_path, self._create_tables)
 
     def _create_tables(self):
         """Dashboard tablolarını oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Dashboard widget'ları
@@ -146,7 +154,7 @@ class AdvancedDashboard:
         try:
             source_id = f"source_{company_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -173,7 +181,7 @@ class AdvancedDashboard:
         try:
             widget_id = f"widget_{company_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -224,7 +232,7 @@ class AdvancedDashboard:
     def _get_widgets(self, company_id: int) -> List[Dict[str, Any]]:
         """Widget'ları getir"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -254,7 +262,7 @@ class AdvancedDashboard:
     def _get_data_sources(self, company_id: int) -> List[Dict[str, Any]]:
         """Veri kaynaklarını getir"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -283,7 +291,7 @@ class AdvancedDashboard:
     def _get_kpis(self, company_id: int) -> List[Dict[str, Any]]:
         """KPI'ları getir"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -402,7 +410,7 @@ class AdvancedDashboard:
         try:
             kpi_id = f"kpi_{company_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -454,7 +462,7 @@ class AdvancedDashboard:
     def _get_kpi_definition(self, kpi_id: str) -> Optional[Dict[str, Any]]:
         """KPI tanımını al"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -481,7 +489,7 @@ class AdvancedDashboard:
     def _save_kpi_value(self, kpi_id: str, company_id: int, period: str, value: float):
         """KPI değerini kaydet"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             value_id = f"value_{kpi_id}_{period}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
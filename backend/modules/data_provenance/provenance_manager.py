@@ -11,6 +11,8 @@ import os
 import sqlite3
 from typing import Dict, List
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class DataProvenanceManager:
@@ -55,11 +57,11 @@ class DataProvenanceManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_provenance_tables()
+        ensure_schema(self.db_path, self._init_provenance_tables)
 
     def _init_provenance_tables(self) -> None:
         """Data provenance tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -215,7 +217,7 @@ class DataProvenanceManager:
             source_type: "manual_entry", "excel_import", "api_integration", vb.
             source_name: Kaynak adı (örn: "Fatura No: 12345", "Sensör ID: S001")
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -260,7 +262,7 @@ class DataProvenanceManager:
             frequency: Toplama sıklığı (günlük, aylık, vb.)
             confidence: Güven seviyesi (0.0-1.0)
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -300,7 +302,7 @@ class DataProvenanceManager:
             justification: Gerekçe
             impact: "low", "medium", "high"
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -338,7 +340,7 @@ class DataProvenanceManager:
             steps: Hesaplama adımları
             result: Sonuç değeri
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -380,7 +382,7 @@ class DataProvenanceManager:
             backup_owner_id: Yedek veri sahibi (user ID)
             responsibilities: Sorumluluklar
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -424,7 +426,7 @@ class DataProvenanceManager:
             change_type: "insert", "update", "delete"
             reason: Değişiklik nedeni
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -449,7 +451,7 @@ class DataProvenanceManager:
 
     def get_change_history(self, table_name: str, record_id: int) -> List[Dict]:
         """Bir kaydın değişiklik geçmişini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -494,7 +496,7 @@ class DataProvenanceManager:
             method: Doğrulama yöntemi
             result: "approved", "rejected", "conditional"
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -531,7 +533,7 @@ class DataProvenanceManager:
 
     def get_data_provenance_report(self, data_source_id: int) -> Dict:
         """Bir veri için tam provenance raporu"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -17,6 +17,21 @@ from datetime import datetime
 from typing import Dict, List, Tuple
 
 import schedule
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
+
+try:
+    from modules.database.incremental_backup import (BackupChainError, ChunkStore, file_sha256,
+                                                     snapshot_database)
+except ImportError:
+    from backend.modules.database.incremental_backup import (BackupChainError, ChunkStore, file_sha256,
+                                                             snapshot_database)
 
 try:
     from backend.modules.integration.cloud_storage_manager import CloudStorageManager
@@ -42,7 +57,10 @@ class BackupRecoveryManager:
         
         os.makedirs(backup_dir, exist_ok=True)
         self._init_backup_config()
-        self._init_backup_tables()
+        ensure_schema(self.db_path, self._init_backup_tables)
+
+        # Artımlı (parça tabanlı) yedek deposu
+        self.chunk_store = ChunkStore(os.path.join(backup_dir, 'incremental'))
         
         # Cloud Storage Init
         self.cloud_manager = CloudStorageManager() if CloudStorageManager else None
@@ -56,6 +74,8 @@ class BackupRecoveryManager:
             'max_backups': 30,  # En fazla 30 yedek sakla
             'compress_backups': True,
             'include_files': True,  # Dosyaları da yedekle
+            'incremental_max_chain': 24,  # Bu kadar artımlıdan sonra yeni full zincir
+            'max_backup_chains': 7,  # Saklanacak artımlı zincir sayısı
             'last_backup': None
         }
         
@@ -65,7 +85,7 @@ class BackupRecoveryManager:
     
     def _init_backup_tables(self) -> None:
         """Yedekleme log tablosu"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
@@ -80,9 +100,14 @@ class BackupRecoveryManager:
                     status TEXT DEFAULT 'completed',
                     error_message TEXT,
                     created_by TEXT,
+                    checksum TEXT,
                     created_at TEXT DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+
+            cursor.execute("PRAGMA table_info(backup_history)")
+            if 'checksum' not in [info[1] for info in cursor.fetchall()]:
+                cursor.execute("ALTER TABLE backup_history ADD COLUMN checksum TEXT")
             
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS recovery_history (
@@ -114,7 +139,7 @@ class BackupRecoveryManager:
         Yedekleme oluştur
         
         Args:
-            backup_type: 'full', 'database_only', 'files_only'
+            backup_type: 'full', 'database_only', 'files_only', 'incremental'
             created_by: Kim oluşturdu
             include_files: Dosyaları dahil et
             upload_to_cloud: Cloud'a yükle (varsayılan True)
@@ -122,6 +147,9 @@ class BackupRecoveryManager:
         Returns:
             Tuple[bool, str]: (Başarı, backup dosya yolu veya hata mesajı)
         """
+        if backup_type == 'incremental':
+            return self.create_incremental_backup(created_by=created_by, upload_to_cloud=upload_to_cloud)
+
         try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             backup_name = f"backup_{backup_type}_{timestamp}"
@@ -130,10 +158,16 @@ class BackupRecoveryManager:
             # Zip dosyası oluştur
             with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
                 
-                # Veritabanını yedekle
+                # Veritabanını yedekle (canlı dosya yerine online backup API ile tutarlı kopya)
                 if backup_type in ['full', 'database_only']:
                     if os.path.exists(self.db_path):
-                        zipf.write(self.db_path, 'database/sdg_desktop.sqlite')
+                        snapshot_path = os.path.join(self.backup_dir, f"{backup_name}.sqlite.tmp")
+                        try:
+                            snapshot_database(self.db_path, snapshot_path)
+                            zipf.write(snapshot_path, 'database/sdg_desktop.sqlite')
+                        finally:
+                            if os.path.exists(snapshot_path):
+                                os.remove(snapshot_path)
                         logging.info("[OK] Veritabanı yedeklendi")
                 
                 # Dosyaları yedekle
@@ -146,9 +180,9 @@ class BackupRecoveryManager:
             # Dosya boyutu
             backup_size = os.path.getsize(backup_path)
             
-            # Log kaydet
+            # Log kaydet (doğrulama için SHA-256 ile)
             self._log_backup(backup_name, backup_type, backup_size, backup_path, 
-                           'completed', created_by=created_by)
+                           'completed', created_by=created_by, checksum=file_sha256(backup_path))
             
             # Cloud Upload
             if upload_to_cloud and self.cloud_manager:
@@ -178,6 +212,59 @@ class BackupRecoveryManager:
             
             return False, error_msg
     
+    def create_incremental_backup(self, created_by: str = 'system', upload_to_cloud: bool = True,
+                                  full: bool = False) -> Tuple[bool, str]:
+        """
+        Veritabanının artımlı yedeği (yalnızca değişen parçalar yazılır).
+        Zincir `incremental_max_chain` uzunluğuna ulaşınca veya full=True
+        verilirse yeni bir full manifest başlatılır.
+
+        Returns:
+            Tuple[bool, str]: (Başarı, manifest yolu veya hata mesajı)
+        """
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        backup_name = f"backup_incremental_{timestamp}"
+        suffix = 1
+        while os.path.exists(self.chunk_store.manifest_path(backup_name)):
+            backup_name = f"backup_incremental_{timestamp}_{suffix}"
+            suffix += 1
+
+        try:
+            config = self.get_backup_config()
+            manifest = self.chunk_store.create(self.db_path, backup_name, full=full,
+                                               max_chain=config.get('incremental_max_chain', 24))
+            manifest_path = manifest['manifest_path']
+            backup_kind = 'incremental' if manifest['kind'] == 'incremental' else 'incremental_full'
+
+            self._log_backup(backup_name, backup_kind, manifest['new_bytes'], manifest_path,
+                             'completed', created_by=created_by, checksum=file_sha256(manifest_path))
+
+            if upload_to_cloud and self.cloud_manager:
+                uploaded = all(
+                    self.cloud_manager.upload_file(self.chunk_store.chunk_path(digest), remote_folder='Backups/chunks')
+                    for digest in manifest['new_chunks']
+                ) and self.cloud_manager.upload_file(manifest_path, remote_folder='Backups/manifests')
+                if not uploaded:
+                    logging.error("[HATA] Cloud artımlı yedekleme başarısız")
+
+            removed, removed_chunks = self.chunk_store.prune(config.get('max_backup_chains', 7))
+            if removed:
+                logging.info(f"[OK] {len(removed)} eski manifest, {removed_chunks} parça silindi")
+
+            logging.info(f"[OK] Artımlı yedek ({manifest['kind']}): {len(manifest['chunks'])}/"
+                         f"{manifest['chunk_count']} parça değişti, {len(manifest['new_chunks'])} yeni")
+            return True, manifest_path
+
+        except Exception as e:
+            error_msg = f"Artımlı yedekleme hatası: {e}"
+            logging.error(f"[HATA] {error_msg}")
+            try:
+                self._log_backup(backup_name, 'incremental', 0, '', 'failed',
+                                 error_message=str(e), created_by=created_by)
+            except Exception as log_error:
+                logging.error(f"[UYARI] Log kaydedilemedi: {log_error}")
+            return False, error_msg
+
     def _backup_files(self, zipf: zipfile.ZipFile) -> None:
         """Dosyaları yedekle - İzin hatalarını güvenli şekilde işle"""
         file_dirs = ['uploads', 'exports', 'reports', 'resimler']
@@ -228,19 +315,20 @@ class BackupRecoveryManager:
     
     def _log_backup(self, backup_name: str, backup_type: str, 
                    backup_size: int, backup_path: str, status: str,
-                   error_message: str = None, created_by: str = 'system'):
+                   error_message: str = None, created_by: str = 'system',
+                   checksum: str = None):
         """Yedekleme logunu kaydet"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
             cursor.execute("""
                 INSERT INTO backup_history 
                 (backup_name, backup_type, backup_size, backup_path, backup_date,
-                 status, error_message, created_by)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                 status, error_message, created_by, checksum)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (backup_name, backup_type, backup_size, backup_path,
-                  datetime.now().isoformat(), status, error_message, created_by))
+                  datetime.now().isoformat(), status, error_message, created_by, checksum))
             
             conn.commit()
         except Exception as e:
@@ -249,18 +337,52 @@ class BackupRecoveryManager:
         finally:
             conn.close()
     
-    def verify_backup(self, backup_path: str) -> Tuple[bool, str]:
+    def _recorded_checksum(self, backup_path: str):
+        """backup_history'de kayıtlı SHA-256 (yoksa None)"""
+        conn = db_connect(self.db_path)
+        try:
+            row = conn.execute(
+                "SELECT checksum FROM backup_history WHERE backup_path = ? AND status = 'completed' "
+                "ORDER BY id DESC LIMIT 1", (backup_path,)
+            ).fetchone()
+            return row[0] if row else None
+        except sqlite3.OperationalError:
+            return None
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _is_manifest(backup_path: str) -> bool:
+        return backup_path.endswith('.json')
+
+    def verify_backup(self, backup_path: str, deep: bool = False) -> Tuple[bool, str]:
         """
-        Yedeğin sağlamlığını doğrula (Restore testi)
+        Yedeğin sağlamlığını doğrula
+
+        Kayıtlı sağlama toplamı olan yedeklerde arşiv açılmaz: artımlı yedekte
+        zincirdeki parçalar, zip yedekte dosya SHA-256'sı kontrol edilir.
+        deep=True ise (veya sağlama toplamı yoksa) eski restore testi yapılır.
         
         Args:
             backup_path: Yedek dosya yolu
+            deep: Parçaları açıp yeniden özetle / zip'i açıp integrity_check yap
             
         Returns:
             Tuple[bool, str]: (Başarı, mesaj)
         """
         if not os.path.exists(backup_path):
             return False, "Yedek dosyası bulunamadı"
+
+        checksum = self._recorded_checksum(backup_path)
+        if checksum and file_sha256(backup_path) != checksum:
+            return False, "Yedek dosyasının sağlama toplamı tutmuyor"
+
+        if self._is_manifest(backup_path):
+            name = os.path.splitext(os.path.basename(backup_path))[0]
+            return self.chunk_store.verify(name, deep=deep)
+
+        if checksum and not deep:
+            return True, "Yedek sağlama toplamı doğrulandı (SHA-256)"
             
         temp_dir = os.path.join(self.backup_dir, f"verify_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
         os.makedirs(temp_dir, exist_ok=True)
@@ -287,7 +409,7 @@ class BackupRecoveryManager:
                 if not os.path.exists(temp_db_path):
                     return False, "Veritabanı çıkarılamadı"
                     
-                verify_conn = sqlite3.connect(temp_db_path)
+                verify_conn = db_connect(temp_db_path)
                 try:
                     cursor = verify_conn.cursor()
                     cursor.execute("PRAGMA integrity_check")
@@ -328,9 +450,20 @@ class BackupRecoveryManager:
             if not os.path.exists(backup_path):
                 return False, "Yedek dosyası bulunamadı"
             
-            # Önce mevcut veritabanının yedeğini al
+            # Önce mevcut veritabanının yedeğini al (online kopya)
             safety_backup = f"{self.db_path}.pre_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            shutil.copy2(self.db_path, safety_backup)
+            snapshot_database(self.db_path, safety_backup)
+
+            if self._is_manifest(backup_path):
+                # Artımlı zincir: full + değişiklikler sırayla uygulanır
+                restored_db = self.materialize_backup(backup_path)
+                try:
+                    self._install_database(restored_db)
+                finally:
+                    os.remove(restored_db)
+                logging.info("[OK] Veritabanı artımlı zincirden geri yüklendi")
+                self._log_recovery(backup_path, 'success', restored_by)
+                return True, f"Yedek başarıyla geri yüklendi. Güvenlik yedeği: {safety_backup}"
             
             # Zip'i aç
             with zipfile.ZipFile(backup_path, 'r') as zipf:
@@ -338,7 +471,7 @@ class BackupRecoveryManager:
                 if 'database/sdg_desktop.sqlite' in zipf.namelist():
                     zipf.extract('database/sdg_desktop.sqlite', self.backup_dir)
                     extracted_db = os.path.join(self.backup_dir, 'database', 'sdg_desktop.sqlite')
-                    shutil.copy2(extracted_db, self.db_path)
+                    self._install_database(extracted_db)
                     logging.info("[OK] Veritabanı geri yüklendi")
                 
                 # Dosyaları geri yükle (opsiyonel)
@@ -398,10 +531,45 @@ class BackupRecoveryManager:
             self._log_recovery(backup_path, 'failed', restored_by, notes=str(e))
             return False, error_msg
     
+    def materialize_backup(self, backup_path: str) -> str:
+        """
+        Artımlı yedeği tek bir SQLite dosyası olarak geçici konuma çıkar
+        (SHA-256 ve quick_check doğrulamalı). Dosyayı silmek çağırana aittir.
+        """
+        name = os.path.splitext(os.path.basename(backup_path))[0]
+        dest_path = os.path.join(self.backup_dir, f"{name}.restore.sqlite")
+        try:
+            self.chunk_store.restore_to(name, dest_path)
+            check_conn = sqlite3.connect(dest_path)
+            try:
+                result = check_conn.execute("PRAGMA quick_check").fetchone()[0]
+            finally:
+                check_conn.close()
+            if result != 'ok':
+                raise BackupChainError(f"Geri yüklenen veritabanı kontrolü başarısız: {result}")
+            return dest_path
+        except Exception:
+            if os.path.exists(dest_path):
+                os.remove(dest_path)
+            raise
+
+    def _install_database(self, source_db: str) -> None:
+        """
+        Kaynak veritabanını canlı dosyanın üzerine backup API ile yaz.
+        Dosya kopyalamanın aksine açık bağlantılar ve WAL ile güvenlidir.
+        """
+        src = sqlite3.connect(source_db)
+        dst = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+            src.close()
+
     def _log_recovery(self, backup_path: str, status: str, 
                      restored_by: str, notes: str = None):
         """Kurtarma logunu kaydet"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
@@ -425,7 +593,7 @@ class BackupRecoveryManager:
     
     def get_backup_list(self, limit: int = 50) -> List[Dict]:
         """Yedek listesini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
@@ -555,7 +723,7 @@ class BackupRecoveryManager:
     
     def get_backup_statistics(self) -> Dict:
         """Yedekleme istatistikleri"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
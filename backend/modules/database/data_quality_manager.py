@@ -10,6 +10,8 @@ import os
 import sqlite3
 from typing import Dict
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class DataQualityManager:
@@ -20,11 +22,11 @@ class DataQualityManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """Veri kalite tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -110,7 +112,7 @@ class DataQualityManager:
                                   timeliness_score: float, validity_score: float,
                                   improvement_areas: str = None) -> bool:
         """Veri kalite değerlendirmesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -139,7 +141,7 @@ class DataQualityManager:
 
     def get_data_quality_summary(self, company_id: int) -> Dict:
         """Veri kalite özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Çevrimiçi (online) ve Artımlı Veritabanı Yedekleme
+
+- Anlık görüntü `sqlite3.Connection.backup` ile sayfa sayfa alınır; her
+  adım arasında kısa bekleme yapılarak yazan isteklere yol verilir ve
+  yazım ortasındaki dosya yerine tutarlı bir kopya elde edilir.
+- Görüntü sayfa sınırına hizalı sabit boyutlu parçalara (chunk) bölünür.
+  Parçalar SHA-256 ile adreslenip sıkıştırılarak `chunks/` altında bir kez
+  saklanır; değişmeyen parçalar tekrar yazılmaz (dedup).
+- Her yedek bir manifest (JSON) dosyasıdır. 'full' manifest tüm parça
+  listesini, 'incremental' manifest yalnızca bir öncekine göre değişen
+  parçaları tutar. Geri yükleme zinciri full'den hedefe kadar uygular.
+- Doğrulama arşivi açıp yeniden okumak yerine parça sağlama
+  toplamlarıyla yapılır.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+MANIFEST_FORMAT = 1
+
+# backup() adımı başına kopyalanan sayfa ve adımlar arası bekleme (sn)
+BACKUP_PAGES_PER_STEP = 256
+BACKUP_STEP_SLEEP = 0.005
+
+# Parça boyutu (sayfa boyutunun katına yuvarlanır)
+DEFAULT_CHUNK_SIZE = 256 * 1024
+COMPRESS_LEVEL = 6
+
+
+class BackupChainError(Exception):
+    """Manifest zinciri eksik veya bozuk"""
+
+
+def snapshot_database(src_path: str, dest_path: str, pages: int = BACKUP_PAGES_PER_STEP,
+                      sleep: float = BACKUP_STEP_SLEEP) -> None:
+    """
+    Canlı veritabanının tutarlı kopyasını al (SQLite online backup API).
+    Kopyalama `pages` sayfalık adımlarla yapılır; adımlar arasında kilit
+    bırakılır. Kaynak kopya sırasında değişirse SQLite kopyayı yeniden başlatır.
+    """
+    src = sqlite3.connect(src_path, timeout=30)
+    dst = sqlite3.connect(dest_path)
+    try:
+        src.backup(dst, pages=pages, sleep=sleep)
+    finally:
+        dst.close()
+        src.close()
+
+
+def file_sha256(path: str, block_size: int = 1024 * 1024) -> str:
+    """Dosyanın SHA-256 özeti"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _page_size(db_file: str) -> int:
+    # SQLite başlığı: 16-17. baytlar sayfa boyutu (1 => 65536)
+    with open(db_file, 'rb') as f:
+        header = f.read(100)
+    if len(header) < 18:
+        return 4096
+    size = int.from_bytes(header[16:18], 'big')
+    return 65536 if size == 1 else (size or 4096)
+
+
+class ChunkStore:
+    """İçerik adresli (SHA-256) sıkıştırılmış parça deposu ve manifestler"""
+
+    def __init__(self, root: str, chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = None) -> None:
+        self.root = root
+        self.chunk_dir = os.path.join(root, 'chunks')
+        self.manifest_dir = os.path.join(root, 'manifests')
+        self.chunk_size = chunk_size
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        os.makedirs(self.chunk_dir, exist_ok=True)
+        os.makedirs(self.manifest_dir, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Parçalar
+    # ------------------------------------------------------------------
+
+    def chunk_path(self, digest: str) -> str:
+        return os.path.join(self.chunk_dir, digest[:2], digest)
+
+    def _store_chunk(self, data: bytes) -> Tuple[str, int, bool]:
+        """Parçayı sakla; (özet, saklanan boyut, yeni mi) döndürür"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.chunk_path(digest)
+        if os.path.exists(path):
+            # mtime tazelenir; prune() yeni kullanılan parçayı silmesin
+            os.utime(path)
+            return digest, os.path.getsize(path), False
+        payload = zlib.compress(data, COMPRESS_LEVEL)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        return digest, len(payload), True
+
+    def read_chunk(self, digest: str) -> bytes:
+        """Parçayı oku ve özetini doğrula"""
+        with open(self.chunk_path(digest), 'rb') as f:
+            data = zlib.decompress(f.read())
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise BackupChainError(f"Parça sağlama toplamı tutmuyor: {digest}")
+        return data
+
+    def _iter_blocks(self, db_file: str, chunk_size: int):
+        with open(db_file, 'rb') as f:
+            for block in iter(lambda: f.read(chunk_size), b''):
+                yield block
+
+    # ------------------------------------------------------------------
+    # Manifestler
+    # ------------------------------------------------------------------
+
+    def manifest_path(self, name: str) -> str:
+        return os.path.join(self.manifest_dir, f"{name}.json")
+
+    def load_manifest(self, name_or_path: str) -> Dict:
+        path = name_or_path if name_or_path.endswith('.json') else self.manifest_path(name_or_path)
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def list_manifests(self) -> List[Dict]:
+        """Tüm manifestler, oluşturulma sırasına göre"""
+        manifests = []
+        for filename in os.listdir(self.manifest_dir):
+            if filename.endswith('.json'):
+                try:
+                    manifests.append(self.load_manifest(os.path.join(self.manifest_dir, filename)))
+                except (OSError, ValueError):
+                    continue
+        return sorted(manifests, key=lambda m: (m.get('created_at', ''), m.get('name', '')))
+
+    def latest_manifest(self) -> Optional[Dict]:
+        manifests = self.list_manifests()
+        return manifests[-1] if manifests else None
+
+    def resolve_chain(self, name: str) -> List[Dict]:
+        """Hedef manifestten geriye full'e kadar zincir (full ilk sırada)"""
+        chain = []
+        seen = set()
+        current = name
+        while current:
+            if current in seen:
+                raise BackupChainError(f"Manifest zincirinde döngü: {current}")
+            seen.add(current)
+            if not os.path.exists(self.manifest_path(current)):
+                raise BackupChainError(f"Manifest bulunamadı: {current}")
+            manifest = self.load_manifest(current)
+            chain.append(manifest)
+            current = manifest.get('parent') if manifest.get('kind') == 'incremental' else None
+        chain.reverse()
+        if chain[0].get('kind') != 'full':
+            raise BackupChainError(f"Zincir full yedekle başlamıyor: {name}")
+        return chain
+
+    @staticmethod
+    def chunk_list(chain: List[Dict]) -> List[str]:
+        """Zinciri uygulayarak son durumdaki parça listesini hesapla"""
+        chunks: List[Optional[str]] = []
+        for manifest in chain:
+            count = manifest['chunk_count']
+            if manifest['kind'] == 'full':
+                chunks = [None] * count
+            else:
+                chunks = (chunks + [None] * count)[:count]
+            for index, digest in manifest['chunks'].items():
+                chunks[int(index)] = digest
+        if any(digest is None for digest in chunks):
+            raise BackupChainError("Zincirde eksik parça var")
+        return chunks
+
+    # ------------------------------------------------------------------
+    # Yedek oluşturma / geri yükleme / doğrulama
+    # ------------------------------------------------------------------
+
+    def create(self, db_path: str, name: str, full: bool = False, max_chain: int = 24) -> Dict:
+        """
+        Online görüntü al ve manifest yaz. Önceki zincir yoksa, uzunluğu
+        `max_chain`'e ulaştıysa veya parça boyutu değiştiyse full oluşturulur.
+
+        Returns:
+            Dict: Manifest (+ 'new_chunks', 'new_bytes', 'manifest_path')
+        """
+        parent = None if full else self.latest_manifest()
+        if parent and (parent.get('chain_depth', 0) + 1 >= max_chain):
+            parent = None
+
+        fd, snapshot = tempfile.mkstemp(suffix='.sqlite', dir=self.root)
+        os.close(fd)
+        try:
+            snapshot_database(db_path, snapshot)
+            page_size = _page_size(snapshot)
+            chunk_size = max(page_size, (self.chunk_size // page_size) * page_size)
+            if parent and parent.get('chunk_size') != chunk_size:
+                parent = None
+
+            parent_chunks = []
+            if parent:
+                try:
+                    parent_chunks = self.chunk_list(self.resolve_chain(parent['name']))
+                except BackupChainError:
+                    parent = None  # bozuk zincirin üzerine eklenmez, yeni full başlar
+            # Özet + sıkıştırma paralel; zlib/hashlib büyük tamponlarda GIL'i bırakır
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                stored = list(pool.map(self._store_chunk, self._iter_blocks(snapshot, chunk_size)))
+            db_sha256 = file_sha256(snapshot)
+            db_size = os.path.getsize(snapshot)
+        finally:
+            os.remove(snapshot)
+
+        digests = [digest for digest, _size, _new in stored]
+        if parent:
+            changes = {str(i): d for i, d in enumerate(digests)
+                       if i >= len(parent_chunks) or parent_chunks[i] != d}
+        else:
+            changes = {str(i): d for i, d in enumerate(digests)}
+        sizes = {d: size for d, size, _new in stored}
+
+        manifest = {
+            'format': MANIFEST_FORMAT,
+            'name': name,
+            'kind': 'incremental' if parent else 'full',
+            'parent': parent['name'] if parent else None,
+            'chain_depth': parent.get('chain_depth', 0) + 1 if parent else 0,
+            'created_at': datetime.now().isoformat(),
+            'db_size': db_size,
+            'db_sha256': db_sha256,
+            'page_size': page_size,
+            'chunk_size': chunk_size,
+            'chunk_count': len(digests),
+            'chunks': changes,
+            'objects': {d: sizes[d] for d in set(changes.values())},
+        }
+        path = self.manifest_path(name)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp_path, path)
+
+        new = [(d, size) for d, size, is_new in stored if is_new]
+        manifest['new_chunks'] = [d for d, _size in new]
+        manifest['new_bytes'] = sum(size for _d, size in new) + os.path.getsize(path)
+        manifest['manifest_path'] = path
+        return manifest
+
+    def restore_to(self, name: str, dest_path: str) -> Dict:
+        """Zinciri uygulayıp veritabanı dosyasını dest_path'e yaz ve SHA-256 ile doğrula"""
+        chain = self.resolve_chain(name)
+        target = chain[-1]
+        digest = hashlib.sha256()
+        with open(dest_path, 'wb') as f:
+            for chunk_digest in self.chunk_list(chain):
+                data = self.read_chunk(chunk_digest)
+                digest.update(data)
+                f.write(data)
+        if digest.hexdigest() != target['db_sha256']:
+            raise BackupChainError(f"Geri yüklenen veritabanı özeti tutmuyor: {name}")
+        return target
+
+    def verify(self, name: str, deep: bool = False) -> Tuple[bool, str]:
+        """
+        Zinciri doğrula. Varsayılan: tüm parçalar mevcut ve saklanan boyutları
+        manifestle aynı. deep=True: parçalar açılıp SHA-256 yeniden hesaplanır.
+        """
+        try:
+            chain = self.resolve_chain(name)
+            chunks = self.chunk_list(chain)
+            sizes = {}
+            for manifest in chain:
+                sizes.update(manifest.get('objects', {}))
+            for chunk_digest in set(chunks):
+                path = self.chunk_path(chunk_digest)
+                if not os.path.exists(path):
+                    return False, f"Parça eksik: {chunk_digest}"
+                expected = sizes.get(chunk_digest)
+                if expected is not None and os.path.getsize(path) != expected:
+                    return False, f"Parça boyutu tutmuyor: {chunk_digest}"
+                if deep:
+                    self.read_chunk(chunk_digest)
+            return True, f"Zincir doğrulandı ({len(chain)} manifest, {len(set(chunks))} parça)"
+        except (BackupChainError, OSError, ValueError, zlib.error) as e:
+            return False, str(e)
+
+    def prune(self, keep_chains: int) -> Tuple[List[str], int]:
+        """
+        En yeni `keep_chains` zinciri tut, eskileri sil ve hiçbir manifestin
+        referans vermediği parçaları temizle.
+
+        Returns:
+            Tuple[List[str], int]: (silinen manifest adları, silinen parça sayısı)
+        """
+        manifests = self.list_manifests()
+        fulls = [m['name'] for m in manifests if m.get('kind') == 'full']
+        keep_from = fulls[-keep_chains] if keep_chains and len(fulls) > keep_chains else None
+
+        removed = []
+        if keep_from:
+            cutoff = next(m for m in manifests if m['name'] == keep_from)
+            for manifest in manifests:
+                if (manifest.get('created_at', ''), manifest['name']) < (cutoff.get('created_at', ''), cutoff['name']):
+                    os.remove(self.manifest_path(manifest['name']))
+                    removed.append(manifest['name'])
+
+        referenced = set()
+        for manifest in self.list_manifests():
+            referenced.update(manifest.get('chunks', {}).values())
+
+        removed_chunks = 0
+        for sub in os.listdir(self.chunk_dir):
+            sub_dir = os.path.join(self.chunk_dir, sub)
+            if not os.path.isdir(sub_dir):
+                continue
+            for filename in os.listdir(sub_dir):
+                path = os.path.join(sub_dir, filename)
+                # Son bir saatte yazılan/kullanılan parçalar süren bir yedeğe ait olabilir
+                if time.time() - os.path.getmtime(path) < 3600:
+                    continue
+                if filename.endswith('.tmp') or filename not in referenced:
+                    os.remove(path)
+                    removed_chunks += 1
+        return removed, removed_chunks
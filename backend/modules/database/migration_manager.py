@@ -1,12 +1,35 @@
 import sqlite3
 import os
+import sys
 import logging
+import argparse
 import importlib.util
 from datetime import datetime
 
+# Komut satırından çalıştırıldığında `utils`/`modules` paketleri bulunabilsin
+_BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _BACKEND_DIR not in sys.path:
+    sys.path.append(_BACKEND_DIR)
+
+try:
+    from utils.db_pool import connect as db_connect
+    from utils.schema_version import migration_files
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+    from backend.utils.schema_version import migration_files
+
 class MigrationManager:
-    """Merkezi veritabanı şema ve versiyon yönetim sınıfı."""
-    
+    """Merkezi veritabanı şema ve versiyon yönetim sınıfı.
+
+    Migrasyonlar deploy sırasında bir kez çalıştırılır:
+
+        python backend/modules/database/migration_manager.py status
+        python backend/modules/database/migration_manager.py apply --db /yol/sustainage.db
+
+    Her migrasyondan sonra `PRAGMA user_version` uygulanan versiyona çekilir;
+    manager'lar (utils.schema_version.ensure_schema) yalnızca bu değeri okur.
+    """
+
     def __init__(self, db_path):
         self.db_path = db_path
         # Migrations klasörü bu dosyanın yanındaki 'migrations' klasörüdür
@@ -15,7 +38,7 @@ class MigrationManager:
         self._init_migration_table()
 
     def _get_connection(self):
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def _init_migration_table(self):
         """Versiyon takip tablosunu oluştur."""
@@ -41,48 +64,76 @@ class MigrationManager:
         except Exception:
             return set()
 
+    def get_pending_migrations(self):
+        """Henüz uygulanmamış (versiyon, dosya adı) listesi."""
+        applied = self.get_applied_migrations()
+        return [(v, f) for v, f in migration_files(self.migrations_dir) if v not in applied]
+
+    def get_schema_version(self):
+        """Veritabanının `PRAGMA user_version` değeri."""
+        conn = self._get_connection()
+        try:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            conn.close()
+
+    def get_status(self):
+        """Sürüm özeti: mevcut, en yeni ve bekleyen migrasyonlar."""
+        files = migration_files(self.migrations_dir)
+        return {
+            'db_path': self.db_path,
+            'schema_version': self.get_schema_version(),
+            'latest_version': files[-1][0] if files else 0,
+            'applied': sorted(self.get_applied_migrations()),
+            'pending': self.get_pending_migrations(),
+        }
+
     def apply_migrations(self):
         """Bekleyen migrasyonları uygula."""
-        applied = self.get_applied_migrations()
-        
-        # Migrasyon dosyalarını bul (format: 001_xxx.py)
-        migration_files = []
-        for f in os.listdir(self.migrations_dir):
-            if f.endswith('.py') and not f.startswith('__'):
-                try:
-                    version = int(f.split('_')[0])
-                    migration_files.append((version, f))
-                except ValueError:
-                    logging.warning(f"Geçersiz migrasyon dosya adı: {f}")
-        
-        # Versiyona göre sırala
-        migration_files.sort()
-        
-        for version, filename in migration_files:
-            if version not in applied:
-                logging.info(f"Applying migration {version}: {filename}")
-                if self._run_migration(version, filename):
-                    logging.info(f"Migration {version} applied successfully.")
-                else:
-                    logging.error(f"Migration {version} failed. Stopping.")
-                    return False
+        for version, filename in self.get_pending_migrations():
+            logging.info(f"Applying migration {version}: {filename}")
+            if self._run_migration(version, filename):
+                logging.info(f"Migration {version} applied successfully.")
+            else:
+                logging.error(f"Migration {version} failed. Stopping.")
+                return False
+        self._sync_user_version()
         return True
 
+    def _sync_user_version(self):
+        """user_version'ı ardışık uygulanmış son migrasyona çek."""
+        applied = self.get_applied_migrations()
+        version = 0
+        for v, _f in migration_files(self.migrations_dir):
+            if v not in applied:
+                break
+            version = v
+        conn = self._get_connection()
+        try:
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+        finally:
+            conn.close()
+
     def _run_migration(self, version, filename):
         """Tek bir migrasyon dosyasını çalıştır."""
         file_path = os.path.join(self.migrations_dir, filename)
         module_name = f"migration_{version}"
-        
+
         try:
             spec = importlib.util.spec_from_file_location(module_name, file_path)
             module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(module)
-            
+
             # Modülün 'up' fonksiyonu olmalı
             if hasattr(module, 'up'):
-                with self._get_connection() as conn:
-                    module.up(conn)
-                    conn.execute("INSERT INTO schema_migrations (version, name) VALUES (?, ?)", (version, filename))
+                conn = self._get_connection()
+                try:
+                    with conn:
+                        module.up(conn)
+                        conn.execute("INSERT INTO schema_migrations (version, name) VALUES (?, ?)", (version, filename))
+                finally:
+                    conn.close()
+                self._sync_user_version()
                 return True
             else:
                 logging.error(f"Migration {filename} 'up' fonksiyonu içermiyor.")
@@ -90,3 +141,39 @@ class MigrationManager:
         except Exception as e:
             logging.error(f"Migration hatası ({filename}): {e}")
             return False
+
+
+def main(argv=None):
+    """Komut satırı: bekleyen migrasyonları listele (status) veya uygula (apply)."""
+    parser = argparse.ArgumentParser(description='Sustainage şema migrasyonları')
+    parser.add_argument('command', nargs='?', default='status', choices=['status', 'apply'])
+    parser.add_argument('--db', dest='db_path', default=None,
+                        help='Veritabanı yolu (varsayılan: config.database.DB_PATH)')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s %(message)s')
+    db_path = args.db_path
+    if not db_path:
+        from config.database import DB_PATH
+        db_path = DB_PATH
+
+    manager = MigrationManager(db_path)
+    if args.command == 'apply':
+        ok = manager.apply_migrations()
+    else:
+        ok = True
+
+    status = manager.get_status()
+    print(f"Database      : {status['db_path']}")
+    print(f"Schema version: {status['schema_version']} / {status['latest_version']}")
+    if status['pending']:
+        print(f"Pending ({len(status['pending'])}):")
+        for version, filename in status['pending']:
+            print(f"  {version:03d}  {filename}")
+    else:
+        print("Pending       : none")
+    return 0 if ok and not (args.command == 'apply' and status['pending']) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -86,7 +86,22 @@ def up(conn):
             password_hash TEXT NOT NULL,
             role TEXT DEFAULT 'user',
             email TEXT,
-            created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            first_name VARCHAR(50) NOT NULL DEFAULT '',
+            last_name VARCHAR(50) NOT NULL DEFAULT '',
+            phone VARCHAR(20),
+            department VARCHAR(100),
+            position VARCHAR(100),
+            avatar_path VARCHAR(255),
+            is_active BOOLEAN DEFAULT 1,
+            is_verified BOOLEAN DEFAULT 0,
+            last_login TIMESTAMP,
+            login_attempts INTEGER DEFAULT 0,
+            locked_until TIMESTAMP,
+            created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            created_by INTEGER,
+            updated_by INTEGER
         )
     """)
 
@@ -103,8 +118,17 @@ def up(conn):
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS roles (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            role_name TEXT UNIQUE NOT NULL,
-            permissions TEXT
+            name VARCHAR(50) NOT NULL UNIQUE,
+            display_name VARCHAR(100) NOT NULL,
+            description TEXT,
+            is_system_role BOOLEAN DEFAULT 0,
+            is_active BOOLEAN DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            created_by INTEGER,
+            updated_by INTEGER,
+            FOREIGN KEY (created_by) REFERENCES users(id),
+            FOREIGN KEY (updated_by) REFERENCES users(id)
         )
     """)
     
@@ -114,6 +138,8 @@ def up(conn):
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
             industry TEXT,
+            sector TEXT,
+            country TEXT,
             is_active INTEGER DEFAULT 1,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
@@ -0,0 +1,18 @@
+# 002_system_settings.py
+# Şirket bazlı sistem ayarları (web_app._get_system_setting_int her okumada
+# bu tabloyu oluşturuyordu)
+
+def up(conn):
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS system_settings (
+            key TEXT,
+            value TEXT,
+            category TEXT,
+            description TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            company_id INTEGER,
+            PRIMARY KEY (key, company_id)
+        )
+    """)
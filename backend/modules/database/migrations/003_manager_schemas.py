@@ -0,0 +1,176 @@
+# 003_manager_schemas.py
+# Manager oluşturucularındaki DDL (_init_database, _ensure_tables,
+# _init_forecast_tables, _create_advanced_tables ...) deploy sırasında bir kez
+# çalıştırılır. Manager'lar şema güncel değilken (user_version bu
+# migrasyondan küçükken) kendi DDL metotlarını çalıştırdığından, burada her
+# birini hedef veritabanıyla bir kez oluşturmak yeterlidir.
+
+import importlib
+import logging
+import os
+
+_BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+# Kökteki 'modules'/'services' paketleri aynı adlarla backend'dekileri gölgeler
+_SHADOW_DIRS = tuple(os.path.join(os.path.dirname(_BACKEND_DIR), name) + os.sep for name in ('modules', 'services'))
+
+MANAGER_CLASSES = [
+    ('core.db_log_handler', 'DBLogHandler'),
+    ('core.enhanced_audit_logger', 'EnhancedAuditLogger'),
+    ('core.reporting_journey_manager', 'ReportingJourneyManager'),
+    ('modules.advanced_reporting.report_templates', 'AdvancedReportTemplates'),
+    ('modules.ai.ai_manager', 'AIManager'),
+    ('modules.analysis.materiality', 'MaterialityAnalysis'),
+    ('modules.analytics.advanced_forecasting', 'AdvancedForecasting'),
+    ('modules.analytics.advanced_materiality_analyzer', 'AdvancedMaterialityAnalyzer'),
+    ('modules.analytics.materiality_analyzer', 'MaterialityAnalyzer'),
+    ('modules.analytics.sector_benchmark_database', 'SectorBenchmarkDatabase'),
+    ('modules.auditor.auditor_system', 'AuditorSystem'),
+    ('modules.automation.automated_reporting', 'AutomatedReportingSystem'),
+    ('modules.cbam.cbam_manager', 'CBAMManager'),
+    ('modules.cdp.cdp_manager', 'CDPManager'),
+    ('modules.common.generic_data_manager', 'GenericDataManager'),
+    ('modules.company.company_manager', 'CompanyManager'),
+    ('modules.company.company_profile_manager', 'CompanyProfileManager'),
+    ('modules.csrd.csrd_compliance_manager', 'CSRDComplianceManager'),
+    ('modules.data_import.data_importer', 'DataImporter'),
+    ('modules.data_inventory.advanced_dashboard', 'AdvancedDashboard'),
+    ('modules.data_provenance.provenance_manager', 'DataProvenanceManager'),
+    ('modules.database.backup_recovery_manager', 'BackupRecoveryManager'),
+    ('modules.database.data_quality_manager', 'DataQualityManager'),
+    ('modules.database.version_control_manager', 'VersionControlManager'),
+    ('modules.economic.economic_manager', 'EconomicManager'),
+    ('modules.economic.economic_metrics', 'EconomicMetrics'),
+    ('modules.economic.gri_201_calculator', 'GRI201Calculator'),
+    ('modules.emission_reduction.emission_reduction_manager', 'EmissionReductionManager'),
+    ('modules.environmental.biodiversity_manager', 'BiodiversityManager'),
+    ('modules.environmental.carbon_calculator', 'CarbonCalculator'),
+    ('modules.environmental.carbon_manager', 'CarbonManager'),
+    ('modules.environmental.detailed_energy_manager', 'DetailedEnergyManager'),
+    ('modules.environmental.energy_manager', 'EnergyManager'),
+    ('modules.environmental.waste_manager', 'WasteManager'),
+    ('modules.environmental.water_manager', 'WaterManager'),
+    ('modules.esrs.esrs_module', 'ESRSModule'),
+    ('modules.eu_taxonomy.taxonomy_manager', 'EUTaxonomyManager'),
+    ('modules.file_manager.advanced_file_manager', 'AdvancedFileManager'),
+    ('modules.forms.form_templates', 'FormTemplateManager'),
+    ('modules.governance.corporate_governance', 'CorporateGovernanceManager'),
+    ('modules.governance.ethics_compliance', 'EthicsComplianceManager'),
+    ('modules.gri.gri_audit_trail', 'GRIAuditTrail'),
+    ('modules.gri.gri_manager', 'GRIManager'),
+    ('modules.iirc.iirc_manager', 'IIRCManager'),
+    ('modules.integration.api_manager', 'APIManager'),
+    ('modules.integration.cloud_sync_manager', 'CloudSyncManager'),
+    ('modules.integration.sso_manager', 'SSOManager'),
+    ('modules.issb.issb_manager', 'ISSBManager'),
+    ('modules.mapping.mapping_manager', 'MappingManager'),
+    ('modules.notification.notification_manager', 'NotificationManager'),
+    ('modules.policy_library.policy_manager', 'PolicyLibraryManager'),
+    ('modules.prioritization.prioritization_manager', 'PrioritizationManager'),
+    ('modules.product_technology.product_tech_manager', 'ProductTechManager'),
+    ('modules.quality.data_quality_scorer', 'DataQualityScorer'),
+    ('modules.regulation.regulation_manager', 'RegulationManager'),
+    ('modules.reporting.advanced_report_manager', 'AdvancedReportManager'),
+    ('modules.reporting.brand_identity_manager', 'BrandIdentityManager'),
+    ('modules.reporting.chart_generator', 'ChartGenerator'),
+    ('modules.reporting.multilingual_manager', 'MultilingualManager'),
+    ('modules.reporting.report_generator', 'ReportGenerator'),
+    ('modules.reporting.report_scheduler', 'ReportScheduler'),
+    ('modules.reporting.sasb_manager', 'SASBManager'),
+    ('modules.reporting.target_manager', 'TargetManager'),
+    ('modules.sasb.sasb_manager', 'SASBManager'),
+    ('modules.scenario_analysis.scenario_engine', 'ScenarioEngine'),
+    ('modules.scope3.scope3_manager', 'Scope3Manager'),
+    ('modules.sdg.sdg_advanced_analytics', 'SDGAdvancedAnalytics'),
+    ('modules.sdg.sdg_data_collection', 'SDGDataCollection'),
+    ('modules.sdg.sdg_data_validation', 'SDGDataValidation'),
+    ('modules.sdg.sdg_manager', 'SDGManager'),
+    ('modules.sdg.sdg_progress_tracking', 'SDGProgressTracking'),
+    ('modules.sdg.sdg_question_bank', 'SDGQuestionBank'),
+    ('modules.security.advanced_security_manager', 'AdvancedSecurityManager'),
+    ('modules.security.audit_logger', 'AuditLogger'),
+    ('modules.security.auditor_system', 'AuditorSystem'),
+    ('modules.security.gdpr_compliance', 'GDPRComplianceManager'),
+    ('modules.skdm.skdm_manager', 'SKDMManager'),
+    ('modules.social.diversity_manager', 'DiversityManager'),
+    ('modules.social.hr_manager', 'HRManager'),
+    ('modules.social.hr_metrics', 'HRMetrics'),
+    ('modules.social.ohs_metrics', 'OHSMetrics'),
+    ('modules.social.safety_manager', 'SafetyManager'),
+    ('modules.social.social_manager', 'SocialManager'),
+    ('modules.social.training_manager', 'TrainingManager'),
+    ('modules.social.training_metrics', 'TrainingMetrics'),
+    ('modules.stakeholder.stakeholder_engagement', 'StakeholderEngagement'),
+    ('modules.stakeholder.stakeholder_manager', 'StakeholderManager'),
+    ('modules.standards.gri_sectoral_standards', 'GRISectoralStandardsManager'),
+    ('modules.standards.gri_standards', 'GRIStandardsManager'),
+    ('modules.standards.tsrs_esrs', 'TSRSESRSManager'),
+    ('modules.strategic.ceo_message_manager', 'CEOMessageManager'),
+    ('modules.strategic.risk_opportunity_manager', 'RiskOpportunityManager'),
+    ('modules.strategic.smart_goals_manager', 'SMARTGoalsManager'),
+    ('modules.strategic.strategic_manager', 'StrategicManager'),
+    ('modules.strategic.sustainability_strategy_manager', 'SustainabilityStrategyManager'),
+    ('modules.supply_chain.supply_chain_manager', 'SupplyChainManager'),
+    ('modules.support.support_manager', 'SupportManager'),
+    ('modules.surveys.hosting_survey_manager', 'HostingSurveyManager'),
+    ('modules.surveys.survey_builder', 'SurveyBuilder'),
+    ('modules.surveys.web_survey_integrator', 'WebSurveyIntegrator'),
+    ('modules.tcfd.tcfd_manager', 'TCFDManager'),
+    ('modules.tnfd.tnfd_manager', 'TNFDManager'),
+    ('modules.training.training_manager', 'TrainingManager'),
+    ('modules.ungc.ungc_reminder', 'UNGCReminderSystem'),
+    ('modules.validation.advanced_validator', 'AdvancedDataValidator'),
+    ('modules.validation.data_validator', 'DataValidator'),
+    ('modules.visualization.dashboard_widgets', 'DashboardWidgetManager'),
+    ('modules.waste_management.waste_manager', 'WasteManager'),
+    ('modules.water_management.water_factors', 'WaterFactors'),
+    ('modules.water_management.water_manager', 'WaterManager'),
+    ('modules.workflow.store', 'WorkflowStore'),
+    ('services.email_service', 'EmailService'),
+    ('services.form_service', 'FormService'),
+    ('services.survey_service', 'SurveyService'),
+    ('yonetim.kullanici_yonetimi.models.user_manager', 'UserManager'),
+]
+
+
+def _db_path(conn):
+    for _seq, name, path in conn.execute("PRAGMA database_list").fetchall():
+        if name == 'main':
+            return path
+    raise RuntimeError("main database path not found")
+
+
+def _import_manager_module(module_name):
+    # Uygulamanın yüklediği kopya kullanılır (modül düzeyi önbellekler iki kez
+    # oluşmaz); ad kökteki gölgeleyen pakete çözülürse tam yol
+    try:
+        module = importlib.import_module(module_name)
+        if not os.path.abspath(getattr(module, '__file__', None) or '').startswith(_SHADOW_DIRS):
+            return module
+    except ImportError:
+        pass
+    return importlib.import_module(f"backend.{module_name}")
+
+
+def up(conn):
+    # Manager'lar kendi bağlantılarını açar; bu bağlantı yazma kilidi tutmamalı
+    conn.commit()
+    db_path = _db_path(conn)
+
+    failed = []
+    for module_name, class_name in MANAGER_CLASSES:
+        try:
+            module = _import_manager_module(module_name)
+        except ImportError as e:
+            # Opsiyonel bağımlılığı kurulu olmayan modül bu ortamda kullanılamaz
+            logging.warning(f"Migration 003: {module_name} atlandı ({e})")
+            continue
+        try:
+            getattr(module, class_name)(db_path)
+        except Exception as e:
+            # Diğer manager'ların şeması kurulmaya devam eder; sonunda hata verilir
+            logging.error(f"Migration 003: {class_name} şeması oluşturulamadı: {e}")
+            failed.append(f"{module_name}.{class_name}: {e}")
+
+    if failed:
+        # Migrasyon kaydedilmez (user_version artmaz); düzeltmeden sonra yeniden çalışır
+        raise RuntimeError("Migration 003 failed for: " + "; ".join(failed))
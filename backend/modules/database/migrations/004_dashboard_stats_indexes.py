@@ -0,0 +1,19 @@
+# 004_dashboard_stats_indexes.py
+# /api/v1/dashboard-stats modül sayımları için company_id indeksleri
+
+try:
+    from modules.dashboard_stats import DashboardStatsManager
+except ImportError:
+    from backend.modules.dashboard_stats import DashboardStatsManager
+
+
+def up(conn):
+    cursor = conn.cursor()
+    existing_tables = {row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+
+    for table, _target in DashboardStatsManager.MODULE_CONFIG.values():
+        if table not in existing_tables:
+            continue
+        columns = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+        if 'company_id' in columns:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_company ON {table}(company_id)")
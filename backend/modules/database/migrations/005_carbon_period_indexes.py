@@ -0,0 +1,20 @@
+# 005_carbon_period_indexes.py
+# Karbon sorgularındaki yıl filtreleri için aralık (range) dostu indeksler
+
+
+def up(conn):
+    cursor = conn.cursor()
+    existing_tables = {row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+
+    if 'carbon_emissions' in existing_tables:
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(carbon_emissions)")}
+        # Eski şemalarda (period/quantity kolonlu) carbon_emissions farklı olabilir
+        if {'company_id', 'period_start', 'scope'} <= columns:
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_carbon_emissions_company_period
+                ON carbon_emissions(company_id, period_start, scope)
+            """)
+
+    for table in ('scope1_emissions', 'scope2_emissions', 'scope3_emissions'):
+        if table in existing_tables:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_company_year ON {table}(company_id, year)")
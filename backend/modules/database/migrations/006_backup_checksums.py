@@ -0,0 +1,12 @@
+# 006_backup_checksums.py
+# backup_history: yedek doğrulaması için SHA-256 sağlama toplamı kolonu
+
+
+def up(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='backup_history'")
+    if not cursor.fetchone():
+        return
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(backup_history)")}
+    if 'checksum' not in columns:
+        cursor.execute("ALTER TABLE backup_history ADD COLUMN checksum TEXT")
@@ -0,0 +1,73 @@
+# 007_iot_rollups.py
+# IoT okumaları: toplu yazım için company_id kolonları, (device_id, timestamp)
+# indeksi ve dakika/saat/gün özet (rollup) tablosu; mevcut okumalardan doldurulur.
+
+try:
+    from modules.realtime.realtime_manager import ROLLUP_GRANULARITIES
+except ImportError:
+    from backend.modules.realtime.realtime_manager import ROLLUP_GRANULARITIES
+
+
+def up(conn):
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS iot_devices (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            company_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            device_type TEXT,
+            unit TEXT,
+            threshold_value REAL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS iot_readings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            device_id INTEGER NOT NULL,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            value REAL NOT NULL,
+            company_id INTEGER DEFAULT 1,
+            FOREIGN KEY (device_id) REFERENCES iot_devices (id)
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS iot_alerts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            device_id INTEGER NOT NULL,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            message TEXT,
+            status TEXT DEFAULT 'unread',
+            company_id INTEGER DEFAULT 1,
+            FOREIGN KEY (device_id) REFERENCES iot_devices (id)
+        )
+    """)
+    for table in ('iot_readings', 'iot_alerts'):
+        columns = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+        if 'company_id' not in columns:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN company_id INTEGER DEFAULT 1")
+
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_iot_readings_device_time ON iot_readings(device_id, timestamp)")
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS iot_reading_rollups (
+            device_id INTEGER NOT NULL,
+            granularity TEXT NOT NULL,
+            bucket_start TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            sum_value REAL NOT NULL,
+            min_value REAL NOT NULL,
+            max_value REAL NOT NULL,
+            PRIMARY KEY (device_id, granularity, bucket_start)
+        ) WITHOUT ROWID
+    """)
+
+    cursor.execute("DELETE FROM iot_reading_rollups")
+    for granularity, (length, suffix) in ROLLUP_GRANULARITIES.items():
+        cursor.execute(f"""
+            INSERT INTO iot_reading_rollups
+                (device_id, granularity, bucket_start, count, sum_value, min_value, max_value)
+            SELECT device_id, ?, substr(replace(timestamp, 'T', ' '), 1, {length}) || ?,
+                   COUNT(*), SUM(value), MIN(value), MAX(value)
+            FROM iot_readings
+            GROUP BY device_id, 3
+        """, (granularity, suffix))
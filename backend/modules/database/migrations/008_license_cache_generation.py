@@ -0,0 +1,18 @@
+# 008_license_cache_generation.py
+# Lisans doğrulama cache'i için paylaşılan nesil sayacı: licenses tablosundaki
+# her değişiklik tetikleyiciyle sayacı artırır, worker'lar cache'lerini düşürür.
+
+try:
+    from yonetim.license_manager import GENERATION_DDL
+except ImportError:
+    from backend.yonetim.license_manager import GENERATION_DDL
+
+
+def up(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='licenses'")
+    if not cursor.fetchone():
+        # licenses henüz yoksa LicenseManager sayaç tablosunu ilk kullanımda kurar
+        return
+    for statement in GENERATION_DDL:
+        cursor.execute(statement)
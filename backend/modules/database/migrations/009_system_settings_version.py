@@ -0,0 +1,15 @@
+# 009_system_settings_version.py
+# Ayar snapshot'ları için paylaşılan sürüm satırı: system_settings üzerindeki
+# her değişiklik tetikleyiciyle sürümü artırır (services/settings_service.py).
+
+# Kök dizindeki 'services' paketi backend/services'i gölgelediği için önce tam yol
+try:
+    from backend.services.settings_service import VERSION_DDL
+except ImportError:
+    from services.settings_service import VERSION_DDL
+
+
+def up(conn):
+    cursor = conn.cursor()
+    for statement in VERSION_DDL:
+        cursor.execute(statement)
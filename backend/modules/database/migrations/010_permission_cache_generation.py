@@ -0,0 +1,22 @@
+# 010_permission_cache_generation.py
+# Yetki cache'i için paylaşılan nesil sayacı: user_roles, role_permissions,
+# user_permissions, roles ve permissions tablolarındaki her değişiklik
+# tetikleyiciyle sayacı artırır (UserManager.get_permission_set).
+
+try:
+    from yonetim.kullanici_yonetimi.models.user_manager import PERMISSION_GENERATION_DDL, PERMISSION_TABLES
+except ImportError:
+    from backend.yonetim.kullanici_yonetimi.models.user_manager import PERMISSION_GENERATION_DDL, PERMISSION_TABLES
+
+
+def up(conn):
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT name FROM sqlite_master WHERE type='table' AND name IN ({','.join('?' * len(PERMISSION_TABLES))})",
+        PERMISSION_TABLES,
+    )
+    if len(cursor.fetchall()) < len(PERMISSION_TABLES):
+        # Kullanıcı tabloları henüz yoksa UserManager sayacı ilk kullanımda kurar
+        return
+    for statement in PERMISSION_GENERATION_DDL:
+        cursor.execute(statement)
@@ -0,0 +1,16 @@
+# 011_survey_token.py
+# Herkese açık anket bağlantıları için tekil indeksli survey_token sütunu
+# (LIKE '%/token' taraması yerine) ve yanıt başına SDG özet tablosu.
+
+try:
+    from modules.stakeholder.stakeholder_engagement import SURVEY_ANALYTICS_DDL, install_survey_token
+except ImportError:
+    from backend.modules.stakeholder.stakeholder_engagement import SURVEY_ANALYTICS_DDL, install_survey_token
+
+
+def up(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='online_surveys'")
+    if cursor.fetchone():
+        install_survey_token(conn)
+    cursor.execute(SURVEY_ANALYTICS_DDL)
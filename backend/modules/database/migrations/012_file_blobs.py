@@ -0,0 +1,12 @@
+# 012_file_blobs.py
+# AdvancedFileManager için içerik adresli blob deposu: files.blob_digest,
+# referans sayılı file_blobs tablosu ve kalıcı silmede referansı düşüren tetikleyici.
+
+try:
+    from modules.file_manager.advanced_file_manager import install_blob_store
+except ImportError:
+    from backend.modules.file_manager.advanced_file_manager import install_blob_store
+
+
+def up(conn):
+    install_blob_store(conn)
@@ -0,0 +1,15 @@
+# 013_notification_counters.py
+# Kullanıcı başına denormalize okunmamış bildirim sayacı (notification_counters)
+# ve onu güncel tutan tetikleyiciler; mevcut bildirimlerden doldurulur.
+
+try:
+    from modules.notification.notification_manager import install_notification_counters
+except ImportError:
+    from backend.modules.notification.notification_manager import install_notification_counters
+
+
+def up(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='notifications'")
+    if cursor.fetchone():
+        install_notification_counters(conn)
@@ -0,0 +1,14 @@
+# 014_esg_catalog_generation.py
+# ESG skor paydaları için katalog nesli: gri_standards, gri_indicators,
+# tsrs_standards ve tsrs_indicators üzerindeki her değişiklik tetikleyiciyle
+# nesli artırır (ESGManager._catalog_totals).
+
+try:
+    from modules.esg.esg_manager import install_catalog_generation
+except ImportError:
+    from backend.modules.esg.esg_manager import install_catalog_generation
+
+
+def up(conn):
+    # Henüz oluşturulmamış katalog tabloları ESGManager ilk kullanımda izlemeye alır
+    install_catalog_generation(conn)
@@ -0,0 +1,12 @@
+# 015_scenario_simulations.py
+# Monte Carlo senaryo simülasyonu: çalıştırma kaydı ve yıl bazlı yüzdelik
+# bantlar (ScenarioEngine.simulate_tcfd_scenario). Ham yollar saklanmaz.
+
+try:
+    from modules.scenario_analysis.scenario_engine import install_simulation_tables
+except ImportError:
+    from backend.modules.scenario_analysis.scenario_engine import install_simulation_tables
+
+
+def up(conn):
+    install_simulation_tables(conn)
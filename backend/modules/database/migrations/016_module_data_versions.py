@@ -0,0 +1,14 @@
+# 016_module_data_versions.py
+# Modül bazlı veri sürümleri: modül tablolarındaki her değişiklik tetikleyiciyle
+# yalnızca o modülün sürümünü artırır (core.module_data_collector). Birleşik KPI
+# snapshot'ı ve ReportingService sürümü değişmeyen modülleri yeniden sorgulamaz.
+
+try:
+    from backend.core.module_data_collector import install_module_versions
+except ImportError:
+    from core.module_data_collector import install_module_versions
+
+
+def up(conn):
+    # Henüz oluşturulmamış modül tabloları toplayıcının ilk kullanımında izlemeye alınır
+    install_module_versions(conn)
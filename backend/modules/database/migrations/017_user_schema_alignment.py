@@ -0,0 +1,84 @@
+# 017_user_schema_alignment.py
+# 001'in eski users ve roles tabloları UserManager'ın kullandığı user_schema.sql
+# şemasıyla çakışıyordu (roles.role_name / roles.name, users.first_name ve
+# companies.sector yok). users ve companies'e eksik sütunlar eklenir; roles
+# yeni şemaya taşınır. Rol id'leri korunduğu için user_roles ve
+# role_permissions satırları geçerli kalır.
+
+try:
+    from yonetim.kullanici_yonetimi.models.user_manager import PERMISSION_GENERATION_DDL
+except ImportError:
+    from backend.yonetim.kullanici_yonetimi.models.user_manager import PERMISSION_GENERATION_DDL
+
+
+# ALTER TABLE ADD COLUMN sabit olmayan varsayılan kabul etmez (created_at/updated_at)
+ADDED_COLUMNS = {'users': (
+    ('first_name', "VARCHAR(50) NOT NULL DEFAULT ''"),
+    ('last_name', "VARCHAR(50) NOT NULL DEFAULT ''"),
+    ('phone', 'VARCHAR(20)'),
+    ('department', 'VARCHAR(100)'),
+    ('position', 'VARCHAR(100)'),
+    ('avatar_path', 'VARCHAR(255)'),
+    ('is_active', 'BOOLEAN DEFAULT 1'),
+    ('is_verified', 'BOOLEAN DEFAULT 0'),
+    ('last_login', 'TIMESTAMP'),
+    ('login_attempts', 'INTEGER DEFAULT 0'),
+    ('locked_until', 'TIMESTAMP'),
+    ('created_at', 'TIMESTAMP'),
+    ('updated_at', 'TIMESTAMP'),
+    ('created_by', 'INTEGER'),
+    ('updated_by', 'INTEGER'),
+), 'companies': (
+    ('sector', 'TEXT'),
+    ('country', 'TEXT'),
+)}
+
+
+def up(conn):
+    for table, added in ADDED_COLUMNS.items():
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if not columns:
+            continue
+        for column, definition in added:
+            if column not in columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    _migrate_roles(conn)
+
+
+def _migrate_roles(conn):
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(roles)")}
+    if 'role_name' not in columns or 'name' in columns:
+        return
+    # Yeni tablo oluşturulup yeniden adlandırılır; diğer tabloların
+    # REFERENCES roles(id) tanımları değişmez
+    conn.execute("""
+        CREATE TABLE roles_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name VARCHAR(50) NOT NULL UNIQUE,
+            display_name VARCHAR(100) NOT NULL,
+            description TEXT,
+            is_system_role BOOLEAN DEFAULT 0,
+            is_active BOOLEAN DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            created_by INTEGER,
+            updated_by INTEGER,
+            FOREIGN KEY (created_by) REFERENCES users(id),
+            FOREIGN KEY (updated_by) REFERENCES users(id)
+        )
+    """)
+    conn.execute("""
+        INSERT INTO roles_new (id, name, display_name)
+        SELECT id, role_name, role_name FROM roles
+    """)
+    conn.execute("DROP TABLE roles")
+    conn.execute("ALTER TABLE roles_new RENAME TO roles")
+
+    # Eski tabloyla düşen yetki cache tetikleyicileri (010) geri kurulur
+    has_generation = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='permission_cache_generation'"
+    ).fetchone()
+    if has_generation:
+        for statement in PERMISSION_GENERATION_DDL:
+            conn.execute(statement)
+        conn.execute("UPDATE permission_cache_generation SET generation = generation + 1 WHERE id = 1")
@@ -0,0 +1,22 @@
+# 018_survey_token_empty.py
+# 011'in tetikleyicileri '/' ile biten survey_link için boş token ('') yazıyordu;
+# ikinci böyle kayıt tekil indeksi ihlal edip yazmayı düşürüyordu. Tetikleyiciler
+# NULLIF'li tanımla yeniden kurulur, yazılmış boş token'lar NULL'a çekilir.
+
+try:
+    from modules.stakeholder.stakeholder_engagement import SURVEY_TOKEN_TRIGGERS, install_survey_token
+except ImportError:
+    from backend.modules.stakeholder.stakeholder_engagement import SURVEY_TOKEN_TRIGGERS, install_survey_token
+
+
+def up(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='online_surveys'")
+    if not cursor.fetchone():
+        return
+    for trigger in SURVEY_TOKEN_TRIGGERS:
+        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(online_surveys)")}
+    if 'survey_token' in columns:
+        cursor.execute("UPDATE online_surveys SET survey_token = NULL WHERE survey_token = ''")
+    install_survey_token(conn)
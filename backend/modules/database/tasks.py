@@ -1,8 +1,13 @@
 
 import logging
+import os
 from backend.celery_app import celery
+from backend.config.database import DB_PATH
 from backend.modules.database.backup_recovery_manager import BackupRecoveryManager
 
+# Web arayüzüyle aynı yedek klasörü (artımlı zincirler burada sürdürülür)
+BACKUP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'data', 'backups')
+
 @celery.task(name='tasks.run_scheduled_backup')
 def run_scheduled_backup(backup_type='full', upload_to_cloud=True):
     """
@@ -10,7 +15,7 @@ def run_scheduled_backup(backup_type='full', upload_to_cloud=True):
     """
     logging.info(f"Starting scheduled backup: type={backup_type}, cloud={upload_to_cloud}")
     try:
-        manager = BackupRecoveryManager()
+        manager = BackupRecoveryManager(DB_PATH, backup_dir=BACKUP_DIR)
         success, message = manager.create_backup(
             backup_type=backup_type,
             created_by='system_scheduler',
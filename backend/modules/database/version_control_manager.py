@@ -10,6 +10,8 @@ import os
 import sqlite3
 from typing import Dict, List
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class VersionControlManager:
@@ -20,11 +22,11 @@ class VersionControlManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """Versiyon kontrol tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -74,7 +76,7 @@ class VersionControlManager:
                           version_date: str, version_type: str, data_category: str,
                           change_description: str = None, changed_by: str = None) -> int:
         """Veri versiyonu oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -101,7 +103,7 @@ class VersionControlManager:
                        change_type: str, old_value: str = None, new_value: str = None,
                        record_id: int = None, change_reason: str = None) -> bool:
         """Veri değişikliği ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -125,7 +127,7 @@ class VersionControlManager:
 
     def get_version_history(self, company_id: int, data_category: str = None) -> List[Dict]:
         """Versiyon geçmişi getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -169,7 +171,7 @@ class VersionControlManager:
 
     def get_version_changes(self, company_id: int, version_id: int) -> List[Dict]:
         """Versiyon değişikliklerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -3,6 +3,14 @@ import logging
 import os
 from datetime import datetime
 from typing import Dict, List, Optional, Any
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 class EconomicManager:
     """
@@ -12,10 +20,10 @@ class EconomicManager:
     """
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             # Investment Projects
@@ -69,7 +77,7 @@ class EconomicManager:
             conn.close()
 
     def get_connection(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -125,7 +133,7 @@ class EconomicManager:
         return projects
 
     def add_investment_project(self, company_id, project_name, initial_investment, start_date, description, discount_rate=0.10, duration_years=5):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         try:
             cursor = conn.execute("""
                 INSERT INTO investment_projects 
@@ -142,7 +150,7 @@ class EconomicManager:
             conn.close()
 
     def add_project_cash_flow(self, project_id, year, cash_flow):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         try:
             # Yıl zaten varsa güncelle, yoksa ekle
             cursor = conn.execute("INSERT OR REPLACE INTO investment_cash_flows (project_id, year, cash_flow) VALUES (?, ?, ?)", (project_id, year, cash_flow))
@@ -12,6 +12,8 @@ from typing import Dict
 
 
 from utils.language_manager import LanguageManager
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class EconomicMetrics:
@@ -20,11 +22,11 @@ class EconomicMetrics:
     def __init__(self, db_path: str = None) -> None:
         self.db_path = db_path or os.path.join(os.getcwd(), 'data', 'sdg_desktop.sqlite')
         self.lm = LanguageManager()
-        self._ensure_tables()
+        ensure_schema(self.db_path, self._ensure_tables)
 
     def _ensure_tables(self) -> None:
         """Ekonomik tablolar"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -60,7 +62,7 @@ class EconomicMetrics:
             payments_government: Devlete ödemeler (vergi)
             community_investments: Toplum yatırımları
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -92,7 +94,7 @@ class EconomicMetrics:
 
     def get_summary(self, company_id: int, year: int) -> Dict:
         """GRI 201-1: Ekonomik değer özeti"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
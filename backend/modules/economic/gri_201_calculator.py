@@ -12,6 +12,8 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from utils.language_manager import LanguageManager
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class GRI201Calculator:
@@ -23,11 +25,11 @@ class GRI201Calculator:
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
         self.lm = LanguageManager()
-        self._init_tables()
+        ensure_schema(self.db_path, self._init_tables)
 
     def _init_tables(self) -> None:
         """Gerekli tabloları oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -85,7 +87,7 @@ class GRI201Calculator:
         - Distributed_Operating: operating_costs, employee_wages, payments_capital_providers, payments_government, community_investments
         - Retained: retained_earnings
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -119,7 +121,7 @@ class GRI201Calculator:
                 'total_distributed': float
             }
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -205,7 +207,7 @@ class GRI201Calculator:
 
     def get_economic_data(self, company_id: int, year: int) -> List[Dict]:
         """Tüm ekonomik verileri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -239,7 +241,7 @@ class GRI201Calculator:
 
     def get_latest_calculation(self, company_id: int, year: int) -> Optional[Dict]:
         """Son hesaplanmış değerleri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -274,7 +276,7 @@ class GRI201Calculator:
     def update_economic_data(self, data_id: int, amount: float,
                             notes: str = None) -> bool:
         """Ekonomik veriyi güncelle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -296,7 +298,7 @@ class GRI201Calculator:
 
     def delete_economic_data(self, data_id: int) -> bool:
         """Ekonomik veriyi sil"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -8,6 +8,8 @@ import logging
 import sqlite3
 from typing import Dict, List
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class EmissionReductionManager:
@@ -15,12 +17,12 @@ class EmissionReductionManager:
 
     def __init__(self, db_path: str = DB_PATH) -> None:
         self.db_path = db_path
-        self._ensure_tables()
+        ensure_schema(self.db_path, self._ensure_tables)
 
     def _ensure_tables(self) -> None:
         """Gerekli tabloları oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn = db_connect(self.db_path, timeout=30)
             cursor = conn.cursor()
 
             # Emisyon azaltma projeleri tablosu
@@ -106,7 +108,7 @@ class EmissionReductionManager:
                    expected_reduction: float = 0.0, budget: float = 0.0,
                    responsible_person: str = None) -> int:
         """Yeni emisyon azaltma projesi ekle"""
-        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn = db_connect(self.db_path, timeout=30)
         cursor = conn.cursor()
 
         try:
@@ -129,7 +131,7 @@ class EmissionReductionManager:
 
     def get_projects(self, company_id: int) -> List[Dict]:
         """Şirketin emisyon azaltma projelerini getir"""
-        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn = db_connect(self.db_path, timeout=30)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -150,7 +152,7 @@ class EmissionReductionManager:
     def add_progress(self, project_id: int, progress_date: str, progress_percentage: float,
                     actual_reduction: float = 0.0, cost: float = 0.0, notes: str = None) -> int:
         """Proje ilerleme kaydı ekle"""
-        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn = db_connect(self.db_path, timeout=30)
         cursor = conn.cursor()
 
         try:
@@ -179,7 +181,7 @@ class EmissionReductionManager:
 
     def get_progress_records(self, project_id: int = None) -> List[Dict]:
         """İlerleme kayıtlarını getir"""
-        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn = db_connect(self.db_path, timeout=30)
         cursor = conn.cursor()
 
         if project_id:
@@ -208,7 +210,7 @@ class EmissionReductionManager:
 
     def get_categories(self) -> List[Dict]:
         """Proje kategorilerini getir"""
-        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn = db_connect(self.db_path, timeout=30)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -225,7 +227,7 @@ class EmissionReductionManager:
 
     def update_project(self, project_id: int, **kwargs) -> bool:
         """Proje bilgilerini güncelle"""
-        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn = db_connect(self.db_path, timeout=30)
         cursor = conn.cursor()
 
         try:
@@ -263,7 +265,7 @@ class EmissionReductionManager:
 
     def delete_project(self, project_id: int) -> bool:
         """Projeyi sil"""
-        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn = db_connect(self.db_path, timeout=30)
         cursor = conn.cursor()
 
         try:
@@ -284,7 +286,7 @@ class EmissionReductionManager:
 
     def get_project_statistics(self, company_id: int) -> Dict:
         """Proje istatistiklerini getir"""
-        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn = db_connect(self.db_path, timeout=30)
         cursor = conn.cursor()
 
         # Toplam proje sayısı
@@ -9,6 +9,14 @@ import logging
 import os
 import sqlite3
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 try:
     from utils.language_manager import LanguageManager
@@ -27,11 +35,11 @@ class BiodiversityManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def get_dashboard_stats(self, company_id: int) -> Dict:
         """Dashboard için özet istatistikleri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         stats = {
             'habitat_count': 0, 'species_count': 0, 'project_count': 0,
@@ -62,7 +70,7 @@ class BiodiversityManager:
 
     def get_recent_records(self, company_id: int, limit: int = 10) -> List[Dict]:
         """Son eklenen kayıtları getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         records = []
 
@@ -99,7 +107,7 @@ class BiodiversityManager:
 
     def _init_db_tables(self) -> None:
         """Biyoçeşitlilik yönetimi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -226,7 +234,7 @@ class BiodiversityManager:
                         coordinates: str = None, biodiversity_value: str = None,
                         protection_status: str = None, management_plan: str = None) -> bool:
         """Habitat alanı ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -254,7 +262,7 @@ class BiodiversityManager:
                                last_survey_date: str = None, threat_factors: str = None,
                                protection_measures: str = None) -> bool:
         """Biyoçeşitlilik türü ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -284,7 +292,7 @@ class BiodiversityManager:
                                area_unit: str = None, target_species: str = None,
                                expected_benefits: str = None) -> bool:
         """Biyoçeşitlilik projesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -310,7 +318,7 @@ class BiodiversityManager:
                             service_value: float, value_unit: str, measurement_method: str = None,
                             beneficiary: str = None, location: str = None) -> bool:
         """Ekosistem hizmeti ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -337,7 +345,7 @@ class BiodiversityManager:
                                          affected_species: str = None, mitigation_measures: str = None,
                                          monitoring_plan: str = None, compliance_status: str = None) -> bool:
         """Biyoçeşitlilik etki değerlendirmesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -363,7 +371,7 @@ class BiodiversityManager:
                               baseline_value: float, baseline_unit: str, target_value: float,
                               target_unit: str, target_description: str = None) -> bool:
         """Biyoçeşitlilik hedefi belirle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -387,7 +395,7 @@ class BiodiversityManager:
 
     def get_biodiversity_summary(self, company_id: int) -> Dict:
         """Biyoçeşitlilik özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -464,7 +472,7 @@ class BiodiversityManager:
 
     def get_biodiversity_targets(self, company_id: int) -> List[Dict]:
         """Biyoçeşitlilik hedeflerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -499,7 +507,7 @@ class BiodiversityManager:
 
     def get_ecosystem_services(self, company_id: int, year: int) -> List[Dict]:
         """Ekosistem hizmetlerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
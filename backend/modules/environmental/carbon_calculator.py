@@ -12,6 +12,20 @@ from typing import Dict, List
 
 from utils.language_manager import LanguageManager
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
+
+SCOPE_COLUMNS = {1: 'scope1_total', 2: 'scope2_total', 3: 'scope3_total'}
+
+
+def year_range(year: int) -> tuple:
+    """
+    Yıl filtresi için [başlangıç, bitiş) tarih aralığı.
+    `strftime('%Y', period_start) = ?` yerine `period_start >= ? AND period_start < ?`
+    kullanıldığında (company_id, period_start, scope) indeksi devreye girer.
+    """
+    year = int(year)
+    return f"{year:04d}-01-01", f"{year + 1:04d}-01-01"
 
 
 class CarbonCalculator:
@@ -74,11 +88,11 @@ class CarbonCalculator:
         """
         self.lm = LanguageManager()
         self.db_path = db_path or DB_PATH
-        self._ensure_tables()
+        ensure_schema(self.db_path, self._ensure_tables)
 
     def _ensure_tables(self) -> None:
         """Karbon verileri için tabloları oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -120,6 +134,11 @@ class CarbonCalculator:
                 )
             """)
 
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_carbon_emissions_company_period
+                ON carbon_emissions(company_id, period_start, scope)
+            """)
+
             conn.commit()
             logging.info(f"[OK] {self.lm.tr('carbon_emission_tables_ready', 'Karbon emisyon tabloları hazır')}")
 
@@ -295,7 +314,7 @@ class CarbonCalculator:
         Returns:
             int: Kayıt ID
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -322,16 +341,12 @@ class CarbonCalculator:
                 created_by
             ))
 
-            conn.commit()
             emission_id = cursor.lastrowid
+            self._apply_summary_delta(cursor, company_id, period_start,
+                                      emission_data['scope'], emission_data['co2e_kg'])
+            conn.commit()
 
             logging.info(f"[OK] {self.lm.tr('emission_record_added', 'Emisyon kaydı eklendi')}: {emission_id}")
-
-            # Özeti güncelle
-            if period_start:
-                year = int(period_start.split('-')[0])
-                self._update_summary(company_id, year)
-
             return emission_id
 
         except Exception as e:
@@ -341,49 +356,165 @@ class CarbonCalculator:
         finally:
             conn.close()
 
-    def _update_summary(self, company_id: int, year: int) -> None:
-        """Yıllık karbon özetini güncelle"""
-        conn = sqlite3.connect(self.db_path)
+    def update_emission(self, emission_id: int, emission_data: Dict = None, period_start: str = None,
+                        period_end: str = None, description: str = None) -> bool:
+        """
+        Emisyon kaydını güncelle; özet eski değer çıkarılıp yenisi eklenerek düzeltilir.
+        None verilen alanlar değişmez.
+        """
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
-            # Scope bazında toplamları hesapla
             cursor.execute("""
-                SELECT 
-                    scope,
-                    SUM(co2e_kg)
-                FROM carbon_emissions
-                WHERE company_id = ?
-                AND strftime('%Y', period_start) = ?
-                GROUP BY scope
-            """, (company_id, str(year)))
+                SELECT company_id, scope, co2e_kg, period_start
+                FROM carbon_emissions WHERE id = ?
+            """, (emission_id,))
+            row = cursor.fetchone()
+            if not row:
+                return False
+            company_id, old_scope, old_co2e, old_period = row
+
+            fields = {}
+            if emission_data:
+                for key in ('scope', 'category', 'amount', 'unit', 'emission_factor', 'co2e_kg'):
+                    if key in emission_data:
+                        fields[key] = emission_data[key]
+            if period_start is not None:
+                fields['period_start'] = period_start
+            if period_end is not None:
+                fields['period_end'] = period_end
+            if description is not None:
+                fields['description'] = description
+            if not fields:
+                return True
+
+            set_clause = ', '.join(f"{key} = ?" for key in fields)
+            cursor.execute(
+                f"UPDATE carbon_emissions SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                (*fields.values(), emission_id)
+            )
+
+            self._apply_summary_delta(cursor, company_id, old_period, old_scope, -(old_co2e or 0))
+            self._apply_summary_delta(cursor, company_id, fields.get('period_start', old_period),
+                                      fields.get('scope', old_scope), fields.get('co2e_kg', old_co2e))
+            conn.commit()
+            return True
 
-            scope_totals = {row[0]: row[1] for row in cursor.fetchall()}
+        except Exception as e:
+            logging.error(f"[{self.lm.tr('error', 'HATA')}] Emisyon guncelleme: {e}")
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
 
-            scope1 = scope_totals.get(1, 0)
-            scope2 = scope_totals.get(2, 0)
-            scope3 = scope_totals.get(3, 0)
-            total = scope1 + scope2 + scope3
+    def delete_emission(self, emission_id: int) -> bool:
+        """Emisyon kaydını sil ve yıllık özetten düş"""
+        conn = db_connect(self.db_path)
+        cursor = conn.cursor()
 
-            # Özeti güncelle veya oluştur
+        try:
             cursor.execute("""
+                SELECT company_id, scope, co2e_kg, period_start
+                FROM carbon_emissions WHERE id = ?
+            """, (emission_id,))
+            row = cursor.fetchone()
+            if not row:
+                return False
+
+            cursor.execute("DELETE FROM carbon_emissions WHERE id = ?", (emission_id,))
+            self._apply_summary_delta(cursor, row[0], row[3], row[1], -(row[2] or 0))
+            conn.commit()
+            return True
+
+        except Exception as e:
+            logging.error(f"[{self.lm.tr('error', 'HATA')}] Emisyon silme: {e}")
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _apply_summary_delta(cursor, company_id: int, period_start: str, scope: int, delta_kg: float) -> None:
+        """
+        carbon_summary satırına artımlı fark uygula (çağıranın transaction'ı içinde).
+        Dönemi olmayan kayıtlar özete girmez. Kapsam, INTEGER sütunun yaptığı
+        gibi sayıya çevrilir ('1' -> 1); 1-3 dışındaki kapsamlar rebuild_summary
+        ile aynı şekilde özete girmez ve uyarı loglanır.
+        """
+        if not period_start or not delta_kg:
+            return
+        try:
+            scope = int(scope)
+        except (TypeError, ValueError):
+            scope = None
+        if scope not in SCOPE_COLUMNS:
+            logging.warning(f"carbon_summary: geçersiz kapsam atlandı ({company_id}, {period_start})")
+            return
+        try:
+            year = int(str(period_start).split('-')[0])
+        except ValueError:
+            return
+
+        cursor.execute("""
+            INSERT INTO carbon_summary (
+                company_id, year, scope1_total, scope2_total, scope3_total, total_emissions
+            )
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(company_id, year) DO UPDATE SET
+                scope1_total = scope1_total + excluded.scope1_total,
+                scope2_total = scope2_total + excluded.scope2_total,
+                scope3_total = scope3_total + excluded.scope3_total,
+                total_emissions = total_emissions + excluded.total_emissions,
+                updated_at = CURRENT_TIMESTAMP
+        """, (
+            company_id, year,
+            delta_kg if scope == 1 else 0,
+            delta_kg if scope == 2 else 0,
+            delta_kg if scope == 3 else 0,
+            delta_kg,
+        ))
+
+    def rebuild_summary(self, company_id: int = None) -> int:
+        """
+        carbon_summary tablosunu carbon_emissions'tan baştan hesapla (onarım).
+        Artımlı güncellemeyi atlayan yazımlar (doğrudan SQL, eski istemciler)
+        sonrası kullanılır. company_id None ise tüm firmalar.
+
+        Returns:
+            int: Yazılan özet satırı sayısı
+        """
+        conn = db_connect(self.db_path)
+        cursor = conn.cursor()
+
+        try:
+            company_filter = " AND company_id = ?" if company_id is not None else ""
+            params = (company_id,) if company_id is not None else ()
+
+            cursor.execute(f"DELETE FROM carbon_summary WHERE 1 = 1{company_filter}", params)
+            cursor.execute(f"""
                 INSERT INTO carbon_summary (
                     company_id, year, scope1_total, scope2_total, scope3_total, total_emissions
                 )
-                VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT(company_id, year) DO UPDATE SET
-                    scope1_total = excluded.scope1_total,
-                    scope2_total = excluded.scope2_total,
-                    scope3_total = excluded.scope3_total,
-                    total_emissions = excluded.total_emissions,
-                    updated_at = CURRENT_TIMESTAMP
-            """, (company_id, year, scope1, scope2, scope3, total))
-
+                SELECT
+                    company_id,
+                    CAST(substr(period_start, 1, 4) AS INTEGER) AS year,
+                    SUM(CASE WHEN scope = 1 THEN co2e_kg ELSE 0 END),
+                    SUM(CASE WHEN scope = 2 THEN co2e_kg ELSE 0 END),
+                    SUM(CASE WHEN scope = 3 THEN co2e_kg ELSE 0 END),
+                    SUM(CASE WHEN scope IN (1, 2, 3) THEN co2e_kg ELSE 0 END)
+                FROM carbon_emissions
+                WHERE period_start IS NOT NULL AND period_start != ''{company_filter}
+                GROUP BY company_id, year
+            """, params)
+            written = cursor.rowcount
             conn.commit()
+            return written
 
         except Exception as e:
-            logging.error(f"[HATA] Ozet guncelleme: {e}")
+            logging.error(f"[HATA] Ozet yeniden olusturma: {e}")
             conn.rollback()
+            return 0
         finally:
             conn.close()
 
@@ -398,7 +529,7 @@ class CarbonCalculator:
         Returns:
             Dict: Özet veriler
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -458,10 +589,11 @@ class CarbonCalculator:
         Returns:
             List[Dict]: Kategori bazında veriler
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
+            start, end = year_range(year)
             if scope:
                 cursor.execute("""
                     SELECT 
@@ -470,11 +602,11 @@ class CarbonCalculator:
                         COUNT(*) as count
                     FROM carbon_emissions
                     WHERE company_id = ? 
-                    AND strftime('%Y', period_start) = ?
+                    AND period_start >= ? AND period_start < ?
                     AND scope = ?
                     GROUP BY category
                     ORDER BY total_kg DESC
-                """, (company_id, str(year), scope))
+                """, (company_id, start, end, scope))
             else:
                 cursor.execute("""
                     SELECT 
@@ -483,10 +615,10 @@ class CarbonCalculator:
                         COUNT(*) as count
                     FROM carbon_emissions
                     WHERE company_id = ? 
-                    AND strftime('%Y', period_start) = ?
+                    AND period_start >= ? AND period_start < ?
                     GROUP BY category
                     ORDER BY total_kg DESC
-                """, (company_id, str(year)))
+                """, (company_id, start, end))
 
             results = []
             for row in cursor.fetchall():
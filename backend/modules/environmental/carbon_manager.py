@@ -10,6 +10,14 @@ import os
 import sqlite3
 from datetime import datetime
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 try:
     from utils.language_manager import LanguageManager
@@ -33,11 +41,11 @@ class CarbonManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """Karbon yönetimi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -142,6 +150,10 @@ class CarbonManager:
                 )
             """)
 
+            # Yıl filtreli sorgular (company_id = ? AND year = ?) için
+            for table in ('scope1_emissions', 'scope2_emissions', 'scope3_emissions'):
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_company_year ON {table}(company_id, year)")
+
             # Varsayılan emisyon faktörlerini ekle
             self._add_default_emission_factors(cursor)
             # DEFRA/IPCC Kütüphanesini içe aktar
@@ -223,23 +235,43 @@ class CarbonManager:
 
     def get_dashboard_stats(self, company_id: int) -> Dict:
         """Dashboard için özet istatistikleri getir"""
+        totals = self._get_scope_totals(company_id)
         return {
-            'total_co2e': self.get_total_carbon_footprint(company_id),
-            'scope1': self.get_scope_emissions(company_id, 1),
-            'scope2': self.get_scope_emissions(company_id, 2),
-            'scope3': self.get_scope_emissions(company_id, 3)
+            'total_co2e': totals[1] + totals[2] + totals[3],
+            'scope1': totals[1],
+            'scope2': totals[2],
+            'scope3': totals[3]
         }
 
     def get_total_carbon_footprint(self, company_id: int, year: int = None) -> float:
         """Toplam karbon ayak izini hesapla (kg CO2e)"""
-        s1 = self.get_scope_emissions(company_id, 1, year)
-        s2 = self.get_scope_emissions(company_id, 2, year)
-        s3 = self.get_scope_emissions(company_id, 3, year)
-        return s1 + s2 + s3
+        totals = self._get_scope_totals(company_id, year)
+        return totals[1] + totals[2] + totals[3]
+
+    def _get_scope_totals(self, company_id: int, year: int = None) -> Dict[int, float]:
+        """Üç kapsamın toplamlarını tek bağlantı ve tek sorguda getir"""
+        totals = {1: 0.0, 2: 0.0, 3: 0.0}
+        year_filter = " AND year = ?" if year else ""
+        params = (company_id, year) if year else (company_id,)
+
+        conn = db_connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(" UNION ALL ".join(
+                f"SELECT {scope}, SUM(total_emissions) FROM scope{scope}_emissions WHERE company_id = ?{year_filter}"
+                for scope in totals
+            ), params * len(totals))
+            for scope, total in cursor.fetchall():
+                totals[scope] = total or 0.0
+        except Exception as e:
+            logging.error(f"Error calculating scope emissions: {e}")
+        finally:
+            conn.close()
+        return totals
 
     def get_scope_emissions(self, company_id: int, scope: int, year: int = None) -> float:
         """Belirli bir kapsamdaki toplam emisyonu getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         table_map = {1: 'scope1_emissions', 2: 'scope2_emissions', 3: 'scope3_emissions'}
@@ -271,7 +303,7 @@ class CarbonManager:
         monthly_data = [0.0] * 12
         
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             
             tables = ['scope1_emissions', 'scope2_emissions', 'scope3_emissions']
@@ -307,7 +339,7 @@ class CarbonManager:
 
     def get_recent_records(self, company_id: int, limit: int = 10) -> List[Dict]:
         """Son eklenen karbon verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         records = []
 
@@ -376,7 +408,7 @@ class CarbonManager:
                            emission_factor: float = None, invoice_date: str = None,
                            due_date: str = None, supplier: str = None) -> bool:
         """Scope 1 emisyonu ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -417,7 +449,7 @@ class CarbonManager:
                            grid_emission_factor: float = None, invoice_date: str = None,
                            due_date: str = None, supplier: str = None) -> bool:
         """Scope 2 emisyonu ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -458,7 +490,7 @@ class CarbonManager:
                            emission_factor: float = None, invoice_date: str = None,
                            due_date: str = None, supplier: str = None) -> bool:
         """Scope 3 emisyonu ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -515,7 +547,7 @@ class CarbonManager:
                          baseline_year: int, baseline_emissions: float,
                          target_reduction_percent: float) -> bool:
         """Karbon hedefi belirle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -541,7 +573,7 @@ class CarbonManager:
 
     def get_carbon_targets(self, company_id: int) -> List[Dict]:
         """Karbon hedeflerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -575,7 +607,7 @@ class CarbonManager:
 
     def get_emission_factors(self, scope: int = None) -> List[Dict]:
         """Emisyon faktörlerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -615,7 +647,7 @@ class CarbonManager:
 
     def get_carbon_records(self, company_id: int, year: int) -> List[Dict]:
         """Tüm scope emisyon kayıtlarını getir (Raporlama için)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         records = []
 
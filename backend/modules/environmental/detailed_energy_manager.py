@@ -10,6 +10,14 @@ import os
 import sqlite3
 from datetime import datetime, timedelta
 from typing import Dict
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 try:
     from utils.language_manager import LanguageManager
@@ -24,11 +32,11 @@ class DetailedEnergyManager:
     def __init__(self, db_path: str = None) -> None:
         self.lm = LanguageManager()
         self.db_path = db_path or os.path.join(os.getcwd(), 'data', 'sdg_desktop.sqlite')
-        self._ensure_tables()
+        ensure_schema(self.db_path, self._ensure_tables)
 
     def _ensure_tables(self) -> None:
         """Gerekli tabloları oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -213,7 +221,7 @@ class DetailedEnergyManager:
         Returns:
             Oluşturulan kayıt ID'si
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -278,7 +286,7 @@ class DetailedEnergyManager:
         Returns:
             Oluşturulan kaynak ID'si
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -334,7 +342,7 @@ class DetailedEnergyManager:
         Returns:
             Oluşturulan proje ID'si
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -374,7 +382,7 @@ class DetailedEnergyManager:
         Returns:
             Hesaplanan metrikler
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -489,7 +497,7 @@ class DetailedEnergyManager:
         Returns:
             Kayıt listesi
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -529,7 +537,7 @@ class DetailedEnergyManager:
 
     def get_energy_trends(self, company_id: int, months: int = 12) -> Dict:
         """Enerji trendlerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -575,7 +583,7 @@ class DetailedEnergyManager:
 
     def get_annual_report_data(self, company_id: int, year: int) -> Dict:
         """Yıllık rapor verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
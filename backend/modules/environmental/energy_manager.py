@@ -12,6 +12,8 @@ from typing import Dict, List
 
 from utils.language_manager import LanguageManager
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class EnergyManager:
@@ -23,11 +25,11 @@ class EnergyManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """Enerji yönetimi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -153,7 +155,7 @@ class EnergyManager:
 
     def get_dashboard_stats(self, company_id: int) -> Dict:
         """Dashboard için özet istatistikleri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         stats = {'total_consumption': 0, 'renewable_ratio': 0, 'total_cost': 0}
 
@@ -183,7 +185,7 @@ class EnergyManager:
 
     def get_recent_records(self, company_id: int, limit: int = 10) -> List[Dict]:
         """Son eklenen kayıtları getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         records = []
 
@@ -218,7 +220,7 @@ class EnergyManager:
                              source: str = None, location: str = None, month: int = None,
                              invoice_date: str = None, due_date: str = None, supplier: str = None) -> bool:
         """Enerji tüketimi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -245,7 +247,7 @@ class EnergyManager:
                            generation_unit: str, self_consumption: float = None,
                            grid_feed: float = None, cost: float = None) -> bool:
         """Yenilenebilir enerji ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -273,7 +275,7 @@ class EnergyManager:
                                     savings_unit: str, cost_savings: float = None,
                                     payback_period: float = None, co2_reduction: float = None) -> bool:
         """Enerji verimliliği projesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -301,7 +303,7 @@ class EnergyManager:
                          baseline_year: int, baseline_consumption: float,
                          target_reduction_percent: float, renewable_target_percent: float = None) -> bool:
         """Enerji hedefi belirle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -329,7 +331,7 @@ class EnergyManager:
 
     def get_energy_summary(self, company_id: int, year: int) -> Dict:
         """Enerji özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -403,7 +405,7 @@ class EnergyManager:
 
     def get_energy_targets(self, company_id: int) -> List[Dict]:
         """Enerji hedeflerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -438,7 +440,7 @@ class EnergyManager:
 
     def get_energy_efficiency_projects(self, company_id: int) -> List[Dict]:
         """Enerji verimliliği projelerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
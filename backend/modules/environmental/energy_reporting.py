@@ -5,6 +5,10 @@ import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional
 from docx.shared import Cm
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 def _add_turkish_paragraph(doc, text, style=None, font_name='Calibri', font_size=11):
     """Türkçe karakterleri destekleyen paragraf ekle"""
@@ -80,7 +84,7 @@ class EnergyReporting:
         """Raporun başına şirket logosunu ekle"""
         try:
             # 1. Veritabanından logo yolunu al
-            conn = sqlite3.connect(self.energy_manager.db_path)
+            conn = db_connect(self.energy_manager.db_path)
             cursor = conn.cursor()
             cursor.execute("SELECT logo_path FROM company_profiles WHERE company_id = ?", (company_id,))
             result = cursor.fetchone()
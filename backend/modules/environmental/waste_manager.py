@@ -9,6 +9,14 @@ import logging
 import os
 import sqlite3
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 try:
     from utils.language_manager import LanguageManager
@@ -27,7 +35,7 @@ class WasteManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def get_dashboard_stats(self, company_id: int) -> Dict:
         """Dashboard için özet istatistikleri getir"""
@@ -35,7 +43,7 @@ class WasteManager:
 
     def get_recent_records(self, company_id: int, limit: int = 10) -> List[Dict]:
         """Son eklenen kayıtları getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         records = []
 
@@ -73,7 +81,7 @@ class WasteManager:
 
     def get_waste_records(self, company_id: int, year: str = None) -> List[Dict]:
         """Atık kayıtlarını getir (Raporlama için)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         records = []
 
@@ -152,7 +160,7 @@ class WasteManager:
 
     def calculate_waste_metrics(self, company_id: int, year: int = None) -> Dict:
         """Atık metriklerini hesapla"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         metrics = {}
 
@@ -195,7 +203,7 @@ class WasteManager:
 
     def _init_db_tables(self):
         """Atık yönetimi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -375,7 +383,7 @@ class WasteManager:
                            location: str = None, hazardous_status: str = None, month: int = None,
                            invoice_date: str = None, due_date: str = None, supplier: str = None) -> bool:
         """Atık üretimi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -404,7 +412,7 @@ class WasteManager:
                           recycling_rate: float = None, revenue: float = None,
                           location: str = None, month: int = None) -> bool:
         """Atık geri dönüşümü ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -432,7 +440,7 @@ class WasteManager:
                                   reduction_unit: str, cost_savings: float = None,
                                   payback_period: float = None) -> bool:
         """Atık azaltma projesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -460,7 +468,7 @@ class WasteManager:
                         baseline_year: int, baseline_generation: float,
                         target_reduction_percent: float, recycling_target_percent: float = None) -> bool:
         """Atık hedefi belirle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -488,7 +496,7 @@ class WasteManager:
 
     def get_waste_summary(self, company_id: int, year: int) -> Dict:
         """Atık özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -586,7 +594,7 @@ class WasteManager:
 
     def get_waste_targets(self, company_id: int) -> List[Dict]:
         """Atık hedeflerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -621,7 +629,7 @@ class WasteManager:
 
     def get_waste_categories(self) -> List[Dict]:
         """Atık kategorilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -9,6 +9,14 @@ import logging
 import os
 import sqlite3
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 try:
     from utils.language_manager import LanguageManager
@@ -27,7 +35,7 @@ class WaterManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def get_dashboard_stats(self, company_id: int) -> Dict:
         """Dashboard için özet istatistikleri getir"""
@@ -35,7 +43,7 @@ class WaterManager:
 
     def get_recent_records(self, company_id: int, limit: int = 10) -> List[Dict]:
         """Son eklenen kayıtları getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         records = []
 
@@ -80,7 +88,7 @@ class WaterManager:
 
     def _init_db_tables(self) -> None:
         """Su yönetimi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -205,7 +213,7 @@ class WaterManager:
                             quality_parameters: str = None,
                             invoice_date: str = None, due_date: str = None, supplier: str = None) -> bool:
         """Su tüketimi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -233,7 +241,7 @@ class WaterManager:
                           recycled_amount: float, unit: str, treatment_method: str = None,
                           reuse_purpose: str = None, cost_savings: float = None) -> bool:
         """Su geri dönüşümü ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -257,7 +265,7 @@ class WaterManager:
 
     def get_water_records(self, company_id: int, year: str = None) -> List[Dict]:
         """Su kayıtlarını getir (Raporlama için)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         records = []
 
@@ -326,7 +334,7 @@ class WaterManager:
 
     def calculate_water_metrics(self, company_id: int, year: int = None) -> Dict:
         """Su metriklerini hesapla"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         metrics = {}
 
@@ -365,7 +373,7 @@ class WaterManager:
                          parameter_name: str, parameter_value: float, unit: str,
                          standard_limit: float = None, month: int = None) -> bool:
         """Su kalitesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -398,7 +406,7 @@ class WaterManager:
                                    savings_unit: str, cost_savings: float = None,
                                    payback_period: float = None) -> bool:
         """Su verimliliği projesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -440,7 +448,7 @@ class WaterManager:
         """GRI 303 ve SDG 6 için su ayak izi hesaplama (Uyumluluk Modu)"""
         year = int(period) if period and period.isdigit() else None
         
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         metrics = {
             'total_water_footprint': 0,
@@ -508,7 +516,7 @@ class WaterManager:
                         baseline_year: int, baseline_consumption: float,
                         target_reduction_percent: float, recycling_target_percent: float = None) -> bool:
         """Su hedefi belirle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -536,7 +544,7 @@ class WaterManager:
 
     def get_water_summary(self, company_id: int, year: int) -> Dict:
         """Su özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -635,7 +643,7 @@ class WaterManager:
 
     def get_water_targets(self, company_id: int) -> List[Dict]:
         """Su hedeflerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -670,7 +678,7 @@ class WaterManager:
 
     def get_water_quality_summary(self, company_id: int, year: int) -> Dict:
         """Su kalitesi özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
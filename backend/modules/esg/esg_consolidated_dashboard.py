@@ -12,6 +12,7 @@ import tkinter as tk
 from datetime import datetime
 from tkinter import messagebox, ttk
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class ESGConsolidatedDashboard:
@@ -238,7 +239,7 @@ class ESGConsolidatedDashboard:
                     suppliers = self._get_all_suppliers()
                     self.supplier_cb['values'] = ['Tümü'] + suppliers
 
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Dönem filtresi
@@ -578,7 +579,7 @@ class ESGConsolidatedDashboard:
     def _get_all_suppliers(self) -> list:
         """Tüm tedarikçileri getir"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             suppliers = set()
             
@@ -2,9 +2,73 @@ import logging
 import json
 import os
 import sqlite3
+import threading
+import time
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.generation_triggers import GenerationTriggers
+
+# GRI/TSRS gösterge sayıları şirketten bağımsızdır; katalog tablolarındaki her
+# değişiklik tetikleyiciyle nesli artırır, paydalar yalnızca nesil değişince
+# yeniden sayılır. Nesil en fazla CATALOG_GENERATION_CHECK_INTERVAL saniyede bir okunur.
+CATALOG_GENERATION_CHECK_INTERVAL = 2.0
+
+ESG_CATALOG_TABLES = ('gri_standards', 'gri_indicators', 'tsrs_standards', 'tsrs_indicators')
+
+# Katalog tablolarındaki her değişiklik tek nesil sayacını (id = 1) artırır
+CATALOG_GENERATION = GenerationTriggers(
+    'esg_catalog_generation', 'id', 'generation',
+    dict.fromkeys(ESG_CATALOG_TABLES, 1), 'esg_catalog_generation',
+)
+
+
+def install_catalog_generation(conn) -> None:
+    """Nesil tablosunu ve mevcut katalog tablolarının tetikleyicilerini kur"""
+    CATALOG_GENERATION.install(conn)
+
+
+_catalog_lock = threading.Lock()
+_catalog_totals_cache: Dict[str, tuple] = {}  # db_path -> (generation | None, checked_at, totals)
+
+_TSRS_CATEGORIES = {'Environmental': 'environmental', 'Social': 'social', 'Governance': 'governance'}
+_COMPANY_CHUNK = 500
+
+# Yapılandırmadan gelen tablo adları yalnızca bu listedeyse sorgulanır
+_COUNTABLE_TABLES = {
+    'sdg_question_responses',
+    'tsrs_materiality_assessment',
+    'erp_metrics',
+    'supplier_assessments',
+    'survey_responses',
+    'carbon_emissions',
+    'energy_consumption',
+    'water_consumption',
+    'waste_generation',
+    'biodiversity_habitats',
+    'employees',
+    'ohs_incidents',
+    'lms_training_records',
+    'governance_board_members',
+    'governance_policies',
+}
+_SDG_ANSWERED_CONDITION = ' AND (answer_text IS NOT NULL OR answer_value IS NOT NULL)'
+_MATERIAL_CONDITION = ' AND is_material=1'
+_COUNTABLE_CONDITIONS = {'', _SDG_ANSWERED_CONDITION, _MATERIAL_CONDITION}
+
+_AVAILABILITY_TABLES = {
+    'carbon': 'carbon_emissions',
+    'energy': 'energy_consumption',
+    'water': 'water_consumption',
+    'waste': 'waste_generation',
+    'biodiv': 'biodiversity_habitats',
+    'employees': 'employees',
+    'ohs': 'ohs_incidents',
+    'training': 'lms_training_records',
+    'board': 'governance_board_members',
+    'policies': 'governance_policies',
+}
 
 
 class ESGManager:
@@ -79,6 +143,10 @@ class ESGManager:
                 cursor.execute("UPDATE esg_scores SET quarter = ((CAST(strftime('%m', score_date) AS INTEGER) - 1) / 3) + 1 WHERE quarter IS NULL")
                 
             conn.commit()
+
+            # Katalog paydaları için nesil sayacı (migrasyon öncesi veritabanları)
+            install_catalog_generation(conn)
+            conn.commit()
         except Exception as e:
             logging.error(f"ESG tablo olusturma hatasi: {e}")
         finally:
@@ -130,129 +198,221 @@ class ESGManager:
             return False
 
     def _connect(self) -> None:
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
+
+    # ------------------------------------------------------------------
+    # Katalog paydaları (şirketten bağımsız, süreç içi cache)
+    # ------------------------------------------------------------------
 
-    def _safe_count(self, cursor, table: str, where: str = None, params: Tuple = ()) -> int:
+    def _catalog_generation(self, cur) -> Optional[Tuple[int, int]]:
+        """
+        (nesil, katalog tablosu sayısı); tablo silinmesi de cache'i geçersiz kılar.
+        Tetikleyiciler eksikse kurulur ve None döner (cache kullanılmaz).
+        """
         try:
-            allowed_tables = {
-                'gri_indicators i JOIN gri_standards s ON i.standard_id = s.id',
-                'gri_responses r JOIN gri_indicators i ON r.indicator_id=i.id JOIN gri_standards s ON i.standard_id=s.id',
-                'tsrs_indicators i JOIN tsrs_standards s ON i.standard_id=s.id',
-                'tsrs_responses r JOIN tsrs_indicators i ON r.indicator_id=i.id JOIN tsrs_standards s ON i.standard_id=s.id',
-                'sdg_question_responses',
-                'tsrs_materiality_assessment',
-                'erp_metrics',
-                'supplier_assessments',
-                'survey_responses',
-                'carbon_emissions',
-                'energy_consumption',
-                'water_consumption',
-                'waste_generation',
-                'biodiversity_habitats',
-                'employees',
-                'ohs_incidents',
-                'lms_training_records',
-                'governance_board_members',
-                'governance_policies',
-            }
-            allowed_wheres = {
-                's.category = ?',
-                'r.company_id=? AND s.category=? AND r.response_value IS NOT NULL',
-                's.code = ?',
-                'r.company_id=? AND s.code=? AND r.response_value IS NOT NULL',
-                'company_id=? AND (answer_text IS NOT NULL OR answer_value IS NOT NULL)',
-                'company_id=? AND is_material=1',
-            }
-            if table not in allowed_tables:
-                return 0
-            q = 'SELECT COUNT(*) FROM ' + table
-            if where:
-                if where not in allowed_wheres:
-                    return 0
-                q += ' WHERE ' + where
-            cursor.execute(q, params)
-            return cursor.fetchone()[0] or 0
-        except Exception:
-            return 0
+            existing, tracked = cur.execute(CATALOG_GENERATION.tracking_sql).fetchone()
+            generation = dict(cur.execute(CATALOG_GENERATION.values_sql)).get(1) if existing == tracked else None
+        except sqlite3.Error:
+            generation = None
+        if generation is not None:
+            return generation, existing
+        conn = self._connect()
+        try:
+            install_catalog_generation(conn)
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            logging.warning(f"ESG katalog nesli kurulamadı: {e}")
+        finally:
+            conn.close()
+        return None
+
+    def _catalog_totals(self, cur) -> Dict[str, Dict[str, int]]:
+        """
+        GRI/TSRS kategori başına gösterge sayıları. Katalog nesli en fazla
+        CATALOG_GENERATION_CHECK_INTERVAL saniyede bir okunur; değişmedikçe
+        sayılar yeniden hesaplanmaz.
+        """
+        now = time.monotonic()
+        entry = _catalog_totals_cache.get(self.db_path)
+        if entry and entry[0] is not None and now - entry[1] < CATALOG_GENERATION_CHECK_INTERVAL:
+            return entry[2]
+
+        generation = self._catalog_generation(cur)
+        if entry and generation is not None and entry[0] == generation:
+            with _catalog_lock:
+                _catalog_totals_cache[self.db_path] = (generation, now, entry[2])
+            return entry[2]
+
+        gri = {'environmental': 0, 'social': 0, 'governance': 0}
+        for category, code, count in self._fetch_grouped(cur, """
+            SELECT s.category, s.code, COUNT(*)
+            FROM gri_indicators i JOIN gri_standards s ON i.standard_id = s.id
+            GROUP BY s.category, s.code
+        """):
+            self._add_gri_count(gri, category, code, count)
+        tsrs = {'environmental': 0, 'social': 0, 'governance': 0}
+        for category, count in self._fetch_grouped(cur, """
+            SELECT s.category, COUNT(*)
+            FROM tsrs_indicators i JOIN tsrs_standards s ON i.standard_id = s.id
+            GROUP BY s.category
+        """):
+            self._add_tsrs_count(tsrs, category, count)
+
+        totals = {'gri': gri, 'tsrs': tsrs}
+        with _catalog_lock:
+            _catalog_totals_cache[self.db_path] = (generation, now, totals)
+        return totals
+
+    def invalidate_catalog_totals(self) -> None:
+        """Bu süreçteki katalog paydalarını düşür (doğrudan SQL ile katalog yüklemesinden sonra)"""
+        with _catalog_lock:
+            _catalog_totals_cache.pop(self.db_path, None)
+
+    @staticmethod
+    def _add_gri_count(bucket: Dict[str, int], category: str, code: str, count: int) -> None:
+        # Governance kategoriden değil GRI 2 standardından sayılır
+        if category == 'Environmental':
+            bucket['environmental'] += count
+        elif category == 'Social':
+            bucket['social'] += count
+        if code == 'GRI 2':
+            bucket['governance'] += count
+
+    @staticmethod
+    def _add_tsrs_count(bucket: Dict[str, int], category: str, count: int) -> None:
+        key = _TSRS_CATEGORIES.get(category)
+        if key:
+            bucket[key] += count
+
+    # ------------------------------------------------------------------
+    # Şirket bazlı gruplu sorgular
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _fetch_grouped(cur, sql: str, params: Tuple = ()) -> List[tuple]:
+        """Tablo yoksa boş liste"""
+        try:
+            return cur.execute(sql, params).fetchall()
+        except sqlite3.Error:
+            return []
+
+    def _fetch_for_companies(self, cur, sql: str, company_ids: List[int]) -> List[tuple]:
+        """`{ids}` yer tutucusunu şirket parçalarıyla doldurarak sorgula"""
+        rows: List[tuple] = []
+        for start in range(0, len(company_ids), _COMPANY_CHUNK):
+            chunk = company_ids[start:start + _COMPANY_CHUNK]
+            rows.extend(self._fetch_grouped(cur, sql.format(ids=','.join('?' * len(chunk))), tuple(chunk)))
+        return rows
+
+    def _companies_with_rows(self, cur, table: str, company_ids: List[int], condition: str = '') -> Set[int]:
+        """Tabloda kaydı olan şirketler"""
+        if table not in _COUNTABLE_TABLES or condition not in _COUNTABLE_CONDITIONS:
+            return set()
+        sql = f"SELECT DISTINCT company_id FROM {table} WHERE company_id IN ({{ids}}){condition}"
+        return {row[0] for row in self._fetch_for_companies(cur, sql, company_ids)}
+
+    def _table_has_rows(self, cur, table: str) -> bool:
+        if table not in _COUNTABLE_TABLES:
+            return False
+        return bool(self._fetch_grouped(cur, f"SELECT 1 FROM {table} LIMIT 1"))
+
+    def _answered_counts(self, cur, company_ids: List[int]) -> Dict[int, Dict[str, Dict[str, int]]]:
+        """Çerçeve başına tek gruplu sorguyla şirketlerin cevaplanan gösterge sayıları"""
+        counts = {
+            cid: {'gri': {'environmental': 0, 'social': 0, 'governance': 0},
+                  'tsrs': {'environmental': 0, 'social': 0, 'governance': 0}}
+            for cid in company_ids
+        }
+        for cid, category, code, count in self._fetch_for_companies(cur, """
+            SELECT r.company_id, s.category, s.code, COUNT(*)
+            FROM gri_responses r
+            JOIN gri_indicators i ON r.indicator_id = i.id
+            JOIN gri_standards s ON i.standard_id = s.id
+            WHERE r.company_id IN ({ids}) AND r.response_value IS NOT NULL
+            GROUP BY r.company_id, s.category, s.code
+        """, company_ids):
+            self._add_gri_count(counts[cid]['gri'], category, code, count)
+        for cid, category, count in self._fetch_for_companies(cur, """
+            SELECT r.company_id, s.category, COUNT(*)
+            FROM tsrs_responses r
+            JOIN tsrs_indicators i ON r.indicator_id = i.id
+            JOIN tsrs_standards s ON i.standard_id = s.id
+            WHERE r.company_id IN ({ids}) AND r.response_value IS NOT NULL
+            GROUP BY r.company_id, s.category
+        """, company_ids):
+            self._add_tsrs_count(counts[cid]['tsrs'], category, count)
+        return counts
+
+    def _data_availability(self, cur, company_ids: List[int]) -> Dict[int, Dict[str, bool]]:
+        """Modül veri varlığı; tablo başına tek sorgu"""
+        present = {key: self._companies_with_rows(cur, table, company_ids)
+                   for key, table in _AVAILABILITY_TABLES.items()}
+        return {cid: {key: cid in ids for key, ids in present.items()} for cid in company_ids}
 
     def _check_data_availability(self, cur, company_id: int) -> Dict:
         """Modül veri varlığını kontrol et"""
-        has_carbon = self._safe_count(cur, 'carbon_emissions', "company_id=?", (company_id,)) > 0
-        has_energy = self._safe_count(cur, 'energy_consumption', "company_id=?", (company_id,)) > 0
-        has_water = self._safe_count(cur, 'water_consumption', "company_id=?", (company_id,)) > 0
-        has_waste = self._safe_count(cur, 'waste_generation', "company_id=?", (company_id,)) > 0
-        has_biodiv = self._safe_count(cur, 'biodiversity_habitats', "company_id=?", (company_id,)) > 0
-        
-        has_employees = self._safe_count(cur, 'employees', "company_id=?", (company_id,)) > 0
-        has_ohs = self._safe_count(cur, 'ohs_incidents', "company_id=?", (company_id,)) > 0
-        has_training = self._safe_count(cur, 'lms_training_records', "company_id=?", (company_id,)) > 0
-        
-        has_board = self._safe_count(cur, 'governance_board_members', "company_id=?", (company_id,)) > 0
-        has_policies = self._safe_count(cur, 'governance_policies', "company_id=?", (company_id,)) > 0
-        
-        return {
-            'carbon': has_carbon, 'energy': has_energy, 'water': has_water, 'waste': has_waste, 'biodiv': has_biodiv,
-            'employees': has_employees, 'ohs': has_ohs, 'training': has_training,
-            'board': has_board, 'policies': has_policies
-        }
+        return self._data_availability(cur, [company_id])[company_id]
 
     def compute_scores(self, company_id: int, period: str = None) -> Dict:
         """E, S, G skorlarını hesaplar ve genel ESG skorunu döner."""
+        return self.compute_scores_for_companies([company_id], period)[company_id]
+
+    def compute_scores_for_companies(self, company_ids: Iterable[int], period: str = None) -> Dict[int, Dict]:
+        """
+        Birden çok şirketi tek geçişte skorla. Katalog paydaları cache'ten gelir;
+        cevaplanan sayılar ve veri varlığı tüm şirketler için gruplu sorgularla okunur.
+        """
+        ids = list(dict.fromkeys(company_ids))
+        if not ids:
+            return {}
+        sources = self.config['sources']
+
         conn = self._connect()
-        cur = conn.cursor()
+        try:
+            cur = conn.cursor()
+            totals = self._catalog_totals(cur)
+            answered = self._answered_counts(cur, ids)
+            availability = self._data_availability(cur, ids)
+
+            # Kanıt bonusu: ERP/tedarikçi/anket tabloları şirketten bağımsız kontrol edilir
+            shared_evidence = any(
+                self._table_has_rows(cur, sources.get(f"{name}_table", name))
+                for name in ('erp_metrics', 'supplier_assessments', 'survey_responses')
+            )
+            sdg_answered = self._companies_with_rows(cur, 'sdg_question_responses', ids, _SDG_ANSWERED_CONDITION)
+            material = self._companies_with_rows(
+                cur, sources.get('tsrs_materiality_table', 'tsrs_materiality_assessment'), ids, _MATERIAL_CONDITION
+            )
+        finally:
+            conn.close()
+
+        return {
+            cid: self._score_from_counts(
+                totals, answered[cid], availability[cid],
+                shared_evidence or cid in sdg_answered, cid in material
+            )
+            for cid in ids
+        }
+
+    def _score_from_counts(self, totals: Dict, answered: Dict, da: Dict,
+                           has_evidence: bool, has_materiality: bool) -> Dict:
+        """Sayımlardan E/S/G skorlarını hesapla"""
         cfg = self.config
         sc = cfg['scoring']
 
-        # Veri varlığı kontrolü
-        da = self._check_data_availability(cur, company_id)
         has_carbon, has_energy, has_water, has_waste, has_biodiv = da['carbon'], da['energy'], da['water'], da['waste'], da['biodiv']
         has_employees, has_ohs, has_training = da['employees'], da['ohs'], da['training']
         has_board, has_policies = da['board'], da['policies']
 
-        # GRI yanıtları: kategoriye göre cevaplanan gösterge oranı
-        gri_e_total = self._safe_count(cur, 'gri_indicators i JOIN gri_standards s ON i.standard_id = s.id', "s.category = ?", ("Environmental",))
-        gri_e_answered = self._safe_count(cur, 'gri_responses r JOIN gri_indicators i ON r.indicator_id=i.id JOIN gri_standards s ON i.standard_id=s.id', "r.company_id=? AND s.category=? AND r.response_value IS NOT NULL", (company_id, "Environmental"))
-
-        gri_s_total = self._safe_count(cur, 'gri_indicators i JOIN gri_standards s ON i.standard_id = s.id', "s.category = ?", ("Social",))
-        gri_s_answered = self._safe_count(cur, 'gri_responses r JOIN gri_indicators i ON r.indicator_id=i.id JOIN gri_standards s ON i.standard_id=s.id', "r.company_id=? AND s.category=? AND r.response_value IS NOT NULL", (company_id, "Social"))
-
-        # Governance: GRI 2 ve TSRS-G1 ağırlıklı
-        gri_g_total = self._safe_count(cur, 'gri_indicators i JOIN gri_standards s ON i.standard_id = s.id', "s.code = ?", ("GRI 2",))
-        gri_g_answered = self._safe_count(cur, 'gri_responses r JOIN gri_indicators i ON r.indicator_id=i.id JOIN gri_standards s ON i.standard_id=s.id', "r.company_id=? AND s.code=? AND r.response_value IS NOT NULL", (company_id, "GRI 2"))
-
-        # TSRS yanıtları: kategoriye göre cevaplanan gösterge oranı
-        tsrs_e_total = self._safe_count(cur, 'tsrs_indicators i JOIN tsrs_standards s ON i.standard_id=s.id', "s.category = ?", ("Environmental",))
-        tsrs_e_answered = self._safe_count(cur, 'tsrs_responses r JOIN tsrs_indicators i ON r.indicator_id=i.id JOIN tsrs_standards s ON i.standard_id=s.id', "r.company_id=? AND s.category=? AND r.response_value IS NOT NULL", (company_id, "Environmental"))
-
-        tsrs_s_total = self._safe_count(cur, 'tsrs_indicators i JOIN tsrs_standards s ON i.standard_id=s.id', "s.category = ?", ("Social",))
-        tsrs_s_answered = self._safe_count(cur, 'tsrs_responses r JOIN tsrs_indicators i ON r.indicator_id=i.id JOIN tsrs_standards s ON i.standard_id=s.id', "r.company_id=? AND s.category=? AND r.response_value IS NOT NULL", (company_id, "Social"))
-
-        tsrs_g_total = self._safe_count(cur, 'tsrs_indicators i JOIN tsrs_standards s ON i.standard_id=s.id', "s.category = ?", ("Governance",))
-        tsrs_g_answered = self._safe_count(cur, 'tsrs_responses r JOIN tsrs_indicators i ON r.indicator_id=i.id JOIN tsrs_standards s ON i.standard_id=s.id', "r.company_id=? AND s.category=? AND r.response_value IS NOT NULL", (company_id, "Governance"))
-
-        # SDG katkısı: soru yanıtları kanıt olarak bonus
-        sdg_any_answers = self._safe_count(cur, 'sdg_question_responses', "company_id=? AND (answer_text IS NOT NULL OR answer_value IS NOT NULL)", (company_id,))
+        gri_e_total, gri_s_total, gri_g_total = (totals['gri'][k] for k in ('environmental', 'social', 'governance'))
+        tsrs_e_total, tsrs_s_total, tsrs_g_total = (totals['tsrs'][k] for k in ('environmental', 'social', 'governance'))
+        gri_e_answered, gri_s_answered, gri_g_answered = (answered['gri'][k] for k in ('environmental', 'social', 'governance'))
+        tsrs_e_answered, tsrs_s_answered, tsrs_g_answered = (answered['tsrs'][k] for k in ('environmental', 'social', 'governance'))
 
         # Kanıt / materyalite bonusları
-        evidence_bonus = 0.0
-        materiality_bonus = 0.0
-        try:
-            # ERP/supplier/survey mevcutsa minimal bonus
-            erp_rows = self._safe_count(cur, cfg['sources'].get('erp_metrics_table', 'erp_metrics'))
-            supp_rows = self._safe_count(cur, cfg['sources'].get('supplier_assessments_table', 'supplier_assessments'))
-            survey_rows = self._safe_count(cur, cfg['sources'].get('survey_responses_table', 'survey_responses'))
-            if erp_rows or supp_rows or survey_rows or sdg_any_answers:
-                evidence_bonus = sc.get('evidence_bonus', 0.05)
-        except Exception as e:
-            logging.error(f"Silent error caught: {str(e)}")
-
-        try:
-            # TSRS materyalite değerlendirmeleri varsa bonus
-            mat_rows = self._safe_count(cur, cfg['sources'].get('tsrs_materiality_table', 'tsrs_materiality_assessment'), "company_id=? AND is_material=1", (company_id,))
-            if mat_rows:
-                materiality_bonus = sc.get('materiality_bonus', 0.1)
-        except Exception as e:
-            logging.error(f"Silent error caught: {str(e)}")
+        evidence_bonus = sc.get('evidence_bonus', 0.05) if has_evidence else 0.0
+        materiality_bonus = sc.get('materiality_bonus', 0.1) if has_materiality else 0.0
 
         # Oranlar (cevaplanan/toplam), 0 bölme güvenliği
         def ratio(ans: int, tot: int) -> float:
@@ -302,7 +462,6 @@ class ESGManager:
         weights = cfg['weights']
         overall = E * weights['E'] + S * weights['S'] + G * weights['G']
 
-        conn.close()
         return {
             'E': round(E * 100, 1),
             'S': round(S * 100, 1),
@@ -7,12 +7,15 @@ __version__ = "1.0.0"
 __author__ = "SUSTAINAGE SDG Team"
 
 try:
-    from .esrs_gui import ESRSGUI
     from .esrs_module import ESRSModule
-    __all__ = ['ESRSModule', 'ESRSGUI']
 except ImportError as e:
     logging.error(f"[UYARI] ESRS modulu yukleme hatasi: {e}")
     ESRSModule = None
+
+try:
+    from .esrs_gui import ESRSGUI
+except ImportError:
     ESRSGUI = None
-    __all__ = []
+
+__all__ = ['ESRSModule', 'ESRSGUI']
 
@@ -11,6 +11,7 @@ import sqlite3
 from typing import Dict
 
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class ESRSManager:
@@ -25,7 +26,7 @@ class ESRSManager:
 
     def init_assessments_table(self) -> None:
         """ESRS değerlendirme ve önemlilik tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             # Mevcut esrs_assessments tablosu
@@ -87,7 +88,7 @@ class ESRSManager:
     def get_dashboard_stats(self, company_id: int) -> Dict:
         """ESRS dashboard istatistiklerini getir"""
         self.init_assessments_table()
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         stats = {"covered_standards": 0, "completion_rate": 0}
@@ -119,7 +120,7 @@ class ESRSManager:
     def get_assessment_status(self, company_id: int) -> Dict[str, str]:
         """Tüm standartlar için durum haritasını getir"""
         self.init_assessments_table()
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         status_map: Dict[str, str] = {}
         try:
@@ -138,7 +139,7 @@ class ESRSManager:
     def get_assessment_details(self, company_id: int, standard_code: str) -> Dict[str, str]:
         """Belirli bir standardın detaylarını getir"""
         self.init_assessments_table()
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         details = {}
         try:
@@ -179,7 +180,7 @@ class ESRSManager:
     ) -> bool:
         """Belirli bir ESRS standardı için durumu güncelle"""
         self.init_assessments_table()
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute(
@@ -216,7 +217,7 @@ class ESRSManager:
     def get_materiality_analysis(self, company_id: int) -> list:
         """Çifte önemlilik analizi verilerini getir"""
         self.init_assessments_table()
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         items = []
         try:
@@ -240,7 +241,7 @@ class ESRSManager:
     def add_materiality_item(self, company_id: int, topic: str, impact_score: int, likelihood: int, financial_effect: str, environmental_effect: str) -> bool:
         """Yeni önemlilik maddesi ekle"""
         self.init_assessments_table()
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute(
@@ -261,7 +262,7 @@ class ESRSManager:
     def delete_materiality_item(self, item_id: int, company_id: int) -> bool:
         """Önemlilik maddesini sil"""
         self.init_assessments_table()
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute(
@@ -12,6 +12,8 @@ from typing import Dict, List
 
 from utils.language_manager import LanguageManager
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class ESRSModule:
@@ -24,11 +26,11 @@ class ESRSModule:
             db_path = os.path.join(base_dir, db_path)
 
         self.db_path = db_path
-        self._ensure_tables()
+        ensure_schema(self.db_path, self._ensure_tables)
 
     def _ensure_tables(self):
         """ESRS tablolarini olustur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -92,7 +94,7 @@ class ESRSModule:
 
     def get_all_topics(self) -> List[Dict]:
         """Tum ESRS konularini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -107,7 +109,7 @@ class ESRSModule:
 
     def get_company_data(self, company_id: int, topic_code: str, year: int) -> List[Dict]:
         """Sirket verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -125,7 +127,7 @@ class ESRSModule:
 
     def save_data(self, company_id: int, topic_code: str, datapoint_code: str, value: str, year: int) -> bool:
         """ESRS veri kaydet"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
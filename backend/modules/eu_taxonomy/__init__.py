@@ -5,7 +5,10 @@ EU Taxonomy Module
 Avrupa Birliği Sürdürülebilir Finans Taksonomisi
 """
 
-from .taxonomy_gui import EUTaxonomyGUI
+try:
+    from .taxonomy_gui import EUTaxonomyGUI
+except ImportError:
+    EUTaxonomyGUI = None
 from .taxonomy_manager import EUTaxonomyManager
 
 __all__ = ['EUTaxonomyManager', 'EUTaxonomyGUI']
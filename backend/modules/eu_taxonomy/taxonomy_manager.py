@@ -3,17 +3,19 @@ import sqlite3
 import os
 from typing import Dict, List, Optional, Any
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 class EUTaxonomyManager:
     """EU Taxonomy Manager"""
     
     def __init__(self, db_path: str = DB_PATH):
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
         
     def _init_db_tables(self):
         """Initialize Taxonomy tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         try:
             cursor = conn.cursor()
             cursor.execute("""
@@ -46,7 +48,7 @@ class EUTaxonomyManager:
 
     def add_activity(self, company_id: int, activity_data: Dict[str, Any]) -> bool:
         """Add a new taxonomy activity"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         try:
             cursor = conn.cursor()
             
@@ -101,7 +103,7 @@ class EUTaxonomyManager:
 
     def get_taxonomy_stats(self, company_id: int) -> Dict:
         """Get taxonomy statistics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         stats = {
             'turnover': 0, 'turnover_aligned': 0, 'turnover_pct': 0,
             'capex': 0, 'capex_aligned': 0, 'capex_pct': 0,
@@ -141,7 +143,7 @@ class EUTaxonomyManager:
 
     def get_taxonomy_activities(self, company_id: int) -> List[Dict]:
         """Get taxonomy activities"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         activities = []
         try:
@@ -6,7 +6,10 @@ Dosya yükleme, saklama ve yönetim işlemlerini yönetir.
 """
 
 from .file_manager import FileManager
-from .file_upload_gui import FileUploadGUI
+try:
+    from .file_upload_gui import FileUploadGUI
+except ImportError:
+    FileUploadGUI = None
 
 __all__ = ['FileManager', 'FileUploadGUI']
 
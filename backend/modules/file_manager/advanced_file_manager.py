@@ -9,10 +9,58 @@ import logging
 import hashlib
 import mimetypes
 import os
-import shutil
 import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
+
+# İçerik adresli blob deposu: yüklemeler base_upload_dir/_blobs/<ab>/<sha256> altında tek kopya
+BLOB_DIR_NAME = '_blobs'
+COPY_BUFFER_SIZE = 1024 * 1024
+HASH_WORKERS = int(os.environ.get('SUSTAINAGE_UPLOAD_HASH_WORKERS', '4'))
+# Referansı sıfırlanan blob'lar bu süre dolmadan silinmez (eşzamanlı yükleme yeniden kullanabilir)
+BLOB_GC_GRACE_SECONDS = 3600
+
+BLOB_DDL = (
+    """CREATE TABLE IF NOT EXISTS file_blobs (
+        digest TEXT PRIMARY KEY,
+        blob_path TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        ref_count INTEGER NOT NULL DEFAULT 0,
+        created_at TEXT,
+        last_used_at REAL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_files_blob_digest ON files(blob_digest)",
+    # files satırı kalıcı silinirse (purge, doğrudan SQL) referans düşer; soft delete referansı korur
+    """CREATE TRIGGER IF NOT EXISTS trg_files_blob_release
+        AFTER DELETE ON files
+        WHEN OLD.blob_digest IS NOT NULL
+        BEGIN
+            UPDATE file_blobs SET ref_count = MAX(ref_count - 1, 0), last_used_at = strftime('%s', 'now')
+            WHERE digest = OLD.blob_digest;
+        END""",
+)
+
+
+def install_blob_store(conn) -> None:
+    """files.blob_digest sütunu, file_blobs tablosu ve referans tetikleyicisi"""
+    cursor = conn.cursor()
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(files)")}
+    if not columns:
+        return
+    if 'blob_digest' not in columns:
+        cursor.execute("ALTER TABLE files ADD COLUMN blob_digest TEXT")
+    for statement in BLOB_DDL:
+        cursor.execute(statement)
 
 
 class AdvancedFileManager:
@@ -32,12 +80,12 @@ class AdvancedFileManager:
              root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
              self.base_upload_dir = os.path.join(root_dir, 'uploads')
              
-        self._init_database()
+        ensure_schema(self.db_path, self._init_database)
         self._ensure_upload_directory()
 
     def _init_database(self) -> None:
         """Veritabanı tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Dosyalar tablosu
@@ -60,6 +108,7 @@ class AdvancedFileManager:
                 uploaded_at TEXT,
                 updated_at TEXT,
                 is_deleted INTEGER DEFAULT 0,
+                blob_digest TEXT,
                 FOREIGN KEY (company_id) REFERENCES companies(id),
                 FOREIGN KEY (folder_id) REFERENCES file_folders(id),
                 FOREIGN KEY (parent_version_id) REFERENCES files(id)
@@ -148,6 +197,8 @@ class AdvancedFileManager:
             ON files(parent_version_id)
         """)
 
+        install_blob_store(conn)
+
         conn.commit()
         conn.close()
 
@@ -159,10 +210,216 @@ class AdvancedFileManager:
         """Dosya checksum'ını hesapla"""
         sha256 = hashlib.sha256()
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b""):
                 sha256.update(chunk)
         return sha256.hexdigest()
 
+    # ============================================
+    # BLOB DEPOSU (İÇERİK ADRESLİ)
+    # ============================================
+
+    @property
+    def blob_dir(self) -> str:
+        return os.path.join(self.base_upload_dir, BLOB_DIR_NAME)
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, digest[:2], digest)
+
+    def _store_blob(self, source_path: str) -> Tuple[str, int, str]:
+        """
+        Kaynağı tek geçişte hem kopyala hem özetle. Aynı içerik depoda zaten
+        varsa geçici kopya atılır (yinelenen yüklemede disk yazımı yok).
+
+        Returns:
+            (sha256, boyut, blob yolu)
+        """
+        os.makedirs(self.blob_dir, exist_ok=True)
+        sha256 = hashlib.sha256()
+        size = 0
+        tmp_path = os.path.join(self.blob_dir, f".upload-{os.getpid()}-{time.monotonic_ns()}.tmp")
+        buffer = bytearray(COPY_BUFFER_SIZE)
+        view = memoryview(buffer)
+        try:
+            with open(source_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+                while True:
+                    read = src.readinto(buffer)
+                    if not read:
+                        break
+                    sha256.update(view[:read])
+                    dst.write(view[:read])
+                    size += read
+            digest = sha256.hexdigest()
+            blob_path = self._blob_path(digest)
+            if os.path.exists(blob_path):
+                os.remove(tmp_path)
+                # Yeniden kullanılan blob'un mtime'ı yenilenir: files satırı eklenene
+                # kadar collect_garbage'ın bekleme süresi onu korur
+                os.utime(blob_path)
+            else:
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                os.replace(tmp_path, blob_path)
+            return digest, size, blob_path
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _insert_file(self, cursor, company_id: int, folder_id: Optional[int], source_path: str,
+                     blob: Tuple[str, int, str], description: str = "", tags: List[str] = None,
+                     metadata: Dict[str, str] = None, uploaded_by: Optional[int] = None) -> int:
+        """files satırını ekle ve blob referansını artır (çağıranın transaction'ında)"""
+        digest, file_size, blob_path = blob
+        original_name = os.path.basename(source_path)
+        mime_type, _ = mimetypes.guess_type(source_path)
+        file_ext = os.path.splitext(original_name)[1]
+        now = datetime.now().isoformat()
+
+        # Benzersiz dosya adı oluştur
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        unique_name = f"{timestamp}_{hashlib.sha256(original_name.encode()).hexdigest()[:12]}{file_ext}"
+
+        cursor.execute("""
+            INSERT INTO file_blobs (digest, blob_path, size, ref_count, created_at, last_used_at)
+            VALUES (?, ?, ?, 1, ?, ?)
+            ON CONFLICT(digest) DO UPDATE SET ref_count = ref_count + 1, last_used_at = excluded.last_used_at
+        """, (digest, blob_path, file_size, now, time.time()))
+
+        cursor.execute("""
+            INSERT INTO files 
+            (company_id, folder_id, file_name, original_name, file_path, 
+             file_size, file_type, mime_type, checksum, description, 
+             uploaded_by, uploaded_at, updated_at, blob_digest)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            company_id,
+            folder_id,
+            unique_name,
+            original_name,
+            blob_path,
+            file_size,
+            file_ext,
+            mime_type,
+            digest,
+            description,
+            uploaded_by,
+            now,
+            now,
+            digest
+        ))
+
+        file_id = cursor.lastrowid
+
+        # Etiketleri ekle
+        if tags:
+            for tag_name in tags:
+                tag_id = self._ensure_tag(cursor, tag_name)
+                cursor.execute("""
+                    INSERT INTO file_tag_relations (file_id, tag_id, created_at)
+                    VALUES (?, ?, ?)
+                """, (file_id, tag_id, now))
+
+        # Metadata ekle
+        if metadata:
+            cursor.executemany("""
+                INSERT INTO file_metadata (file_id, meta_key, meta_value)
+                VALUES (?, ?, ?)
+            """, [(file_id, key, value) for key, value in metadata.items()])
+
+        return file_id
+
+    def collect_garbage(self, grace_seconds: float = BLOB_GC_GRACE_SECONDS, dry_run: bool = False) -> Dict:
+        """
+        Sahipsiz blob'ları temizle.
+
+        Referans sayıları files tablosundan yeniden hesaplanır; referansı
+        olmayan ve grace_seconds boyunca kullanılmamış blob'lar ile depoda
+        kaydı olmayan eski dosyalar (yarım kalmış yüklemeler) silinir.
+        Soft delete edilmiş dosyalar blob'larını korur.
+        """
+        cutoff = time.time() - grace_seconds
+        result = {'blobs_removed': 0, 'bytes_freed': 0, 'stray_removed': 0}
+
+        conn = db_connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE file_blobs
+                SET ref_count = (SELECT COUNT(*) FROM files WHERE files.blob_digest = file_blobs.digest)
+            """)
+            cursor.execute("""
+                SELECT digest, blob_path, size FROM file_blobs
+                WHERE ref_count = 0 AND COALESCE(last_used_at, 0) < ?
+            """, (cutoff,))
+            # Dosyası yakın zamanda yazılan/yeniden kullanılan blob (henüz kaydı
+            # eklenmemiş yükleme) bekleme süresi dolana kadar silinmez
+            orphans = [row for row in cursor.fetchall() if not self._touched_since(row[1], cutoff)]
+            if not dry_run and orphans:
+                cursor.executemany("DELETE FROM file_blobs WHERE digest = ? AND ref_count = 0",
+                                   [(digest,) for digest, _, _ in orphans])
+            known = {row[0] for row in cursor.execute("SELECT digest FROM file_blobs")}
+            if dry_run:
+                conn.rollback()
+            else:
+                conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+        for digest, blob_path, size in orphans:
+            result['blobs_removed'] += 1
+            result['bytes_freed'] += size or 0
+            if not dry_run and not self._touched_since(blob_path, cutoff):
+                try:
+                    os.remove(blob_path)
+                except FileNotFoundError:
+                    pass
+
+        orphan_digests = {digest for digest, _, _ in orphans}
+        if os.path.isdir(self.blob_dir):
+            for root, _, names in os.walk(self.blob_dir):
+                for name in names:
+                    if name in known or name in orphan_digests:
+                        continue
+                    path = os.path.join(root, name)
+                    try:
+                        if os.path.getmtime(path) >= cutoff:
+                            continue
+                        result['stray_removed'] += 1
+                        if not dry_run:
+                            os.remove(path)
+                    except FileNotFoundError:
+                        pass
+        return result
+
+    @staticmethod
+    def _touched_since(path: str, cutoff: float) -> bool:
+        try:
+            return os.path.getmtime(path) >= cutoff
+        except OSError:
+            return False
+
+    def get_blob_stats(self) -> Dict:
+        """Depo verimliliği: mantıksal (files) ve fiziksel (blob) boyutlar"""
+        conn = db_connect(self.db_path)
+        try:
+            blobs, physical = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM file_blobs").fetchone()
+            files, logical = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(file_size), 0) FROM files WHERE blob_digest IS NOT NULL").fetchone()
+        finally:
+            conn.close()
+        return {
+            'blobs': blobs,
+            'physical_bytes': physical,
+            'files': files,
+            'logical_bytes': logical,
+            'dedup_ratio': round(logical / physical, 2) if physical else 0.0,
+        }
+
     # ============================================
     # KLASÖR YÖNETİMİ
     # ============================================
@@ -199,7 +456,7 @@ class AdvancedFileManager:
             os.makedirs(folder_path, exist_ok=True)
 
             # Veritabanına kaydet
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -230,7 +487,7 @@ class AdvancedFileManager:
     def get_folder_path(self, folder_id: int) -> Optional[str]:
         """Klasör yolunu al"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("SELECT folder_path FROM file_folders WHERE id = ?", (folder_id,))
@@ -255,7 +512,7 @@ class AdvancedFileManager:
             Klasör listesi
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             if parent_folder_id is None:
@@ -303,7 +560,7 @@ class AdvancedFileManager:
             Başarılı ise True
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Soft delete
@@ -353,87 +610,31 @@ class AdvancedFileManager:
         Returns:
             Dosya ID veya None
         """
+        conn = None
         try:
-            # Dosya bilgilerini al
-            original_name = os.path.basename(source_path)
-            file_size = os.path.getsize(source_path)
-            mime_type, _ = mimetypes.guess_type(source_path)
-            file_ext = os.path.splitext(original_name)[1]
-
-            # Benzersiz dosya adı oluştur
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            unique_name = f"{timestamp}_{hashlib.sha256(original_name.encode()).hexdigest()[:12]}{file_ext}"
-
-            # Hedef yolu belirle
-            if folder_id:
-                folder_path = self.get_folder_path(folder_id)
-                if not folder_path:
-                    return None
-                dest_path = os.path.join(folder_path, unique_name)
-            else:
-                company_dir = os.path.join(self.base_upload_dir, f"company_{company_id}")
-                os.makedirs(company_dir, exist_ok=True)
-                dest_path = os.path.join(company_dir, unique_name)
-
-            # Dosyayı kopyala
-            shutil.copy2(source_path, dest_path)
+            if folder_id and not self.get_folder_path(folder_id):
+                return None
 
-            # Checksum hesapla
-            checksum = self._calculate_checksum(dest_path)
+            # Tek geçişte kopyala + özetle; aynı içerik tekrar yazılmaz
+            blob = self._store_blob(source_path)
 
             # Veritabanına kaydet
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
-
-            cursor.execute("""
-                INSERT INTO files 
-                (company_id, folder_id, file_name, original_name, file_path, 
-                 file_size, file_type, mime_type, checksum, description, 
-                 uploaded_by, uploaded_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                company_id,
-                folder_id,
-                unique_name,
-                original_name,
-                dest_path,
-                file_size,
-                file_ext,
-                mime_type,
-                checksum,
-                description,
-                uploaded_by,
-                datetime.now().isoformat(),
-                datetime.now().isoformat()
-            ))
-
-            file_id = cursor.lastrowid
-
-            # Etiketleri ekle
-            if tags:
-                for tag_name in tags:
-                    tag_id = self._ensure_tag(cursor, tag_name)
-                    cursor.execute("""
-                        INSERT INTO file_tag_relations (file_id, tag_id, created_at)
-                        VALUES (?, ?, ?)
-                    """, (file_id, tag_id, datetime.now().isoformat()))
-
-            # Metadata ekle
-            if metadata:
-                for key, value in metadata.items():
-                    cursor.execute("""
-                        INSERT INTO file_metadata (file_id, meta_key, meta_value)
-                        VALUES (?, ?, ?)
-                    """, (file_id, key, value))
-
+            file_id = self._insert_file(cursor, company_id, folder_id, source_path, blob,
+                                        description, tags, metadata, uploaded_by)
             conn.commit()
-            conn.close()
 
             return file_id
 
         except Exception as e:
+            if conn is not None:
+                conn.rollback()
             logging.error(f"Dosya yükleme hatası: {e}")
             return None
+        finally:
+            if conn is not None:
+                conn.close()
 
     def upload_multiple_files(self, company_id: int, file_paths: List[str],
                              folder_id: Optional[int] = None,
@@ -441,6 +642,9 @@ class AdvancedFileManager:
         """
         Birden fazla dosya yükle
         
+        Dosyalar paralel olarak depoya kopyalanıp özetlenir (hashlib büyük
+        tamponlarda GIL'i bırakır); kayıtlar tek transaction'da eklenir.
+        
         Args:
             company_id: Şirket ID
             file_paths: Dosya yolları listesi
@@ -450,16 +654,37 @@ class AdvancedFileManager:
         Returns:
             Yüklenen dosya ID'leri listesi
         """
+        if not file_paths:
+            return []
+        if folder_id and not self.get_folder_path(folder_id):
+            return []
+
+        def store(path):
+            try:
+                return self._store_blob(path)
+            except Exception as e:
+                logging.error(f"Dosya yükleme hatası ({path}): {e}")
+                return None
+
+        workers = max(1, min(HASH_WORKERS, len(file_paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            blobs = list(executor.map(store, file_paths))
+
         file_ids = []
-        for file_path in file_paths:
-            file_id = self.upload_file(
-                company_id=company_id,
-                source_path=file_path,
-                folder_id=folder_id,
-                uploaded_by=uploaded_by
-            )
-            if file_id:
-                file_ids.append(file_id)
+        conn = db_connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            for file_path, blob in zip(file_paths, blobs):
+                if blob is not None:
+                    file_ids.append(self._insert_file(cursor, company_id, folder_id, file_path, blob,
+                                                      uploaded_by=uploaded_by))
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logging.error(f"Toplu dosya yükleme hatası: {e}")
+            return []
+        finally:
+            conn.close()
 
         return file_ids
 
@@ -478,7 +703,7 @@ class AdvancedFileManager:
         """
         try:
             # Orijinal dosya bilgilerini al
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -509,7 +734,7 @@ class AdvancedFileManager:
 
             if file_id:
                 # Versiyon bilgisini güncelle
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -538,7 +763,7 @@ class AdvancedFileManager:
             Versiyon listesi
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Dosya ID'nin kök versiyonunu bul
@@ -597,7 +822,7 @@ class AdvancedFileManager:
             Dosya listesi
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Temel sorgu
@@ -680,7 +905,7 @@ class AdvancedFileManager:
             Başarılı ise True
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -727,7 +952,7 @@ class AdvancedFileManager:
             Başarılı ise True
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             for tag_name in tags:
@@ -759,7 +984,7 @@ class AdvancedFileManager:
             Başarılı ise True
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             placeholders = ','.join('?' * len(tags))
@@ -781,7 +1006,7 @@ class AdvancedFileManager:
     def get_all_tags(self) -> List[Dict]:
         """Tüm etiketleri listele"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -815,7 +1040,7 @@ class AdvancedFileManager:
     def add_metadata(self, file_id: int, key: str, value: str) -> bool:
         """Dosyaya metadata ekle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -834,7 +1059,7 @@ class AdvancedFileManager:
     def get_metadata(self, file_id: int) -> Dict[str, str]:
         """Dosya metadata'sını al"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -862,7 +1087,7 @@ class AdvancedFileManager:
                   expires_at: Optional[str] = None) -> bool:
         """Dosyayı paylaş"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -890,7 +1115,7 @@ class AdvancedFileManager:
     def get_file_info(self, file_id: int) -> Optional[Dict]:
         """Dosya bilgilerini al"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
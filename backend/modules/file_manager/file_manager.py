@@ -13,6 +13,7 @@ import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class FileManager:
@@ -106,7 +107,7 @@ class FileManager:
             shutil.copy2(source_path, dest_path)
 
             # Veritabanına kaydet
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -137,7 +138,7 @@ class FileManager:
         Returns:
             List[Dict]: Dosya listesi
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -177,7 +178,7 @@ class FileManager:
         Returns:
             bool: Başarılı mı?
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -219,7 +220,7 @@ class FileManager:
         Returns:
             Optional[str]: Dosya yolu veya None
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -14,6 +14,7 @@ from datetime import datetime
 from tkinter import filedialog, messagebox, ttk
 from typing import Any, Dict, List, Optional
 from utils.language_manager import LanguageManager
+from utils.db_pool import connect as db_connect
 
 
 class DynamicFormBuilder:
@@ -728,7 +729,7 @@ class DynamicFormBuilder:
 
         # Veritabanına kaydet
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Form responses tablosuna kaydet
@@ -785,7 +786,7 @@ class DynamicFormBuilder:
     def load_form_data(self, form_id: str, response_id: int) -> None:
         """Kayıtlı form verilerini yükle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -10,6 +10,14 @@ import json
 import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class FormTemplateManager:
@@ -21,11 +29,11 @@ class FormTemplateManager:
             db_path: Veritabanı yolu
         """
         self.db_path = db_path
-        self._init_database()
+        ensure_schema(self.db_path, self._init_database)
 
     def _init_database(self) -> None:
         """Veritabanı tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Form şablonları tablosu
@@ -78,7 +86,7 @@ class FormTemplateManager:
             Başarılı ise True
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -115,7 +123,7 @@ class FormTemplateManager:
             Form şeması veya None
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -151,7 +159,7 @@ class FormTemplateManager:
             Şablon listesi
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             if category:
@@ -197,7 +205,7 @@ class FormTemplateManager:
             Başarılı ise True
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("DELETE FROM form_templates WHERE form_id = ?", (form_id,))
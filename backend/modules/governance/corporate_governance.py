@@ -9,6 +9,14 @@ import logging
 import os
 import sqlite3
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 try:
     from config.database import DB_PATH
 except ImportError:
@@ -23,11 +31,11 @@ class CorporateGovernanceManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """Kurumsal yönetim tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -118,7 +126,7 @@ class CorporateGovernanceManager:
             
     def get_dashboard_stats(self, company_id: int) -> Dict:
         """Dashboard için özet istatistikleri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         stats = {
             'board_members': 0,
@@ -162,7 +170,7 @@ class CorporateGovernanceManager:
                         term_end_date: str = None, independence_status: str = None,
                         expertise_area: str = None, gender: str = None, age: int = None) -> bool:
         """Yönetim kurulu üyesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -188,7 +196,7 @@ class CorporateGovernanceManager:
                                chair_person: str = None, member_count: int = None,
                                meeting_frequency: str = None, responsibilities: str = None) -> bool:
         """Yönetişim komitesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -215,7 +223,7 @@ class CorporateGovernanceManager:
                             review_date: str = None, approval_authority: str = None,
                             compliance_requirements: str = None) -> bool:
         """Yönetişim politikası ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -240,7 +248,7 @@ class CorporateGovernanceManager:
     def add_ethics_training(self, company_id: int, training_name: str, participants: int,
                           total_hours: float, description: str = None) -> bool:
         """Etik eğitim/uyum kaydı ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -263,7 +271,7 @@ class CorporateGovernanceManager:
     def get_dashboard_stats(self, company_id: int) -> Dict[str, int]:
         """Dashboard için özet istatistikler"""
         stats = {'board_members': 0, 'committees': 0, 'ethics_training': 0}
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         try:
             # Board Members
             row = conn.execute("SELECT COUNT(*) FROM board_members WHERE company_id = ? AND status = 'active'", (company_id,)).fetchone()
@@ -291,7 +299,7 @@ class CorporateGovernanceManager:
     def get_recent_data(self, company_id: int, limit: int = 10) -> list:
         """Son aktiviteleri getir"""
         recent_data = []
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         
         try:
@@ -319,7 +327,7 @@ class CorporateGovernanceManager:
 
     def get_recent_records(self, company_id: int, limit: int = 5) -> list:
         """Son eklenen yönetişim verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         recent_data = []
@@ -358,7 +366,7 @@ class CorporateGovernanceManager:
 
     def get_governance_summary(self, company_id: int) -> Dict:
         """Yönetişim özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -448,7 +456,7 @@ class CorporateGovernanceManager:
 
     def add_fair_operating_record(self, company_id: int, data: Dict) -> bool:
         """Adil çalışma uygulaması kaydı ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
@@ -470,7 +478,7 @@ class CorporateGovernanceManager:
 
     def get_fair_operating_records(self, company_id: int) -> List[Dict]:
         """Adil çalışma kayıtlarını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         records = []
         
@@ -499,7 +507,7 @@ class CorporateGovernanceManager:
             'value_chain': 0
         }
         
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         try:
             # Total
             row = conn.execute("SELECT COUNT(*) FROM fair_operating_practices WHERE company_id = ? AND status = 'active'", (company_id,)).fetchone()
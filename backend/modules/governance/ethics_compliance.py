@@ -10,6 +10,8 @@ import os
 import sqlite3
 from typing import Dict
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class EthicsComplianceManager:
@@ -20,11 +22,11 @@ class EthicsComplianceManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """Etik ve uyumluluk tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -89,7 +91,7 @@ class EthicsComplianceManager:
                            investigation_status: str = None, disciplinary_action: str = None,
                            preventive_measures: str = None) -> bool:
         """Etik ihlal ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -116,7 +118,7 @@ class EthicsComplianceManager:
                                 non_compliance_items: str = None, corrective_actions: str = None,
                                 next_review_date: str = None) -> bool:
         """Uyumluluk değerlendirmesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -142,7 +144,7 @@ class EthicsComplianceManager:
                           participant_count: int, completion_rate: float = None,
                           assessment_score: float = None) -> bool:
         """Etik eğitimi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -166,7 +168,7 @@ class EthicsComplianceManager:
 
     def get_ethics_compliance_summary(self, company_id: int, year: int) -> Dict:
         """Etik ve uyumluluk özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
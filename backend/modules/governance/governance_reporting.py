@@ -5,6 +5,10 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from docx.shared import Cm, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 try:
     from docx import Document
@@ -69,7 +73,7 @@ class GovernanceReporting:
     def _add_logo(self, doc, company_id: int):
         """Raporun başına şirket logosunu ekle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("SELECT logo_path FROM company_profiles WHERE company_id = ?", (company_id,))
             result = cursor.fetchone()
@@ -116,7 +120,7 @@ class GovernanceReporting:
             doc.add_page_break()
             _add_turkish_heading(doc, '1. Yönetim Kurulu Yapısı', 1)
             
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
@@ -13,6 +13,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class UserRole(Enum):
@@ -41,11 +43,11 @@ class GRIAuditTrail:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self.create_audit_tables()
+        ensure_schema(self.db_path, self.create_audit_tables)
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def create_audit_tables(self) -> None:
         """Denetim tablolarını oluştur"""
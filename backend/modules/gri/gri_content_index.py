@@ -13,6 +13,7 @@ from typing import Dict, Optional
 
 import pandas as pd
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class GRIContentIndex:
@@ -31,7 +32,7 @@ class GRIContentIndex:
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def generate_content_index(self, company_id: int = 1) -> Dict:
         """GRI Content Index oluştur"""
@@ -17,6 +17,7 @@ from typing import Dict
 import pandas as pd
 from openpyxl.styles import Alignment, Font, PatternFill
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class GRIContentIndexEnhanced:
@@ -45,7 +46,7 @@ class GRIContentIndexEnhanced:
 
     def get_connection(self):
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def generate_content_index(self, company_id: int = 1) -> Dict:
         """GRI Content Index oluştur"""
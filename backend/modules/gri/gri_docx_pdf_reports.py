@@ -24,6 +24,7 @@ from reportlab.platypus import (Paragraph, SimpleDocTemplate, Spacer, Table,
 
 from utils.language_manager import LanguageManager
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 def _add_turkish_paragraph(doc, text, style=None, font_name='Calibri', font_size=11):
@@ -71,7 +72,7 @@ class GRIDocxPDFReports:
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def generate_gri_content_index_data(self, company_id: int = 1) -> Dict:
         """GRI Content Index verilerini oluştur"""
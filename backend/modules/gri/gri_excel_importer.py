@@ -13,6 +13,7 @@ from typing import Dict
 
 import pandas as pd
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class GRIExcelImporter:
@@ -43,7 +44,7 @@ class GRIExcelImporter:
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def load_excel_data(self) -> Dict[str, pd.DataFrame]:
         """Excel dosyasından tüm sayfaları yükle"""
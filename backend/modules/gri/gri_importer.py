@@ -10,6 +10,10 @@ import logging
 import argparse
 import sqlite3
 from typing import Optional
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 try:
     import pandas as pd
@@ -71,7 +75,7 @@ def upsert_indicator(cur, standard_id: int, code: str, title: Optional[str], uni
 
 
 def import_excel(db_path: str, excel_path: str, sheet: Optional[str]) -> None:
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     cur = conn.cursor()
     try:
         # MASTER_232 sayfasını oku ve GRI Bağlantısı kolonundan standartları çıkar
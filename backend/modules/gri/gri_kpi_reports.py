@@ -12,6 +12,7 @@ from typing import Dict
 
 import pandas as pd
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class GRIKPIReports:
@@ -26,7 +27,7 @@ class GRIKPIReports:
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def generate_kpi_dashboard(self, company_id: int = 1) -> Dict:
         """KPI Dashboard oluştur"""
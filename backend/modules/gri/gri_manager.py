@@ -4,6 +4,8 @@ from datetime import datetime
 from typing import Dict, List
 
 from config.settings import ensure_directories, get_db_path
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class GRIManager:
@@ -18,12 +20,12 @@ class GRIManager:
         self.company_id = 1  # Varsayılan company_id
 
         # Tabloları oluştur ve veri doldur
-        self.create_gri_tables()
+        ensure_schema(self.db_path, self.create_gri_tables)
         self.populate_gri_standards()
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def get_dashboard_stats(self, company_id: int) -> Dict:
         """Dashboard için özet istatistikleri getir"""
@@ -14,6 +14,7 @@ import time
 from functools import wraps
 from typing import Any, Dict, List, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class GRIPerformanceCache:
@@ -39,7 +40,7 @@ class GRIPerformanceCache:
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def generate_cache_key(self, query: str, params: tuple = ()) -> str:
         """Cache key oluştur"""
@@ -29,6 +29,7 @@ from reportlab.platypus import (Paragraph, SimpleDocTemplate, Spacer, Table,
 
 from utils.language_manager import LanguageManager
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 def _add_turkish_paragraph(doc, text, style=None, font_name='Calibri', font_size=11):
@@ -121,7 +122,7 @@ class GRIReporting:
             logging.error(f"Font kurulumu hatası: {e}")
 
     def get_connection(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def _get_company(self, conn: sqlite3.Connection, company_id: int) -> Optional[Tuple]:
         cur = conn.cursor()
@@ -9,6 +9,7 @@ import logging
 import os
 import sqlite3
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class GRISchemaUpgrade:
@@ -23,7 +24,7 @@ class GRISchemaUpgrade:
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def create_extension_tables(self) -> None:
         """Ek tabloları oluştur - mevcut şemayı bozmadan"""
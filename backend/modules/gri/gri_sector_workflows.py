@@ -11,6 +11,7 @@ import sqlite3
 from typing import Dict, List
 from utils.language_manager import LanguageManager
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class GRISectorWorkflows:
@@ -25,7 +26,7 @@ class GRISectorWorkflows:
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def get_sector_standards(self) -> Dict[str, Dict]:
         """Sektör standartları ve özel gereksinimlerini getir"""
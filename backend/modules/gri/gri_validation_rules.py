@@ -11,6 +11,7 @@ import sqlite3
 from datetime import datetime
 from typing import Dict
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class GRIValidationRules:
@@ -25,7 +26,7 @@ class GRIValidationRules:
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def create_validation_rules(self) -> None:
         """Temel doğrulama kurallarını oluştur"""
@@ -1,5 +1,8 @@
 # IIRC (International Integrated Reporting Council) - Entegre Raporlama Modülü
-from .iirc_gui import IIRCGUI
+try:
+    from .iirc_gui import IIRCGUI
+except ImportError:
+    IIRCGUI = None
 from .iirc_manager import IIRCManager
 from .six_capitals import SixCapitalsManager
 from .value_creation import ValueCreationStory
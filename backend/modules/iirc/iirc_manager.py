@@ -3,6 +3,8 @@ import logging
 import os
 from typing import Dict, List, Optional, Union
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 class IIRCManager:
     """IIRC (International Integrated Reporting Council) Manager"""
@@ -16,7 +18,7 @@ class IIRCManager:
         # Ensure directory exists
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
             
-        self.init_database()
+        ensure_schema(self.db_path, self.init_database)
         
     def init_database(self):
         """Initialize IIRC tables"""
@@ -57,7 +59,7 @@ class IIRCManager:
             conn.close()
             
     def get_connection(self):
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
         
     def get_dashboard_stats(self, company_id: int) -> Dict:
         """Get summary statistics for IIRC dashboard"""
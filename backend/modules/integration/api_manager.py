@@ -11,6 +11,8 @@ import sqlite3
 from datetime import datetime
 from typing import Dict
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class APIManager:
@@ -21,11 +23,11 @@ class APIManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """API yönetimi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -97,7 +99,7 @@ class APIManager:
                         http_method: str, description: str = None,
                         authentication_type: str = None, rate_limit: int = None) -> bool:
         """API endpoint ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -122,7 +124,7 @@ class APIManager:
     def create_api_key(self, company_id: int, key_name: str, permissions: str = None,
                       expires_at: str = None) -> str:
         """API anahtarı oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -151,7 +153,7 @@ class APIManager:
                        execution_time: float, ip_address: str = None,
                        user_agent: str = None) -> bool:
         """API isteği logla"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -186,7 +188,7 @@ class APIManager:
 
     def get_api_summary(self, company_id: int) -> Dict:
         """API özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -259,7 +261,7 @@ class APIManager:
 
     def generate_api_documentation(self, company_id: int) -> str:
         """API dokümantasyonu oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
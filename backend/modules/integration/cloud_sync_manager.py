@@ -10,6 +10,8 @@ import os
 import sqlite3
 from typing import Dict
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class CloudSyncManager:
@@ -20,11 +22,11 @@ class CloudSyncManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """Cloud sync tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -88,7 +90,7 @@ class CloudSyncManager:
                           access_key: str = None, secret_key: str = None,
                           bucket_name: str = None, region: str = None) -> bool:
         """Bulut sağlayıcısı ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -114,7 +116,7 @@ class CloudSyncManager:
                        source_path: str, destination_path: str,
                        sync_frequency: str = None) -> bool:
         """Senkronizasyon işi oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -138,7 +140,7 @@ class CloudSyncManager:
                            file_size: int = None, backup_location: str = None,
                            backup_status: str = 'completed') -> bool:
         """Yedekleme kaydı oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -160,7 +162,7 @@ class CloudSyncManager:
 
     def get_cloud_sync_summary(self, company_id: int) -> Dict:
         """Cloud sync özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -14,6 +14,7 @@ from typing import List
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class RESTAPIServer:
@@ -108,7 +109,7 @@ class RESTAPIServer:
         def get_company(company_id):
             """Şirket bilgilerini getir"""
             try:
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cursor = conn.cursor()
 
                 cursor.execute(
@@ -150,7 +151,7 @@ class RESTAPIServer:
                 except Exception:
                     year = datetime.now().year
 
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -185,7 +186,7 @@ class RESTAPIServer:
             try:
                 data = request.get_json()
 
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -219,7 +220,7 @@ class RESTAPIServer:
         def get_sdg_goals(company_id):
             """Seçilen SDG hedeflerini getir"""
             try:
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -252,7 +253,7 @@ class RESTAPIServer:
                 module = request.args.get('module', None)
                 client_ip = request.headers.get('X-Forwarded-For') or request.remote_addr or '0.0.0.0'
                 rl_key = 'reports:' + client_ip
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cursor = conn.cursor()
 
                 if module:
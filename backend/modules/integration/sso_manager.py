@@ -11,6 +11,8 @@ import sqlite3
 from datetime import datetime
 from typing import Dict
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class SSOManager:
@@ -21,11 +23,11 @@ class SSOManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """SSO yönetimi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -91,7 +93,7 @@ class SSOManager:
                         client_id: str = None, client_secret: str = None,
                         redirect_uri: str = None, scope: str = None) -> bool:
         """SSO sağlayıcısı ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -116,7 +118,7 @@ class SSOManager:
     def create_sso_session(self, company_id: int, user_id: int, provider_name: str,
                           external_user_id: str, expires_at: str) -> str:
         """SSO oturumu oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -143,7 +145,7 @@ class SSOManager:
                       action_type: str, success: bool, ip_address: str = None,
                       user_agent: str = None, error_message: str = None) -> bool:
         """SSO aksiyonu logla"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -169,7 +171,7 @@ class SSOManager:
 
     def get_sso_summary(self, company_id: int) -> Dict:
         """SSO özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
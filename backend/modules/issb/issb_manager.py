@@ -1,13 +1,21 @@
 import sqlite3
 import logging
 from typing import Dict, List, Optional, Union
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 class ISSBManager:
     """ISSB (International Sustainability Standards Board) Manager"""
     
     def __init__(self, db_path: str = "data/sustainability.db"):
         self.db_path = db_path
-        self.init_database()
+        ensure_schema(self.db_path, self.init_database)
         
     def init_database(self):
         """Initialize ISSB tables"""
@@ -33,7 +41,7 @@ class ISSBManager:
             conn.close()
             
     def get_connection(self):
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
         
     def get_dashboard_stats(self, company_id: int) -> Dict:
         """Get summary statistics for ISSB dashboard"""
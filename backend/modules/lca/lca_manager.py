@@ -2,6 +2,7 @@ import sqlite3
 import logging
 from typing import List, Dict, Optional, Any
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 class LCAManager:
     def __init__(self, db_path: str = DB_PATH):
@@ -9,7 +10,7 @@ class LCAManager:
         self.logger = logging.getLogger(__name__)
 
     def get_connection(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -3,7 +3,10 @@ Eşleştirme (Mapping) Modülü
 GRI-SDG-TSRS-UNGC-ISSB standartları arası eşleştirme
 """
 
-from .mapping_gui import MappingGUI
+try:
+    from .mapping_gui import MappingGUI
+except ImportError:
+    MappingGUI = None
 from .mapping_manager import MappingManager
 
 __all__ = ['MappingGUI', 'MappingManager']
@@ -7,6 +7,15 @@ import logging
 import sqlite3
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
+
 try:
     from sklearn.feature_extraction.text import TfidfVectorizer
     from sklearn.metrics.pairwise import cosine_similarity
@@ -21,13 +30,13 @@ class MappingManager:
 
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self.create_tables()
+        ensure_schema(self.db_path, self.create_tables)
         self.initialize_default_mappings()
 
     def create_tables(self) -> None:
         """Eşleştirme tablolarını oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Ana eşleştirme tablosu
@@ -92,7 +101,7 @@ class MappingManager:
     def initialize_default_mappings(self) -> None:
         """Varsayılan eşleştirmeleri yükle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Mevcut eşleştirme sayısını kontrol et
@@ -220,7 +229,7 @@ class MappingManager:
     def get_all_mappings(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Tüm eşleştirmeleri getir"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             query = "SELECT * FROM standard_mappings WHERE 1=1"
@@ -275,7 +284,7 @@ class MappingManager:
     def add_mapping(self, mapping_data: Dict[str, Any]) -> bool:
         """Yeni eşleştirme ekle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute('''
@@ -310,7 +319,7 @@ class MappingManager:
     def get_mapping_by_id(self, mapping_id: int) -> Optional[Tuple]:
         """ID'ye göre eşleştirme getir"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT id, source_standard, source_code, target_standard, 
@@ -328,7 +337,7 @@ class MappingManager:
     def delete_mapping(self, mapping_id: int) -> bool:
         """Eşleştirme sil"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("DELETE FROM standard_mappings WHERE id = ?", (mapping_id,))
             conn.commit()
@@ -341,7 +350,7 @@ class MappingManager:
     def update_mapping(self, mapping_id: int, mapping_data: Dict[str, Any]) -> bool:
         """Eşleştirme güncelle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute('''
@@ -387,7 +396,7 @@ class MappingManager:
     def get_mapping_statistics(self) -> Dict[str, Any]:
         """Eşleştirme istatistikleri"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Toplam eşleştirme
@@ -531,7 +540,7 @@ class MappingManager:
             return 0
 
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # 1. Mevcut tüm standart maddelerini topla
@@ -612,7 +621,7 @@ class MappingManager:
     def get_suggestions(self, status: str = 'pending') -> List[Dict[str, Any]]:
         """Önerileri listele"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -648,7 +657,7 @@ class MappingManager:
     def approve_suggestion(self, suggestion_id: int) -> bool:
         """Öneriyi onayla ve standard_mappings'e taşı"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             
             # Öneriyi al
@@ -701,7 +710,7 @@ class MappingManager:
     def reject_suggestion(self, suggestion_id: int) -> bool:
         """Öneriyi reddet"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("UPDATE mapping_suggestions SET status = 'rejected' WHERE id = ?", (suggestion_id,))
             conn.commit()
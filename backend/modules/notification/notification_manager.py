@@ -1,11 +1,75 @@
 import sqlite3
 import logging
+import threading
+import time
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
+
+# Worker başına okunmamış sayaç cache'inin tazelik süresi (sn)
+UNREAD_CACHE_TTL = 5.0
+
+# Kullanıcı başına denormalize okunmamış sayacı; notifications üzerindeki her
+# değişiklik tetikleyiciyle sayacı ve sürümü (liste ETag'i) günceller.
+COUNTER_DDL = (
+    """CREATE TABLE IF NOT EXISTS notification_counters (
+        user_id INTEGER PRIMARY KEY,
+        unread_count INTEGER NOT NULL DEFAULT 0,
+        version INTEGER NOT NULL DEFAULT 0
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_notifications_user_read ON notifications(user_id, is_read, created_at)",
+    """CREATE TRIGGER IF NOT EXISTS trg_notification_counters_insert
+        AFTER INSERT ON notifications
+        BEGIN
+            INSERT OR IGNORE INTO notification_counters (user_id, unread_count, version) VALUES (NEW.user_id, 0, 0);
+            UPDATE notification_counters
+            SET unread_count = unread_count + (COALESCE(NEW.is_read, 0) = 0), version = version + 1
+            WHERE user_id = NEW.user_id;
+        END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_notification_counters_update
+        AFTER UPDATE OF is_read ON notifications
+        WHEN COALESCE(OLD.is_read, 0) != COALESCE(NEW.is_read, 0)
+        BEGIN
+            UPDATE notification_counters
+            SET unread_count = MAX(unread_count + CASE WHEN COALESCE(NEW.is_read, 0) = 0 THEN 1 ELSE -1 END, 0),
+                version = version + 1
+            WHERE user_id = NEW.user_id;
+        END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_notification_counters_delete
+        AFTER DELETE ON notifications
+        BEGIN
+            UPDATE notification_counters
+            SET unread_count = MAX(unread_count - (COALESCE(OLD.is_read, 0) = 0), 0), version = version + 1
+            WHERE user_id = OLD.user_id;
+        END""",
+)
+
+
+def install_notification_counters(conn) -> None:
+    """Sayaç tablosu ve tetikleyicileri kur; mevcut bildirimlerden sayaçları doldur"""
+    cursor = conn.cursor()
+    for statement in COUNTER_DDL:
+        cursor.execute(statement)
+    cursor.execute("""
+        INSERT OR IGNORE INTO notification_counters (user_id, unread_count, version)
+        SELECT user_id, SUM(COALESCE(is_read, 0) = 0), 1 FROM notifications GROUP BY user_id
+    """)
+
 
 class NotificationManager:
     """
     Manages user notifications.
+
+    Unread counts come from the denormalized notification_counters row and
+    are cached per worker for UNREAD_CACHE_TTL seconds; writes in this
+    worker drop the user's cache entry immediately.
     """
     
     def __init__(self, db_path: str = None):
@@ -16,12 +80,15 @@ class NotificationManager:
             self.db_path = os.path.join(base_dir, 'data', 'sdg_desktop.sqlite')
         else:
             self.db_path = db_path
-            
-        self._ensure_table()
+
+        self._unread_cache: Dict[int, Tuple[int, int, float]] = {}
+        self._cache_lock = threading.Lock()
+        self._stats = {'hits': 0, 'loads': 0}
+        ensure_schema(self.db_path, self._ensure_table)
         
     def _ensure_table(self):
         """Ensure notifications table exists."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS notifications (
@@ -35,13 +102,18 @@ class NotificationManager:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
+        install_notification_counters(conn)
         conn.commit()
         conn.close()
+
+    def _invalidate(self, user_id: Optional[int]) -> None:
+        with self._cache_lock:
+            self._unread_cache.pop(user_id, None)
         
     def create_notification(self, user_id: int, title: str, message: str, type: str = 'info', link: str = None) -> int:
         """Create a new notification."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO notifications (user_id, title, message, type, link, is_read, created_at)
@@ -50,6 +122,7 @@ class NotificationManager:
             conn.commit()
             notification_id = cursor.lastrowid
             conn.close()
+            self._invalidate(user_id)
             return notification_id
         except Exception as e:
             logging.error(f"Error creating notification: {e}")
@@ -58,7 +131,7 @@ class NotificationManager:
     def get_unread_notifications(self, user_id: int, limit: int = 10) -> List[Dict[str, Any]]:
         """Get unread notifications for a user."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute("""
@@ -77,7 +150,7 @@ class NotificationManager:
     def get_all_notifications(self, user_id: int, limit: int = 50) -> List[Dict[str, Any]]:
         """Get all notifications for a user."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute("""
@@ -96,11 +169,14 @@ class NotificationManager:
     def mark_as_read(self, notification_id: int) -> bool:
         """Mark a notification as read."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
-            cursor.execute("UPDATE notifications SET is_read = 1 WHERE id = ?", (notification_id,))
+            cursor.execute("UPDATE notifications SET is_read = 1 WHERE id = ? RETURNING user_id", (notification_id,))
+            row = cursor.fetchone()
             conn.commit()
             conn.close()
+            if row:
+                self._invalidate(row[0])
             return True
         except Exception as e:
             logging.error(f"Error marking notification as read: {e}")
@@ -109,25 +185,56 @@ class NotificationManager:
     def mark_all_as_read(self, user_id: int) -> bool:
         """Mark all notifications for a user as read."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
-            cursor.execute("UPDATE notifications SET is_read = 1 WHERE user_id = ?", (user_id,))
+            cursor.execute("UPDATE notifications SET is_read = 1 WHERE user_id = ? AND is_read = 0", (user_id,))
             conn.commit()
             conn.close()
+            self._invalidate(user_id)
             return True
         except Exception as e:
             logging.error(f"Error marking all notifications as read: {e}")
             return False
             
+    def get_unread_state(self, user_id: int, fresh: bool = False) -> Tuple[int, int]:
+        """
+        (okunmamış sayısı, sürüm). Sürüm kullanıcının bildirimleri her
+        değiştiğinde artar; liste uç noktası bunu ETag olarak kullanır.
+        fresh=True cache'i atlayıp sayaç satırını yeniden okur.
+        """
+        now = time.monotonic()
+        entry = self._unread_cache.get(user_id)
+        if not fresh and entry is not None and now - entry[2] < UNREAD_CACHE_TTL:
+            with self._cache_lock:
+                self._stats['hits'] += 1
+            return entry[0], entry[1]
+
+        conn = db_connect(self.db_path)
+        try:
+            row = conn.execute(
+                "SELECT unread_count, version FROM notification_counters WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        finally:
+            conn.close()
+        count, version = (row[0], row[1]) if row else (0, 0)
+        with self._cache_lock:
+            self._unread_cache[user_id] = (count, version, now)
+            self._stats['loads'] += 1
+        return count, version
+
     def get_unread_count(self, user_id: int) -> int:
         """Get count of unread notifications."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM notifications WHERE user_id = ? AND is_read = 0", (user_id,))
-            count = cursor.fetchone()[0]
-            conn.close()
-            return count
+            return self.get_unread_state(user_id)[0]
         except Exception as e:
             logging.error(f"Error counting notifications: {e}")
             return 0
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """İzleme sayfası için sayaçlar"""
+        with self._cache_lock:
+            stats = dict(self._stats)
+            stats['users'] = len(self._unread_cache)
+        reads = stats['hits'] + stats['loads']
+        stats['hit_ratio'] = round(stats['hits'] / reads, 3) if reads else 0.0
+        return stats
@@ -5,7 +5,10 @@ Policy Library Module
 Kurumsal Sürdürülebilirlik Politika Kütüphanesi
 """
 
-from .policy_gui import PolicyLibraryGUI
+try:
+    from .policy_gui import PolicyLibraryGUI
+except ImportError:
+    PolicyLibraryGUI = None
 from .policy_manager import PolicyLibraryManager
 
 __all__ = ['PolicyLibraryManager', 'PolicyLibraryGUI']
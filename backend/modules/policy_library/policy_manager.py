@@ -12,6 +12,8 @@ import sqlite3
 from typing import Dict, List
 from config.icons import Icons
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class PolicyLibraryManager:
@@ -20,12 +22,12 @@ class PolicyLibraryManager:
     def __init__(self, db_path: str, templates_dir: str = 'data/policy_templates') -> None:
         self.db_path = db_path
         self.templates_dir = templates_dir
-        self._ensure_schema()
+        ensure_schema(self.db_path, self._ensure_schema)
         self._ensure_templates_dir()
 
     def _ensure_schema(self) -> None:
         """Veritabanı şemasını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -179,7 +181,7 @@ class PolicyLibraryManager:
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def get_categories(self) -> List[Dict]:
         """Kategorileri getir"""
@@ -461,7 +463,7 @@ class PolicyLibraryManager:
 
     def add_company_policy(self, policy_data: Dict) -> bool:
         """Şirket politikası ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -507,7 +509,7 @@ class PolicyLibraryManager:
 
     def add_compliance_requirement(self, requirement_data: Dict) -> bool:
         """Uyum gereksinimi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -563,7 +565,7 @@ class PolicyLibraryManager:
 
     def get_compliance_requirements(self, company_id: int) -> List[Dict]:
         """Uyum gereksinimlerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -9,6 +9,10 @@ MATERYAL KONU DEĞERLENDİRME MODÜLÜ
 
 import sqlite3
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 class MaterialityAssessment:
@@ -28,7 +32,7 @@ class MaterialityAssessment:
 
     def create_materiality_tables(self) -> None:
         """Materyal konu değerlendirme tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Materyal konular tablosu
@@ -165,7 +169,7 @@ class MaterialityAssessment:
     def create_survey_template(self, company_id: int, survey_name: str,
                              stakeholder_category: str) -> int:
         """Anket şablonu oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -184,7 +188,7 @@ class MaterialityAssessment:
                            question_type: str, weight: float = 1.0,
                            category: str = None, sdg_mapping: str = None) -> int:
         """Anket sorusu ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -203,7 +207,7 @@ class MaterialityAssessment:
                               response_value: str, score: float,
                               stakeholder_type: str = None) -> int:
         """Anket cevabı gönder"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -220,7 +224,7 @@ class MaterialityAssessment:
 
     def get_prioritization_results(self, company_id: int) -> List[Dict]:
         """Önceliklendirme sonuçlarını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
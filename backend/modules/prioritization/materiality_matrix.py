@@ -18,6 +18,7 @@ import matplotlib.patches as mpatches
 import pandas as pd
 from matplotlib.figure import Figure
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class MaterialityMatrix:
@@ -47,7 +48,7 @@ class MaterialityMatrix:
 
     def get_connection(self):
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def get_materiality_topics(self, company_id: int) -> List[Dict]:
         """Materialite konularını getir"""
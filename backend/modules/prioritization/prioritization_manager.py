@@ -6,6 +6,8 @@ from datetime import datetime
 from typing import Dict, List
 
 from config.settings import ensure_directories, get_db_path
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class PrioritizationManager:
@@ -17,11 +19,11 @@ class PrioritizationManager:
         else:
             ensure_directories()
             self.db_path = get_db_path()
-        self.create_tables()
+        ensure_schema(self.db_path, self.create_tables)
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def create_tables(self) -> None:
         """Gerekli tabloları oluştur"""
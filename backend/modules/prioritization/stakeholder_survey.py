@@ -11,6 +11,10 @@ import json
 import sqlite3
 from datetime import datetime
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 class StakeholderSurvey:
@@ -28,7 +32,7 @@ class StakeholderSurvey:
     def create_survey(self, company_id: int, survey_name: str,
                      stakeholder_category: str, description: str = "") -> int:
         """Yeni anket oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         survey_data = {
@@ -54,7 +58,7 @@ class StakeholderSurvey:
                     category: str = None, sdg_mapping: str = None,
                     options: List[str] = None) -> int:
         """Anket sorusu ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Çoktan seçmeli sorular için seçenekleri JSON olarak sakla
@@ -76,7 +80,7 @@ class StakeholderSurvey:
 
     def get_survey_questions(self, survey_id: int) -> List[Dict]:
         """Anket sorularını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -103,7 +107,7 @@ class StakeholderSurvey:
     def submit_response(self, survey_id: int, question_id: int,
                        response_value: str, stakeholder_type: str = None) -> int:
         """Anket cevabı gönder"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Cevabı skorla
@@ -123,7 +127,7 @@ class StakeholderSurvey:
 
     def _calculate_response_score(self, question_id: int, response_value: str) -> float:
         """Cevap skorunu hesapla"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -154,7 +158,7 @@ class StakeholderSurvey:
 
     def get_survey_results(self, survey_id: int) -> Dict:
         """Anket sonuçlarını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Anket bilgileri
@@ -213,7 +217,7 @@ class StakeholderSurvey:
 
     def get_company_surveys(self, company_id: int) -> List[Dict]:
         """Şirketin tüm anketlerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -9,6 +9,10 @@ import logging
 import os
 import sqlite3
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 class CertificateMonitor:
@@ -28,7 +32,7 @@ class CertificateMonitor:
         Returns:
             List[Dict]: Süresi dolacak sertifikalar
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -9,6 +9,14 @@ import logging
 import os
 import sqlite3
 from typing import Dict
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class DataQualityScorer:
@@ -16,11 +24,11 @@ class DataQualityScorer:
 
     def __init__(self, db_path: str = None) -> None:
         self.db_path = db_path or os.path.join(os.getcwd(), 'data', 'sdg_desktop.sqlite')
-        self._ensure_table()
+        ensure_schema(self.db_path, self._ensure_table)
 
     def _ensure_table(self) -> None:
         """Kalite skoru tablosu"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -80,7 +88,7 @@ class DataQualityScorer:
         - Timeliness (Güncellik): Veriler güncel mi?
         - Consistency (Tutarlılık): Veriler tutarlı mı?
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -192,7 +200,7 @@ class DataQualityScorer:
 
     def get_esg_summary_score(self, company_id: int, year: int) -> float:
         """ESG genel özet skoru"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
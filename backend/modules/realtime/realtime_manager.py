@@ -1,13 +1,100 @@
-
 import sqlite3
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+try:
+    from utils.db_pool import connect as db_connect
+    from utils.cache import SimpleCache
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+    from backend.utils.cache import SimpleCache
+    from backend.utils.schema_version import ensure_schema
+
+# Cihaz eşik/şirket bilgisi cache'i: (db_path, device_id) -> (threshold, company_id).
+# Bu süreçteki değişikliklerde anında silinir; diğer worker'lar en fazla TTL kadar eski eşik görür.
+DEVICE_CACHE_TTL = 60
+_device_cache = SimpleCache(ttl=DEVICE_CACHE_TTL)
+
+# Zaman damgasının ('YYYY-MM-DD HH:MM:SS') kova başlangıcına çevrilmesi: (önek uzunluğu, sonek)
+ROLLUP_GRANULARITIES = {
+    'minute': (16, ':00'),
+    'hour': (13, ':00:00'),
+    'day': (10, ' 00:00:00'),
+}
+
+
+def invalidate_device_cache(db_path=None, device_id=None):
+    """Cihaz eşik cache'ini sil (argümansız çağrıda tümü)"""
+    if db_path is None or device_id is None:
+        _device_cache.clear()
+    else:
+        _device_cache.delete((db_path, device_id))
+
+
 class RealTimeMonitoringManager:
     def __init__(self, db_path):
         self.db_path = db_path
+        ensure_schema(self.db_path, self._init_tables)
 
     def get_connection(self):
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
+
+    def _init_tables(self):
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS iot_devices (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    company_id INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    device_type TEXT,
+                    unit TEXT,
+                    threshold_value REAL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS iot_readings (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    device_id INTEGER NOT NULL,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    value REAL NOT NULL,
+                    company_id INTEGER DEFAULT 1,
+                    FOREIGN KEY (device_id) REFERENCES iot_devices (id)
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS iot_alerts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    device_id INTEGER NOT NULL,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    message TEXT,
+                    status TEXT DEFAULT 'unread',
+                    company_id INTEGER DEFAULT 1,
+                    FOREIGN KEY (device_id) REFERENCES iot_devices (id)
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS iot_reading_rollups (
+                    device_id INTEGER NOT NULL,
+                    granularity TEXT NOT NULL,
+                    bucket_start TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    sum_value REAL NOT NULL,
+                    min_value REAL NOT NULL,
+                    max_value REAL NOT NULL,
+                    PRIMARY KEY (device_id, granularity, bucket_start)
+                ) WITHOUT ROWID
+            ''')
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_iot_readings_device_time ON iot_readings(device_id, timestamp)'
+            )
+            conn.commit()
+        finally:
+            conn.close()
 
     def add_device(self, company_id, name, device_type, unit, threshold_value=None):
         conn = self.get_connection()
@@ -19,8 +106,21 @@ class RealTimeMonitoringManager:
         conn.commit()
         device_id = cursor.lastrowid
         conn.close()
+        # Bu id daha önce "bilinmeyen cihaz" olarak cache'lenmiş olabilir
+        invalidate_device_cache(self.db_path, device_id)
         return device_id
 
+    def update_threshold(self, device_id, company_id, threshold_value):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('UPDATE iot_devices SET threshold_value = ? WHERE id = ? AND company_id = ?',
+                       (threshold_value, device_id, company_id))
+        conn.commit()
+        updated = cursor.rowcount > 0
+        conn.close()
+        invalidate_device_cache(self.db_path, device_id)
+        return updated
+
     def get_devices(self, company_id):
         conn = self.get_connection()
         cursor = conn.cursor()
@@ -39,42 +139,157 @@ class RealTimeMonitoringManager:
             return dict(zip([column[0] for column in cursor.description], row))
         return None
 
-    def add_reading(self, device_id, value, timestamp=None):
-        if timestamp is None:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
+    def _device_info(self, cursor, device_ids):
+        """device_id -> (threshold, company_id); cache'te olmayanlar tek sorguda okunur"""
+        info = {}
+        missing = []
+        for device_id in device_ids:
+            cached = _device_cache.get((self.db_path, device_id))
+            if cached is None:
+                missing.append(device_id)
+            else:
+                info[device_id] = cached
+        if missing:
+            placeholders = ','.join('?' * len(missing))
+            cursor.execute(f'SELECT id, threshold_value, company_id FROM iot_devices WHERE id IN ({placeholders})',
+                           missing)
+            found = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+            for device_id in missing:
+                # Bilinmeyen cihaz da cache'lenir (her okumada tekrar sorgulanmasın)
+                info[device_id] = found.get(device_id, (None, None))
+                _device_cache.set((self.db_path, device_id), info[device_id])
+        return info
+
+    def add_readings(self, readings):
+        """
+        Toplu okuma kaydı. readings: (device_id, value[, timestamp]) demetleri
+        veya {'device_id', 'value', 'timestamp'} sözlükleri.
+        Okumalar, eşik alarmları ve dakika/saat/gün özetleri tek transaction'da yazılır.
+
+        Returns:
+            dict: {'inserted': okuma sayısı, 'alerts': oluşan alarm sayısı}
+        """
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        device_ids, values, timestamps = [], [], []
+        for reading in readings:
+            if isinstance(reading, dict):
+                device_id, value, timestamp = reading['device_id'], reading['value'], reading.get('timestamp')
+            else:
+                device_id, value = reading[0], reading[1]
+                timestamp = reading[2] if len(reading) > 2 else None
+            device_ids.append(int(device_id))
+            values.append(float(value))
+            timestamps.append(str(timestamp).replace('T', ' ')[:19] if timestamp else now)
+        if not device_ids:
+            return {'inserted': 0, 'alerts': 0}
+
+        ids = np.asarray(device_ids, dtype=np.int64)
+        vals = np.asarray(values, dtype=np.float64)
+
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Insert reading
-        cursor.execute('''
-            INSERT INTO iot_readings (device_id, timestamp, value)
-            VALUES (?, ?, ?)
-        ''', (device_id, timestamp, value))
-        
-        # Check threshold
-        cursor.execute('SELECT threshold_value, name, company_id FROM iot_devices WHERE id = ?', (device_id,))
-        device = cursor.fetchone()
-        if device and device[0] is not None:
-            threshold = device[0]
-            if float(value) > float(threshold):
-                message = f"Eşik Değeri Aşıldı: {value} > {threshold}"
-                cursor.execute('''
-                    INSERT INTO iot_alerts (device_id, timestamp, message, status)
-                    VALUES (?, ?, ?, 'unread')
-                ''', (device_id, timestamp, message))
-        
-        conn.commit()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            info = self._device_info(cursor, list(dict.fromkeys(device_ids)))
+            thresholds = np.array([np.nan if info[d][0] is None else float(info[d][0]) for d in device_ids])
+            companies = [info[d][1] if info[d][1] is not None else 1 for d in device_ids]
+
+            # Eşik kontrolü tek vektörel karşılaştırma (eşiği olmayanlar NaN => False)
+            with np.errstate(invalid='ignore'):
+                exceeded = np.flatnonzero(vals > thresholds)
+
+            cursor.executemany('''
+                INSERT INTO iot_readings (device_id, timestamp, value, company_id)
+                VALUES (?, ?, ?, ?)
+            ''', zip(device_ids, timestamps, values, companies))
+
+            if exceeded.size:
+                cursor.executemany('''
+                    INSERT INTO iot_alerts (device_id, timestamp, message, status, company_id)
+                    VALUES (?, ?, ?, 'unread', ?)
+                ''', [(device_ids[i], timestamps[i],
+                       f"Eşik Değeri Aşıldı: {values[i]} > {info[device_ids[i]][0]}", companies[i])
+                      for i in exceeded])
 
-    def get_readings(self, device_id, limit=100):
+            self._update_rollups(cursor, ids, vals, timestamps)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+        return {'inserted': len(device_ids), 'alerts': int(exceeded.size)}
+
+    def _update_rollups(self, cursor, ids, vals, timestamps):
+        frame = pd.DataFrame({'device_id': ids, 'value': vals, 'ts': timestamps})
+        rows = []
+        for granularity, (length, suffix) in ROLLUP_GRANULARITIES.items():
+            frame['bucket'] = frame['ts'].str.slice(0, length) + suffix
+            grouped = frame.groupby(['device_id', 'bucket'])['value'].agg(['count', 'sum', 'min', 'max'])
+            rows.extend(
+                (int(device_id), granularity, bucket, int(count), float(total), float(low), float(high))
+                for (device_id, bucket), count, total, low, high in zip(
+                    grouped.index, grouped['count'], grouped['sum'], grouped['min'], grouped['max'])
+            )
+        cursor.executemany('''
+            INSERT INTO iot_reading_rollups
+                (device_id, granularity, bucket_start, count, sum_value, min_value, max_value)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(device_id, granularity, bucket_start) DO UPDATE SET
+                count = count + excluded.count,
+                sum_value = sum_value + excluded.sum_value,
+                min_value = MIN(min_value, excluded.min_value),
+                max_value = MAX(max_value, excluded.max_value)
+        ''', rows)
+
+    def rebuild_rollups(self, device_id=None):
+        """Özet tablosunu ham okumalardan yeniden hesapla (onarım)"""
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            device_filter = ' WHERE device_id = ?' if device_id is not None else ''
+            params = (device_id,) if device_id is not None else ()
+            cursor.execute(f'DELETE FROM iot_reading_rollups{device_filter}', params)
+            for granularity, (length, suffix) in ROLLUP_GRANULARITIES.items():
+                cursor.execute(f'''
+                    INSERT INTO iot_reading_rollups
+                        (device_id, granularity, bucket_start, count, sum_value, min_value, max_value)
+                    SELECT device_id, ?, substr(replace(timestamp, 'T', ' '), 1, {length}) || ?,
+                           COUNT(*), SUM(value), MIN(value), MAX(value)
+                    FROM iot_readings{device_filter}
+                    GROUP BY device_id, 3
+                ''', (granularity, suffix) + params)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def add_reading(self, device_id, value, timestamp=None):
+        self.add_readings([(device_id, value, timestamp)])
+
+    def get_readings(self, device_id, limit=100, granularity=None):
+        """
+        Son okumalar. granularity 'minute' / 'hour' / 'day' verilirse ham satırlar
+        yerine önceden toplanmış kovalar döner (value = ortalama).
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
-        cursor.execute('''
-            SELECT * FROM iot_readings 
-            WHERE device_id = ? 
-            ORDER BY timestamp DESC LIMIT ?
-        ''', (device_id, limit))
+        if granularity in ROLLUP_GRANULARITIES:
+            cursor.execute('''
+                SELECT bucket_start AS timestamp, sum_value / count AS value,
+                       min_value, max_value, count
+                FROM iot_reading_rollups
+                WHERE device_id = ? AND granularity = ?
+                ORDER BY bucket_start DESC LIMIT ?
+            ''', (device_id, granularity, limit))
+        else:
+            cursor.execute('''
+                SELECT * FROM iot_readings
+                WHERE device_id = ?
+                ORDER BY timestamp DESC LIMIT ?
+            ''', (device_id, limit))
         readings = [dict(zip([column[0] for column in cursor.description], row)) for row in cursor.fetchall()]
         conn.close()
         return readings
@@ -83,7 +298,7 @@ class RealTimeMonitoringManager:
         conn = self.get_connection()
         cursor = conn.cursor()
         cursor.execute('''
-            SELECT a.*, d.name as device_name 
+            SELECT a.*, d.name as device_name
             FROM iot_alerts a
             JOIN iot_devices d ON a.device_id = d.id
             WHERE d.company_id = ?
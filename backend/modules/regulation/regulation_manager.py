@@ -3,6 +3,14 @@ import logging
 from datetime import datetime, timedelta
 import os
 from typing import List, Dict, Optional, Tuple
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 class RegulationManager:
     """
@@ -12,11 +20,11 @@ class RegulationManager:
     
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self._init_tables()
+        ensure_schema(self.db_path, self._init_tables)
         
     def _init_tables(self):
         """Veritabanı tablolarını oluşturur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
@@ -67,7 +75,7 @@ class RegulationManager:
 
     def add_regulation(self, code: str, title: str, scope: str, authority: str, **kwargs) -> int:
         """Yeni bir regülasyon ekler"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
@@ -93,7 +101,7 @@ class RegulationManager:
 
     def get_regulations(self, scope: Optional[str] = None, status: str = 'active') -> List[Dict]:
         """Regülasyonları listeler"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -118,7 +126,7 @@ class RegulationManager:
 
     def get_upcoming_deadlines(self, days: int = 90) -> List[Dict]:
         """Yaklaşan uyum tarihlerini getirir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -143,7 +151,7 @@ class RegulationManager:
             
     def update_compliance_status(self, company_id: int, regulation_id: int, status: str, notes: str = None) -> bool:
         """Şirketin uyum durumunu günceller"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
@@ -162,7 +170,7 @@ class RegulationManager:
 
     def get_company_compliance(self, company_id: int) -> List[Dict]:
         """Şirketin regülasyon uyum raporunu getirir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -187,7 +195,7 @@ class RegulationManager:
 
     def populate_initial_data(self):
         """Başlangıç verilerini yükle (Eğer tablo boşsa)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
@@ -3,6 +3,10 @@ import os
 import logging
 import sqlite3
 from datetime import datetime, timedelta
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 # Add project root to path
 # c:\SUSTAINAGESERVER\backend\modules\regulation\weekly_update.py -> c:\SUSTAINAGESERVER
@@ -36,7 +40,7 @@ except ImportError:
 def get_admin_users():
     """Get list of admin user IDs to notify"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = db_connect(DB_PATH)
         cursor = conn.cursor()
         # Get users with role_id that corresponds to admin/super_admin
         # Assuming roles table: 1=super_admin, 2=admin etc. 
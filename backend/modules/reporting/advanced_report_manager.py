@@ -13,6 +13,8 @@ import sqlite3
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class AdvancedReportManager:
@@ -51,7 +53,7 @@ class AdvancedReportManager:
 
         # Rapor klasörlerini oluştur
         self._create_report_folders()
-        self._init_report_tables()
+        ensure_schema(self.db_path, self._init_report_tables)
 
     def _create_report_folders(self) -> None:
         """Modül bazlı rapor klasörlerini oluştur"""
@@ -61,7 +63,7 @@ class AdvancedReportManager:
 
     def _init_report_tables(self) -> None:
         """Rapor tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -164,7 +166,7 @@ class AdvancedReportManager:
             file_size = os.path.getsize(dest_path)
 
             # Veritabanına kaydet
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             tags_json = json.dumps(tags) if tags else None
@@ -191,7 +193,7 @@ class AdvancedReportManager:
 
     def get_module_reports(self, company_id: int, module_code: str) -> List[Dict]:
         """Modül raporlarını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -229,7 +231,7 @@ class AdvancedReportManager:
         Returns:
             (silinen_sayisi, hata_sayisi)
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         deleted_count = 0
@@ -280,7 +282,7 @@ class AdvancedReportManager:
     def register_existing_file(self, company_id: int, module_code: str, report_name: str,
                                report_type: str, file_path: str, reporting_period: str = "",
                                tags: Optional[List[str]] = None, description: str = "") -> Optional[int]:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             if not os.path.exists(file_path):
@@ -319,7 +321,7 @@ class AdvancedReportManager:
             schedule_time: Saat (HH:MM)
             email_recipients: Email adresleri
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
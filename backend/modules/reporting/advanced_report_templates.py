@@ -8,6 +8,10 @@ Gelişmiş Rapor Şablonları
 import json
 from datetime import datetime
 from typing import Dict, List, Optional
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 class AdvancedReportTemplates:
@@ -317,7 +321,7 @@ class AdvancedReportTemplates:
     def _fetch_yearly_data(self, company_id: int, year: int) -> Dict:
         """Yıllık verileri veritabanından çek"""
         import sqlite3
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         data = {
             'ghg_total': 0.0, 'energy_total': 0.0, 'water_total': 0.0, 'waste_total': 0.0,
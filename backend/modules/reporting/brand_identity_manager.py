@@ -12,6 +12,14 @@ from datetime import datetime
 from typing import Any, Dict, Optional, Tuple
 
 from PIL import Image
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class BrandIdentityManager:
@@ -35,11 +43,11 @@ class BrandIdentityManager:
     def __init__(self, db_path: str, company_id: int = 1) -> None:
         self.db_path = db_path
         self.company_id = company_id
-        self._init_tables()
+        ensure_schema(self.db_path, self._init_tables)
 
     def _init_tables(self) -> None:
         """Marka kimliği tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -89,7 +97,7 @@ class BrandIdentityManager:
             fonts: {'heading': 'Segoe UI', 'body': 'Georgia'}
             texts: {'header': 'text', 'footer': 'text', 'watermark': 'text'}
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -170,7 +178,7 @@ class BrandIdentityManager:
 
     def get_brand_identity(self, company_id: int) -> Dict:
         """Marka kimliğini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         result = {
@@ -10,6 +10,8 @@ import os
 import sqlite3
 from typing import Dict, List, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class MultilingualManager:
@@ -20,12 +22,12 @@ class MultilingualManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
         self._init_default_translations()
 
     def _init_db_tables(self) -> None:
         """Çok dilli modülü tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -66,7 +68,7 @@ class MultilingualManager:
 
     def _init_default_translations(self) -> None:
         """Varsayılan çevirileri ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -163,7 +165,7 @@ class MultilingualManager:
     def add_translation(self, company_id: int, text_key: str, language_code: str,
                        translated_text: str, context: Optional[str] = None) -> bool:
         """Çeviri ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -185,7 +187,7 @@ class MultilingualManager:
 
     def get_translation(self, text_key: str, language_code: str, company_id: int = 0) -> str:
         """Çeviri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -213,7 +215,7 @@ class MultilingualManager:
 
     def get_supported_languages(self) -> List[Dict]:
         """Desteklenen dilleri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
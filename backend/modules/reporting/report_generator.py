@@ -11,6 +11,8 @@ import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class ReportGenerator:
@@ -21,11 +23,11 @@ class ReportGenerator:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """Raporlama tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -75,7 +77,7 @@ class ReportGenerator:
                           template_content: str, template_variables: Optional[str] = None,
                           language_code: str = 'tr') -> bool:
         """Rapor şablonu ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -100,7 +102,7 @@ class ReportGenerator:
     def generate_report(self, company_id: int, template_id: int, report_name: str,
                        report_period: str, report_format: str, generated_by: Optional[str] = None) -> bool:
         """Rapor oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -127,7 +129,7 @@ class ReportGenerator:
 
     def get_report_templates(self, company_id: int, template_type: Optional[str] = None) -> List[Dict]:
         """Rapor şablonlarını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -165,7 +167,7 @@ class ReportGenerator:
             conn.close()
 
     def _get_sustainability_context(self, company_id: int, report_period: str) -> Tuple[Dict[str, List[Dict]], str]:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
 
         report_data: Dict[str, List[Dict]] = {}
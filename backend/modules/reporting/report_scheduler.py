@@ -15,6 +15,8 @@ from datetime import datetime, timedelta
 from threading import Thread
 from typing import Dict, List, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class ReportScheduler:
@@ -57,14 +59,14 @@ class ReportScheduler:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_scheduler_tables()
+        ensure_schema(self.db_path, self._init_scheduler_tables)
         self.scheduler_thread: Optional[Thread] = None
         self.is_running = False
         self.stop_event = threading.Event()
 
     def _init_scheduler_tables(self) -> None:
         """Scheduling tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -194,7 +196,7 @@ class ReportScheduler:
             frequency: "gunluk", "haftalik", "aylik", "ceyreklik", "yillik"
             report_type: "csrd", "gri", "tcfd", "carbon", vb.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -250,7 +252,7 @@ class ReportScheduler:
 
     def run_scheduled_report(self, schedule_id: int) -> bool:
         """Zamanlanmış raporu çalıştır"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -409,7 +411,7 @@ class ReportScheduler:
             cc: Kopya alıcılar
             bcc: Gizli kopya alıcılar
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -439,7 +441,7 @@ class ReportScheduler:
     def send_report_email(self, report_version_id: int,
                          distribution_list_id: int) -> bool:
         """Raporu email ile gönder"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -497,7 +499,7 @@ class ReportScheduler:
                            submitted_by: int, approver_id: int,
                            notes: str = "") -> int:
         """Raporu onaya gönder"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -522,7 +524,7 @@ class ReportScheduler:
     def approve_report(self, workflow_id: int, approver_id: int,
                       notes: str = "") -> bool:
         """Raporu onayla"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -548,7 +550,7 @@ class ReportScheduler:
     def reject_report(self, workflow_id: int, approver_id: int,
                      reason: str) -> bool:
         """Raporu reddet"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -579,7 +581,7 @@ class ReportScheduler:
                              file_path: str, created_by: Optional[int] = None,
                              change_notes: str = "") -> int:
         """Yeni rapor versiyonu oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -628,7 +630,7 @@ class ReportScheduler:
 
     def get_report_versions(self, company_id: int, report_type: str) -> List[Dict]:
         """Rapor versiyonlarını listele"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -691,7 +693,7 @@ class ReportScheduler:
         while self.is_running:
             try:
                 # Bugün çalışması gereken raporları kontrol et
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -10,6 +10,8 @@ import sqlite3
 from typing import Dict, List, Optional
 
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 class SASBManager:
     """SASB Standartları yönetimi"""
@@ -19,11 +21,11 @@ class SASBManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """SASB tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -52,7 +54,7 @@ class SASBManager:
             'topics_covered': 0,
             'completion_rate': 0
         }
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         try:
             rows = conn.execute("SELECT topic FROM sasb_disclosures WHERE company_id = ?", (company_id,)).fetchall()
             stats['total_metrics'] = len(rows)
@@ -67,7 +69,7 @@ class SASBManager:
 
     def get_disclosures(self, company_id: int) -> List[Dict]:
         """Tüm açıklamaları getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         disclosures = []
         try:
@@ -81,7 +83,7 @@ class SASBManager:
 
     def add_disclosure(self, company_id: int, year: int, topic: str, metric: str, value: str, unit: str) -> bool:
         """Yeni açıklama ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         try:
             conn.execute("""
                 INSERT INTO sasb_disclosures (company_id, year, topic, metric, value, unit)
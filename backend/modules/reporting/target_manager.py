@@ -4,14 +4,16 @@ import json
 import logging
 from datetime import datetime
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 class TargetManager:
     def __init__(self, db_path=None):
         self.db_path = db_path if db_path else DB_PATH
-        self._ensure_table()
+        ensure_schema(self.db_path, self._ensure_table)
     
     def _get_conn(self):
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
     
     def _ensure_table(self):
         conn = self._get_conn()
@@ -12,6 +12,10 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Pt
 import sqlite3
 import logging
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 def _add_heading(doc: Document, text: str, level: int = 1) -> None:
@@ -511,7 +515,7 @@ class UnifiedReportDocxGenerator:
             supply_chain_data = {}
 
             try:
-                conn = sqlite3.connect(db_path)
+                conn = db_connect(db_path)
                 cur = conn.cursor()
                 sdg_ozet, gri_ozet, tsrs_ozet = self._build_summaries(cur, company_id, reporting_period)
                 # sdg_validation_results üzerinden doğrulama özeti zaten _add_methodology_section içinde kullanılıyor
@@ -673,7 +677,7 @@ class UnifiedReportDocxGenerator:
             supply_chain_data = {}
             
             try:
-                conn = sqlite3.connect(db_path)
+                conn = db_connect(db_path)
                 cur = conn.cursor()
                 target_summary_text, target_list = self._build_target_summary(cur, company_id)
                 supply_chain_summary_text, supply_chain_data = self._build_supply_chain_summary(cur, company_id, reporting_period)
@@ -718,7 +722,7 @@ class UnifiedReportDocxGenerator:
 
             # 6. Çifte Önemlilik ve ESRS
             try:
-                conn = sqlite3.connect(db_path)
+                conn = db_connect(db_path)
                 cur = conn.cursor()
                 self._add_materiality_section(doc, cur, company_id)
                 self._add_esrs_section(doc, cur, company_id)
@@ -732,7 +736,7 @@ class UnifiedReportDocxGenerator:
 
             # 7. Metodoloji ve Veri Kalitesi
             try:
-                conn = sqlite3.connect(db_path)
+                conn = db_connect(db_path)
                 cur = conn.cursor()
                 self._add_methodology_section(doc, cur, company_id)
             except Exception as e:
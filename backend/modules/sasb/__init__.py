@@ -5,7 +5,10 @@ SASB (Sustainability Accounting Standards Board) Modülü
 77 Sektör Standardı - TAM VERSİYON
 """
 
-from .sasb_gui import SASBGUI
+try:
+    from .sasb_gui import SASBGUI
+except ImportError:
+    SASBGUI = None
 from .sasb_manager import SASBManager
 
 __version__ = "1.0.0"
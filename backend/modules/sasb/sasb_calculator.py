@@ -13,6 +13,10 @@ import sqlite3
 from typing import Any, Dict, Optional
 
 import pandas as pd
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 class SASBCalculator:
@@ -26,7 +30,7 @@ class SASBCalculator:
                                   year: Optional[int] = None) -> Dict[str, Any]:
         """Finansal materiality skorunu hesapla"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
 
             # Sektöre özgü topics'leri al
             query = """
@@ -158,7 +162,7 @@ class SASBCalculator:
 
             # Sektör ortalaması (Basitçe veritabanındaki diğer şirketlerin ortalaması)
             # Gerçek senaryoda daha karmaşık olabilir
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             query = """
                 SELECT DISTINCT company_id
                 FROM company_sasb_data
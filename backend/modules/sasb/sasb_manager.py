@@ -14,6 +14,8 @@ import os
 import sqlite3
 from typing import Dict, List, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class SASBManager:
@@ -29,7 +31,7 @@ class SASBManager:
         self.module_dir = os.path.dirname(os.path.abspath(__file__))
 
         # Veritabanı başlat
-        self.init_database()
+        ensure_schema(self.db_path, self.init_database)
 
         # Veri yükle
         self.load_sector_data()
@@ -42,7 +44,7 @@ class SASBManager:
             logging.info("️ SASB schema bulunamadı!")
             return
 
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -59,7 +61,7 @@ class SASBManager:
 
     def load_sector_data(self) -> bool:
         """Sektör verilerini JSON'dan yükle (Yeni yapı - Data dizini)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -175,7 +177,7 @@ class SASBManager:
 
     def get_all_sectors(self) -> List[Dict]:
         """Tüm sektörleri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -201,7 +203,7 @@ class SASBManager:
 
     def get_sector_topics(self, sector_id: int) -> List[Dict]:
         """Sektör disclosure topics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -228,7 +230,7 @@ class SASBManager:
 
     def get_topic_metrics(self, topic_id: int) -> List[Dict]:
         """Topic metrikleri"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -256,7 +258,7 @@ class SASBManager:
 
     def select_company_sector(self, company_id: int, year: int, sector_id: int) -> bool:
         """Şirket sektörü seç"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -277,7 +279,7 @@ class SASBManager:
                             response_value: str, numerical_value: Optional[float] = None,
                             unit: Optional[str] = None, notes: Optional[str] = None) -> bool:
         """Metrik yanıtı kaydet"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -297,7 +299,7 @@ class SASBManager:
 
     def get_sasb_gri_mappings(self) -> List[Dict]:
         """SASB-GRI mapping listesi"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -324,7 +326,7 @@ class SASBManager:
 
     def get_metric_responses(self, company_id: int, year: int) -> Dict:
         """Şirketin belirli bir yıldaki metrik yanıtlarını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -348,7 +350,7 @@ class SASBManager:
 
     def get_company_sector(self, company_id: int, year: int) -> Optional[Dict]:
         """Şirketin seçili sektörünü getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -373,7 +375,7 @@ class SASBManager:
 
     def get_company_disclosures(self, company_id: int, year: int) -> List[Dict]:
         """Rapor için detaylı disclosure verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -407,7 +409,7 @@ class SASBManager:
 
     def get_completion_status(self, company_id: int, year: int) -> Dict:
         """Tamamlanma durumu"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
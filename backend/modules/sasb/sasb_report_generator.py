@@ -11,6 +11,10 @@ SASB Report Generator - SASB raporu oluşturma sınıfı
 import logging
 from datetime import datetime
 from typing import Any, Dict, Optional
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 # Rapor oluşturma kütüphaneleri
 try:
@@ -588,7 +592,7 @@ class SASBReportGenerator:
             Rapor verileri
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cur = conn.cursor()
 
             # Şirket bilgilerini al
@@ -1,5 +1,9 @@
 # Scenario Analysis Module
 from .scenario_engine import ScenarioEngine
-from .scenario_gui import ScenarioGUI
+
+try:
+    from .scenario_gui import ScenarioGUI
+except ImportError:
+    ScenarioGUI = None
 
 __all__ = ['ScenarioEngine', 'ScenarioGUI']
@@ -3,14 +3,258 @@
 """
 Senaryo Analizi ve Modelleme Motoru - TAM VE EKSİKSİZ
 TCFD senaryoları, BAU vs Net Zero, Risk modelleme, Finansal etki
+
+Monte Carlo modu (simulate_tcfd_scenario) karbon fiyatı, yenilenebilir payı,
+CAPEX ve azaltım başarısı üzerinden N x yıl boyutlu yolları NumPy ile üretir;
+ham yollar saklanmaz, yalnızca yıl bazlı ortalama/std ve yüzdelik bantlar
+yazılır. Deterministik senaryo aynı çekirdeğin tek yollu, sıfır oynaklıklı
+özel durumudur.
 """
 
 import logging
 import json
 import os
 import sqlite3
-from typing import Dict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Dict, List, Optional
+
+import numpy as np
+
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
+
+SIMULATION_METRICS = (
+    'total_emissions', 'carbon_cost', 'energy_cost', 'capex_investment',
+    'net_financial_impact', 'roi_percentage',
+)
+SIMULATION_QUANTILES = (5, 25, 50, 75, 95)
+
+# Yıllık oynaklıklar (log ölçeğinde). Karbon fiyatı ve yenilenebilir payı yıllık
+# rastgele yürüyüş, CAPEX ve azaltım başarısı yol başına tek çarpan.
+DEFAULT_VOLATILITY = {
+    'carbon_price': 0.10,
+    'renewable_share': 0.05,
+    'capex': 0.20,
+    'reduction': 0.15,
+}
+
+# Bu sayının üzerindeki yollar parçalara bölünür. Ortalama/std kesin
+# birleştirilir; yüzdelikler için önce tüm parçaların yıl bazlı min/max'ı
+# alınır, her parça bu ortak sınırlarla sabit kutulu histogram üretir ve
+# histogramlar toplanır (sonuç parça boyutuna bağlı değildir).
+SIMULATION_CHUNK_PATHS = 50_000
+PROCESS_POOL_MIN_PATHS = 200_000
+HISTOGRAM_BINS = 4096
+
+ENERGY_COST_BASE = 50000000
+ENERGY_SAVING_RATE = 0.20
+
+SIMULATION_DDL = (
+    """CREATE TABLE IF NOT EXISTS scenario_simulations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        scenario_id INTEGER NOT NULL,
+        n_paths INTEGER NOT NULL,
+        seed TEXT,
+        volatility TEXT,
+        summary TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (scenario_id) REFERENCES scenario_analyses(id)
+    )""",
+    """CREATE TABLE IF NOT EXISTS scenario_simulation_quantiles (
+        simulation_id INTEGER NOT NULL,
+        metric TEXT NOT NULL,
+        year INTEGER NOT NULL,
+        mean REAL,
+        std REAL,
+        p5 REAL,
+        p25 REAL,
+        p50 REAL,
+        p75 REAL,
+        p95 REAL,
+        PRIMARY KEY (simulation_id, metric, year),
+        FOREIGN KEY (simulation_id) REFERENCES scenario_simulations(id)
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_scenario_simulations_scenario ON scenario_simulations(scenario_id)",
+)
+
+
+def install_simulation_tables(conn) -> None:
+    """Monte Carlo özet tablolarını kur (commit çağırana aittir)"""
+    for statement in SIMULATION_DDL:
+        conn.execute(statement)
+
+
+def _random_walk(rng, sigma: float, shape) -> np.ndarray:
+    """Ortalaması 1 olan çarpımsal yıllık rastgele yürüyüş (sigma=0 -> 1)"""
+    if not sigma:
+        return np.ones(shape)
+    steps = np.arange(1, shape[1] + 1)
+    log_walk = np.cumsum(rng.standard_normal(shape), axis=1) * sigma
+    return np.exp(log_walk - 0.5 * sigma ** 2 * steps)
+
+
+def _path_factor(rng, sigma: float, n_paths: int) -> np.ndarray:
+    """Ortalaması 1 olan yol başına lognormal çarpan (sigma=0 -> 1)"""
+    if not sigma:
+        return np.ones((n_paths, 1))
+    return np.exp(rng.standard_normal((n_paths, 1)) * sigma - 0.5 * sigma ** 2)
+
+
+def simulate_paths(params: Dict, progress: np.ndarray, n_paths: int,
+                   volatility: Optional[Dict] = None, seed=None) -> Dict[str, np.ndarray]:
+    """
+    Senaryo yollarını vektörel hesapla.
+
+    Args:
+        params: ScenarioEngine._scenario_parameters çıktısı
+        progress: Yıl başına ilerleme oranı (0..1)
+        volatility: DEFAULT_VOLATILITY anahtarları; None/0 deterministik
+
+    Returns:
+        Metrik -> (n_paths, yıl) dizisi
+    """
+    volatility = volatility or {}
+    rng = np.random.default_rng(seed)
+    progress = np.asarray(progress, dtype=float)[None, :]
+    shape = (n_paths, progress.shape[1])
+
+    reduction = params['reduction_rate'] * progress * _path_factor(rng, volatility.get('reduction', 0), n_paths)
+    reduction = np.clip(reduction, 0.0, 1.0)
+    emissions = params['current_emissions'] * (1 - reduction)
+
+    carbon_price = params['carbon_price'] * progress * _random_walk(rng, volatility.get('carbon_price', 0), shape)
+    carbon_cost = emissions * carbon_price
+
+    renewable_share = params['renewable_share'] * progress
+    renewable_share = np.clip(renewable_share * _random_walk(rng, volatility.get('renewable_share', 0), shape), 0.0, 1.0)
+    energy_cost_saving = ENERGY_COST_BASE * renewable_share * ENERGY_SAVING_RATE
+
+    capex = params['capex_base'] * progress * _path_factor(rng, volatility.get('capex', 0), n_paths)
+    net_impact = carbon_cost + capex - energy_cost_saving
+
+    roi = np.zeros(shape)
+    np.divide(energy_cost_saving - carbon_cost, capex, out=roi, where=capex > 0)
+    roi *= 100
+
+    return {
+        'reduction_percentage': reduction * 100,
+        'total_emissions': emissions,
+        'carbon_cost': carbon_cost,
+        'energy_cost': energy_cost_saving,
+        'capex_investment': capex,
+        'net_financial_impact': net_impact,
+        'roi_percentage': roi,
+    }
+
+
+def _chunk_paths(params: Dict, progress: np.ndarray, n_paths: int,
+                 volatility: Optional[Dict], seed) -> Dict[str, np.ndarray]:
+    """Özetlenecek diziler: yıllık metrikler ve ufuk boyunca kümülatif net etki"""
+    paths = simulate_paths(params, progress, n_paths, volatility, seed)
+    paths['cumulative_net_impact'] = paths['net_financial_impact'].sum(axis=1, keepdims=True)
+    return paths
+
+
+def _chunk_bounds(args) -> Dict[str, tuple]:
+    """Birinci geçiş: parçanın metrik/yıl bazlı min ve max'ı (süreç havuzu işçisi)"""
+    paths = _chunk_paths(*args)
+    return {metric: (paths[metric].min(axis=0), paths[metric].max(axis=0))
+            for metric in SIMULATION_METRICS + ('cumulative_net_impact',)}
+
+
+def _merge_bounds(chunks: List[Dict[str, tuple]]) -> Dict[str, tuple]:
+    """Parça sınırlarından tüm yollar için ortak histogram sınırları"""
+    return {
+        metric: (np.min([chunk[metric][0] for chunk in chunks], axis=0),
+                 np.max([chunk[metric][1] for chunk in chunks], axis=0))
+        for metric in chunks[0]
+    }
+
+
+def _histogram(values: np.ndarray, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """Yıl başına ortak sınırlı HISTOGRAM_BINS kutulu sayım: (yıl, kutu)"""
+    width = np.where(high > low, (high - low) / HISTOGRAM_BINS, 1.0)
+    bins = np.clip(((values - low) / width).astype(np.int64), 0, HISTOGRAM_BINS - 1)
+    bins += np.arange(values.shape[1]) * HISTOGRAM_BINS
+    return np.bincount(bins.ravel(), minlength=values.shape[1] * HISTOGRAM_BINS).reshape(
+        values.shape[1], HISTOGRAM_BINS)
+
+
+def _histogram_quantiles(hist: np.ndarray, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """Toplanmış histogramdan kutu içi doğrusal aradeğerli yüzdelikler: (quantile, yıl)"""
+    width = np.where(high > low, (high - low) / HISTOGRAM_BINS, 0.0)
+    cumulative = np.cumsum(hist, axis=1)
+    rows = np.arange(hist.shape[0])
+    quantiles = []
+    for q in SIMULATION_QUANTILES:
+        target = cumulative[:, -1] * q / 100.0
+        index = np.minimum((cumulative < target[:, None]).sum(axis=1), HISTOGRAM_BINS - 1)
+        before = np.where(index > 0, cumulative[rows, index - 1], 0)
+        in_bin = hist[rows, index]
+        fraction = np.divide(target - before, in_bin, out=np.zeros(len(rows)), where=in_bin > 0)
+        quantiles.append(np.clip(low + (index + fraction) * width, low, high))
+    return np.array(quantiles)
+
+
+def _path_statistics(values: np.ndarray, bounds: Optional[tuple] = None) -> Dict:
+    """
+    Birleştirilebilir özet: ortalama ve sapma kareleri toplamı; ortak sınırlar
+    verilmişse histogram, verilmemişse (tek parça) kesin yüzdelikler.
+    """
+    mean = values.mean(axis=0)
+    stats = {
+        'count': values.shape[0],
+        'mean': mean,
+        'm2': np.square(values - mean).sum(axis=0),
+    }
+    if bounds is None:
+        stats['quantiles'] = np.percentile(values, SIMULATION_QUANTILES, axis=0)
+    else:
+        stats['bounds'] = bounds
+        stats['hist'] = _histogram(values, *bounds)
+    return stats
+
+
+def _simulate_chunk(args) -> Dict[str, Dict]:
+    """Bir yol parçasını simüle edip yalnızca özetini döndür (süreç havuzu işçisi)"""
+    params, progress, n_paths, volatility, seed, bounds = args
+    paths = _chunk_paths(params, progress, n_paths, volatility, seed)
+    stats = {metric: _path_statistics(paths[metric], bounds and bounds[metric])
+             for metric in SIMULATION_METRICS + ('cumulative_net_impact',)}
+    positive_roi = paths['roi_percentage'][:, -1:] > 0
+    stats['positive_final_roi'] = {'count': n_paths, 'mean': positive_roi.mean(axis=0)}
+    return stats
+
+
+def _merge_statistics(chunks: List[Dict[str, Dict]]) -> Dict[str, Dict]:
+    """
+    Parça özetlerini birleştir: ortalama/std kesin (Chan'in paralel varyans
+    formülü), yüzdelikler toplanmış histogramlardan.
+    """
+    merged = {}
+    for key in chunks[0]:
+        parts = [chunk[key] for chunk in chunks]
+        count, mean = parts[0]['count'], parts[0]['mean']
+        m2 = parts[0].get('m2')
+        for part in parts[1:]:
+            total = count + part['count']
+            delta = part['mean'] - mean
+            if m2 is not None:
+                m2 = m2 + part['m2'] + np.square(delta) * count * part['count'] / total
+            mean = mean + delta * part['count'] / total
+            count = total
+        entry = {'count': count, 'mean': mean}
+        if m2 is not None:
+            entry['std'] = np.sqrt(m2 / count)
+            if 'hist' in parts[0]:
+                entry['quantiles'] = _histogram_quantiles(
+                    sum(part['hist'] for part in parts), *parts[0]['bounds'])
+            else:
+                entry['quantiles'] = parts[0]['quantiles']
+        merged[key] = entry
+    return merged
 
 
 class ScenarioEngine:
@@ -50,6 +294,13 @@ class ScenarioEngine:
         }
     }
 
+    # Azaltım hedefleri: (2030, 2050); tanımsız senaryolar 4°C gibi davranır
+    REDUCTION_TARGETS = {
+        "2C": (0.50, 0.80),
+        "1_5C": (0.65, 0.95),
+        "4C": (0.10, 0.20)
+    }
+
     # Geçiş Riskleri (Türkçe)
     TRANSITION_RISKS = {
         "politika_duzenleyici": "Politika ve Düzenleyici Risk",
@@ -69,11 +320,11 @@ class ScenarioEngine:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_scenario_tables()
+        ensure_schema(self.db_path, self._init_scenario_tables)
 
     def _init_scenario_tables(self) -> None:
         """Senaryo tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -178,6 +429,9 @@ class ScenarioEngine:
                 )
             """)
 
+            # Monte Carlo özet tabloları
+            install_simulation_tables(conn)
+
             conn.commit()
             logging.info("[OK] Senaryo analizi tablolari olusturuldu")
 
@@ -202,7 +456,7 @@ class ScenarioEngine:
             current_emissions: Mevcut toplam emisyon (tCO2e)
             assumptions: Şirket varsayımları
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -226,10 +480,13 @@ class ScenarioEngine:
 
             scenario_id = cursor.lastrowid
 
+            # Deterministik yol: tek yollu, sıfır oynaklıklı simülasyon
+            paths = self._deterministic_paths(scenario_key, base_year, target_year, current_emissions)
+
             # Emisyon projeksiyonları hesapla
             self._calculate_emission_projections(
                 cursor, scenario_id, scenario_key,
-                base_year, target_year, current_emissions
+                base_year, target_year, current_emissions, paths
             )
 
             # Geçiş risklerini ekle
@@ -241,7 +498,7 @@ class ScenarioEngine:
             # Finansal etki simülasyonu
             self._simulate_financial_impact(
                 cursor, scenario_id, scenario_key,
-                base_year, target_year, current_emissions
+                base_year, target_year, current_emissions, paths
             )
 
             conn.commit()
@@ -254,50 +511,61 @@ class ScenarioEngine:
         finally:
             conn.close()
 
+    def _scenario_parameters(self, scenario_key: str, target_year: int,
+                             current_emissions: float) -> Dict:
+        """Senaryo çekirdeğinin girdileri (hedef yıla göre azaltım ve karbon fiyatı)"""
+        scenario = self.TCFD_SCENARIOS[scenario_key]
+        target_reduction, final_reduction = self.REDUCTION_TARGETS.get(
+            scenario_key, self.REDUCTION_TARGETS["4C"])
+
+        return {
+            "current_emissions": current_emissions,
+            "reduction_rate": final_reduction if target_year == 2050 else target_reduction,
+            "carbon_price": (scenario["carbon_price_2030"] if target_year == 2030
+                             else scenario["carbon_price_2050"]),
+            "renewable_share": scenario["renewable_share_2030"],
+            "capex_base": 20000000 if scenario_key in ["2C", "1_5C"] else 5000000
+        }
+
+    @staticmethod
+    def _projection_years(base_year: int, target_year: int):
+        """Projeksiyon yılları ve lineer ilerleme oranları"""
+        if target_year == base_year:
+            raise ValueError("Hedef yıl baz yıldan farklı olmalı")
+        years = np.arange(base_year, target_year + 1)
+        return years, (years - base_year) / (target_year - base_year)
+
+    def _deterministic_paths(self, scenario_key: str, base_year: int,
+                             target_year: int, current_emissions: float) -> Dict:
+        """Tek yollu deterministik senaryo (yıl listesiyle birlikte)"""
+        years, progress = self._projection_years(base_year, target_year)
+        params = self._scenario_parameters(scenario_key, target_year, current_emissions)
+        paths = {metric: values[0].tolist() for metric, values
+                 in simulate_paths(params, progress, 1).items()}
+        paths["year"] = years.tolist()
+        return paths
+
     def _calculate_emission_projections(self, cursor, scenario_id: int,
                                        scenario_key: str, base_year: int,
                                        target_year: int,
-                                       current_emissions: float) -> None:
+                                       current_emissions: float,
+                                       paths: Optional[Dict] = None) -> None:
         """Emisyon projeksiyonlarını hesapla"""
-        self.TCFD_SCENARIOS[scenario_key]
-
-        # Senaryoya göre azaltma hedefleri
-        if scenario_key == "2C":
-            target_reduction = 0.50  # %50 azaltım (2030)
-            final_reduction = 0.80   # %80 azaltım (2050)
-        elif scenario_key == "1_5C":
-            target_reduction = 0.65  # %65 azaltım (2030)
-            final_reduction = 0.95   # %95 azaltım (2050)
-        else:  # 4C
-            target_reduction = 0.10  # %10 azaltım (2030)
-            final_reduction = 0.20   # %20 azaltım (2050)
-
-        # Yıllık projeksiyonlar
-        for year in range(base_year, target_year + 1):
-            # Lineer interpolasyon
-            progress = (year - base_year) / (target_year - base_year)
-
-            if target_year == 2030:
-                reduction = target_reduction * progress
-            elif target_year == 2050:
-                reduction = final_reduction * progress
-            else:
-                reduction = target_reduction * progress
-
-            projected_emissions = current_emissions * (1 - reduction)
-
-            # Scope dağılımı (varsayılan: Scope1: 40%, Scope2: 30%, Scope3: 30%)
-            scope1 = projected_emissions * 0.40
-            scope2 = projected_emissions * 0.30
-            scope3 = projected_emissions * 0.30
-
-            cursor.execute("""
-                INSERT INTO emission_projections
-                (scenario_id, year, scope1_emissions, scope2_emissions,
-                 scope3_emissions, total_emissions, reduction_percentage)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (scenario_id, year, scope1, scope2, scope3,
-                  projected_emissions, reduction * 100))
+        if paths is None:
+            paths = self._deterministic_paths(scenario_key, base_year, target_year, current_emissions)
+
+        # Scope dağılımı (varsayılan: Scope1: 40%, Scope2: 30%, Scope3: 30%)
+        cursor.executemany("""
+            INSERT INTO emission_projections
+            (scenario_id, year, scope1_emissions, scope2_emissions,
+             scope3_emissions, total_emissions, reduction_percentage)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (scenario_id, year, emissions * 0.40, emissions * 0.30, emissions * 0.30,
+             emissions, reduction)
+            for year, emissions, reduction in zip(
+                paths["year"], paths["total_emissions"], paths["reduction_percentage"])
+        ])
 
     def _add_transition_risks(self, cursor, scenario_id: int, scenario_key: str) -> None:
         """Geçiş risklerini ekle"""
@@ -406,51 +674,191 @@ class ScenarioEngine:
 
     def _simulate_financial_impact(self, cursor, scenario_id: int,
                                    scenario_key: str, base_year: int,
-                                   target_year: int, current_emissions: float) -> None:
+                                   target_year: int, current_emissions: float,
+                                   paths: Optional[Dict] = None) -> None:
         """Finansal etki simülasyonu"""
-        scenario = self.TCFD_SCENARIOS[scenario_key]
+        if paths is None:
+            paths = self._deterministic_paths(scenario_key, base_year, target_year, current_emissions)
+
+        # Emisyonlar aynı yoldan gelir; projeksiyon tablosu yeniden okunmaz
+        cursor.executemany("""
+            INSERT INTO financial_impact_simulation
+            (scenario_id, year, carbon_cost, energy_cost, capex_investment,
+             net_financial_impact, roi_percentage)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (scenario_id,) + row
+            for row in zip(paths["year"], paths["carbon_cost"], paths["energy_cost"],
+                           paths["capex_investment"], paths["net_financial_impact"],
+                           paths["roi_percentage"])
+        ])
 
-        # Yıllık finansal etki
-        for year in range(base_year, target_year + 1):
-            progress = (year - base_year) / (target_year - base_year)
+    # =====================================================
+    # 1b. MONTE CARLO SİMÜLASYONU
+    # =====================================================
 
-            # Karbon maliyeti
-            if target_year == 2030:
-                carbon_price = scenario["carbon_price_2030"] * progress
-            else:
-                carbon_price = scenario["carbon_price_2050"] * progress
+    def simulate_tcfd_scenario(self, company_id: int, scenario_key: str,
+                               base_year: int, target_year: int,
+                               current_emissions: float, n_paths: int = 10000,
+                               volatility: Dict = None, seed: int = None,
+                               scenario_id: int = None,
+                               max_workers: int = None) -> Dict:
+        """
+        TCFD senaryosu için Monte Carlo simülasyonu
 
-            # Emisyon azaltımı
-            cursor.execute("""
-                SELECT total_emissions FROM emission_projections
-                WHERE scenario_id = ? AND year = ?
-            """, (scenario_id, year))
+        Args:
+            n_paths: Yol sayısı; PROCESS_POOL_MIN_PATHS ve üzeri süreç havuzunda çalışır
+            volatility: DEFAULT_VOLATILITY üzerine yazılacak oynaklıklar
+            seed: Tekrarlanabilirlik için tohum (saklanır)
+            scenario_id: Bantların bağlanacağı senaryo; yoksa deterministik senaryo oluşturulur
+            max_workers: Süreç sayısı; 1 ise havuz kullanılmaz
 
-            result = cursor.fetchone()
-            emissions = result[0] if result else current_emissions
+        Returns:
+            Yıl bazlı yüzdelik bantlar ve ufuk özeti
+        """
+        try:
+            if n_paths < 1:
+                raise ValueError("n_paths en az 1 olmalı")
+            volatility = {**DEFAULT_VOLATILITY, **(volatility or {})}
+            years, progress = self._projection_years(base_year, target_year)
+            params = self._scenario_parameters(scenario_key, target_year, current_emissions)
+
+            if scenario_id is None:
+                scenario_id = self.create_tcfd_scenario(
+                    company_id, scenario_key, base_year, target_year, current_emissions,
+                    {"simulation": "monte_carlo", "n_paths": n_paths}
+                )
+                if not scenario_id:
+                    return {}
+
+            # Parça tohumları SeedSequence'tan türetilir: sonuç işçi sırasından bağımsız
+            seed_seq = np.random.SeedSequence(seed)
+            sizes = [SIMULATION_CHUNK_PATHS] * (n_paths // SIMULATION_CHUNK_PATHS)
+            if n_paths % SIMULATION_CHUNK_PATHS:
+                sizes.append(n_paths % SIMULATION_CHUNK_PATHS)
+            seeds = seed_seq.spawn(len(sizes)) if len(sizes) > 1 else [seed_seq]
+            tasks = [(params, progress, size, volatility, chunk_seed)
+                     for size, chunk_seed in zip(sizes, seeds)]
+
+            use_pool = n_paths >= PROCESS_POOL_MIN_PATHS and max_workers != 1 and len(tasks) > 1
+            with ProcessPoolExecutor(max_workers=max_workers) if use_pool else nullcontext() as pool:
+                run = pool.map if pool is not None else map
+                # Birden çok parçada ortak histogram sınırları için önce min/max
+                # geçişi (aynı tohumlar aynı yolları yeniden üretir)
+                bounds = _merge_bounds(list(run(_chunk_bounds, tasks))) if len(tasks) > 1 else None
+                chunks = list(run(_simulate_chunk, [task + (bounds,) for task in tasks]))
+
+            stats = _merge_statistics(chunks)
+            result = self._simulation_result(stats, years.tolist())
+            result.update({
+                "scenario_id": scenario_id,
+                "n_paths": n_paths,
+                "seed": str(seed_seq.entropy),
+                "volatility": volatility
+            })
+            result["simulation_id"] = self._save_simulation(result)
+            return result
 
-            carbon_cost = emissions * carbon_price
+        except Exception as e:
+            logging.error(f"Monte Carlo simulasyon hatasi: {e}")
+            return {}
 
-            # Enerji maliyeti (yenilenebilir enerji payı arttıkça azalır)
-            renewable_share = scenario["renewable_share_2030"] * progress
-            energy_cost_saving = 50000000 * renewable_share * 0.20  # %20 tasarruf
+    @staticmethod
+    def _simulation_result(stats: Dict, years: List[int]) -> Dict:
+        """Birleştirilmiş istatistiklerden yıl bazlı bantlar"""
+        bands = {}
+        for metric in SIMULATION_METRICS:
+            entry = stats[metric]
+            bands[metric] = [
+                dict(
+                    {"year": year, "mean": float(entry["mean"][i]), "std": float(entry["std"][i])},
+                    **{f"p{q}": float(entry["quantiles"][k][i]) for k, q in enumerate(SIMULATION_QUANTILES)}
+                )
+                for i, year in enumerate(years)
+            ]
 
-            # CAPEX (yatırım)
-            capex = 20000000 * progress if scenario_key in ["2C", "1_5C"] else 5000000 * progress
+        cumulative = stats["cumulative_net_impact"]
+        summary = {
+            "cumulative_net_impact": dict(
+                {"mean": float(cumulative["mean"][0]), "std": float(cumulative["std"][0])},
+                **{f"p{q}": float(cumulative["quantiles"][k][0]) for k, q in enumerate(SIMULATION_QUANTILES)}
+            ),
+            "probability_positive_roi": float(stats["positive_final_roi"]["mean"][0])
+        }
+        return {"years": years, "bands": bands, "summary": summary}
 
-            # Net finansal etki
-            net_impact = carbon_cost + capex - energy_cost_saving
+    def _save_simulation(self, result: Dict) -> int:
+        """Özet quantile'ları tek transaction'da yaz; ham yollar saklanmaz"""
+        conn = db_connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO scenario_simulations
+                (scenario_id, n_paths, seed, volatility, summary)
+                VALUES (?, ?, ?, ?, ?)
+            """, (result["scenario_id"], result["n_paths"], result["seed"],
+                  json.dumps(result["volatility"]), json.dumps(result["summary"])))
+            simulation_id = cursor.lastrowid
+
+            cursor.executemany("""
+                INSERT INTO scenario_simulation_quantiles
+                (simulation_id, metric, year, mean, std, p5, p25, p50, p75, p95)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (simulation_id, metric, band["year"], band["mean"], band["std"],
+                 *(band[f"p{q}"] for q in SIMULATION_QUANTILES))
+                for metric, metric_bands in result["bands"].items()
+                for band in metric_bands
+            ])
+            conn.commit()
+            return simulation_id
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
 
-            # ROI
-            roi = ((energy_cost_saving - carbon_cost) / capex * 100) if capex > 0 else 0
+    def get_simulation_summary(self, simulation_id: int) -> Dict:
+        """Kaydedilmiş Monte Carlo simülasyonunun bantları"""
+        conn = db_connect(self.db_path)
+        cursor = conn.cursor()
 
+        try:
             cursor.execute("""
-                INSERT INTO financial_impact_simulation
-                (scenario_id, year, carbon_cost, energy_cost, capex_investment,
-                 net_financial_impact, roi_percentage)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (scenario_id, year, carbon_cost, energy_cost_saving,
-                  capex, net_impact, roi))
+                SELECT scenario_id, n_paths, seed, volatility, summary, created_at
+                FROM scenario_simulations WHERE id = ?
+            """, (simulation_id,))
+            row = cursor.fetchone()
+            if not row:
+                return {}
+
+            result = {
+                "simulation_id": simulation_id,
+                "scenario_id": row[0],
+                "n_paths": row[1],
+                "seed": row[2],
+                "volatility": json.loads(row[3]) if row[3] else {},
+                "summary": json.loads(row[4]) if row[4] else {},
+                "created_at": row[5],
+                "bands": {}
+            }
+
+            cursor.execute("""
+                SELECT metric, year, mean, std, p5, p25, p50, p75, p95
+                FROM scenario_simulation_quantiles WHERE simulation_id = ?
+                ORDER BY metric, year
+            """, (simulation_id,))
+            keys = ("year", "mean", "std") + tuple(f"p{q}" for q in SIMULATION_QUANTILES)
+            for metric, *values in cursor.fetchall():
+                result["bands"].setdefault(metric, []).append(dict(zip(keys, values)))
+            result["years"] = [band["year"] for band in next(iter(result["bands"].values()), [])]
+            return result
+
+        except Exception as e:
+            logging.error(f"Simulasyon ozeti hatasi: {e}")
+            return {}
+        finally:
+            conn.close()
 
     # =====================================================
     # 2. BAU vs NET ZERO KARŞILAŞTIRMASI
@@ -464,7 +872,7 @@ class ScenarioEngine:
         Returns:
             Karşılaştırma ID
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -510,7 +918,7 @@ class ScenarioEngine:
 
     def get_scenario_comparison_summary(self, comparison_id: int) -> Dict:
         """Senaryo karşılaştırma özeti"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -596,7 +1004,7 @@ class ScenarioEngine:
 
     def get_scenario_details(self, scenario_id: int) -> Dict:
         """Senaryo detaylarını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -5,7 +5,10 @@ Scope 3 Kategorileri Modülü
 GHG Protocol Scope 3 kategorileri için kapsamlı yönetim sistemi
 """
 
-from .scope3_gui import Scope3GUI
+try:
+    from .scope3_gui import Scope3GUI
+except ImportError:
+    Scope3GUI = None
 from .scope3_manager import Scope3Manager
 
 __all__ = ['Scope3Manager', 'Scope3GUI']
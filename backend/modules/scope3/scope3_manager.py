@@ -11,6 +11,8 @@ import sqlite3
 from datetime import datetime
 from typing import Dict, List
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class Scope3Manager:
@@ -22,12 +24,12 @@ class Scope3Manager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self.create_tables()
+        ensure_schema(self.db_path, self.create_tables)
         self.load_scope3_categories()
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def create_tables(self) -> None:
         """Gerekli tabloları oluştur"""
@@ -8,6 +8,7 @@ Bu script kalan 15 SDG formu için dosyalar ve veritabanı tablolarını oluştu
 import logging
 import sqlite3
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 # Tüm SDG form tanımları
 SDG_FORMS = {
@@ -180,7 +181,7 @@ SDG_FORMS = {
 
 def create_all_tables() -> None:
     """Tüm SDG tablolarını oluştur"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_connect(DB_PATH)
     cursor = conn.cursor()
 
     logging.info("Tüm SDG tabloları oluşturuluyor...\n")
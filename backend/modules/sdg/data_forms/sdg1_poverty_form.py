@@ -8,6 +8,7 @@ Veri Giriş Formu
 import logging
 import os
 import sys
+from utils.db_pool import connect as db_connect
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 import sqlite3
@@ -40,7 +41,7 @@ def get_sdg1_fields() -> List[FormField]:
     ]
 
 def save_sdg1_data(form_data: Dict, is_draft: bool, company_id: int, task_id: Optional[int] = None) -> bool:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_connect(DB_PATH)
     cursor = conn.cursor()
     try:
         cursor.execute("""CREATE TABLE IF NOT EXISTS sdg1_poverty_data (
@@ -8,6 +8,7 @@ Veri Giriş Formu
 import logging
 import os
 import sys
+from utils.db_pool import connect as db_connect
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
@@ -202,7 +203,7 @@ def save_sdg7_data(form_data: Dict, is_draft: bool, company_id: int, task_id: Op
         company_id: Firma ID
         task_id: İlgili görev ID (opsiyonel)
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_connect(DB_PATH)
     cursor = conn.cursor()
 
     try:
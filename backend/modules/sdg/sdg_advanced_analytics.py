@@ -14,6 +14,8 @@ from typing import Dict, List, Optional
 
 import numpy as np
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class SDGAdvancedAnalytics:
@@ -26,11 +28,11 @@ class SDGAdvancedAnalytics:
         else:
             self.db_path = db_path
 
-        self._create_advanced_tables()
+        ensure_schema(self.db_path, self._create_advanced_tables)
 
     def _create_advanced_tables(self) -> None:
         """Gelişmiş analitik tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # SDG hedef performans skorları
@@ -135,7 +137,7 @@ class SDGAdvancedAnalytics:
 
     def get_connection(self) -> sqlite3.Connection:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def calculate_goal_performance_score(self, company_id: int, sdg_no: int) -> Dict:
         """SDG hedef performans skorunu hesapla"""
@@ -562,70 +564,7 @@ class SDGAdvancedAnalytics:
                 """, (company_id,))
 
             metrics = cursor.fetchall()
-
-            if not metrics:
-                return {
-                    'total_metrics': 0,
-                    'categories': {},
-                    'top_performers': [],
-                    'underperformers': [],
-                    'average_performance': 0.0
-                }
-
-            # Kategorilere göre analiz
-            categories = defaultdict(list)
-            all_scores = []
-
-            for metric in metrics:
-                category = metric[0]
-                name = metric[1]
-                value = metric[2]
-                target = metric[3]
-                vs_target = metric[4]
-                improvement = metric[5]
-
-                categories[category].append({
-                    'name': name,
-                    'value': value,
-                    'target': target,
-                    'vs_target': vs_target,
-                    'improvement': improvement
-                })
-
-                if vs_target is not None:
-                    all_scores.append(vs_target)
-
-            # En iyi ve en kötü performanslar
-            sorted_metrics = sorted(metrics, key=lambda x: x[4] or 0, reverse=True)
-            top_performers = sorted_metrics[:5]
-            underperformers = sorted_metrics[-5:]
-
-            # Ortalama performans
-            avg_performance = np.mean(all_scores) if all_scores else 0.0
-
-            result = {
-                'total_metrics': len(metrics),
-                'categories': dict(categories),
-                'top_performers': [
-                    {
-                        'name': m[1],
-                        'category': m[0],
-                        'value': m[2],
-                        'vs_target': m[4]
-                    } for m in top_performers
-                ],
-                'underperformers': [
-                    {
-                        'name': m[1],
-                        'category': m[0],
-                        'value': m[2],
-                        'vs_target': m[4]
-                    } for m in underperformers
-                ],
-                'average_performance': round(avg_performance, 2)
-            }
-
-            return result
+            return self._summarize_metrics(metrics)
 
         except Exception as e:
             logging.error(f"Performans metrikleri analiz edilirken hata: {e}")
@@ -639,6 +578,71 @@ class SDGAdvancedAnalytics:
         finally:
             conn.close()
 
+    @staticmethod
+    def _summarize_metrics(metrics: List) -> Dict:
+        """(kategori, ad, değer, hedef, hedefe göre, iyileşme, tarih) satırlarını özetle"""
+        if not metrics:
+            return {
+                'total_metrics': 0,
+                'categories': {},
+                'top_performers': [],
+                'underperformers': [],
+                'average_performance': 0.0
+            }
+
+        # Kategorilere göre analiz
+        categories = defaultdict(list)
+        all_scores = []
+
+        for metric in metrics:
+            category = metric[0]
+            name = metric[1]
+            value = metric[2]
+            target = metric[3]
+            vs_target = metric[4]
+            improvement = metric[5]
+
+            categories[category].append({
+                'name': name,
+                'value': value,
+                'target': target,
+                'vs_target': vs_target,
+                'improvement': improvement
+            })
+
+            if vs_target is not None:
+                all_scores.append(vs_target)
+
+        # En iyi ve en kötü performanslar
+        sorted_metrics = sorted(metrics, key=lambda x: x[4] or 0, reverse=True)
+        top_performers = sorted_metrics[:5]
+        underperformers = sorted_metrics[-5:]
+
+        # Ortalama performans
+        avg_performance = np.mean(all_scores) if all_scores else 0.0
+
+        return {
+            'total_metrics': len(metrics),
+            'categories': dict(categories),
+            'top_performers': [
+                {
+                    'name': m[1],
+                    'category': m[0],
+                    'value': m[2],
+                    'vs_target': m[4]
+                } for m in top_performers
+            ],
+            'underperformers': [
+                {
+                    'name': m[1],
+                    'category': m[0],
+                    'value': m[2],
+                    'vs_target': m[4]
+                } for m in underperformers
+            ],
+            'average_performance': round(avg_performance, 2)
+        }
+
     def perform_risk_analysis(self, company_id: int, sdg_no: int) -> List[Dict]:
         """Risk analizi yap"""
         try:
@@ -780,14 +784,7 @@ class SDGAdvancedAnalytics:
             overall_score = performance_score['performance_score']
             risk_count = len([r for r in risk_analysis if r['risk_level'] == 'high'])
 
-            if overall_score >= 80 and risk_count == 0:
-                overall_status = "excellent"
-            elif overall_score >= 60 and risk_count <= 2:
-                overall_status = "good"
-            elif overall_score >= 40 and risk_count <= 5:
-                overall_status = "fair"
-            else:
-                overall_status = "needs_improvement"
+            overall_status = self._overall_status(overall_score, risk_count)
 
             return {
                 'sdg_no': sdg_no,
@@ -811,6 +808,373 @@ class SDGAdvancedAnalytics:
                 'error': str(e)
             }
 
+    # ------------------------------------------------------------------
+    # Toplu analiz: tüm hedefler tek geçişte
+    # ------------------------------------------------------------------
+
+    def analyze_all_goals(self, company_id: int, sdg_numbers: Optional[List[int]] = None,
+                          days: int = 30) -> Dict[int, Dict]:
+        """
+        Şirketin tüm SDG hedeflerini tek geçişte analiz et.
+
+        Gösterge durumları, trend ölçümleri ve metrikler birer sorguyla okunur;
+        skorlar NumPy dizileri üzerinde hedef bazında gruplanarak hesaplanır ve
+        sonuçlar tek transaction'da executemany ile kaydedilir. Dönen sözlük
+        sdg_no -> get_comprehensive_analysis ile aynı yapıdadır.
+        """
+        goals = sorted(set(sdg_numbers)) if sdg_numbers else list(range(1, 18))
+        now = datetime.now()
+        now_iso = now.isoformat()
+        placeholders = ','.join('?' * len(goals))
+
+        conn = self.get_connection()
+        try:
+            indicator_rows = self._fetch_optional(conn, f"""
+                SELECT sdg_no, indicator_code, indicator_title, answered_questions,
+                       total_questions, completion_percentage, last_updated
+                FROM sdg_indicator_status
+                WHERE company_id = ? AND sdg_no IN ({placeholders})
+                ORDER BY sdg_no, rowid
+            """, (company_id, *goals))
+            trend_rows = self._fetch_optional(conn, f"""
+                SELECT sdg_no, completion_percentage
+                FROM sdg_progress_trends
+                WHERE company_id = ? AND sdg_no IN ({placeholders})
+                AND measurement_date >= ? AND measurement_date <= ?
+                ORDER BY sdg_no, measurement_date
+            """, (company_id, *goals, (now - timedelta(days=days)).isoformat(), now_iso))
+            metric_rows = self._fetch_optional(conn, f"""
+                SELECT sdg_no, metric_category, metric_name, metric_value, target_value,
+                       actual_vs_target, improvement_rate, measurement_date
+                FROM sdg_performance_metrics_detailed
+                WHERE company_id = ? AND sdg_no IN ({placeholders})
+                ORDER BY measurement_date DESC
+            """, (company_id, *goals))
+        finally:
+            conn.close()
+
+        goal_pos = {sdg_no: i for i, sdg_no in enumerate(goals)}
+        indicators = self._score_indicators_batch(indicator_rows, goal_pos, now)
+        performance = self._score_goals_batch(indicators, len(goals))
+        trends = self._score_trends_batch(trend_rows, goal_pos, len(goals))
+
+        metrics_by_goal = defaultdict(list)
+        for row in metric_rows:
+            metrics_by_goal[row[0]].append(row[1:])
+
+        results: Dict[int, Dict] = {}
+        goal_rows, indicator_out, trend_out, risk_out = [], [], [], []
+        for sdg_no, g in goal_pos.items():
+            rows = indicators['by_goal'][g]
+            indicator_analytics = [indicators['results'][i] for i in rows]
+
+            if rows:
+                performance_score = {
+                    'sdg_no': sdg_no,
+                    'performance_score': performance['score'][g],
+                    'improvement_rate': performance['improvement'][g],
+                    'benchmark_score': 75.0,
+                    'industry_average': 70.0,
+                    'calculation_method': 'weighted_average',
+                    'indicators_analyzed': len(rows)
+                }
+                goal_rows.append((
+                    company_id, sdg_no, performance_score['performance_score'],
+                    performance_score['improvement_rate'], 75.0, 70.0, now_iso, 'weighted_average'
+                ))
+            else:
+                performance_score = {
+                    'sdg_no': sdg_no,
+                    'performance_score': 0.0,
+                    'improvement_rate': 0.0,
+                    'benchmark_score': 0.0,
+                    'industry_average': 0.0,
+                    'calculation_method': 'weighted_average',
+                    'indicators_analyzed': 0
+                }
+
+            trend_analysis = trends[g]
+            if trend_analysis['trend_type'] != 'insufficient_data':
+                trend_analysis['analysis_period'] = f"{days} days"
+                trend_out.append((
+                    company_id, sdg_no, trend_analysis['analysis_period'], trend_analysis['trend_type'],
+                    trend_analysis['trend_strength'], trend_analysis['trend_direction'],
+                    trend_analysis['confidence_level'], trend_analysis['forecast_value'], now_iso
+                ))
+
+            risk_analysis = [self._indicator_risk(sdg_no, item) for item in indicator_analytics]
+            for item in indicator_analytics:
+                indicator_out.append((
+                    company_id, sdg_no, item['indicator_code'], item['indicator_title'],
+                    item['completion_score'], item['quality_score'], item['timeliness_score'],
+                    item['consistency_score'], item['overall_score'], item['trend_direction'],
+                    item['risk_level'], item['priority_level']
+                ))
+            for risk in risk_analysis:
+                risk_out.append((
+                    company_id, sdg_no, risk['risk_type'], risk['risk_level'], risk['risk_score'],
+                    risk['risk_description'], risk['mitigation_strategy'],
+                    risk['impact_assessment'], risk['probability_assessment'], now_iso
+                ))
+
+            overall_score = performance_score['performance_score']
+            overall_status = self._overall_status(
+                overall_score, sum(1 for r in risk_analysis if r['risk_level'] == 'high')
+            )
+            results[sdg_no] = {
+                'sdg_no': sdg_no,
+                'overall_status': overall_status,
+                'overall_score': overall_score,
+                'performance_analysis': performance_score,
+                'indicator_analytics': indicator_analytics,
+                'trend_analysis': trend_analysis,
+                'metrics_analysis': self._summarize_metrics(metrics_by_goal.get(sdg_no, [])),
+                'risk_analysis': risk_analysis,
+                'analysis_date': now_iso,
+                'recommendations': self._generate_recommendations(overall_status, risk_analysis)
+            }
+
+        self._save_batch(goal_rows, indicator_out, trend_out, risk_out)
+        return results
+
+    @staticmethod
+    def _fetch_optional(conn: sqlite3.Connection, sql: str, params: tuple) -> List:
+        """Kaynak tablo henüz oluşturulmamışsa boş liste"""
+        try:
+            return conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            logging.warning(f"SDG toplu analiz kaynağı okunamadı: {e}")
+            return []
+
+    def _score_indicators_batch(self, rows: List, goal_pos: Dict[int, int], now: datetime) -> Dict:
+        """Gösterge skorlarını dizi işlemleriyle hesapla (analyze_indicator_details ile aynı kurallar)"""
+        n = len(rows)
+        goal_idx = np.fromiter((goal_pos[r[0]] for r in rows), dtype=np.int64, count=n)
+        answered = np.fromiter((r[3] or 0 for r in rows), dtype=float, count=n)
+        total = np.fromiter((r[4] or 3 for r in rows), dtype=float, count=n)
+        completion = np.fromiter((r[5] or 0.0 for r in rows), dtype=float, count=n)
+
+        # Kalite: tamamlanma oranı * 100, tam tamamlanmışsa +10, en fazla 100
+        safe_total = np.where(total == 0, 1.0, total)
+        ratio = answered / safe_total
+        quality = np.minimum(ratio * 100 + np.where(ratio == 1.0, 10.0, 0.0), 100.0)
+        quality = np.where(total == 0, 0.0, quality)
+
+        # Zamanında güncelleme: aynı tarih metni bir kez çözümlenir. Tarihsiz
+        # satırlar ayrı maskede; gelecekteki tarih (ör. UTC damgası) negatif gün verir
+        parsed: Dict[str, float] = {}
+        age = np.zeros(n)
+        missing = np.zeros(n, dtype=bool)
+        for i, r in enumerate(rows):
+            stamp = r[6]
+            if not stamp:
+                missing[i] = True
+                continue
+            if stamp not in parsed:
+                try:
+                    parsed[stamp] = float((now - datetime.fromisoformat(stamp.replace('Z', '+00:00'))).days)
+                except Exception:
+                    parsed[stamp] = np.nan
+            age[i] = parsed[stamp]
+        timeliness = np.select(
+            [missing, np.isnan(age), age <= 7, age <= 30, age <= 90],
+            [0.0, 50.0, 100.0, 80.0, 60.0],
+            default=40.0
+        )
+
+        consistency = np.full(n, 75.0)
+        overall = (completion + quality + timeliness + consistency) / 4
+        risk = np.select(
+            [(overall >= 80) & (completion >= 80), (overall >= 60) & (completion >= 60)],
+            ['low', 'medium'], default='high'
+        )
+        priority = np.select(
+            [(overall < 40) | (completion < 40), (overall < 70) | (completion < 70)],
+            ['high', 'medium'], default='low'
+        )
+
+        columns = [np.round(a, 2).tolist() for a in (completion, quality, timeliness, consistency, overall)]
+        results = []
+        by_goal: List[List[int]] = [[] for _ in goal_pos]
+        for i, r in enumerate(rows):
+            results.append({
+                'indicator_code': r[1],
+                'indicator_title': r[2],
+                'completion_score': columns[0][i],
+                'quality_score': columns[1][i],
+                'timeliness_score': columns[2][i],
+                'consistency_score': columns[3][i],
+                'overall_score': columns[4][i],
+                'trend_direction': 'stable',
+                'risk_level': str(risk[i]),
+                'priority_level': str(priority[i]),
+                'answered_questions': r[3] or 0,
+                'total_questions': r[4] or 3,
+                'completion_percentage': r[5] or 0.0
+            })
+            by_goal[goal_idx[i]].append(i)
+
+        return {
+            'goal_idx': goal_idx, 'answered': answered, 'total': total,
+            'completion': completion, 'results': results, 'by_goal': by_goal
+        }
+
+    @staticmethod
+    def _score_goals_batch(indicators: Dict, goal_count: int) -> Dict:
+        """Hedef performans skorları (calculate_goal_performance_score ile aynı ağırlıklandırma)"""
+        goal_idx, total = indicators['goal_idx'], indicators['total']
+        weight = np.where(total > 0, total / 3.0, 1.0)
+        score = indicators['completion'] / 100.0 * weight
+        weight_sum = np.bincount(goal_idx, weights=weight, minlength=goal_count)
+        score_sum = np.bincount(goal_idx, weights=score, minlength=goal_count)
+        performance = np.divide(score_sum * 100, weight_sum, out=np.zeros(goal_count), where=weight_sum > 0)
+
+        # İyileşme: cevaplanmış göstergelerde cevaplanma oranının ortalaması
+        answered_mask = indicators['answered'] > 0
+        rate = np.where(answered_mask, indicators['answered'] / np.where(total == 0, 1.0, total) * 100, 0.0)
+        rate_sum = np.bincount(goal_idx, weights=rate, minlength=goal_count)
+        rate_count = np.bincount(goal_idx, weights=answered_mask.astype(float), minlength=goal_count)
+        improvement = np.divide(rate_sum, rate_count, out=np.zeros(goal_count), where=rate_count > 0)
+
+        return {
+            'score': np.round(performance, 2).tolist(),
+            'improvement': np.round(improvement, 2).tolist()
+        }
+
+    @staticmethod
+    def _score_trends_batch(rows: List, goal_pos: Dict[int, int], goal_count: int) -> List[Dict]:
+        """Hedef başına doğrusal trend; eğim kapalı formdaki en küçük kareler ile gruplu hesaplanır"""
+        n = len(rows)
+        goal_idx = np.fromiter((goal_pos[r[0]] for r in rows), dtype=np.int64, count=n)
+        y = np.fromiter((r[1] or 0.0 for r in rows), dtype=float, count=n)
+
+        counts = np.bincount(goal_idx, minlength=goal_count).astype(float)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+        # Satırlar hedef ve tarihe göre sıralı: x = hedef içindeki sıra
+        x = (np.arange(n) - starts[goal_idx]).astype(float)
+
+        sx = np.bincount(goal_idx, weights=x, minlength=goal_count)
+        sy = np.bincount(goal_idx, weights=y, minlength=goal_count)
+        sxy = np.bincount(goal_idx, weights=x * y, minlength=goal_count)
+        sxx = np.bincount(goal_idx, weights=x * x, minlength=goal_count)
+        denom = counts * sxx - sx * sx
+        slope = np.divide(counts * sxy - sx * sy, denom, out=np.zeros(goal_count), where=denom > 0)
+
+        # Tahmin: son 3 ölçümün ortalaması
+        last3 = (x >= counts[goal_idx] - 3).astype(float)
+        last3_sum = np.bincount(goal_idx, weights=y * last3, minlength=goal_count)
+        last3_count = np.bincount(goal_idx, weights=last3, minlength=goal_count)
+        forecast = np.divide(last3_sum, last3_count, out=np.zeros(goal_count), where=last3_count > 0)
+
+        direction = np.select([slope > 0.5, slope < -0.5], ['improving', 'declining'], default='stable')
+        strength = np.round(np.abs(slope), 2).tolist()
+        forecast = np.round(forecast, 2).tolist()
+
+        trends = []
+        for g in range(goal_count):
+            points = int(counts[g])
+            if points < 2:
+                trends.append({
+                    'trend_type': 'insufficient_data',
+                    'trend_strength': 0.0,
+                    'trend_direction': 'stable',
+                    'confidence_level': 0.0,
+                    'forecast_value': None,
+                    'data_points': points
+                })
+                continue
+            trends.append({
+                'trend_type': 'linear',
+                'trend_strength': strength[g],
+                'trend_direction': str(direction[g]),
+                'confidence_level': round(min(100.0, points * 10), 2),
+                'forecast_value': (forecast[g] or None) if points >= 3 else None,
+                'data_points': points
+            })
+        return trends
+
+    @staticmethod
+    def _indicator_risk(sdg_no: int, indicator: Dict) -> Dict:
+        """Gösterge analitiğinden risk kaydı (perform_risk_analysis ile aynı kurallar)"""
+        code = indicator['indicator_code']
+        risk_level = indicator['risk_level']
+        if risk_level == "high":
+            risk_type = "completion_risk"
+            risk_score = 100 - indicator['completion_score']
+            risk_description = f"Gösterge {code} tamamlanma riski yüksek"
+            mitigation_strategy = "Acil eylem planı oluşturulmalı"
+        elif risk_level == "medium":
+            risk_type = "performance_risk"
+            risk_score = 100 - indicator['overall_score']
+            risk_description = f"Gösterge {code} performans riski orta"
+            mitigation_strategy = "İyileştirme planı uygulanmalı"
+        else:
+            risk_type = "monitoring_risk"
+            risk_score = 50
+            risk_description = f"Gösterge {code} izleme gerektiriyor"
+            mitigation_strategy = "Düzenli takip yapılmalı"
+
+        return {
+            'indicator_code': code,
+            'indicator_title': indicator['indicator_title'],
+            'risk_type': risk_type,
+            'risk_level': risk_level,
+            'risk_score': round(risk_score, 2),
+            'risk_description': risk_description,
+            'mitigation_strategy': mitigation_strategy,
+            'impact_assessment': f"SDG {sdg_no} hedefine etki: {risk_level}",
+            'probability_assessment': f"Olasılık: {risk_level}"
+        }
+
+    @staticmethod
+    def _overall_status(overall_score: float, high_risk_count: int) -> str:
+        """Genel durum değerlendirmesi"""
+        if overall_score >= 80 and high_risk_count == 0:
+            return "excellent"
+        if overall_score >= 60 and high_risk_count <= 2:
+            return "good"
+        if overall_score >= 40 and high_risk_count <= 5:
+            return "fair"
+        return "needs_improvement"
+
+    def _save_batch(self, goal_rows: List[tuple], indicator_rows: List[tuple],
+                    trend_rows: List[tuple], risk_rows: List[tuple]) -> None:
+        """Toplu analiz sonuçlarını tek transaction'da kaydet"""
+        conn = self.get_connection()
+        try:
+            conn.executemany("""
+                INSERT INTO sdg_goal_performance_scores
+                (company_id, sdg_no, performance_score, improvement_rate,
+                 benchmark_score, industry_average, measurement_date, calculation_method)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, goal_rows)
+            conn.executemany("""
+                INSERT OR REPLACE INTO sdg_indicator_analytics
+                (company_id, sdg_no, indicator_code, indicator_title, completion_score,
+                 quality_score, timeliness_score, consistency_score, overall_score,
+                 trend_direction, risk_level, priority_level, last_updated)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """, indicator_rows)
+            conn.executemany("""
+                INSERT INTO sdg_trend_analysis
+                (company_id, sdg_no, analysis_period, trend_type, trend_strength,
+                 trend_direction, confidence_level, forecast_value, analysis_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, trend_rows)
+            conn.executemany("""
+                INSERT INTO sdg_risk_analysis
+                (company_id, sdg_no, risk_type, risk_level, risk_score,
+                 risk_description, mitigation_strategy, impact_assessment,
+                 probability_assessment, analysis_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, risk_rows)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logging.error(f"SDG toplu analiz sonuçları kaydedilirken hata: {e}")
+        finally:
+            conn.close()
+
     def _generate_recommendations(self, status: str, risks: List[Dict]) -> List[str]:
         """Öneriler oluştur"""
         recommendations = []
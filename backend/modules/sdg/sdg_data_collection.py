@@ -14,6 +14,8 @@ from typing import Any, Dict, List, Optional, cast
 import pandas as pd
 
 from config.settings import ensure_directories, get_db_path
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class SDGDataCollection:
@@ -27,7 +29,7 @@ class SDGDataCollection:
             self.db_path = get_db_path()
 
         self.questions_df = self._load_questions_excel()
-        self._create_tables()
+        ensure_schema(self.db_path, self._create_tables)
 
     def _load_questions_excel(self) -> pd.DataFrame:
         """Soru bankası Excel dosyasını yükle (MASTER_232 sayfası)"""
@@ -105,7 +107,7 @@ class SDGDataCollection:
 
     def _create_tables(self) -> None:
         """Veri toplama tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # SDG soru yanıtları tablosu
@@ -168,7 +170,7 @@ class SDGDataCollection:
 
     def get_connection(self) -> sqlite3.Connection:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def get_questions_for_indicator(self, indicator_code: str) -> List[Dict]:
         """Belirli bir gösterge için soruları getir"""
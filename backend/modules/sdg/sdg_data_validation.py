@@ -11,6 +11,8 @@ import sqlite3
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class SDGDataValidation:
@@ -23,7 +25,7 @@ class SDGDataValidation:
         else:
             self.db_path = db_path
 
-        self._create_validation_tables()
+        ensure_schema(self.db_path, self._create_validation_tables)
 
     # --- Kural CRUD ---
     def get_rules(self) -> List[Tuple]:
@@ -137,7 +139,7 @@ class SDGDataValidation:
 
     def _create_validation_tables(self) -> None:
         """Doğrulama tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Veri doğrulama kuralları
@@ -245,7 +247,7 @@ class SDGDataValidation:
 
     def get_connection(self) -> sqlite3.Connection:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def validate_company_data(self, company_id: int) -> Dict[str, Any]:
         """Şirket verilerini doğrula"""
@@ -3,6 +3,14 @@ import os
 import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 class SDGManager:
     """SDG modülü yöneticisi - 17 hedef, 169 alt hedef, 232 gösterge"""
@@ -23,7 +31,7 @@ class SDGManager:
             
         try:
             os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-            self._create_tables()
+            ensure_schema(self.db_path, self._create_tables)
         except Exception as e:
             logging.error(f"Silent error caught: {str(e)}")
 
@@ -69,7 +77,7 @@ class SDGManager:
     def get_connection(self) -> sqlite3.Connection:
         """Veritabanı bağlantısı"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row # Use Row factory for name access
         return conn
 
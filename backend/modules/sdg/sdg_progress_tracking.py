@@ -11,6 +11,8 @@ import sqlite3
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class SDGProgressTracking:
@@ -26,11 +28,11 @@ class SDGProgressTracking:
         # DB klasörünü garanti et
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
 
-        self._create_tables()
+        ensure_schema(self.db_path, self._create_tables)
 
     def _create_tables(self) -> None:
         """İlerleme takibi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # SDG hedef ilerleme tablosu
@@ -109,7 +111,7 @@ class SDGProgressTracking:
 
     def get_connection(self) -> sqlite3.Connection:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def calculate_goal_progress(self, company_id: int, sdg_no: int) -> Dict:
         """SDG hedef ilerlemesini hesapla
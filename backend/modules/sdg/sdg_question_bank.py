@@ -11,6 +11,8 @@ import sqlite3
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class SDGQuestionBank:
@@ -24,7 +26,7 @@ class SDGQuestionBank:
         else:
             self.db_path = db_path
 
-        self._create_question_tables()
+        ensure_schema(self.db_path, self._create_question_tables)
 
     # --- CRUD Yardımcıları ---
     def add_question(self, sdg_no: int, indicator_code: str, question_text: str,
@@ -142,7 +144,7 @@ class SDGQuestionBank:
 
     def _create_question_tables(self) -> None:
         """Soru bankası tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # SDG soru kategorileri
@@ -281,7 +283,7 @@ class SDGQuestionBank:
 
     def get_connection(self) -> sqlite3.Connection:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def create_questions_for_indicator(self, sdg_no: int, indicator_code: str, indicator_title: str) -> List[int]:
         """Gösterge için 3 soru oluştur"""
@@ -25,6 +25,7 @@ from reportlab.lib.units import inch
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle, Image
 
 from config.settings import ensure_directories, get_db_path
+from utils.db_pool import connect as db_connect
 
 matplotlib.use('Agg')  # Performans için non-GUI backend
 import matplotlib.pyplot as plt
@@ -94,7 +95,7 @@ class SDGReporting:
         """Veritabanı bağlantısı"""
         # Klasör hala yoksa oluştur
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.execute("PRAGMA foreign_keys = ON")
         return conn
 
@@ -102,7 +103,7 @@ class SDGReporting:
         """Şirket logosunun yolunu bul"""
         try:
             # 1. Veritabanından logo yolunu al
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("SELECT logo_path FROM company_profiles WHERE company_id = ?", (company_id,))
             result = cursor.fetchone()
@@ -4,7 +4,10 @@
 Gelişmiş Güvenlik Modülü
 """
 
-from .advanced_security_gui import AdvancedSecurityGUI
+try:
+    from .advanced_security_gui import AdvancedSecurityGUI
+except ImportError:
+    AdvancedSecurityGUI = None
 from .advanced_security_manager import AdvancedSecurityManager
 
 __all__ = ['AdvancedSecurityManager', 'AdvancedSecurityGUI']
@@ -8,6 +8,8 @@ Multi-factor authentication, IP whitelist, session recording, threat detection
 import os
 import secrets
 import sqlite3
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 # İsteğe bağlı bağımlılıklar — eksikse belirli özellikler devre dışı
 try:
@@ -35,12 +37,12 @@ class AdvancedSecurityManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_advanced_security_tables()
+        ensure_schema(self.db_path, self._init_advanced_security_tables)
         self._setup_logging()
 
     def _init_advanced_security_tables(self) -> None:
         """Gelişmiş güvenlik tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -185,6 +187,7 @@ class AdvancedSecurityManager:
 
     def _setup_logging(self) -> None:
         """Güvenlik loglarını ayarla"""
+        os.makedirs('logs', exist_ok=True)
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -233,7 +236,7 @@ class AdvancedSecurityManager:
             qr.make_image().save(qr_path)
 
             # Veritabanına kaydet
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -263,7 +266,7 @@ class AdvancedSecurityManager:
             if pyotp is None:
                 self.security_logger.error("pyotp eksik; MFA doğrulama yapılamaz.")
                 return False
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -304,7 +307,7 @@ class AdvancedSecurityManager:
     def enable_mfa(self, user_id: int) -> bool:
         """MFA'yı etkinleştir"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -329,7 +332,7 @@ class AdvancedSecurityManager:
             # IP adresini doğrula
             ipaddress.ip_address(ip_address)
 
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -350,7 +353,7 @@ class AdvancedSecurityManager:
     def check_ip_whitelist(self, user_id: int, ip_address: str) -> bool:
         """IP adresinin whitelist'te olup olmadığını kontrol et"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -370,7 +373,7 @@ class AdvancedSecurityManager:
     def get_user_whitelisted_ips(self, user_id: int) -> List[Dict[str, Any]]:
         """Kullanıcının whitelist'teki IP'lerini getir"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -401,7 +404,7 @@ class AdvancedSecurityManager:
     def start_session_recording(self, user_id: int, session_id: str, ip_address: str, user_agent: str) -> bool:
         """Session kaydını başlat"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -424,7 +427,7 @@ class AdvancedSecurityManager:
                             module_name: str = None, ip_address: str = None) -> bool:
         """Session aksiyonunu kaydet"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -452,7 +455,7 @@ class AdvancedSecurityManager:
     def end_session_recording(self, session_id: str) -> bool:
         """Session kaydını sonlandır"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -474,7 +477,7 @@ class AdvancedSecurityManager:
     def get_session_recordings(self, user_id: int = None, limit: int = 100) -> List[Dict[str, Any]]:
         """Session kayıtlarını getir"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             if user_id:
@@ -520,7 +523,7 @@ class AdvancedSecurityManager:
                      description: str, ip_address: str = None, user_agent: str = None) -> bool:
         """Tehdit tespit et ve kaydet"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -547,7 +550,7 @@ class AdvancedSecurityManager:
     def analyze_login_patterns(self, user_id: int, ip_address: str, user_agent: str) -> Dict[str, Any]:
         """Giriş kalıplarını analiz et"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Son 30 günün giriş verilerini al
@@ -611,7 +614,7 @@ class AdvancedSecurityManager:
                           additional_data: str = None) -> bool:
         """Güvenlik olayını kaydet"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -635,7 +638,7 @@ class AdvancedSecurityManager:
                               tester_name: str) -> int:
         """Penetration test oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -659,7 +662,7 @@ class AdvancedSecurityManager:
                          description: str, affected_component: str, remediation_steps: str) -> bool:
         """Vulnerability ekle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -691,7 +694,7 @@ class AdvancedSecurityManager:
     def get_penetration_tests(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Penetration testlerini getir"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -730,7 +733,7 @@ class AdvancedSecurityManager:
     def get_vulnerabilities_by_test(self, test_id: int) -> List[Dict[str, Any]]:
         """Test'e ait vulnerability'leri getir"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -765,7 +768,7 @@ class AdvancedSecurityManager:
     def analyze_audit_logs_for_threats(self) -> List[Dict[str, Any]]:
         """Audit logları analiz ederek tehditleri tespit et"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Son 24 saatteki audit logları
@@ -873,7 +876,7 @@ class AdvancedSecurityManager:
     def generate_security_report(self, user_id: int = None) -> Dict[str, Any]:
         """Güvenlik raporu oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # MFA istatistikleri
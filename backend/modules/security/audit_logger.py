@@ -11,6 +11,8 @@ import sqlite3
 from datetime import datetime
 from typing import Dict, List
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class AuditLogger:
@@ -21,11 +23,11 @@ class AuditLogger:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """Audit log tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -78,7 +80,7 @@ class AuditLogger:
                   ip_address: str = None, user_agent: str = None, success: bool = True,
                   error_message: str = None) -> bool:
         """Aksiyon logla"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -106,7 +108,7 @@ class AuditLogger:
                           event_description: str, source_ip: str = None,
                           affected_user: str = None) -> bool:
         """Güvenlik olayı logla"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -129,7 +131,7 @@ class AuditLogger:
     def get_audit_logs(self, company_id: int, start_date: str = None, end_date: str = None,
                       action_type: str = None, user_id: int = None, limit: int = 100) -> List[Dict]:
         """Audit logları getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -189,7 +191,7 @@ class AuditLogger:
     def get_security_events(self, company_id: int, severity_level: str = None,
                            resolution_status: str = None, limit: int = 100) -> List[Dict]:
         """Güvenlik olaylarını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -10,6 +10,14 @@ import hashlib
 import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class AuditorSystem:
@@ -25,11 +33,11 @@ class AuditorSystem:
 
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
-        self._init_tables()
+        ensure_schema(self.db_path, self._init_tables)
 
     def _init_tables(self) -> None:
         """Denetçi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -156,7 +164,7 @@ class AuditorSystem:
         Returns:
             Tuple[bool, str]: (Başarı, mesaj/hata)
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -186,7 +194,7 @@ class AuditorSystem:
 
     def authenticate_auditor(self, username: str, password: str) -> Optional[Dict]:
         """Denetçi girişi doğrula"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -226,7 +234,7 @@ class AuditorSystem:
                           module: str = None, document_id: int = None,
                           details: str = None):
         """Denetçi erişimini logla"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -245,7 +253,7 @@ class AuditorSystem:
 
     def share_document_with_auditor(self, document_id: int) -> bool:
         """Belgeyi denetçiyle paylaş"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -268,7 +276,7 @@ class AuditorSystem:
                            comment_text: str, module_name: str = None,
                            document_id: int = None, severity: str = 'info') -> int:
         """Denetçi yorumu ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -289,7 +297,7 @@ class AuditorSystem:
 
     def get_auditor_comments(self, status: str = None) -> List[Dict]:
         """Denetçi yorumlarını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -319,7 +327,7 @@ class AuditorSystem:
 
     def get_auditor_list(self) -> List[Dict]:
         """Denetçi listesini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -341,7 +349,7 @@ class AuditorSystem:
                                scope: str = None, findings: str = None,
                                recommendations: str = None) -> int:
         """Güvence raporu oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -11,6 +11,8 @@ import sqlite3
 from datetime import datetime
 from typing import Dict
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class GDPRComplianceManager:
@@ -21,11 +23,11 @@ class GDPRComplianceManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """GDPR uyumluluk tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -116,7 +118,7 @@ class GDPRComplianceManager:
                         consent_status: str = None, retention_period: str = None,
                         data_source: str = None) -> bool:
         """Veri sahibi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -142,7 +144,7 @@ class GDPRComplianceManager:
                       consent_given: bool, consent_method: str = None,
                       ip_address: str = None, user_agent: str = None) -> bool:
         """Onay kaydı oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -171,7 +173,7 @@ class GDPRComplianceManager:
                           affected_subjects_count: int, breach_description: str,
                           containment_measures: str = None) -> bool:
         """Veri ihlali rapor et"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -199,7 +201,7 @@ class GDPRComplianceManager:
                                  data_recipients: str = None, third_country_transfers: str = None,
                                  security_measures: str = None, dpo_contact: str = None) -> bool:
         """Veri işleme kaydı ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -225,7 +227,7 @@ class GDPRComplianceManager:
 
     def get_gdpr_compliance_summary(self, company_id: int) -> Dict:
         """GDPR uyumluluk özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -4,7 +4,10 @@
 SKDM Modülü - Sürdürülebilir Kalkınma Modülü
 """
 
-from .skdm_gui import SKDMGUI
+try:
+    from .skdm_gui import SKDMGUI
+except ImportError:
+    SKDMGUI = None
 from .skdm_manager import SKDMManager
 
 __all__ = ['SKDMManager', 'SKDMGUI']
@@ -10,6 +10,8 @@ import sqlite3
 from datetime import datetime
 from typing import Dict, List
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class SKDMManager:
@@ -20,11 +22,11 @@ class SKDMManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_tables()
+        ensure_schema(self.db_path, self._init_tables)
 
     def _init_tables(self) -> None:
         """SKDM tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -172,7 +174,7 @@ class SKDMManager:
         if year is None:
             year = datetime.now().year
 
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -208,7 +210,7 @@ class SKDMManager:
         if year is None:
             year = datetime.now().year
 
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -241,7 +243,7 @@ class SKDMManager:
         if year is None:
             year = datetime.now().year
 
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -274,7 +276,7 @@ class SKDMManager:
         if year is None:
             year = datetime.now().year
 
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -307,7 +309,7 @@ class SKDMManager:
         if year is None:
             year = datetime.now().year
 
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -338,7 +340,7 @@ class SKDMManager:
 
     def get_emission_projects(self, company_id: int) -> List[Dict]:
         """Emisyon azaltma projeleri"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -372,7 +374,7 @@ class SKDMManager:
 
     def get_stakeholders(self, company_id: int) -> List[Dict]:
         """Paydaş listesi"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -404,7 +406,7 @@ class SKDMManager:
 
     def add_carbon_data(self, company_id: int, year: int, data: Dict) -> bool:
         """Karbon verisi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -432,7 +434,7 @@ class SKDMManager:
 
     def add_emission_project(self, company_id: int, project_data: Dict) -> bool:
         """Emisyon azaltma projesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -458,7 +460,7 @@ class SKDMManager:
 
     def add_stakeholder(self, company_id: int, stakeholder_data: Dict) -> bool:
         """Paydaş ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -488,7 +490,7 @@ class SKDMManager:
 
     def update_stakeholder(self, stakeholder_id: int, stakeholder_data: Dict) -> bool:
         """Paydaş güncelle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -524,7 +526,7 @@ class SKDMManager:
 
     def delete_stakeholder(self, stakeholder_id: int) -> bool:
         """Paydaş sil"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -10,6 +10,8 @@ import os
 import sqlite3
 from typing import Dict
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class DiversityManager:
@@ -20,11 +22,11 @@ class DiversityManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """Çeşitlilik yönetimi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -73,7 +75,7 @@ class DiversityManager:
                            metric_name: str, metric_value: float, target_value: float = None,
                            benchmark_value: float = None) -> bool:
         """Çeşitlilik metrik ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -97,7 +99,7 @@ class DiversityManager:
                                start_date: str = None, end_date: str = None, budget: float = None,
                                participants: int = None, success_metrics: str = None) -> bool:
         """Kapsayıcılık girişimi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -121,7 +123,7 @@ class DiversityManager:
 
     def get_diversity_summary(self, company_id: int, year: int) -> Dict:
         """Çeşitlilik özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
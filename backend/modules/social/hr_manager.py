@@ -10,6 +10,8 @@ import os
 import sqlite3
 from typing import Dict, List, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class HRManager:
@@ -20,11 +22,11 @@ class HRManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """İK yönetimi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -192,7 +194,7 @@ class HRManager:
     def add_compensation(self, company_id: int, year: int, position_level: str,
                         gender: str, avg_salary: float, employee_count: int, **kwargs) -> int:
         """Ücret verisi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -216,7 +218,7 @@ class HRManager:
                               contract_employees: int = None, new_hires: int = None,
                               departures: int = None, month: int = None) -> bool:
         """Çalışan istatistikleri ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -247,7 +249,7 @@ class HRManager:
                                 gender: str, employee_count: int, employment_type: str = None, 
                                 department: str = None) -> bool:
         """Çalışan demografik bilgileri ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -282,7 +284,7 @@ class HRManager:
 
     def get_demographics(self, company_id: int, year: int) -> List[Dict]:
         """Demografik verileri getir (GUI uyumlu)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             # Önce employees tablosundan detaylı analiz dene (Eğer varsa)
@@ -334,7 +336,7 @@ class HRManager:
 
     def get_turnover(self, company_id: int, year: int) -> List[Dict]:
         """İşe alım/ayrılma verilerini getir (GUI uyumlu)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -357,7 +359,7 @@ class HRManager:
             
     def get_compensation(self, company_id: int, year: int) -> List[Dict]:
         """Ücret verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -372,7 +374,7 @@ class HRManager:
 
     def calculate_gender_pay_ratio(self, company_id: int, year: int) -> str:
         """Cinsiyet bazlı ücret oranı (GRI 405-2)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -394,7 +396,7 @@ class HRManager:
 
     def get_diversity_details(self, company_id: int, year: int) -> List[Dict]:
         """Çeşitlilik metriklerini detay kayıtlar olarak getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         results = []
         try:
@@ -470,7 +472,7 @@ class HRManager:
                                  competency_score: float = None, development_needs: str = None,
                                  career_planning: str = None) -> bool:
         """Performans değerlendirmesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -497,7 +499,7 @@ class HRManager:
                                 average_score: float, response_count: int,
                                 total_responses: int) -> bool:
         """Çalışan memnuniyeti ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -523,7 +525,7 @@ class HRManager:
                                participant_count: int, total_hours: float = None,
                                investment_amount: float = None, success_rate: float = None) -> bool:
         """Çalışan gelişimi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -549,7 +551,7 @@ class HRManager:
                      baseline_value: float, target_value: float, target_unit: str,
                      target_description: str = None) -> bool:
         """İK hedefi belirle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -573,7 +575,7 @@ class HRManager:
 
     def get_hr_summary(self, company_id: int, year: int) -> Dict:
         """İK özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -700,7 +702,7 @@ class HRManager:
 
     def get_hr_targets(self, company_id: int) -> List[Dict]:
         """İK hedeflerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -777,7 +779,7 @@ class HRManager:
 
     def add_employee(self, employee_data: Dict) -> bool:
         """Tek çalışan bilgisi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -815,7 +817,7 @@ class HRManager:
                             focus_area: str, participant_count: int, 
                             success_rate: float, status: str = 'active') -> bool:
         """Çeşitlilik programı ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -835,7 +837,7 @@ class HRManager:
 
     def get_diversity_programs(self, company_id: int, year: int) -> List[Dict]:
         """Çeşitlilik programlarını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -863,7 +865,7 @@ class HRManager:
 
     def get_monthly_employee_trend(self, company_id: int, year: int) -> Dict[str, List]:
         """Aylık çalışan trendini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
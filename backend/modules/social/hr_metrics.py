@@ -10,6 +10,14 @@ import logging
 import os
 import sqlite3
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class HRMetrics:
@@ -17,11 +25,11 @@ class HRMetrics:
 
     def __init__(self, db_path: str = None) -> None:
         self.db_path = db_path or os.path.join(os.getcwd(), 'data', 'sdg_desktop.sqlite')
-        self._ensure_tables()
+        ensure_schema(self.db_path, self._ensure_tables)
 
     def _ensure_tables(self) -> None:
         """İK tabloları"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -111,7 +119,7 @@ class HRMetrics:
             employment_type: İstihdam tipi (Tam zamanlı/Yarı zamanlı/Sözleşmeli)
             count: Çalışan sayısı
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -138,7 +146,7 @@ class HRMetrics:
             new_hires: Yeni işe alınanlar
             terminations: Ayrılanlar
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -167,7 +175,7 @@ class HRMetrics:
             avg_salary: Ortalama maaş
             employee_count: Çalışan sayısı
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -184,7 +192,7 @@ class HRMetrics:
 
     def get_workforce_summary(self, company_id: int, year: int) -> Dict:
         """İş gücü özeti"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             # Toplam çalışan
@@ -221,7 +229,7 @@ class HRMetrics:
 
     def get_turnover_rate(self, company_id: int, year: int) -> Dict:
         """İşgücü devir hızı"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             # Toplam işe alım ve ayrılma
@@ -260,7 +268,7 @@ class HRMetrics:
 
     def get_gender_pay_gap(self, company_id: int, year: int, position_level: str = None) -> Dict:
         """Cinsiyet ücret farkı"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             if position_level:
@@ -299,7 +307,7 @@ class HRMetrics:
 
     def get_diversity_metrics(self, company_id: int, year: int) -> Dict:
         """Çeşitlilik metrikleri"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             workforce = self.get_workforce_summary(company_id, year)
@@ -343,7 +351,7 @@ class HRMetrics:
 
     def calculate_summary(self, company_id: int, year: int) -> Dict:
         """İK özet verilerini hesapla"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("SELECT SUM(count) FROM hr_demographics WHERE company_id=? AND period_year=?",
@@ -373,7 +381,7 @@ class HRMetrics:
 
     def get_demographics(self, company_id: int, year: int) -> List[Dict]:
         """Demografik verileri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -387,7 +395,7 @@ class HRMetrics:
 
     def get_turnover(self, company_id: int, year: int) -> List[Dict]:
         """İşe alım/ayrılma verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -402,7 +410,7 @@ class HRMetrics:
 
     def get_compensation(self, company_id: int, year: int) -> List[Dict]:
         """Ücret verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -417,7 +425,7 @@ class HRMetrics:
 
     def get_diversity_details(self, company_id: int, year: int) -> List[Dict]:
         """Çeşitlilik metriklerini detay kayıtlar olarak getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -431,7 +439,7 @@ class HRMetrics:
 
     def calculate_gender_pay_ratio(self, company_id: int, year: int) -> str:
         """Cinsiyet bazlı ücret oranı (GRI 405-2)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
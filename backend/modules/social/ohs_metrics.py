@@ -10,6 +10,14 @@ import logging
 import os
 import sqlite3
 from typing import Dict
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class OHSMetrics:
@@ -17,11 +25,11 @@ class OHSMetrics:
 
     def __init__(self, db_path: str = None) -> None:
         self.db_path = db_path or os.path.join(os.getcwd(), 'data', 'sdg_desktop.sqlite')
-        self._ensure_tables()
+        ensure_schema(self.db_path, self._ensure_tables)
 
     def _ensure_tables(self) -> None:
         """İSG tabloları"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -64,7 +72,7 @@ class OHSMetrics:
     def add_incident(self, company_id: int, incident_date: str, incident_type: str,
                     severity: str = 'Hafif', days_lost: int = 0, fatality: bool = False, **kwargs) -> int:
         """Kaza/olay kaydı"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -83,7 +91,7 @@ class OHSMetrics:
     def add_training(self, company_id: int, year: int, training_type: str,
                     participants: int, hours: float, **kwargs) -> int:
         """İSG eğitimi kaydı"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -98,7 +106,7 @@ class OHSMetrics:
 
     def get_summary(self, company_id: int, year: int) -> Dict:
         """Yıllık İSG özeti"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             # Kaza istatistikleri
@@ -10,6 +10,8 @@ import os
 import sqlite3
 from typing import Dict, List
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class SafetyManager:
@@ -20,11 +22,11 @@ class SafetyManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """İSG yönetimi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -162,7 +164,7 @@ class SafetyManager:
                           lost_work_days: int = None, medical_treatment: str = None,
                           investigation_status: str = None) -> bool:
         """İSG olayı ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -191,7 +193,7 @@ class SafetyManager:
                           duration_hours: float = None, training_method: str = None,
                           assessment_score: float = None, certification_validity: str = None) -> bool:
         """İSG eğitimi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -219,7 +221,7 @@ class SafetyManager:
                           additional_controls: str = None, responsible_person: str = None,
                           review_date: str = None) -> bool:
         """Risk değerlendirmesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -250,7 +252,7 @@ class SafetyManager:
                         non_conformities: int, observations: int, recommendations: int,
                         follow_up_date: str = None) -> bool:
         """İSG denetimi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -276,7 +278,7 @@ class SafetyManager:
                          baseline_value: float, target_value: float, target_unit: str,
                          target_description: str = None) -> bool:
         """İSG hedefi belirle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -300,7 +302,7 @@ class SafetyManager:
 
     def get_safety_summary(self, company_id: int, year: int) -> Dict:
         """İSG özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -401,7 +403,7 @@ class SafetyManager:
 
     def get_safety_targets(self, company_id: int) -> List[Dict]:
         """İSG hedeflerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
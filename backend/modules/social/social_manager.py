@@ -8,6 +8,14 @@ Central manager for all social performance metrics and data.
 import datetime
 import sqlite3
 from typing import Dict, List, Tuple
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 try:
     from config.database import DB_PATH
@@ -17,11 +25,11 @@ except ImportError:
 class SocialManager:
     def __init__(self, db_path: str = None):
         self.db_path = db_path if db_path else DB_PATH
-        self.init_database()
+        ensure_schema(self.db_path, self.init_database)
 
     def init_database(self):
         """Initialize social performance tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # HR Employees table
@@ -147,7 +155,7 @@ class SocialManager:
     def add_human_rights_assessment(self, company_id: int, data: Dict) -> bool:
         """Add a new human rights assessment"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO human_rights_assessments 
@@ -165,7 +173,7 @@ class SocialManager:
 
     def get_human_rights_assessments(self, company_id: int) -> List[Dict]:
         """Get all human rights assessments"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM human_rights_assessments WHERE company_id = ? ORDER BY assessment_date DESC", (company_id,))
@@ -176,7 +184,7 @@ class SocialManager:
     def add_labor_audit(self, company_id: int, data: Dict) -> bool:
         """Add a new fair labor audit"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO fair_labor_audits 
@@ -194,7 +202,7 @@ class SocialManager:
 
     def get_labor_audits(self, company_id: int) -> List[Dict]:
         """Get all labor audits"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM fair_labor_audits WHERE company_id = ? ORDER BY audit_date DESC", (company_id,))
@@ -212,7 +220,7 @@ class SocialManager:
             'labor_audit_avg_score': 0
         }
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             
             # Satisfaction (Latest year)
@@ -256,7 +264,7 @@ class SocialManager:
     def add_consumer_complaint(self, company_id: int, data: Dict) -> bool:
         """Add a new consumer complaint"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO consumer_complaints 
@@ -274,7 +282,7 @@ class SocialManager:
 
     def get_consumer_complaints(self, company_id: int) -> List[Dict]:
         """Get all consumer complaints"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM consumer_complaints WHERE company_id = ? ORDER BY complaint_date DESC", (company_id,))
@@ -285,7 +293,7 @@ class SocialManager:
     def add_community_investment(self, company_id: int, data: Dict) -> bool:
         """Add community investment"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO community_investment 
@@ -302,7 +310,7 @@ class SocialManager:
 
     def get_community_investments(self, company_id: int) -> List[Dict]:
         """Get community investments"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM community_investment WHERE company_id = ? ORDER BY date DESC", (company_id,))
@@ -316,7 +324,7 @@ class SocialManager:
 
     def get_dashboard_stats(self, company_id: int) -> Dict:
         """Dashboard için özet istatistikleri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         stats = {
             'employees': 0,
@@ -373,7 +381,7 @@ class SocialManager:
         return stats
 
     def add_employee_data(self, company_id: int, count: int, gender: str, department: str, age_group: str, year: int):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute("""
             INSERT INTO hr_employees (company_id, employee_count, gender, department, age_group, year)
@@ -383,7 +391,7 @@ class SocialManager:
         conn.close()
 
     def add_ohs_incident(self, company_id: int, incident_type: str, date: str, severity: str, description: str, lost_time_days: int):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute("""
             INSERT INTO ohs_incidents (company_id, incident_type, date, severity, description, lost_time_days)
@@ -393,7 +401,7 @@ class SocialManager:
         conn.close()
 
     def add_training(self, company_id: int, name: str, hours: float, participants: int, date: str, category: str):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute("""
             INSERT INTO training_records (company_id, training_name, hours, participants, date, category)
@@ -403,7 +411,7 @@ class SocialManager:
         conn.close()
 
     def add_employee_satisfaction(self, company_id: int, year: int, survey_date: str, score: float, turnover: float, participation: float, comments: str):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute("""
             INSERT INTO employee_satisfaction (company_id, year, survey_date, satisfaction_score, turnover_rate, participation_rate, comments)
@@ -413,7 +421,7 @@ class SocialManager:
         conn.close()
 
     def add_community_investment(self, company_id: int, project_name: str, amount: float, beneficiaries: int, description: str, date: str):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute("""
             INSERT INTO community_investment (company_id, project_name, investment_amount, beneficiaries_count, impact_description, date)
@@ -424,7 +432,7 @@ class SocialManager:
 
     def get_satisfaction_trends(self, company_id: int) -> Dict:
         """Grafikler için memnuniyet ve devir hızı trendlerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         trends = {
@@ -458,7 +466,7 @@ class SocialManager:
         return trends
     def get_recent_data(self, company_id: int, limit: int = 10) -> List[Dict]:
         """Son eklenen verileri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         data = []
         
@@ -507,7 +515,7 @@ class SocialManager:
             output = io.BytesIO()
             writer = pd.ExcelWriter(output, engine='openpyxl')
             
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             
             # HR Employees
             df_hr = pd.read_sql_query("SELECT * FROM hr_employees WHERE company_id = ?", conn, params=(company_id,))
@@ -541,7 +549,7 @@ class SocialManager:
 
     def get_employee_satisfaction_trends(self, company_id: int) -> Dict:
         """Memnuniyet ve devir hızı trendlerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         trends = {
             'years': [],
@@ -10,6 +10,10 @@ import os
 import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 try:
     from docx import Document
@@ -117,7 +121,7 @@ class SocialReporting:
         """Raporun başına şirket logosunu ekle"""
         try:
             # 1. Veritabanından logo yolunu al
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("SELECT logo_path FROM company_profiles WHERE company_id = ?", (company_id,))
             result = cursor.fetchone()
@@ -336,7 +340,7 @@ class SocialReporting:
 
         # Veritabanından finansal verileri çek
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT program_name, supplier, total_cost, currency, invoice_date 
@@ -469,7 +473,7 @@ class SocialReporting:
 
         # Veritabanından finansal verileri çek
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT program_name, supplier, total_cost, currency, invoice_date 
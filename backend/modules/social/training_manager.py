@@ -11,6 +11,8 @@ from typing import Dict
 from datetime import datetime
 
 from config.settings import ensure_directories, get_db_path
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 try:
     from utils.language_manager import LanguageManager
 except ImportError:
@@ -27,11 +29,11 @@ class TrainingManager:
             ensure_directories()
             self.db_path = get_db_path()
         self.lm = LanguageManager()
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """Eğitim yönetimi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -106,7 +108,7 @@ class TrainingManager:
 
     def check_program_exists(self, company_id: int, program_name: str, period_year: int) -> bool:
         """Check if a training program already exists"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -126,7 +128,7 @@ class TrainingManager:
                            payment_due_date: str = None, currency: str = 'TRY',
                            total_cost: float = None, period_year: int = None) -> bool:
         """Eğitim programı ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         if period_year is None:
@@ -163,7 +165,7 @@ class TrainingManager:
                          issuing_authority: str = None, issue_date: str = None,
                          expiry_date: str = None, renewal_required: str = None) -> bool:
         """Sertifika ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -187,7 +189,7 @@ class TrainingManager:
 
     def get_training_summary(self, company_id: int) -> Dict:
         """Eğitim özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -10,6 +10,14 @@ import logging
 import os
 import sqlite3
 from typing import Dict
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 try:
@@ -24,11 +32,11 @@ class TrainingMetrics:
     def __init__(self, db_path: str = None) -> None:
         self.db_path = db_path or os.path.join(os.getcwd(), 'data', 'sdg_desktop.sqlite')
         self.lm = LanguageManager()
-        self._ensure_tables()
+        ensure_schema(self.db_path, self._ensure_tables)
 
     def _ensure_tables(self) -> None:
         """Eğitim tabloları"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -78,7 +86,7 @@ class TrainingMetrics:
     def add_training(self, company_id: int, year: int, program_name: str,
                     participants: int, hours_per_person: float, **kwargs) -> int:
         """Eğitim programı kaydı"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             total_hours = participants * hours_per_person
@@ -98,7 +106,7 @@ class TrainingMetrics:
     def add_performance_review(self, company_id: int, year: int, reviewed: int,
                               total: int, **kwargs) -> int:
         """Performans değerlendirme kaydı"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -115,7 +123,7 @@ class TrainingMetrics:
 
     def get_summary(self, company_id: int, year: int) -> Dict:
         """Yıllık eğitim özeti"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             # Eğitim istatistikleri
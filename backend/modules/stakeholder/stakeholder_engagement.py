@@ -13,6 +13,96 @@ import sqlite3
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
+
+try:
+    from core.async_db_writer import get_writer
+except ImportError:
+    from backend.core.async_db_writer import get_writer
+
+# Yanıt başına SDG analitiğini kuyruğa bırak (yoğun anket dönemlerinde istek yolunu kısaltır)
+DEFER_SURVEY_ANALYTICS = os.environ.get('SUSTAINAGE_SURVEY_ANALYTICS_DEFERRED', '0') == '1'
+
+# survey_link'in son '/' sonrasındaki kısmı (survey_token_of ile aynı sonuç);
+# '/' ile biten bağlantıda boş token NULL kalır (geri doldurmadaki gibi)
+_SURVEY_TOKEN_SQL = "NULLIF(substr({link}, length(rtrim({link}, replace({link}, '/', ''))) + 1), '')"
+
+SURVEY_TOKEN_TRIGGERS = ('trg_online_surveys_token_insert', 'trg_online_surveys_token_update')
+
+SURVEY_TOKEN_DDL = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_online_surveys_survey_token ON online_surveys(survey_token)",
+    # survey_token yazmayan eski INSERT/UPDATE yolları için token'ı bağlantıdan türet
+    f"""CREATE TRIGGER IF NOT EXISTS trg_online_surveys_token_insert
+        AFTER INSERT ON online_surveys
+        WHEN NEW.survey_token IS NULL
+        BEGIN
+            UPDATE online_surveys SET survey_token = {_SURVEY_TOKEN_SQL.format(link='NEW.survey_link')}
+            WHERE id = NEW.id;
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_online_surveys_token_update
+        AFTER UPDATE OF survey_link ON online_surveys
+        BEGIN
+            UPDATE online_surveys SET survey_token = {_SURVEY_TOKEN_SQL.format(link='NEW.survey_link')}
+            WHERE id = NEW.id;
+        END""",
+)
+
+SURVEY_ANALYTICS_DDL = """
+    CREATE TABLE IF NOT EXISTS sdg_survey_analytics (
+        survey_id INTEGER,
+        sdg_id TEXT,
+        total_score INTEGER DEFAULT 0,
+        response_count INTEGER DEFAULT 0,
+        average_score REAL DEFAULT 0,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (survey_id, sdg_id)
+    )
+"""
+
+SURVEY_ANALYTICS_UPSERT = """
+    INSERT INTO sdg_survey_analytics (survey_id, sdg_id, total_score, response_count, average_score)
+    VALUES (?, ?, ?, 1, ?)
+    ON CONFLICT(survey_id, sdg_id) DO UPDATE SET
+    total_score = total_score + excluded.total_score,
+    response_count = response_count + 1,
+    average_score = CAST((total_score + excluded.total_score) AS REAL) / (response_count + 1),
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+
+def survey_token_of(survey_link: str) -> str:
+    """Tam URL, '/survey/<token>' veya çıplak token -> token"""
+    return (survey_link or '').rsplit('/', 1)[-1]
+
+
+def install_survey_token(conn) -> None:
+    """
+    online_surveys.survey_token sütununu ekle, boş olanları doldur ve tekil
+    indeksi kur. Aynı token'a düşen eski kayıtlardan yalnızca en yenisi
+    token alır (herkese açık sayfa da en yeni anketi gösteriyordu).
+    """
+    cursor = conn.cursor()
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(online_surveys)")}
+    if not columns:
+        return
+    if 'survey_token' not in columns:
+        cursor.execute("ALTER TABLE online_surveys ADD COLUMN survey_token TEXT")
+
+    taken = {row[0] for row in cursor.execute(
+        "SELECT survey_token FROM online_surveys WHERE survey_token IS NOT NULL")}
+    updates = []
+    for survey_id, link in cursor.execute(
+            "SELECT id, survey_link FROM online_surveys WHERE survey_token IS NULL ORDER BY id DESC").fetchall():
+        token = survey_token_of(link)
+        if token and token not in taken:
+            taken.add(token)
+            updates.append((token, survey_id))
+    if updates:
+        cursor.executemany("UPDATE online_surveys SET survey_token = ? WHERE id = ?", updates)
+
+    for statement in SURVEY_TOKEN_DDL:
+        cursor.execute(statement)
 
 
 class StakeholderEngagement:
@@ -276,16 +366,17 @@ class StakeholderEngagement:
         "medya": ["SDG8", "SDG11", "SDG12", "SDG13", "SDG16", "SDG17"]
     }
 
-    def __init__(self, db_path: str = DB_PATH) -> None:
+    def __init__(self, db_path: str = DB_PATH, defer_analytics: Optional[bool] = None) -> None:
         if not os.path.isabs(db_path):
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_stakeholder_tables()
+        self.defer_analytics = DEFER_SURVEY_ANALYTICS if defer_analytics is None else defer_analytics
+        ensure_schema(self.db_path, self._init_stakeholder_tables)
 
     def _init_stakeholder_tables(self) -> None:
         """Paydaş tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -334,6 +425,7 @@ class StakeholderEngagement:
                     survey_type TEXT DEFAULT 'sdg',
                     target_groups TEXT NOT NULL,
                     survey_link TEXT UNIQUE NOT NULL,
+                    survey_token TEXT,
                     start_date DATE,
                     end_date DATE,
                     total_questions INTEGER DEFAULT 0,
@@ -350,6 +442,10 @@ class StakeholderEngagement:
             except sqlite3.OperationalError:
                 pass
 
+            install_survey_token(conn)
+
+            # Anket bazlı SDG özet tablosu (yanıt kaydıyla aynı transaction'da güncellenir)
+            cursor.execute(SURVEY_ANALYTICS_DDL)
 
             # Anket yanıtları (external)
             cursor.execute("""
@@ -495,7 +591,7 @@ class StakeholderEngagement:
         Returns:
             Portal erişim token'ı
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -525,7 +621,7 @@ class StakeholderEngagement:
 
     def verify_portal_access(self, access_token: str) -> Optional[Dict]:
         """Portal token'ı doğrula"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -569,7 +665,7 @@ class StakeholderEngagement:
         Returns:
             Anket web linki
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -581,12 +677,13 @@ class StakeholderEngagement:
             cursor.execute("""
                 INSERT INTO online_surveys
                 (company_id, survey_title, survey_description, target_groups,
-                 survey_link, start_date, end_date, total_questions, survey_type)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 survey_link, survey_token, start_date, end_date, total_questions, survey_type)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 company_id, title, description,
                 json.dumps(target_groups),
                 survey_link,
+                survey_token,
                 datetime.now().date(),
                 (datetime.now() + timedelta(days=duration_days)).date(),
                 len(questions),
@@ -662,23 +759,45 @@ class StakeholderEngagement:
             return self.get_general_sdg_survey_questions()
         return selected
 
+    def find_survey_by_token(self, survey_link: str) -> Optional[Dict]:
+        """Aktif anketi token'ı (veya token ile biten bağlantısı) ile bul"""
+        conn = db_connect(self.db_path)
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                SELECT * FROM online_surveys
+                WHERE survey_token = ? AND is_active = 1
+            """, (survey_token_of(survey_link),))
+            row = cursor.fetchone()
+            if row:
+                columns = [col[0] for col in cursor.description]
+                return dict(zip(columns, row))
+            return None
+
+        except Exception as e:
+            logging.error(f"Anket arama hatasi: {e}")
+            return None
+        finally:
+            conn.close()
+
     def submit_survey_response(self, survey_link: str, responses: Dict,
                               stakeholder_id: int = None) -> bool:
-        """Anket yanıtını kaydet (external)"""
-        conn = sqlite3.connect(self.db_path)
+        """
+        Anket yanıtını kaydet (external).
+
+        Anket tekil survey_token indeksiyle bulunur; yanıt, sayaç ve SDG
+        analitiği tek transaction'da yazılır. defer_analytics açıksa analitik
+        satırları toplu yazıcı kuyruğuna bırakılır.
+        """
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
-            if "://" in survey_link:
-                cursor.execute("""
-                    SELECT id FROM online_surveys
-                    WHERE survey_link = ? AND is_active = 1
-                """, (survey_link,))
-            else:
-                cursor.execute("""
-                    SELECT id FROM online_surveys
-                    WHERE survey_link LIKE ? AND is_active = 1
-                """, (f"%/{survey_link}",))
+            cursor.execute("""
+                SELECT id FROM online_surveys
+                WHERE survey_token = ? AND is_active = 1
+            """, (survey_token_of(survey_link),))
 
             result = cursor.fetchone()
             if not result:
@@ -701,65 +820,57 @@ class StakeholderEngagement:
                 WHERE id = ?
             """, (survey_id,))
 
+            analytics_rows = self._survey_analytics_rows(survey_id, responses)
+            if analytics_rows and not self.defer_analytics:
+                cursor.executemany(SURVEY_ANALYTICS_UPSERT, analytics_rows)
+
             conn.commit()
             logging.info(f"[OK] Anket yaniti kaydedildi: {survey_id}")
-            
-            # Otomatik analiz tetikle
-            self._update_survey_analytics(survey_id, responses)
-            
-            return True
 
         except Exception as e:
+            conn.rollback()
             logging.error(f"Anket yanit kaydetme hatasi: {e}")
             return False
         finally:
             conn.close()
-            
+
+        if analytics_rows and self.defer_analytics:
+            writer = get_writer(self.db_path)
+            for params in analytics_rows:
+                if not writer.submit(SURVEY_ANALYTICS_UPSERT, params):
+                    # Kuyruk dolu: skor kaybolmasın
+                    writer.write_now(SURVEY_ANALYTICS_UPSERT, params)
+        return True
+
+    @staticmethod
+    def _survey_analytics_rows(survey_id: int, responses: Dict) -> List[tuple]:
+        """Yanıttaki sayısal SDG cevapları -> sdg_survey_analytics upsert parametreleri"""
+        rows = []
+        answers = responses.get('answers', {})
+        for q_id, value in answers.items():
+            # Sadece SDG sorularını ve sayısal değerleri al (SDG1, SDG2... formatı)
+            if q_id.startswith('SDG') and str(value).isdigit():
+                score = int(value)
+                rows.append((survey_id, q_id, score, float(score)))
+        return rows
+
     def _update_survey_analytics(self, survey_id: int, new_response: Dict) -> None:
         """
-        Her yeni yanıtta anket istatistiklerini güncelle.
-        Bu fonksiyon, raporlamalarda kullanılacak olan 'sdg_survey_analytics' 
-        tablosunu besler.
+        Bir yanıtın skorlarını 'sdg_survey_analytics' özet tablosuna işle
+        (yanıt kaydından bağımsız yeniden hesaplama için).
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        rows = self._survey_analytics_rows(survey_id, new_response)
+        if not rows:
+            return
+        conn = db_connect(self.db_path)
+
         try:
-            # Tablo yoksa oluştur (Basit cache/summary tablosu)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS sdg_survey_analytics (
-                    survey_id INTEGER,
-                    sdg_id TEXT,
-                    total_score INTEGER DEFAULT 0,
-                    response_count INTEGER DEFAULT 0,
-                    average_score REAL DEFAULT 0,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    PRIMARY KEY (survey_id, sdg_id)
-                )
-            """)
-            
-            # Yanıtlardaki skorları işle
-            answers = new_response.get('answers', {})
-            for q_id, value in answers.items():
-                # Sadece SDG sorularını ve sayısal değerleri al (SDG1, SDG2... formatı)
-                if q_id.startswith('SDG') and str(value).isdigit():
-                    score = int(value)
-                    
-                    # Mevcut kaydı kontrol et
-                    cursor.execute("""
-                        INSERT INTO sdg_survey_analytics (survey_id, sdg_id, total_score, response_count, average_score)
-                        VALUES (?, ?, ?, 1, ?)
-                        ON CONFLICT(survey_id, sdg_id) DO UPDATE SET
-                        total_score = total_score + excluded.total_score,
-                        response_count = response_count + 1,
-                        average_score = CAST((total_score + excluded.total_score) AS REAL) / (response_count + 1),
-                        updated_at = CURRENT_TIMESTAMP
-                    """, (survey_id, q_id, score, float(score)))
-            
+            conn.executemany(SURVEY_ANALYTICS_UPSERT, rows)
             conn.commit()
             logging.info(f"[OK] Anket analizi guncellendi: Survey {survey_id}")
-            
+
         except Exception as e:
+            conn.rollback()
             logging.error(f"Analiz guncelleme hatasi: {e}")
         finally:
             conn.close()
@@ -769,7 +880,7 @@ class StakeholderEngagement:
         Şirketin SDG performans skorlarını getir.
         Raporlama modülü bu fonksiyonu kullanacak.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         scores = {}
         
@@ -807,7 +918,7 @@ class StakeholderEngagement:
             category: cevre, sosyal, yonetisim, urun
             rating: 1-5 yıldız
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -834,7 +945,7 @@ class StakeholderEngagement:
     def respond_to_feedback(self, feedback_id: int, responded_by: int,
                            response_text: str) -> bool:
         """Feedback'e yanıt ver"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -871,7 +982,7 @@ class StakeholderEngagement:
             meeting_type: genel_kurul, paydas_toplantisi, odak_grubu, webinar
             participants: Katılımcı email listesi
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -898,7 +1009,7 @@ class StakeholderEngagement:
     def add_meeting_minutes(self, meeting_id: int, minutes: str,
                            action_items: List[Dict]) -> bool:
         """Toplantı tutanağı ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -936,7 +1047,7 @@ class StakeholderEngagement:
             responsible: Sorumlu kişi/birim
             target_group: Hedef paydaş grubu
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -963,7 +1074,7 @@ class StakeholderEngagement:
     def update_commitment_progress(self, commitment_id: int,
                                   progress: int, notes: str = "") -> bool:
         """Taahhüt ilerlemesini güncelle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -989,7 +1100,7 @@ class StakeholderEngagement:
 
     def get_commitment_summary(self, company_id: int) -> Dict:
         """Taahhüt özeti"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -1051,7 +1162,7 @@ class StakeholderEngagement:
     def get_stakeholder_engagement_score(self, company_id: int) -> Dict:
         """Paydaş etkileşim skoru hesapla"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             score_data = {
@@ -1107,7 +1218,7 @@ class StakeholderEngagement:
                              content_type: str = "video",
                              target_groups: List[str] = []) -> int:
         """Eğitim materyali ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -1127,7 +1238,7 @@ class StakeholderEngagement:
 
     def assign_training(self, material_id: int, stakeholder_id: int) -> bool:
         """Paydaşa eğitim ata"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -1146,7 +1257,7 @@ class StakeholderEngagement:
     def update_training_status(self, stakeholder_id: int, material_id: int,
                               status: str, progress: int = 0) -> bool:
         """Eğitim durumunu güncelle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             completed_at = datetime.now() if status == 'completed' or progress >= 100 else None
@@ -1165,7 +1276,7 @@ class StakeholderEngagement:
 
     def get_training_materials(self, company_id: int) -> List[Dict]:
         """Eğitim materyallerini listele"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("SELECT * FROM training_materials WHERE company_id = ? AND is_active = 1", (company_id,))
@@ -1180,7 +1291,7 @@ class StakeholderEngagement:
 
     def get_stakeholder_trainings(self, stakeholder_id: int) -> List[Dict]:
         """Paydaşın eğitimlerini listele"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
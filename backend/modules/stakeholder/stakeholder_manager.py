@@ -11,6 +11,8 @@ import sqlite3
 from datetime import datetime
 from typing import Dict, List
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class StakeholderManager:
@@ -21,11 +23,11 @@ class StakeholderManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """Paydaş yönetimi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -185,7 +187,7 @@ class StakeholderManager:
 
     def get_dashboard_stats(self, company_id: int) -> Dict:
         """Dashboard için özet istatistikleri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         stats = {
             'total_stakeholders': 0,
@@ -219,7 +221,7 @@ class StakeholderManager:
                       sector: str = None, influence_level: str = None,
                       interest_level: str = None, engagement_frequency: str = None) -> bool:
         """Paydaş ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -249,7 +251,7 @@ class StakeholderManager:
                                  outcomes: str = None, follow_up_actions: str = None,
                                  satisfaction_score: float = None) -> bool:
         """Paydaş etkileşimi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -276,7 +278,7 @@ class StakeholderManager:
                              response_count: int = None, total_invitations: int = None,
                              overall_satisfaction: float = None, key_findings: str = None) -> bool:
         """Paydaş anketi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -307,7 +309,7 @@ class StakeholderManager:
                                 frequency: str = None, owner: str = None,
                                 next_action: str = None, notes: str = None,
                                 stakeholder_id: int = None) -> bool:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -325,7 +327,7 @@ class StakeholderManager:
             conn.close()
 
     def get_communication_plans(self, company_id: int) -> List[Dict]:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -345,7 +347,7 @@ class StakeholderManager:
     # Anket Şablonları CRUD
     def add_survey_template(self, company_id: int, template_name: str,
                             stakeholder_category: str, questions_json: str) -> bool:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -363,7 +365,7 @@ class StakeholderManager:
             conn.close()
 
     def get_survey_templates(self, company_id: int) -> List[Dict]:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -384,7 +386,7 @@ class StakeholderManager:
     def add_action_plan(self, company_id: int, title: str, description: str = None,
                         owner: str = None, due_date: str = None, status: str = 'open',
                         stakeholder_id: int = None, engagement_id: int = None) -> bool:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             now = datetime.now().isoformat()
@@ -403,7 +405,7 @@ class StakeholderManager:
             conn.close()
 
     def update_action_plan_status(self, plan_id: int, status: str) -> bool:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -419,7 +421,7 @@ class StakeholderManager:
             conn.close()
 
     def get_action_plans(self, company_id: int) -> List[Dict]:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -436,7 +438,7 @@ class StakeholderManager:
 
     def get_engagements(self, company_id: int, limit: int = 100) -> List[Dict]:
         """Toplantı/Etkileşim kayıtlarını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute(
@@ -462,7 +464,7 @@ class StakeholderManager:
     def add_complaint(self, company_id: int, description: str, complaint_date: str,
                       stakeholder_id: int = None, channel: str = None, severity: str = None,
                       status: str = 'open') -> bool:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -480,7 +482,7 @@ class StakeholderManager:
             conn.close()
 
     def update_complaint(self, complaint_id: int, status: str, resolution: str = None, resolved_at: str = None) -> bool:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -496,7 +498,7 @@ class StakeholderManager:
             conn.close()
 
     def get_complaints(self, company_id: int) -> List[Dict]:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -513,7 +515,7 @@ class StakeholderManager:
 
     def get_stakeholder_summary(self, company_id: int) -> Dict:
         """Paydaş özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -626,7 +628,7 @@ class StakeholderManager:
 
     def generate_stakeholder_matrix(self, company_id: int) -> Dict:
         """Paydaş Etkisi/Önem Matrisi oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -10,6 +10,8 @@ import os
 import sqlite3
 from typing import Dict, List
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class GRISectoralStandardsManager:
@@ -20,12 +22,12 @@ class GRISectoralStandardsManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_sectoral_tables()
+        ensure_schema(self.db_path, self._init_sectoral_tables)
         self._populate_sectoral_standards()
 
     def _init_sectoral_tables(self) -> None:
         """GRI sektörel standartları tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -208,7 +210,7 @@ class GRISectoralStandardsManager:
 
     def _populate_sectoral_standards(self) -> None:
         """GRI sektörel standartları verilerini doldur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -426,7 +428,7 @@ class GRISectoralStandardsManager:
 
     def get_sectoral_standards(self) -> List[Dict]:
         """Tüm sektörel standartları getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -449,7 +451,7 @@ class GRISectoralStandardsManager:
 
     def get_standard_topics(self, standard_code: str, company_id: int = 0) -> List[Dict]:
         """Belirli bir standart için konuları getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -487,7 +489,7 @@ class GRISectoralStandardsManager:
     def update_topic_compliance(self, standard_code: str, topic_id: int,
                                compliance_status: str, notes: str = "") -> bool:
         """Konu uyumluluk durumunu güncelle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
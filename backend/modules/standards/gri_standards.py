@@ -10,6 +10,8 @@ import os
 import sqlite3
 from typing import Dict
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class GRIStandardsManager:
@@ -20,12 +22,12 @@ class GRIStandardsManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
         self._upgrade_schema()
 
     def _init_db_tables(self) -> None:
         """GRI standartları tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -116,7 +118,7 @@ class GRIStandardsManager:
             conn.close()
 
     def _upgrade_schema(self) -> None:
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute("PRAGMA table_info(gri_1_foundation)")
@@ -162,7 +164,7 @@ class GRIStandardsManager:
                            assurance_standard: str = None, assurance_scope: str = None,
                            assurance_date: str = None) -> bool:
         """GRI 1 temel gereksinimler ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -194,7 +196,7 @@ class GRIStandardsManager:
                            page_number: int = None, omission_reason: str = None,
                            data_quality: str = None, external_verification: str = None) -> bool:
         """GRI 2 genel açıklama ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -223,7 +225,7 @@ class GRIStandardsManager:
                               page_number: int = None, omission_reason: str = None,
                               reporting_status: str = "Reported") -> bool:
         """GRI 3 içerik indeksi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -251,7 +253,7 @@ class GRIStandardsManager:
                                  business_impact_score: float, materiality_level: str,
                                  reporting_boundary: str = None, management_approach: str = None) -> bool:
         """Materialite değerlendirmesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -277,7 +279,7 @@ class GRIStandardsManager:
 
     def get_gri_reporting_status(self, company_id: int, reporting_period: str) -> Dict:
         """GRI raporlama durumu getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -10,6 +10,8 @@ import os
 import sqlite3
 from typing import Dict
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class TSRSESRSManager:
@@ -20,11 +22,11 @@ class TSRSESRSManager:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_db_tables()
+        ensure_schema(self.db_path, self._init_db_tables)
 
     def _init_db_tables(self) -> None:
         """TSRS/ESRS tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -118,7 +120,7 @@ class TSRSESRSManager:
                                         stakeholder_impact: str = None,
                                         business_impact: str = None) -> bool:
         """Çift önemlendirme değerlendirmesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -148,7 +150,7 @@ class TSRSESRSManager:
                            reporting_content: str = None, data_sources: str = None,
                            assurance_status: str = None) -> bool:
         """ESRS gereklilik ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -176,7 +178,7 @@ class TSRSESRSManager:
                                  capex_share: float = None, opex_share: float = None,
                                  nfrd_requirement: str = None) -> bool:
         """AB Taksonomisi uyumluluk ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -204,7 +206,7 @@ class TSRSESRSManager:
                                 target_value: float = None, target_unit: str = None,
                                 achievement_status: str = None, progress_percentage: float = None) -> bool:
         """Sürdürülebilirlik hedefi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -228,7 +230,7 @@ class TSRSESRSManager:
 
     def get_tsrs_esrs_summary(self, company_id: int, reporting_period: str) -> Dict:
         """TSRS/ESRS özeti getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -11,6 +11,14 @@ import os
 import sqlite3
 from datetime import datetime
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class CEOMessageManager:
@@ -18,11 +26,11 @@ class CEOMessageManager:
 
     def __init__(self, db_path: str = None) -> None:
         self.db_path = db_path or os.path.join(os.getcwd(), 'data', 'sdg_desktop.sqlite')
-        self._ensure_tables()
+        ensure_schema(self.db_path, self._ensure_tables)
 
     def _ensure_tables(self) -> None:
         """Gerekli tabloları oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -106,7 +114,7 @@ class CEOMessageManager:
         Returns:
             Oluşturulan mesaj ID'si
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -157,7 +165,7 @@ class CEOMessageManager:
 
     def get_messages(self, company_id: int, message_type: str = None, year: int = None) -> List[Dict]:
         """CEO mesajlarını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -200,7 +208,7 @@ class CEOMessageManager:
 
     def update_message(self, message_id: int, **kwargs) -> bool:
         """CEO mesajını güncelle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -294,7 +302,7 @@ class CEOMessageManager:
             }
         ]
 
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -329,7 +337,7 @@ class CEOMessageManager:
 
     def get_templates(self, message_type: str = None) -> List[Dict]:
         """Mesaj şablonlarını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -366,7 +374,7 @@ class CEOMessageManager:
 
     def generate_message_from_template(self, template_id: int, variables: Dict[str, str]) -> str:
         """Şablondan mesaj oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -11,6 +11,14 @@ import os
 import sqlite3
 from datetime import datetime, timedelta
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class RiskOpportunityManager:
@@ -18,11 +26,11 @@ class RiskOpportunityManager:
 
     def __init__(self, db_path: str = None) -> None:
         self.db_path = db_path or os.path.join(os.getcwd(), 'data', 'sdg_desktop.sqlite')
-        self._ensure_tables()
+        ensure_schema(self.db_path, self._ensure_tables)
 
     def _ensure_tables(self) -> None:
         """Gerekli tabloları oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -145,7 +153,7 @@ class RiskOpportunityManager:
 
     def get_dashboard_stats(self, company_id: int) -> Dict:
         """Dashboard için özet istatistikleri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         stats = {
             'total_risks': 0,
@@ -225,7 +233,7 @@ class RiskOpportunityManager:
         Returns:
             Oluşturulan risk ID'si
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -300,7 +308,7 @@ class RiskOpportunityManager:
         Returns:
             Oluşturulan fırsat ID'si
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -342,7 +350,7 @@ class RiskOpportunityManager:
 
     def get_risks(self, company_id: int, risk_category: str = None, status: str = None) -> List[Dict]:
         """Riskleri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -390,7 +398,7 @@ class RiskOpportunityManager:
 
     def get_opportunities(self, company_id: int, opportunity_category: str = None, status: str = None) -> List[Dict]:
         """Fırsatları getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -11,6 +11,14 @@ import os
 import sqlite3
 from datetime import datetime, timedelta
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class SMARTGoalsManager:
@@ -18,11 +26,11 @@ class SMARTGoalsManager:
 
     def __init__(self, db_path: str = None) -> None:
         self.db_path = db_path or os.path.join(os.getcwd(), 'data', 'sdg_desktop.sqlite')
-        self._ensure_tables()
+        ensure_schema(self.db_path, self._ensure_tables)
 
     def _ensure_tables(self) -> None:
         """Gerekli tabloları oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -204,7 +212,7 @@ class SMARTGoalsManager:
         Returns:
             Oluşturulan hedef ID'si
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -274,7 +282,7 @@ class SMARTGoalsManager:
         Returns:
             Oluşturulan takip kaydı ID'si
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -364,7 +372,7 @@ class SMARTGoalsManager:
         Returns:
             Oluşturulan değerlendirme ID'si
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -405,7 +413,7 @@ class SMARTGoalsManager:
 
     def get_smart_goals(self, company_id: int, goal_category: str = None, status: str = None) -> List[Dict]:
         """SMART hedefleri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -10,6 +10,14 @@ import json
 import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class StrategicManager:
@@ -17,11 +25,11 @@ class StrategicManager:
 
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
-        self._init_database()
+        ensure_schema(self.db_path, self._init_database)
 
     def _init_database(self) -> None:
         """Veritabanı tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Yönetici Mesajları
@@ -53,7 +61,7 @@ class StrategicManager:
                 strategy_title TEXT NOT NULL,
                 vision TEXT,
                 mission TEXT,
-                values TEXT,
+                "values" TEXT,
                 strategic_pillars TEXT,
                 commitments TEXT,
                 sdg_alignment TEXT,
@@ -188,7 +196,7 @@ class StrategicManager:
                                  created_by: Optional[int] = None) -> Optional[int]:
         """Yönetici mesajı oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -215,7 +223,7 @@ class StrategicManager:
     def get_executive_message(self, company_id: int, year: int) -> Optional[Dict]:
         """Yönetici mesajını al"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -253,12 +261,12 @@ class StrategicManager:
                                       created_by: Optional[int] = None) -> Optional[int]:
         """Sürdürülebilirlik stratejisi oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
                 INSERT INTO sustainability_strategy 
-                (company_id, year, strategy_title, vision, mission, values,
+                (company_id, year, strategy_title, vision, mission, "values",
                  strategic_pillars, commitments, sdg_alignment, created_by, created_at, updated_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
@@ -286,7 +294,7 @@ class StrategicManager:
                             unit: str = "", responsible_person: str = "") -> Optional[int]:
         """Stratejik hedef oluştur (SMART)"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -313,7 +321,7 @@ class StrategicManager:
     def update_goal_progress(self, goal_id: int, current_value: float) -> bool:
         """Hedef ilerlemesini güncelle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Hedef bilgilerini al
@@ -356,7 +364,7 @@ class StrategicManager:
     def get_strategic_goals(self, company_id: int, category: Optional[str] = None) -> List[Dict]:
         """Stratejik hedefleri listele"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             if category:
@@ -401,7 +409,7 @@ class StrategicManager:
                                created_by: Optional[int] = None) -> Optional[int]:
         """Risk veya fırsat oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -435,7 +443,7 @@ class StrategicManager:
             # Risk skoru = Etki x Olasılık
             risk_score = impact_score * probability_score
 
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -461,7 +469,7 @@ class StrategicManager:
                                category: Optional[str] = None) -> List[Dict]:
         """Risk ve fırsatları listele"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             query = "SELECT * FROM risks_opportunities WHERE company_id = ?"
@@ -504,7 +512,7 @@ class StrategicManager:
 
             for risk in risks:
                 # Son değerlendirmeyi al
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -551,7 +559,7 @@ class StrategicManager:
                           responsible_person: str = "") -> Optional[int]:
         """Eylem planı oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -586,7 +594,7 @@ class StrategicManager:
                   responsible_person: str = "") -> Optional[int]:
         """KPI oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
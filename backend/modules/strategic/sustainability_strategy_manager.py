@@ -11,6 +11,14 @@ import os
 import sqlite3
 from datetime import datetime
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class SustainabilityStrategyManager:
@@ -18,11 +26,11 @@ class SustainabilityStrategyManager:
 
     def __init__(self, db_path: str = None) -> None:
         self.db_path = db_path or os.path.join(os.getcwd(), 'data', 'sdg_desktop.sqlite')
-        self._ensure_tables()
+        ensure_schema(self.db_path, self._ensure_tables)
 
     def _ensure_tables(self) -> None:
         """Gerekli tabloları oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -163,7 +171,7 @@ class SustainabilityStrategyManager:
         Returns:
             Oluşturulan strateji ID'si
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -233,7 +241,7 @@ class SustainabilityStrategyManager:
         Returns:
             Oluşturulan hedef ID'si
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -283,7 +291,7 @@ class SustainabilityStrategyManager:
         Returns:
             Oluşturulan ilerleme kaydı ID'si
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -332,7 +340,7 @@ class SustainabilityStrategyManager:
 
     def get_strategies(self, company_id: int, status: str = None) -> List[Dict]:
         """Sürdürülebilirlik stratejilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -372,7 +380,7 @@ class SustainabilityStrategyManager:
 
     def get_strategy_goals(self, strategy_id: int) -> List[Dict]:
         """Stratejik hedefleri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -405,7 +413,7 @@ class SustainabilityStrategyManager:
 
     def get_goal_progress(self, goal_id: int = None, strategy_id: int = None) -> List[Dict]:
         """Hedef ilerlemelerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -4,7 +4,10 @@
 SUSTAINAGE SDG - Süper Admin Modülü
 """
 
-from .super_admin_gui import SuperAdminGUI
+try:
+    from .super_admin_gui import SuperAdminGUI
+except ImportError:
+    SuperAdminGUI = None
 
 __all__ = ['SuperAdminGUI']
 
@@ -10,6 +10,7 @@ import sqlite3
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class IPManager:
@@ -29,7 +30,7 @@ class IPManager:
             # Validate IP address
             ipaddress.ip_address(ip_address)
 
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -65,7 +66,7 @@ class IPManager:
             if duration_minutes:
                 expires_at = (datetime.now() + timedelta(minutes=duration_minutes)).isoformat()
 
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -87,7 +88,7 @@ class IPManager:
     def remove_from_whitelist(self, ip_address: str) -> bool:
         """Remove IP from whitelist"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("DELETE FROM ip_whitelist WHERE ip_address = ?", (ip_address,))
             conn.commit()
@@ -99,7 +100,7 @@ class IPManager:
     def remove_from_blacklist(self, ip_address: str) -> bool:
         """Remove IP from blacklist"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("DELETE FROM ip_blacklist WHERE ip_address = ?", (ip_address,))
             conn.commit()
@@ -111,7 +112,7 @@ class IPManager:
     def is_whitelisted(self, ip_address: str) -> bool:
         """Check if IP is whitelisted"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT COUNT(*) FROM ip_whitelist 
@@ -126,7 +127,7 @@ class IPManager:
     def is_blacklisted(self, ip_address: str) -> bool:
         """Check if IP is blacklisted and not expired"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT COUNT(*) FROM ip_blacklist 
@@ -162,7 +163,7 @@ class IPManager:
     def get_whitelist(self) -> List[Dict[str, Any]]:
         """Get all whitelisted IPs"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT id, ip_address, description, added_by, created_at, is_active
@@ -187,7 +188,7 @@ class IPManager:
     def get_blacklist(self) -> List[Dict[str, Any]]:
         """Get all blacklisted IPs"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT id, ip_address, reason, blocked_by, block_type, created_at, expires_at, is_active
@@ -221,7 +222,7 @@ class IPManager:
     def _has_whitelist_entries(self) -> bool:
         """Check if there are any whitelist entries"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM ip_whitelist WHERE is_active = 1")
             count = cursor.fetchone()[0]
@@ -233,7 +234,7 @@ class IPManager:
     def get_ip_statistics(self) -> Dict[str, int]:
         """Get IP management statistics"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("SELECT COUNT(*) FROM ip_whitelist WHERE is_active = 1")
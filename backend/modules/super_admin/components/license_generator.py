@@ -16,6 +16,7 @@ from typing import Any, Dict, List, Optional
 
 import jwt
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 # Secret key for JWT signing (in production, use environment variable)
 JWT_SECRET = "SUSTAINAGE_SDG_LICENSE_SECRET_KEY_2025"
@@ -28,7 +29,7 @@ class LicenseGenerator:
         self.db_path = db_path
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        conn = db_connect(self.db_path, timeout=5.0)
         try:
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("PRAGMA busy_timeout=5000")
@@ -7,6 +7,7 @@ Real-time system monitoring and email notifications
 """
 
 import logging
+import os
 import sqlite3
 from datetime import datetime
 from typing import Any, Dict, List
@@ -15,6 +16,7 @@ import psutil
 
 from config.database import DB_PATH
 from services.email_service import EmailService
+from utils.db_pool import connect as db_connect, get_pool_stats
 
 
 class MonitoringDashboard:
@@ -27,7 +29,7 @@ class MonitoringDashboard:
     def get_live_stats(self) -> Dict[str, Any]:
         """Get real-time system statistics"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Active users (sessions in last 15 minutes)
@@ -112,10 +114,27 @@ class MonitoringDashboard:
                 'timestamp': datetime.now().isoformat()
             }
 
+    def get_performance_counters(self) -> Dict[str, Dict[str, Any]]:
+        """Get in-process performance counters of this worker (pools, caches)"""
+        counters: Dict[str, Dict[str, Any]] = {}
+        for stats in get_pool_stats():
+            name = f"DB Pool ({os.path.basename(stats['db_path'])})"
+            counters[name] = {
+                'open_connections': stats['open_connections'],
+                'in_use_connections': stats['in_use_connections'],
+                'peak_connections': stats['peak_connections'],
+                'checkouts': stats['checkouts'],
+                'waits': stats['waits'],
+                'wait_time_avg_ms': round(stats['wait_time_avg_ms'], 2),
+                'wait_time_max_ms': round(stats['wait_time_max_ms'], 2),
+                'overflow_connections': stats['overflow_connections'],
+            }
+        return counters
+
     def get_recent_events(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent system events"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -143,7 +162,7 @@ class MonitoringDashboard:
     def get_chart_data(self, chart_type: str, hours: int = 24) -> List[Dict[str, Any]]:
         """Get data for charts"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             if chart_type == 'login_activity':
@@ -216,7 +235,7 @@ class MonitoringDashboard:
                     last_error = result.get('error', 'Unknown error')
             
             # Log to database
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             
             if success_count > 0:
@@ -253,7 +272,7 @@ class MonitoringDashboard:
         except Exception as e:
             # Log error
             try:
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cursor = conn.cursor()
                 cursor.execute("""
                     INSERT INTO email_notifications 
@@ -272,7 +291,7 @@ class MonitoringDashboard:
         alerts = []
 
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Check for expiring licenses (30 days)
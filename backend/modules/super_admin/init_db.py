@@ -8,6 +8,10 @@ Creates necessary tables for IP Manager, Rate Limiter, and other components.
 import sqlite3
 import os
 import sys
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 # Add project root and backend to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
@@ -26,7 +30,7 @@ def init_super_admin_db():
     print(f"Initializing Super Admin Database at {DB_PATH}...")
     
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = db_connect(DB_PATH)
         cursor = conn.cursor()
         
         # 1. IP Whitelist Table
@@ -9,6 +9,7 @@ IP Control, Rate Limiting, Monitoring Dashboard
 import tkinter as tk
 from tkinter import messagebox, scrolledtext, ttk
 from config.icons import Icons
+from utils.db_pool import connect as db_connect
 
 # Import edilecek (super_admin_gui.py içinde)
 # from .components.ip_manager import IPManager
@@ -433,7 +434,7 @@ class SecurityTabsComplete:
         def load_rule_values():
             try:
                 import sqlite3
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cur = conn.cursor()
                 cur.execute("""
                     CREATE TABLE IF NOT EXISTS system_settings (
@@ -457,7 +458,7 @@ class SecurityTabsComplete:
         def save_rules():
             try:
                 import sqlite3
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cur = conn.cursor()
                 cur.execute("""
                     CREATE TABLE IF NOT EXISTS system_settings (
@@ -702,7 +703,7 @@ class SecurityTabsComplete:
         def ensure_columns():
             try:
                 import sqlite3
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cur = conn.cursor()
                 cur.execute("PRAGMA table_info(users)")
                 cols = [c[1] for c in cur.fetchall()]
@@ -721,7 +722,7 @@ class SecurityTabsComplete:
             ensure_columns()
             try:
                 import sqlite3
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cur = conn.cursor()
                 cur.execute("SELECT username, COALESCE(totp_enabled,0) FROM users WHERE deleted_at IS NULL")
                 rows = cur.fetchall()
@@ -741,7 +742,7 @@ class SecurityTabsComplete:
                 return
             try:
                 import sqlite3
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cur = conn.cursor()
                 cur.execute("SELECT COALESCE(totp_enabled,0) FROM users WHERE username=?", (uname,))
                 row = cur.fetchone()
@@ -790,7 +791,7 @@ class SecurityTabsComplete:
                                                         get_otpauth_uri)
                 ensure_columns()
                 secret = generate_totp_secret()
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 res = enable_2fa(conn, uname, secret)
                 conn.close()
                 backup_text.delete('1.0', tk.END)
@@ -812,7 +813,7 @@ class SecurityTabsComplete:
                 import sqlite3
 
                 from yonetim.security.core.auth import disable_2fa
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 res = disable_2fa(conn, uname)
                 conn.close()
                 backup_text.delete('1.0', tk.END)
@@ -834,7 +835,7 @@ class SecurityTabsComplete:
             try:
                 import json
                 import sqlite3
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cur = conn.cursor()
                 cur.execute("SELECT backup_codes FROM users WHERE username=?", (uname,))
                 row = cur.fetchone()
@@ -859,7 +860,7 @@ class SecurityTabsComplete:
                 import sqlite3
 
                 from yonetim.security.core.auth import regen_backup_codes
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 res = regen_backup_codes(conn, uname)
                 conn.close()
                 backup_text.delete('1.0', tk.END)
@@ -875,7 +876,7 @@ class SecurityTabsComplete:
 
                 from yonetim.security.core.auth import (is_force_2fa,
                                                         set_force_2fa)
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 set_force_2fa(conn, bool(force_var.get()))
                 on = is_force_2fa(conn)
                 conn.close()
@@ -895,7 +896,7 @@ class SecurityTabsComplete:
             import sqlite3
 
             from yonetim.security.core.auth import is_force_2fa
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             on = is_force_2fa(conn)
             conn.close()
             force_var.set(on)
@@ -937,7 +938,7 @@ class SecurityTabsComplete:
         def load_settings():
             try:
                 import sqlite3
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cur = conn.cursor()
                 # Ensure table exists
                 cur.execute("""
@@ -965,7 +966,7 @@ class SecurityTabsComplete:
         def save_settings():
             try:
                 import sqlite3
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cur = conn.cursor()
                 
                 for key, _, _, _ in fields_config:
@@ -2,6 +2,14 @@ import sqlite3
 import logging
 import json
 from typing import List, Dict, Optional, Any
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 try:
     from config.database import DB_PATH
 except ImportError:
@@ -11,7 +19,7 @@ class SupplyChainManager:
     def __init__(self, db_path: str = DB_PATH):
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
-        self.ensure_tables()
+        ensure_schema(self.db_path, self.ensure_tables)
 
     def ensure_tables(self):
         conn = self.get_connection()
@@ -57,7 +65,7 @@ class SupplyChainManager:
         conn.close()
 
     def get_connection(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
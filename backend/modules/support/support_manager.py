@@ -2,15 +2,23 @@ import sqlite3
 import logging
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 class SupportManager:
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self._init_tables()
+        ensure_schema(self.db_path, self._init_tables)
 
     def _init_tables(self):
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             
             # Support Tickets Table
@@ -49,7 +57,7 @@ class SupportManager:
 
     def create_ticket(self, user_id: int, company_id: int, subject: str, message: str, priority: str, category: str) -> bool:
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO support_tickets (user_id, company_id, subject, message, priority, category)
@@ -64,7 +72,7 @@ class SupportManager:
 
     def get_user_tickets(self, company_id: int, user_id: Optional[int] = None, limit: int = 50, offset: int = 0) -> List[Dict]:
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
@@ -88,7 +96,7 @@ class SupportManager:
 
     def get_user_tickets_count(self, company_id: int, user_id: Optional[int] = None) -> int:
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             
             query = "SELECT COUNT(*) FROM support_tickets WHERE company_id = ?"
@@ -109,7 +117,7 @@ class SupportManager:
     def get_all_tickets(self, limit: int = 50, offset: int = 0) -> List[Dict]:
         """Admin use only"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute("""
@@ -129,7 +137,7 @@ class SupportManager:
 
     def get_all_tickets_count(self) -> int:
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM support_tickets")
             count = cursor.fetchone()[0]
@@ -141,7 +149,7 @@ class SupportManager:
 
     def get_ticket_details(self, ticket_id: int) -> Optional[Dict]:
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
@@ -173,7 +181,7 @@ class SupportManager:
 
     def add_reply(self, ticket_id: int, user_id: int, message: str, is_admin: bool = False) -> bool:
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO support_replies (ticket_id, user_id, message, is_admin)
@@ -23,6 +23,8 @@ from typing import Any, Dict, List, Tuple
 
 import requests
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class HostingSurveyManager:
@@ -60,7 +62,7 @@ class HostingSurveyManager:
         self.timeout = 30  # seconds
 
         # Lokal veritabanında anket takip tablosu oluştur
-        self._init_local_database()
+        ensure_schema(self.db_path, self._init_local_database)
 
     def _load_hosting_config(self) -> Dict[str, str]:
         """anket/config.php içinden BASE_URL ve ADMIN_API_KEY değerlerini okumaya çalış"""
@@ -106,7 +108,7 @@ class HostingSurveyManager:
     def _init_local_database(self) -> None:
         """Lokal veritabanında anket takip tablosu oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Anket takip tablosu
@@ -281,7 +283,7 @@ class HostingSurveyManager:
     def _save_survey_locally(self, survey_data: Dict) -> None:
         """Anketi lokal veritabanına kaydet"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -499,7 +501,7 @@ class HostingSurveyManager:
     def _update_response_count(self, survey_id: int, count: int) -> None:
         """Yanıt sayısını lokal veritabanında güncelle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 UPDATE hosting_surveys 
@@ -514,7 +516,7 @@ class HostingSurveyManager:
     def _update_local_status(self, survey_id: int, status: str) -> None:
         """Lokal anket durumunu güncelle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 UPDATE hosting_surveys 
@@ -529,7 +531,7 @@ class HostingSurveyManager:
     def _delete_local_survey(self, survey_id: int) -> None:
         """Lokal anket kaydını sil"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("DELETE FROM hosting_surveys WHERE hosting_survey_id = ?", (survey_id,))
             conn.commit()
@@ -680,7 +682,7 @@ class HostingSurveyManager:
     def get_local_surveys(self) -> List[Dict[str, Any]]:
         """Lokal veritabanındaki anketleri getir"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT * FROM hosting_surveys 
@@ -704,7 +706,7 @@ class HostingSurveyManager:
     def get_stakeholders(self, active_only: bool = True) -> List[Dict[str, Any]]:
         """Paydaş listesini getir"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             if active_only:
@@ -729,7 +731,7 @@ class HostingSurveyManager:
     def add_stakeholder(self, name: str, email: str, organization: str = "", role: str = "", category: str = "") -> bool:
         """Yeni paydaş ekle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO survey_stakeholders (name, email, organization, role, category)
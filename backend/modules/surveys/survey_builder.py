@@ -8,6 +8,14 @@ import logging
 import json
 import sqlite3
 from typing import Dict, List, Optional
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class SurveyBuilder:
@@ -16,11 +24,11 @@ class SurveyBuilder:
     def __init__(self, db_path: str = None) -> None:
         import os
         self.db_path = db_path or os.path.join(os.getcwd(), 'data', 'sdg_desktop.sqlite')
-        self.create_tables()
+        ensure_schema(self.db_path, self.create_tables)
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def create_tables(self) -> None:
         """Gerekli tabloları oluştur"""
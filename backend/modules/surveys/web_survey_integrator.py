@@ -15,6 +15,8 @@ from typing import Any, Dict, List, Optional
 import requests
 from config.icons import Icons
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class WebSurveyIntegrator:
@@ -25,11 +27,11 @@ class WebSurveyIntegrator:
         # direct_create.php kullan (nginx body size sorunu için)
         self.web_api_url = "https://sustainage.cloud/anket/direct_create.php"
         self.web_survey_base = "https://sustainage.cloud/anket/survey.php"
-        self._init_tables()
+        ensure_schema(self.db_path, self._init_tables)
 
     def _init_tables(self):
         """Anket tracking tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Web anket tracking tablosu
@@ -165,7 +167,7 @@ class WebSurveyIntegrator:
             token = self.generate_secure_token(company_id, module_name)
 
             # Şirket bilgisini al
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("SELECT name FROM companies WHERE id = ?", (company_id,))
             company = cursor.fetchone()
@@ -320,7 +322,7 @@ class WebSurveyIntegrator:
     def _save_responses_to_local(self, token: str, responses: List[Dict]) -> None:
         """Yanıtları lokal veritabanına kaydet"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Survey ID'yi bul
@@ -407,7 +409,7 @@ class WebSurveyIntegrator:
     def _process_to_materiality(self, company_id: int, responses: List[Dict]) -> Dict:
         """Çift önemlilik (materiality) modülüne aktar"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # materiality_responses tablosuna veri ekle (detaylı yanıtlar)
@@ -482,7 +484,7 @@ class WebSurveyIntegrator:
     def _process_to_gri(self, company_id: int, responses: List[Dict]) -> Dict:
         """GRI modülüne aktar"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # GRI responses tablosuna aktar
@@ -530,7 +532,7 @@ class WebSurveyIntegrator:
     def _process_to_sdg(self, company_id: int, responses: List[Dict]) -> Dict:
         """SDG modülüne aktar"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # SDG survey responses
@@ -582,7 +584,7 @@ class WebSurveyIntegrator:
     def _process_to_stakeholder(self, company_id: int, responses: List[Dict]) -> Dict:
         """Stakeholder engagement modülüne aktar"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Stakeholder feedback tablosu
@@ -629,7 +631,7 @@ class WebSurveyIntegrator:
     def _process_generic(self, company_id: int, module_name: str, responses: List[Dict]) -> Dict:
         """Generic modül için işle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Generic survey responses
@@ -675,7 +677,7 @@ class WebSurveyIntegrator:
     def sync_all_surveys(self) -> Dict[str, Any]:
         """Tüm aktif anketlerin yanıtlarını senkronize et"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Aktif anketleri al
@@ -723,7 +725,7 @@ class WebSurveyIntegrator:
     def get_survey_status(self, survey_token: str) -> Dict[str, Any]:
         """Anket durumunu kontrol et"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -847,7 +849,7 @@ class WebSurveyIntegrator:
 
                 if result.get('success'):
                     # Lokal veritabanını da güncelle
-                    conn = sqlite3.connect(self.db_path)
+                    conn = db_connect(self.db_path)
                     cursor = conn.cursor()
 
                     cursor.execute("""
@@ -4,7 +4,10 @@
 TCFD (Task Force on Climate-related Financial Disclosures) Modülü
 """
 
-from .tcfd_gui import TCFDGUI
+try:
+    from .tcfd_gui import TCFDGUI
+except ImportError:
+    TCFDGUI = None
 from .tcfd_manager import TCFDManager
 
 __all__ = ['TCFDManager', 'TCFDGUI']
@@ -14,6 +14,14 @@ import os
 import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class TCFDManager:
@@ -29,7 +37,7 @@ class TCFDManager:
         self.data_dir = os.path.join(self.module_dir, 'data')
 
         # Veritabanını başlat
-        self.init_database()
+        ensure_schema(self.db_path, self.init_database)
 
         # Risk katalogu ve senaryoları yükle
         self.load_catalogs()
@@ -39,7 +47,7 @@ class TCFDManager:
         schema_path = os.path.join(self.module_dir, 'tcfd_schema.sql')
 
         if os.path.exists(schema_path):
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cur = conn.cursor()
 
             try:
@@ -63,7 +71,7 @@ class TCFDManager:
 
     def init_financial_impact_table(self) -> None:
         """Finansal etki tablosunu oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
         try:
             cur.execute("""
@@ -93,7 +101,7 @@ class TCFDManager:
 
     def add_financial_impact(self, company_id: int, data: Dict) -> Tuple[bool, str]:
         """Finansal etki verisi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
         try:
             cur.execute("""
@@ -121,7 +129,7 @@ class TCFDManager:
 
     def get_financial_impacts(self, company_id: int) -> List[Dict]:
         """Finansal etki verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
         try:
             cur.execute("""
@@ -141,7 +149,7 @@ class TCFDManager:
 
     def delete_financial_impact(self, company_id: int, impact_id: int) -> Tuple[bool, str]:
         """Finansal etki verisini sil"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
         try:
             cur.execute("""
@@ -189,7 +197,7 @@ class TCFDManager:
         Returns:
             (başarılı_mı, mesaj)
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -275,7 +283,7 @@ class TCFDManager:
 
     def get_governance(self, company_id: int, year: int) -> Optional[Dict]:
         """Yönetişim verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -301,7 +309,7 @@ class TCFDManager:
 
     def save_strategy(self, company_id: int, year: int, data: Dict) -> Tuple[bool, str]:
         """Strateji verilerini kaydet"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -387,7 +395,7 @@ class TCFDManager:
 
     def save_metrics(self, company_id: int, year: int, data: Dict) -> Tuple[bool, str]:
         """Metrikler verilerini kaydet"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -553,7 +561,7 @@ class TCFDManager:
 
     def get_metrics(self, company_id: int, year: int) -> Optional[Dict]:
         """Metrikler verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -574,7 +582,7 @@ class TCFDManager:
 
     def add_target(self, company_id: int, target_data: Dict) -> Tuple[bool, str, Optional[int]]:
         """Yeni hedef ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -620,7 +628,7 @@ class TCFDManager:
 
     def get_dashboard_stats(self, company_id: int) -> Dict:
         """Dashboard istatistiklerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
         stats = {
             'governance_score': 0,
@@ -671,7 +679,7 @@ class TCFDManager:
 
     def update_target(self, target_id: int, target_data: Dict) -> Tuple[bool, str]:
         """Hedef güncelle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -718,7 +726,7 @@ class TCFDManager:
 
     def get_targets(self, company_id: int, status: Optional[str] = None) -> List[Dict]:
         """Hedefleri listele"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
         try:
             query = "SELECT * FROM tcfd_targets WHERE company_id = ?"
@@ -736,7 +744,7 @@ class TCFDManager:
 
     def delete_target(self, target_id: int) -> Tuple[bool, str]:
         """Hedef sil"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
         try:
             cur.execute("DELETE FROM tcfd_targets WHERE id = ?", (target_id,))
@@ -752,7 +760,7 @@ class TCFDManager:
 
     def get_strategy(self, company_id: int, year: int) -> Optional[Dict]:
         """Strateji verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -777,7 +785,7 @@ class TCFDManager:
 
     def add_climate_risk(self, company_id: int, year: int, risk_data: Dict) -> Tuple[bool, str, Optional[int]]:
         """İklim riski ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -848,7 +856,7 @@ class TCFDManager:
 
     def update_climate_risk(self, risk_id: int, risk_data: Dict) -> Tuple[bool, str]:
         """İklim riskini güncelle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -930,7 +938,7 @@ class TCFDManager:
                          category: Optional[str] = None,
                          risk_type: Optional[str] = None) -> List[Dict]:
         """İklim risklerini getir (filtreli)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -961,7 +969,7 @@ class TCFDManager:
 
     def delete_climate_risk(self, risk_id: int) -> Tuple[bool, str]:
         """İklim riskini sil"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -983,7 +991,7 @@ class TCFDManager:
     # Devam edecek...
     def get_risk_summary(self, company_id: int, year: int) -> Dict:
         """Risk özeti istatistikleri"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
 
         try:
@@ -11,6 +11,14 @@ import os
 import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 class TNFDManager:
     """TNFD modülü iş mantığı ve veri yönetimi"""
@@ -18,11 +26,11 @@ class TNFDManager:
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.module_dir = os.path.dirname(os.path.abspath(__file__))
-        self.init_database()
+        ensure_schema(self.db_path, self.init_database)
 
     def init_database(self) -> None:
         """TNFD tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
         try:
             # TNFD Governance
@@ -88,7 +96,7 @@ class TNFDManager:
 
     def get_stats(self, company_id: int, year: int) -> Dict:
         """Dashboard istatistiklerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cur = conn.cursor()
         stats = {
             'nature_risks': 0,
@@ -8,6 +8,10 @@ Anket tamamlanma, gecikme ve veri kalitesi takibi
 import os
 import sqlite3
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 class SurveyTracker:
@@ -18,7 +22,7 @@ class SurveyTracker:
 
     def get_completion_dashboard(self, company_id: int) -> Dict:
         """Anket tamamlanma dashboard'u"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -64,7 +68,7 @@ class SurveyTracker:
 
     def get_category_status(self, company_id: int) -> Dict:
         """Kategori bazında durum (SDG, GRI, TSRS)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -92,7 +96,7 @@ class SurveyTracker:
 
     def get_department_progress(self, company_id: int) -> List[Dict]:
         """Departman bazında ilerleme"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -2,14 +2,22 @@ import sqlite3
 import json
 import logging
 from datetime import datetime
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 class TrainingManager:
     def __init__(self, db_path):
         self.db_path = db_path
-        self._init_tables()
+        ensure_schema(self.db_path, self._init_tables)
 
     def _init_tables(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         # Training Programs table
@@ -44,7 +52,7 @@ class TrainingManager:
         conn.close()
 
     def add_training_program(self, company_id, title, description, training_type, content_url, duration_minutes):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             cursor.execute('''
@@ -60,7 +68,7 @@ class TrainingManager:
             conn.close()
 
     def get_training_programs(self, company_id):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('SELECT * FROM lms_training_programs WHERE company_id = ? ORDER BY created_at DESC', (company_id,))
@@ -69,7 +77,7 @@ class TrainingManager:
         return [dict(row) for row in rows]
 
     def add_training_record(self, company_id, training_id, participant_name, status='assigned', score=None):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             completion_date = datetime.now().strftime('%Y-%m-%d') if status == 'completed' else None
@@ -86,7 +94,7 @@ class TrainingManager:
             conn.close()
 
     def get_training_records(self, company_id):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute('''
@@ -101,7 +109,7 @@ class TrainingManager:
         return [dict(row) for row in rows]
     
     def get_dashboard_stats(self, company_id):
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         stats = {}
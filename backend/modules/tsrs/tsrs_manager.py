@@ -11,6 +11,7 @@ import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class TSRSManager:
@@ -31,7 +32,7 @@ class TSRSManager:
 
     def get_connection(self) -> sqlite3.Connection:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def create_tables(self) -> bool:
         """TSRS tablolarını oluştur"""
@@ -13,6 +13,7 @@ from typing import Dict, List
 
 import pandas as pd
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 # Raporlama kütüphaneleri
 try:
@@ -101,7 +102,7 @@ class TSRSReporting:
 
     def get_connection(self) -> sqlite3.Connection:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def get_company_info(self, company_id: int) -> Dict:
         """Şirket bilgilerini getir (şema uyumlu ve null-güvenli)"""
@@ -5,7 +5,10 @@ UNGC Module
 UN Global Compact - Ten Principles
 """
 
-from .ungc_gui import UNGCGUI
+try:
+    from .ungc_gui import UNGCGUI
+except ImportError:
+    UNGCGUI = None
 from .ungc_manager import UNGCManager
 
 __all__ = ['UNGCManager', 'UNGCGUI']
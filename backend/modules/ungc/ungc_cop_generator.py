@@ -19,6 +19,7 @@ from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer,
 
 from modules.ungc.ungc_manager_enhanced import UNGCManagerEnhanced
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class UNGCCOPGenerator:
@@ -81,7 +82,7 @@ class UNGCCOPGenerator:
     def _get_company_info(self, company_id: int) -> Dict:
         """Get company information"""
         import sqlite3
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         try:
             cursor = conn.cursor()
             result = cursor.execute(
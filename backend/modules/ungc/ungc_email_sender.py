@@ -14,6 +14,7 @@ from typing import Any, Dict, List, Optional
 
 from modules.ungc.ungc_cop_generator import UNGCCOPGenerator
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class UNGCEmailSender:
@@ -81,7 +82,7 @@ class UNGCEmailSender:
 
             # Get company name
             import sqlite3
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             result = cursor.execute("SELECT name FROM companies WHERE id = ?", (company_id,)).fetchone()
             company_name = result[0] if result else "Company"
@@ -15,6 +15,7 @@ from openpyxl.utils import get_column_letter
 
 from modules.ungc.ungc_manager_enhanced import UNGCManagerEnhanced
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class UNGCExcelExporter:
@@ -36,7 +37,7 @@ class UNGCExcelExporter:
 
         # Get company info
         import sqlite3
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         result = cursor.execute("SELECT name FROM companies WHERE id = ?", (company_id,)).fetchone()
         company_name = result[0] if result else "Company"
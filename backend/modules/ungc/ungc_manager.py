@@ -12,6 +12,7 @@ import os
 import sqlite3
 from typing import Dict, List, Tuple
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class UNGCManager:
@@ -38,7 +39,7 @@ class UNGCManager:
             }
 
     def _conn(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def create_ungc_tables(self) -> None:
         """UNGC tablolarını oluştur"""
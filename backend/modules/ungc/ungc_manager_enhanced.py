@@ -13,6 +13,7 @@ import sqlite3
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class UNGCManagerEnhanced:
@@ -40,7 +41,7 @@ class UNGCManagerEnhanced:
 
     def _conn(self) -> sqlite3.Connection:
         """Database connection"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def get_principle_info(self, principle_id: str, lang: str = 'tr') -> Optional[Dict]:
         """Get principle information"""
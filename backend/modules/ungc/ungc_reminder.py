@@ -9,6 +9,8 @@ import sqlite3
 from datetime import datetime
 from typing import Dict, List
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class UNGCReminderSystem:
@@ -16,11 +18,11 @@ class UNGCReminderSystem:
 
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self._create_reminder_table()
+        ensure_schema(self.db_path, self._create_reminder_table)
 
     def _create_reminder_table(self):
         """Create reminder table"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -55,7 +57,7 @@ class UNGCReminderSystem:
         # COP due date: June 30 of following year
         due_date = datetime(year + 1, 6, 30)
 
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -88,7 +90,7 @@ class UNGCReminderSystem:
         Returns:
             Reminder ID
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -118,7 +120,7 @@ class UNGCReminderSystem:
         Returns:
             List of pending reminders
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -148,7 +150,7 @@ class UNGCReminderSystem:
 
     def mark_reminder_completed(self, reminder_id: int):
         """Mark a reminder as completed"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
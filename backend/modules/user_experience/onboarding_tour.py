@@ -12,6 +12,7 @@ from typing import Optional, Tuple
 
 from utils.language_manager import LanguageManager
 from config.icons import Icons
+from utils.db_pool import connect as db_connect
 
 
 class TourStep:
@@ -48,7 +49,7 @@ class OnboardingTour:
     def should_show_tour(self) -> bool:
         """Tur gösterilmeli mi?"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -66,7 +67,7 @@ class OnboardingTour:
     def mark_tour_completed(self) -> None:
         """Turu tamamlandı olarak işaretle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -13,6 +13,7 @@ from typing import Callable, Optional
 from utils.language_manager import LanguageManager
 from utils.ui_theme import apply_theme
 from config.icons import Icons
+from utils.db_pool import connect as db_connect
 
 
 class OnboardingWizard:
@@ -38,7 +39,7 @@ class OnboardingWizard:
     def has_seen_tour(self) -> bool:
         """Kullanıcı turu daha önce görmüş mü?"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # User settings tablosunu kontrol et
@@ -79,7 +80,7 @@ class OnboardingWizard:
     def mark_tour_completed(self) -> None:
         """Turu tamamlandı olarak işaretle"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             # Mevcut satır varsa show_onboarding değerini koru; yoksa 1 olarak başlat
             cursor.execute("""
@@ -605,7 +606,7 @@ class OnboardingWizard:
     def mark_dont_show_again(self) -> None:
         """Bir daha gösterme seçeneğini kaydet - hem onboarding hem welcome banner için"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # User settings tablosunu oluştur
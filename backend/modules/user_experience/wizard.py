@@ -11,6 +11,7 @@ from typing import Callable, List, Optional
 
 from utils.language_manager import LanguageManager
 from config.icons import Icons
+from utils.db_pool import connect as db_connect
 
 
 class WizardStep:
@@ -390,7 +391,7 @@ def create_company_setup_wizard(parent, db_path: str, company_id: int) -> None:
     def on_complete(data) -> None:
         # Veritabanına kaydet
         import sqlite3
-        conn = sqlite3.connect(db_path)
+        conn = db_connect(db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
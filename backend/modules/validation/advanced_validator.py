@@ -14,6 +14,8 @@ import statistics
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class AdvancedDataValidator:
@@ -24,12 +26,12 @@ class AdvancedDataValidator:
             base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
-        self._init_validation_tables()
+        ensure_schema(self.db_path, self._init_validation_tables)
         self.normalization_rules = self._load_normalization_rules()
 
     def _init_validation_tables(self) -> None:
         """Validasyon tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -161,7 +163,7 @@ class AdvancedDataValidator:
         Returns:
             Karşılaştırma sonuçları
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -223,7 +225,7 @@ class AdvancedDataValidator:
         """Önceki yıl verisini getir (modül spesifik)"""
         # Bu fonksiyon her modül için özelleştirilmiş sorgu yapabilir
         # Örnek: Karbon emisyon verisi
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -309,7 +311,7 @@ class AdvancedDataValidator:
     def _check_carbon_consistency(self, company_id: int,
                                  reporting_year: int) -> List[Dict]:
         """Karbon verisi tutarlılığı (Toplam + Scope 1/2/3, birim/doğrulama)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         inconsistencies = []
 
@@ -448,7 +450,7 @@ class AdvancedDataValidator:
     def _check_energy_consistency(self, company_id: int,
                                   reporting_year: int) -> List[Dict]:
         """Enerji verisi tutarlılığı (TCFD metrics vs GRI 302-1/302-3)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         inconsistencies: List[Dict] = []
 
@@ -536,7 +538,7 @@ class AdvancedDataValidator:
     def _check_water_consistency(self, company_id: int,
                                 reporting_year: int) -> List[Dict]:
         """Su verisi tutarlılığı (TCFD metrics ve Water KPIs vs GRI 303-1/303-2/303-3)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         inconsistencies: List[Dict] = []
 
@@ -690,7 +692,7 @@ class AdvancedDataValidator:
         - Tutarlılık (Consistency): %20
         - Güncellik (Timeliness): %10
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -769,7 +771,7 @@ class AdvancedDataValidator:
         """Tamlık skorunu hesapla"""
         # Modüldeki zorunlu alanların dolu olma oranı
         # Basitleştirilmiş hesaplama - gerçekte modül spesifik olmalı
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -794,7 +796,7 @@ class AdvancedDataValidator:
                           reporting_year: int) -> float:
         """Doğruluk skorunu hesapla"""
         # Validasyon hatalarına göre
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -863,7 +865,7 @@ class AdvancedDataValidator:
 
     def check_missing_data(self, company_id: int, module_name: str) -> List[Dict]:
         """Eksik verileri kontrol et ve uyar"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         missing_data = []
 
@@ -986,7 +988,7 @@ class AdvancedDataValidator:
     def _detect_historical_anomalies(self, company_id: int, module_name: str,
                                     reporting_year: int) -> List[Dict]:
         """Tarihsel anomali tespiti"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         anomalies = []
 
@@ -1129,7 +1131,7 @@ class AdvancedDataValidator:
     def get_validation_summary(self, company_id: int,
                               reporting_year: int = None) -> Dict:
         """Genel validasyon özeti"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -10,6 +10,14 @@ import re
 import sqlite3
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Tuple
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class ValidationRule:
@@ -67,12 +75,12 @@ class DataValidator:
         """
         self.db_path = db_path
         self.rules = {}  # {field_name: [ValidationRule, ...]}
-        self._init_database()
+        ensure_schema(self.db_path, self._init_database)
         self._load_default_rules()
 
     def _init_database(self) -> None:
         """Veritabanı tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Validasyon kuralları tablosu
@@ -343,7 +351,7 @@ class DataValidator:
         warnings = []
 
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Önceki yılın verisini al
@@ -399,7 +407,7 @@ class DataValidator:
                              error_message: str = "") -> None:
         """Validasyon sonucunu logla"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -436,7 +444,7 @@ class DataValidator:
             Kalite skoru (0-100)
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Validasyon sonuçlarını al
@@ -495,7 +503,7 @@ class DataValidator:
             Kalite raporu
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
 
             # Tablo bazında skorlar
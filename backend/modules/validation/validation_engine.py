@@ -9,6 +9,10 @@ import sqlite3
 from typing import Dict, List
 
 from .data_validator import ENVIRONMENTAL_CROSS_CHECKS, SOCIAL_CROSS_CHECKS, DataValidator
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 class ValidationEngine:
@@ -35,7 +39,7 @@ class ValidationEngine:
         Returns:
             Validasyon sonuç raporu
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Tabloyu oku
@@ -13,6 +13,8 @@ from tkinter import ttk
 from typing import Dict, List, Optional
 
 from utils.language_manager import LanguageManager
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class DashboardWidget:
@@ -219,11 +221,11 @@ class DashboardWidgetManager:
 
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
-        self._init_tables()
+        ensure_schema(self.db_path, self._init_tables)
 
     def _init_tables(self) -> None:
         """Widget yapılandırma tablosu"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -277,7 +279,7 @@ class DashboardWidgetManager:
             widgets: Widget listesi
             is_default: Varsayılan layout mu
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -309,7 +311,7 @@ class DashboardWidgetManager:
 
     def get_user_layout(self, user_id: int, layout_id: int = None) -> Optional[Dict]:
         """Kullanıcının layout'unu getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -19,6 +19,11 @@ import os
 import sqlite3
 from typing import Dict
 
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+
 
 class MappingDiagram:
     """SDG-GRI-TSRS eşleştirme diyagramı oluşturucu"""
@@ -123,7 +128,7 @@ class MappingDiagram:
 
     def _get_connections(self, sdg_number: int) -> Dict:
         """SDG bağlantılarını al"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         connections = {'gri': [], 'tsrs': []}
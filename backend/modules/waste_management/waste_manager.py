@@ -10,6 +10,8 @@ import os
 import sqlite3
 from typing import Dict, List
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class WasteManager:
@@ -24,11 +26,11 @@ class WasteManager:
         self.company_id = 1  # Varsayılan company_id
 
         # Tabloları oluştur
-        self.create_waste_tables()
+        ensure_schema(self.db_path, self.create_waste_tables)
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def create_waste_tables(self) -> None:
         """Atık yönetimi tablolarını oluştur"""
@@ -11,7 +11,10 @@ __description__ = "Su yönetimi modülü - Su ayak izi, tüketim takibi ve verim
 
 from .water_calculator import WaterCalculator
 from .water_factors import WaterFactors
-from .water_gui import WaterGUI
+try:
+    from .water_gui import WaterGUI
+except ImportError:
+    WaterGUI = None
 from .water_manager import WaterManager
 from .water_reporting import WaterReporting
 
@@ -11,6 +11,8 @@ import sqlite3
 from typing import Dict, List, Optional
 
 from config.settings import get_db_path
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class WaterFactors:
@@ -28,11 +30,11 @@ class WaterFactors:
                 base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
                 db_path = os.path.join(base_dir, db_path)
             self.db_path = db_path
-        self.create_water_factors_table()
+        ensure_schema(self.db_path, self.create_water_factors_table)
 
     def create_water_factors_table(self) -> None:
         """Özel su faktörleri tablosu oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -293,7 +295,7 @@ class WaterFactors:
 
     def get_custom_factor(self, factor_type: str, factor_name: str, region: str = None) -> Optional[float]:
         """Özel su faktörü getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -325,7 +327,7 @@ class WaterFactors:
                          region: str = None, validity_start: str = None,
                          validity_end: str = None, notes: str = None) -> int:
         """Özel su faktörü ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -352,7 +354,7 @@ class WaterFactors:
 
     def get_all_custom_factors(self, factor_type: str = None) -> List[Dict]:
         """Tüm özel su faktörlerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -399,7 +401,7 @@ class WaterFactors:
 
     def update_custom_factor(self, factor_id: int, **updates) -> bool:
         """Özel su faktörünü güncelle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -438,7 +440,7 @@ class WaterFactors:
 
     def delete_custom_factor(self, factor_id: int) -> bool:
         """Özel su faktörünü sil"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -16,6 +16,8 @@ from core.db_manager import DatabaseManager
 
 from .water_calculator import WaterCalculator
 from .water_factors import WaterFactors
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 
 
 class WaterManager:
@@ -36,11 +38,11 @@ class WaterManager:
         self.db_manager = DatabaseManager(self.db_path)
         self.calculator = WaterCalculator(self.db_path)
         self.water_factors = WaterFactors(self.db_path)
-        self.create_tables()
+        ensure_schema(self.db_path, self.create_tables)
 
     def get_connection(self) -> sqlite3.Connection:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def create_tables(self) -> None:
         """Su yönetimi tablolarını oluştur"""
@@ -10,6 +10,14 @@ import os
 import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 DEFAULT_DB = os.path.join('data', 'db', 'workflow.sqlite')
 
@@ -18,10 +26,10 @@ class WorkflowStore:
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or DEFAULT_DB
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        self._init_db()
+        ensure_schema(self.db_path, self._init_db)
 
     def _connect(self):
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def _init_db(self):
         conn = self._connect()
@@ -5,6 +5,10 @@ import os
 from typing import List, Tuple
 from cryptography.fernet import Fernet
 from dotenv import load_dotenv
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 # Load .env explicitly to ensure we get the key
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -42,7 +46,7 @@ def enable_totp_for_user(db_path: str, username: str) -> Tuple[bool, str, str, b
     # Encrypt secret before storing in DB
     encrypted_secret = _encrypt_secret(secret)
     
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     try:
         _ensure_2fa_columns(conn)
         # Pass encrypted secret to enable_2fa (which saves it to DB)
@@ -58,7 +62,7 @@ def enable_totp_for_user(db_path: str, username: str) -> Tuple[bool, str, str, b
 
 def verify_totp_code(db_path: str, username: str, code: str) -> Tuple[bool, str]:
     from yonetim.security.core.auth import verify_totp
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     cur = conn.cursor()
     cur.execute("SELECT totp_secret_encrypted FROM users WHERE username=?", (username,))
     row = cur.fetchone()
@@ -74,7 +78,7 @@ def verify_totp_code(db_path: str, username: str, code: str) -> Tuple[bool, str]
 
 def get_backup_codes(db_path: str, username: str) -> Tuple[bool, str, List[str]]:
     from yonetim.security.core.auth import regen_backup_codes
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     try:
         res = regen_backup_codes(conn, username)
         return bool(res.get("ok")), "ok" if res.get("ok") else "hata", list(res.get("backup_plain") or [])
@@ -83,7 +87,7 @@ def get_backup_codes(db_path: str, username: str) -> Tuple[bool, str, List[str]]
 
 def verify_backup_code(db_path: str, username: str, code: str) -> Tuple[bool, str]:
     from yonetim.security.core.auth import consume_backup_code
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     try:
         _ensure_2fa_columns(conn)
         ok = consume_backup_code(conn, username, code)
@@ -93,7 +97,7 @@ def verify_backup_code(db_path: str, username: str, code: str) -> Tuple[bool, st
 
 def disable_2fa(db_path: str, username: str) -> Tuple[bool, str]:
     from yonetim.security.core.auth import disable_2fa
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     try:
         _ensure_2fa_columns(conn)
         res = disable_2fa(conn, username)
@@ -103,7 +107,7 @@ def disable_2fa(db_path: str, username: str) -> Tuple[bool, str]:
 
 def regenerate_backup_codes(db_path: str, username: str) -> Tuple[bool, str, List[str]]:
     from yonetim.security.core.auth import regen_backup_codes
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     try:
         _ensure_2fa_columns(conn)
         res = regen_backup_codes(conn, username)
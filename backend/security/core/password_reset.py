@@ -13,6 +13,7 @@ from datetime import datetime, timedelta
 from typing import Tuple
 
 from yonetim.security.core.crypto import hash_password
+from utils.db_pool import connect as db_connect
 
 try:
     from security.core.secure_password import PasswordPolicy as GlobalPasswordPolicy
@@ -29,7 +30,7 @@ def request_password_reset(db_path: str, username_or_email: str) -> Tuple[bool,
     Returns:
         (basarili_mi, mesaj)
     """
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     cur = conn.cursor()
 
     try:
@@ -134,7 +135,7 @@ def verify_reset_code_and_change_password(db_path: str, username: str, code: str
     Returns:
         (basarili_mi, mesaj)
     """
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     cur = conn.cursor()
 
     try:
@@ -5,6 +5,10 @@ import secrets
 import sqlite3
 import time
 from typing import Tuple
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 def _ensure_users_columns(conn: sqlite3.Connection) -> None:
@@ -121,7 +125,7 @@ def verify_password(stored_hash: str, password: str) -> Tuple[bool, bool]:
 
 
 def record_failed_login(db_path: str, username: str, max_attempts=None, lock_seconds=None) -> None:
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     cur = conn.cursor()
     _ensure_users_columns(conn)
     cur.execute("SELECT id, failed_attempts FROM users WHERE username=?", (username,))
@@ -157,7 +161,7 @@ def record_failed_login(db_path: str, username: str, max_attempts=None, lock_sec
 
 
 def reset_failed_attempts(db_path: str, username: str) -> None:
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     _ensure_users_columns(conn)
     cur = conn.cursor()
     cur.execute("UPDATE users SET failed_attempts=0, locked_until=NULL WHERE username=?", (username,))
@@ -166,7 +170,7 @@ def reset_failed_attempts(db_path: str, username: str) -> None:
 
 
 def lockout_check(db_path: str, username: str) -> Tuple[bool, int]:
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     _ensure_users_columns(conn)
     cur = conn.cursor()
     cur.execute("SELECT locked_until FROM users WHERE username=?", (username,))
@@ -215,7 +219,7 @@ def _insert_security_log(cur: sqlite3.Cursor, action: str, username: str, succes
 
 
 def audit_log(db_path: str, action: str, **kwargs) -> None:
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     _ensure_security_logs(conn)
     cur = conn.cursor()
     username = kwargs.get("username")
@@ -310,7 +314,7 @@ class PasswordPolicy:
 
 
 def check_password_history(db_path: str, username: str, new_password: str, max_history: int = 5) -> bool:
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     cur = conn.cursor()
     cur.execute(
         """
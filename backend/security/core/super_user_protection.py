@@ -5,13 +5,14 @@ import json
 from datetime import datetime, timedelta
 from typing import Tuple, Optional
 from core.audit_manager import AuditManager
+from utils.db_pool import connect as db_connect
 
 # Configuration
 APPROVAL_WINDOW_SECONDS = 120  # 2 minutes to confirm
 SUPER_ADMIN_USERNAME = "__super__"
 
 def _get_connection(db_path: str):
-    return sqlite3.connect(db_path)
+    return db_connect(db_path)
 
 def _ensure_approval_table(conn):
     """Ensures the approval table exists."""
@@ -2,6 +2,10 @@ import secrets
 import sqlite3
 import time
 from typing import Dict, List, Tuple
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 def _ensure_table(conn: sqlite3.Connection) -> None:
@@ -25,7 +29,7 @@ def _ensure_table(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 def generate_temp_token(db_path: str, username: str, duration_minutes: int = 30, max_uses: int = 1, purpose: str | None = None, created_by_user_id: int | None = None) -> Tuple[bool, str, str]:
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     _ensure_table(conn)
     cur = conn.cursor()
     token = secrets.token_urlsafe(48)
@@ -40,7 +44,7 @@ def generate_temp_token(db_path: str, username: str, duration_minutes: int = 30,
     return True, "token oluşturuldu", token
 
 def verify_temp_token(db_path: str, token: str) -> Tuple[bool, str, Dict | None]:
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     _ensure_table(conn)
     cur = conn.cursor()
     cur.execute("SELECT username, purpose, created_at, expires_at, max_uses, use_count, revoked FROM temp_access_tokens WHERE token=?", (token,))
@@ -72,7 +76,7 @@ def verify_temp_token(db_path: str, token: str) -> Tuple[bool, str, Dict | None]
     return True, "ok", info
 
 def revoke_temp_token(db_path: str, token: str) -> Tuple[bool, str]:
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     _ensure_table(conn)
     cur = conn.cursor()
     cur.execute("UPDATE temp_access_tokens SET revoked=1 WHERE token=?", (token,))
@@ -82,7 +86,7 @@ def revoke_temp_token(db_path: str, token: str) -> Tuple[bool, str]:
     return ok, "ok" if ok else "bulunamadı"
 
 def list_active_tokens(db_path: str, username: str | None = None) -> List[Dict]:
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     _ensure_table(conn)
     conn.row_factory = sqlite3.Row
     cur = conn.cursor()
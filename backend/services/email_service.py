@@ -16,6 +16,14 @@ from email.mime.base import MIMEBase
 from email import encoders
 from typing import List, Dict, Optional, Any
 from .icons import Icons
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 # Ensure root path is in sys.path for .env loading if needed
 root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -601,7 +609,7 @@ class EmailService:
         self.db_path = db_path
         
         # Compatibility with old mock
-        self.create_tables()
+        ensure_schema(self.db_path, self.create_tables)
 
         # Load from DB if available
         if self.db_path:
@@ -613,7 +621,7 @@ class EmailService:
             if not os.path.exists(self.db_path):
                 return
 
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cur = conn.cursor()
             # Check if table exists first to avoid errors during init
             cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='system_settings'")
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sistem Ayarları Servisi
+
+system_settings tablosu için süreç içi, şirket bazlı anlık görüntü (snapshot).
+Bir şirketin tüm ayarları ilk okumada tek sorguyla yüklenir; sonraki okumalar
+bellekten yapılır. Tazelik paylaşılan bir sürüm satırıyla (system_settings_version)
+sağlanır: system_settings üzerindeki her INSERT/UPDATE/DELETE tetikleyiciyle
+sürümü artırır. Sürüm en fazla VERSION_CHECK_INTERVAL saniyede bir okunur, bu
+yüzden istek başına sorgu yoktur ve bir worker'daki yazma diğerlerine en geç
+bu süre içinde yansır.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+
+VERSION_CHECK_INTERVAL = 2.0
+
+SETTINGS_DDL = (
+    """CREATE TABLE IF NOT EXISTS system_settings (
+        key TEXT,
+        value TEXT,
+        category TEXT,
+        description TEXT,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        company_id INTEGER,
+        PRIMARY KEY (key, company_id)
+    )""",
+)
+
+VERSION_DDL = (
+    """CREATE TABLE IF NOT EXISTS system_settings_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL DEFAULT 0
+    )""",
+    "INSERT OR IGNORE INTO system_settings_version (id, version) VALUES (1, 0)",
+) + tuple(
+    f"""CREATE TRIGGER IF NOT EXISTS trg_system_settings_version_{event.lower()}
+        AFTER {event} ON system_settings
+        BEGIN
+            UPDATE system_settings_version SET version = version + 1 WHERE id = 1;
+        END"""
+    for event in ('INSERT', 'UPDATE', 'DELETE')
+)
+
+
+class SettingsService:
+    """Şirket bazlı, önbellekli system_settings erişimi"""
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._snapshots: Dict[int, Tuple[Dict[str, str], Optional[int]]] = {}
+        self._version: Optional[int] = None
+        self._version_checked_at = 0.0
+        self._schema_ready = False
+        self._stats = {'hits': 0, 'loads': 0, 'version_checks': 0, 'writes': 0}
+
+    # ------------------------------------------------------------------
+    # Sürüm kontrolü
+    # ------------------------------------------------------------------
+
+    def _ensure_version_table(self, conn) -> None:
+        # Migrasyon öncesi oluşturulmuş veritabanı: tabloları ve tetikleyicileri kur
+        for statement in SETTINGS_DDL + VERSION_DDL:
+            conn.execute(statement)
+        conn.commit()
+        self._schema_ready = True
+
+    def _current_version(self) -> Optional[int]:
+        """Paylaşılan sürüm; kontrol aralığı dolmadıysa son okunan değer döner"""
+        now = time.monotonic()
+        if self._version is not None and now - self._version_checked_at < VERSION_CHECK_INTERVAL:
+            return self._version
+
+        version = None
+        conn = db_connect(self.db_path)
+        try:
+            try:
+                row = conn.execute("SELECT version FROM system_settings_version WHERE id = 1").fetchone()
+            except sqlite3.OperationalError:
+                self._ensure_version_table(conn)
+                row = conn.execute("SELECT version FROM system_settings_version WHERE id = 1").fetchone()
+            version = row[0] if row else None
+        except sqlite3.Error as e:
+            conn.rollback()
+            logging.warning(f"Settings version unavailable: {e}")
+        finally:
+            conn.close()
+
+        with self._lock:
+            if version != self._version:
+                self._snapshots.clear()
+            self._version = version
+            self._version_checked_at = now
+            self._stats['version_checks'] += 1
+        return version
+
+    # ------------------------------------------------------------------
+    # Okuma
+    # ------------------------------------------------------------------
+
+    def _load(self, company_id: int) -> Dict[str, str]:
+        conn = db_connect(self.db_path)
+        try:
+            rows = conn.execute(
+                "SELECT key, value FROM system_settings WHERE company_id = ?", (company_id,)
+            ).fetchall()
+        except sqlite3.OperationalError:
+            # Tablo yoksa tüm ayarlar varsayılan değerde
+            rows = []
+        finally:
+            conn.close()
+        return {key: value for key, value in rows if value is not None}
+
+    def get_all(self, company_id: int) -> Dict[str, str]:
+        """Şirketin tüm ayarları (anlık görüntünün kopyası)"""
+        return dict(self._snapshot(company_id))
+
+    def _snapshot(self, company_id: int) -> Dict[str, str]:
+        version = self._current_version()
+        entry = self._snapshots.get(company_id)
+        if version is not None and entry is not None and entry[1] == version:
+            with self._lock:
+                self._stats['hits'] += 1
+            return entry[0]
+
+        settings = self._load(company_id)
+        with self._lock:
+            self._stats['loads'] += 1
+            if version is not None:
+                self._snapshots[company_id] = (settings, version)
+        return settings
+
+    def get(self, company_id: int, key: str, default: Optional[str] = None) -> Optional[str]:
+        return self._snapshot(company_id).get(key, default)
+
+    def get_many(self, company_id: int, keys: Iterable[str]) -> Dict[str, str]:
+        """İstenen anahtarlar; olmayanlar boş string (ayar formları için)"""
+        snapshot = self._snapshot(company_id)
+        return {key: str(snapshot.get(key, '')) for key in keys}
+
+    def get_int(self, company_id: int, key: str, default: int) -> int:
+        """Pozitif tam sayı ayarı; geçersiz veya <= 0 ise varsayılan"""
+        value = self._snapshot(company_id).get(key)
+        if value is not None:
+            try:
+                val = int(str(value).strip())
+                if val > 0:
+                    return val
+            except ValueError:
+                pass
+        return default
+
+    # ------------------------------------------------------------------
+    # Yazma
+    # ------------------------------------------------------------------
+
+    def save(self, company_id: int, values: Dict[str, str], category: str, description: str) -> None:
+        """
+        Ayarları tek transaction'da kaydet. Tetikleyiciler paylaşılan sürümü
+        artırır; bu süreçteki snapshot'lar hemen düşürülür.
+        """
+        conn = db_connect(self.db_path)
+        try:
+            if not self._schema_ready:
+                self._ensure_version_table(conn)
+            conn.executemany(
+                """
+                INSERT INTO system_settings (key, value, category, description, company_id)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(key, company_id) DO UPDATE SET value=excluded.value, updated_at=CURRENT_TIMESTAMP
+                """,
+                [(key, value, category, description, company_id) for key, value in values.items()],
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        self.invalidate()
+        with self._lock:
+            self._stats['writes'] += 1
+
+    def invalidate(self) -> None:
+        """Bu süreçteki snapshot'ları düşür; sonraki okuma sürümü yeniden kontrol eder"""
+        with self._lock:
+            self._snapshots.clear()
+            self._version = None
+
+    def get_stats(self) -> Dict:
+        """İzleme sayfası için sayaçlar"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['companies'] = len(self._snapshots)
+            stats['version'] = self._version
+        reads = stats['hits'] + stats['loads']
+        stats['hit_ratio'] = round(stats['hits'] / reads, 3) if reads else 0.0
+        return stats
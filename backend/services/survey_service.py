@@ -2,21 +2,29 @@ import json
 import os
 import sqlite3
 from typing import Dict, List, Optional
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+try:
+    from utils.schema_version import ensure_schema
+except ImportError:
+    from backend.utils.schema_version import ensure_schema
 
 
 class SurveyService:
     def __init__(self, db_path: str = None) -> None:
         self.db_path = db_path or os.path.join(os.getcwd(), 'data', 'sdg_desktop.sqlite')
         self._ensure_db()
-        self.create_tables()
+        ensure_schema(self.db_path, self.create_tables)
 
     def _ensure_db(self) -> None:
         if not os.path.exists(self.db_path):
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             conn.close()
 
     def get_connection(self) -> None:
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     def create_tables(self) -> None:
         conn = self.get_connection()
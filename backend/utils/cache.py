@@ -9,7 +9,7 @@ import json
 import time
 import threading
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, FrozenSet, Iterable, Optional
 
 
 class SimpleCache:
@@ -25,13 +25,14 @@ class SimpleCache:
 
     def get(self, key: str) -> Optional[Any]:
         """Cache'den veri al"""
-        if key in self.cache:
-            data, timestamp = self.cache[key]
+        entry = self.cache.get(key)
+        if entry is not None:
+            data, timestamp = entry
             if time.time() - timestamp < self.ttl:
                 return data
             else:
                 # Expired
-                del self.cache[key]
+                self.cache.pop(key, None)
         return None
 
     def set(self, key: str, value: Any) -> None:
@@ -40,8 +41,7 @@ class SimpleCache:
 
     def delete(self, key: str) -> None:
         """Cache'den sil"""
-        if key in self.cache:
-            del self.cache[key]
+        self.cache.pop(key, None)
 
     def clear(self) -> None:
         """Tüm cache'i temizle"""
@@ -105,26 +105,44 @@ def get_cache_stats() -> None:
 
 # User permissions cache
 class UserPermissionsCache:
-    """Kullanıcı yetkileri için özel cache"""
+    """Kullanıcı yetkileri için özel cache (değişmez frozenset olarak tutulur)"""
 
     def __init__(self) -> None:
         self.cache = SimpleCache(ttl=600)  # 10 dakika
+        self._lock = threading.Lock()
 
-    def get_permissions(self, user_id: int) -> Optional[set]:
+    @staticmethod
+    def _key(user_id: int, db_path: Optional[str] = None) -> str:
+        if db_path:
+            return f"user_permissions_{db_path}_{user_id}"
+        return f"user_permissions_{user_id}"
+
+    def get_permissions(self, user_id: int, db_path: Optional[str] = None) -> Optional[FrozenSet[str]]:
         """Kullanıcı yetkilerini cache'den al"""
-        return self.cache.get(f"user_permissions_{user_id}")
+        return self.cache.get(self._key(user_id, db_path))
 
-    def set_permissions(self, user_id: int, permissions: set) -> None:
+    def set_permissions(self, user_id: int, permissions: Iterable[str], db_path: Optional[str] = None) -> FrozenSet[str]:
         """Kullanıcı yetkilerini cache'e ekle"""
-        self.cache.set(f"user_permissions_{user_id}", permissions)
+        frozen = frozenset(permissions)
+        with self._lock:
+            self.cache.set(self._key(user_id, db_path), frozen)
+        return frozen
 
-    def invalidate_user(self, user_id: int) -> None:
+    def invalidate_user(self, user_id: int, db_path: Optional[str] = None) -> None:
         """Kullanıcı cache'ini sil (yetki değiştiğinde)"""
-        self.cache.delete(f"user_permissions_{user_id}")
+        with self._lock:
+            self.cache.delete(self._key(user_id, db_path))
+
+    def invalidate_users(self, user_ids: Iterable[int], db_path: Optional[str] = None) -> None:
+        """Birden fazla kullanıcının cache'ini sil (ör. rolün yetkileri değiştiğinde)"""
+        with self._lock:
+            for user_id in user_ids:
+                self.cache.delete(self._key(user_id, db_path))
 
     def clear(self) -> None:
         """Tüm user cache'i temizle"""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
 
 # Global user permissions cache
 user_permissions_cache = UserPermissionsCache()
@@ -3,140 +3,475 @@
 """
 Database Connection Pool
 Performance optimizasyonu için veritabanı bağlantı havuzu
+
+Süreç (worker) başına, veritabanı yolu başına bir havuz tutulur. Havuzdan
+alınan bağlantılar `PooledConnection` sınıfındandır: `close()` çağrısı
+bağlantıyı kapatmak yerine havuza iade eder, böylece mevcut
+`conn = sqlite3.connect(...)` / `conn.close()` kalıbındaki kod yalnızca
+`db_connect(...)` çağrısına geçirilerek havuzdan yararlanır.
+
+Kullanım:
+    from utils.db_pool import connect as db_connect
+
+    conn = db_connect(self.db_path)
+    ...
+    conn.close()  # havuza iade
 """
 
 import logging
-import queue
+import os
 import sqlite3
+import sys
 import threading
+import time
+import weakref
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import Optional
+from typing import Dict, List, Optional
+
+# Havuzu tamamen kapatmak için (ör. Windows'ta test DB dosyası silinecekse)
+POOL_ENABLED = os.environ.get('SUSTAINAGE_DB_POOL', '1') not in ('0', 'false', 'False')
+
+# Aynı anda tutulacak en fazla havuz (farklı DB yolu) sayısı
+MAX_POOLS = 16
+
+# fork sonrası ebeveyn süreçten kalan bağlantılar; alt süreçte kapatılmamalı
+_forked_orphans: List[sqlite3.Connection] = []
+
+
+class PooledConnection(sqlite3.Connection):
+    """close() çağrısında havuza geri dönen SQLite bağlantısı"""
+
+    def close(self) -> None:
+        pool = getattr(self, '_pool', None)
+        if pool is None:
+            super().close()
+            return
+
+        if getattr(self, '_request_depth', 0) > 0:
+            # İstek kapsamındaki bağlantı: iç içe kullanım bitene kadar açık kalır
+            self._request_depth -= 1
+            if self._request_depth == 0 and self.in_transaction:
+                self.rollback()
+            return
+
+        pool.release(self)
+
+    def close_physical(self) -> None:
+        """Bağlantıyı gerçekten kapat"""
+        finalizer = getattr(self, '_finalizer', None)
+        if finalizer is not None:
+            finalizer.detach()
+        self._pool = None
+        sqlite3.Connection.close(self)
 
 
 class DatabaseConnectionPool:
     """SQLite veritabanı bağlantı havuzu"""
 
-    def __init__(self, db_path: str, max_connections: int = 10, timeout: int = 30) -> None:
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA cache_size=10000",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",  # 256MB
+    )
+
+    def __init__(self, db_path: str, max_connections: int = 10, timeout: int = 30,
+                 min_connections: int = 0, checkout_timeout: float = 5.0) -> None:
         self.db_path = db_path
         self.max_connections = max_connections
         self.timeout = timeout
-        self._pool = queue.Queue(maxsize=max_connections)
-        self._created_connections = 0
-        self._lock = threading.Lock()
+        self.checkout_timeout = checkout_timeout
         self.logger = logging.getLogger(__name__)
 
-        # İlk bağlantıyı oluştur
-        self._create_initial_connections()
+        # Yeniden girişli: sızan bağlantının finalizer'ı (_reclaim) GC ile kilit
+        # tutulurken aynı thread'de çalışabilir
+        self._lock = threading.RLock()
+        self._available = threading.Condition(self._lock)
+        self._reset_state()
 
-    def _create_initial_connections(self) -> None:
-        """İlk bağlantıları oluştur"""
-        for _ in range(min(3, self.max_connections)):
+        # İlk bağlantıları oluştur
+        for _ in range(min(min_connections, self.max_connections)):
+            with self._lock:
+                self._created_connections += 1
             conn = self._create_connection()
-            if conn:
-                self._pool.put(conn)
+            if conn is None:
+                self._forget()
+                break
+            conn._checked_out = True
+            self.release(conn)
 
-    def _create_connection(self) -> Optional[sqlite3.Connection]:
-        """Yeni veritabanı bağlantısı oluştur"""
+    def _reset_state(self) -> None:
+        """Süreç-yerel havuz durumunu sıfırla (ilk kurulum ve fork sonrası)"""
+        self._pid = os.getpid()
+        self._idle: List[PooledConnection] = []
+        # Dışarıdaki bağlantılar (id -> weakref); sızıntı taraması için
+        self._checked_out: Dict[int, weakref.ref] = {}
+        self._created_connections = 0
+        self._file_id = self._stat_file()
+        self._stats = {
+            'checkouts': 0,
+            'waits': 0,
+            'wait_time_total_ms': 0.0,
+            'wait_time_max_ms': 0.0,
+            'overflow_connections': 0,
+            'peak_connections': 0,
+            'discarded_connections': 0,
+            'leaked_connections': 0,
+        }
+
+    def _stat_file(self):
         try:
+            st = os.stat(self.db_path)
+            return (st.st_dev, st.st_ino)
+        except OSError:
+            return None
+
+    def _check_process(self) -> None:
+        """gunicorn worker fork'u sonrası ebeveynin bağlantılarını kullanma"""
+        if self._pid != os.getpid():
             with self._lock:
-                if self._created_connections >= self.max_connections:
-                    return None
-
-                conn = sqlite3.connect(
-                    self.db_path,
-                    timeout=self.timeout,
-                    check_same_thread=False
-                )
-
-                # Performance ayarları
-                conn.execute("PRAGMA journal_mode=WAL")
-                conn.execute("PRAGMA synchronous=NORMAL")
-                conn.execute("PRAGMA cache_size=10000")
-                conn.execute("PRAGMA temp_store=MEMORY")
-                conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+                if self._pid != os.getpid():
+                    _forked_orphans.extend(self._idle)
+                    self._reset_state()
 
-                self._created_connections += 1
-                self.logger.debug(f"Yeni bağlantı oluşturuldu. Toplam: {self._created_connections}")
+    def _check_file(self) -> None:
+        """DB dosyası silinip yeniden oluşturulduysa boştaki bağlantıları at"""
+        file_id = self._stat_file()
+        if file_id == self._file_id:
+            return
+        with self._lock:
+            stale, self._idle = self._idle, []
+            self._file_id = file_id
+        for conn in stale:
+            self._discard(conn)
+
+    def _create_connection(self, overflow: bool = False) -> Optional[PooledConnection]:
+        """Yeni veritabanı bağlantısı oluştur (pragmalar bir kez uygulanır)"""
+        try:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.timeout,
+                check_same_thread=False,
+                factory=PooledConnection
+            )
+
+            # Performance ayarları
+            conn.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
+            conn._busy_timeout = self.timeout
+            for pragma in self.PRAGMAS:
+                conn.execute(pragma)
+
+            conn._request_depth = 0
+            conn._checked_out = False
+            if overflow:
+                conn._pool = None
                 return conn
 
+            conn._pool = self
+            # Bağlantının kendi iç referansları (statement cache); yalnızca bunlar
+            # kalmışsa bağlantı close() çağrılmadan bırakılmıştır
+            conn._internal_refs = sys.getrefcount(conn) - 2
+            conn._finalizer = weakref.finalize(conn, self._reclaim, id(conn))
+            # Süreç kapanırken havuzdaki canlı bağlantılar sızıntı sayılmaz
+            conn._finalizer.atexit = False
+            self.logger.debug(f"Yeni bağlantı oluşturuldu. Toplam: {self._created_connections}")
+            return conn
+
         except Exception as e:
             self.logger.error(f"Bağlantı oluşturma hatası: {e}")
             return None
 
-    @contextmanager
-    def get_connection(self) -> None:
-        """Bağlantı havuzundan bağlantı al"""
+    def _forget(self) -> None:
+        """Oluşturulamayan veya kaybolan bağlantıyı sayaçtan düş"""
+        with self._lock:
+            self._created_connections = max(0, self._created_connections - 1)
+            self._available.notify()
+
+    def _reclaim(self, conn_id: int) -> None:
+        """
+        close() çağrılmadan bırakılan bağlantı çöp toplanınca (weakref.finalize)
+        yerini aç ve bekleyen acquire()'ı uyandır.
+        """
+        with self._lock:
+            self._checked_out.pop(conn_id, None)
+            self._stats['leaked_connections'] += 1
+        self.logger.warning(f"Bağlantı havuza iade edilmeden bırakıldı (close() eksik): {self.db_path}")
+        self._forget()
+
+    def _release_abandoned(self) -> None:
+        """
+        Havuz doluyken, dışarıda referansı kalmamış bağlantıları havuza al.
+        sqlite3 bağlantısı statement cache'iyle referans döngüsündedir; GC'yi
+        beklemek (veya istek yolunda gc.collect) yerine referans sayısına bakılır.
+        """
+        with self._lock:
+            refs = list(self._checked_out.values())
+        for ref in refs:
+            conn = ref()
+            # conn yerel değişkeni + getrefcount argümanı dışında dış referans yok
+            if conn is not None and sys.getrefcount(conn) - 2 <= conn._internal_refs:
+                with self._lock:
+                    self._stats['leaked_connections'] += 1
+                self.logger.warning(f"Bağlantı havuza iade edilmeden bırakıldı (close() eksik): {self.db_path}")
+                self.release(conn)
+            del conn
+
+    def _discard(self, conn: PooledConnection) -> None:
+        try:
+            conn.close_physical()
+        except Exception as e:
+            logging.error(f"Silent error caught: {str(e)}")
+        with self._lock:
+            self._created_connections = max(0, self._created_connections - 1)
+            self._stats['discarded_connections'] += 1
+            self._available.notify()
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledConnection:
+        """
+        Havuzdan bağlantı al; havuz doluysa `checkout_timeout` süresince bekle.
+        `timeout` verilirse bu kullanım için kilit bekleme süresi
+        (PRAGMA busy_timeout) olarak uygulanır; iade edilince havuz değerine döner.
+        """
+        self._check_process()
+        self._check_file()
+
+        if not self._idle and self._created_connections >= self.max_connections:
+            self._release_abandoned()
+
+        started = None
         conn = None
+        create = False
+        with self._lock:
+            self._stats['checkouts'] += 1
+            deadline = time.monotonic() + self.checkout_timeout
+            while True:
+                if self._idle:
+                    conn = self._idle.pop()
+                    break
+                if self._created_connections < self.max_connections:
+                    self._created_connections += 1
+                    self._stats['peak_connections'] = max(
+                        self._stats['peak_connections'], self._created_connections
+                    )
+                    create = True
+                    break
+                if started is None:
+                    started = time.monotonic()
+                    self._stats['waits'] += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._available.wait(remaining)
+
+            if started is not None:
+                waited_ms = (time.monotonic() - started) * 1000
+                self._stats['wait_time_total_ms'] += waited_ms
+                self._stats['wait_time_max_ms'] = max(self._stats['wait_time_max_ms'], waited_ms)
+
+        if create:
+            conn = self._create_connection()
+            if conn is None:
+                self._forget()
+                raise sqlite3.OperationalError(f"Bağlantı oluşturulamadı: {self.db_path}")
+            if self._file_id is None:
+                self._file_id = self._stat_file()
+        elif conn is None:
+            # Havuz dolu ve beklemede boşalmadı: isteği düşürmek yerine havuz dışı bağlantı aç
+            self.logger.warning(f"Bağlantı havuzu dolu, havuz dışı bağlantı açılıyor: {self.db_path}")
+            conn = self._create_connection(overflow=True)
+            if conn is None:
+                raise sqlite3.OperationalError(f"Bağlantı oluşturulamadı: {self.db_path}")
+            with self._lock:
+                self._stats['overflow_connections'] += 1
+
+        if timeout is not None and timeout != conn._busy_timeout:
+            conn.execute(f"PRAGMA busy_timeout={int(timeout * 1000)}")
+            conn._busy_timeout = timeout
+        conn._checked_out = True
+        if conn._pool is self:
+            with self._lock:
+                self._checked_out[id(conn)] = weakref.ref(conn)
+        return conn
+
+    def release(self, conn: PooledConnection) -> None:
+        """Bağlantıyı temiz durumda havuza geri ver"""
+        if not getattr(conn, '_checked_out', True) or getattr(conn, '_pool', None) is not self:
+            return
+        conn._checked_out = False
+        conn._request_depth = 0
+        with self._lock:
+            self._checked_out.pop(id(conn), None)
         try:
-            # Havuzdan bağlantı al
-            try:
-                conn = self._pool.get(timeout=5)
-            except queue.Empty:
-                # Havuz boşsa yeni bağlantı oluştur
-                conn = self._create_connection()
-                if not conn:
-                    raise Exception("Bağlantı havuzu dolu ve yeni bağlantı oluşturulamadı")
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = None
+            conn.text_factory = str
+            conn.isolation_level = ''
+            conn.execute("PRAGMA foreign_keys=OFF")
+            if conn._busy_timeout != self.timeout:
+                conn.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
+                conn._busy_timeout = self.timeout
+        except Exception:
+            # Bağlantı bozuksa at
+            self._discard(conn)
+            return
 
-            # Bağlantıyı test et
-            conn.execute("SELECT 1")
+        if self._pid != os.getpid():
+            return
 
-            yield conn
+        with self._lock:
+            if len(self._idle) < self.max_connections:
+                self._idle.append(conn)
+                self._available.notify()
+                return
 
+        self._discard(conn)
+
+    @contextmanager
+    def get_connection(self) -> None:
+        """Bağlantı havuzundan bağlantı al"""
+        conn = self.acquire()
+        try:
+            yield conn
         except Exception as e:
             self.logger.error(f"Bağlantı hatası: {e}")
-            if conn:
-                try:
-                    conn.rollback()
-                except Exception as e:
-                    logging.error(f"Silent error caught: {str(e)}")
+            try:
+                conn.rollback()
+            except Exception as e:
+                logging.error(f"Silent error caught: {str(e)}")
             raise
         finally:
-            # Bağlantıyı havuzuna geri ver
-            if conn:
-                try:
-                    # Bağlantıyı temizle
-                    conn.execute("PRAGMA optimize")
-                    self._pool.put(conn)
-                except Exception:
-                    # Bağlantı bozuksa yeni oluştur
-                    try:
-                        conn.close()
-                    except Exception as e:
-                        logging.error(f"Silent error caught: {str(e)}")
-                    self._created_connections -= 1
+            conn.close()
 
     def close_all(self) -> None:
         """Tüm bağlantıları kapat"""
         with self._lock:
-            while not self._pool.empty():
-                try:
-                    conn = self._pool.get_nowait()
-                    conn.close()
-                except Exception as e:
-                    logging.error(f"Silent error caught: {str(e)}")
-            self._created_connections = 0
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            try:
+                conn.execute("PRAGMA optimize")
+            except Exception as e:
+                logging.error(f"Silent error caught: {str(e)}")
+            self._discard(conn)
 
     def get_stats(self) -> dict:
         """Havuz istatistiklerini al"""
-        return {
-            "max_connections": self.max_connections,
-            "created_connections": self._created_connections,
-            "available_connections": self._pool.qsize(),
-            "db_path": self.db_path
-        }
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({
+                "max_connections": self.max_connections,
+                "created_connections": self._created_connections,
+                "open_connections": self._created_connections,
+                "available_connections": len(self._idle),
+                "in_use_connections": self._created_connections - len(self._idle),
+                "wait_time_avg_ms": (
+                    stats['wait_time_total_ms'] / stats['waits'] if stats['waits'] else 0.0
+                ),
+                "pid": self._pid,
+                "db_path": self.db_path,
+            })
+        return stats
+
 
 # Global connection pool instance
 _connection_pool: Optional[DatabaseConnectionPool] = None
 
+# DB yolu başına havuzlar (LRU)
+_pools: "OrderedDict[str, DatabaseConnectionPool]" = OrderedDict()
+_pools_lock = threading.Lock()
+
+
 def init_connection_pool(db_path: str, max_connections: int = 10) -> None:
     """Global bağlantı havuzunu başlat"""
     global _connection_pool
-    _connection_pool = DatabaseConnectionPool(db_path, max_connections)
+    _connection_pool = get_pool(db_path, max_connections)
+
 
 def get_connection_pool() -> Optional[DatabaseConnectionPool]:
     """Global bağlantı havuzunu al"""
     return _connection_pool
 
+
+def get_pool(db_path: str, max_connections: int = 10) -> DatabaseConnectionPool:
+    """Verilen DB yolu için süreç-yerel havuzu al (yoksa oluştur)"""
+    key = os.path.abspath(db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is not None:
+            _pools.move_to_end(key)
+            return pool
+        pool = DatabaseConnectionPool(db_path, max_connections)
+        _pools[key] = pool
+        evicted = []
+        while len(_pools) > MAX_POOLS:
+            evicted.append(_pools.popitem(last=False)[1])
+    for old in evicted:
+        old.close_all()
+    return pool
+
+
+def connect(db_path: str, timeout: Optional[float] = None, **kwargs) -> sqlite3.Connection:
+    """
+    `sqlite3.connect` yerine kullanılır; havuzdan bağlantı döndürür.
+
+    `close()` bağlantıyı havuza iade eder ve açık işlemi geri alır, yani
+    yeni açılmış bir bağlantıyla aynı davranışı korur. `timeout` havuzdaki
+    bağlantıya PRAGMA busy_timeout olarak uygulanır. Bellek içi DB'ler
+    ve havuzun desteklemediği parametreler için doğrudan bağlantı açılır.
+    """
+    if not POOL_ENABLED or kwargs or db_path == ':memory:' or str(db_path).startswith('file:'):
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        return sqlite3.connect(db_path, **kwargs)
+    return get_pool(db_path).acquire(timeout)
+
+
+def get_request_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Flask isteğine (flask.g) bağlı bağlantıyı döndür.
+
+    Aynı istek içindeki tüm çağrılar tek bağlantıyı paylaşır; `close()`
+    yalnızca iç içe kullanım sayacını azaltır. Bağlantı istek sonunda
+    `release_request_connections` ile havuza döner.
+    """
+    from flask import g, has_app_context
+
+    if not has_app_context() or not POOL_ENABLED:
+        return connect(db_path)
+
+    conns: Dict[str, PooledConnection] = g.setdefault('_db_pool_connections', {})
+    conn = conns.get(db_path)
+    if conn is None:
+        conn = connect(db_path)
+        conns[db_path] = conn
+    conn._request_depth = getattr(conn, '_request_depth', 0) + 1
+    return conn
+
+
+def release_request_connections(exc: Optional[BaseException] = None) -> None:
+    """flask teardown_appcontext: isteğe bağlı bağlantıları havuza iade et"""
+    from flask import g
+
+    conns = g.pop('_db_pool_connections', None)
+    if not conns:
+        return
+    for conn in conns.values():
+        try:
+            conn._request_depth = 0
+            conn.close()
+        except Exception as e:
+            logging.error(f"Silent error caught: {str(e)}")
+
+
+def get_pool_stats() -> List[dict]:
+    """Tüm havuzların sayaçları (izleme sayfası için)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [pool.get_stats() for pool in pools]
+
+
 @contextmanager
 def get_db_connection() -> None:
     """Global bağlantı havuzundan bağlantı al"""
@@ -146,9 +481,13 @@ def get_db_connection() -> None:
     with _connection_pool.get_connection() as conn:
         yield conn
 
+
 def close_connection_pool() -> None:
     """Global bağlantı havuzunu kapat"""
     global _connection_pool
-    if _connection_pool:
-        _connection_pool.close_all()
-        _connection_pool = None
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close_all()
+    _connection_pool = None
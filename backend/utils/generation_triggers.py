@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Generation Triggers
+Tetikleyicili paylaşılan nesil/sürüm sayaçları
+
+İzlenen tablolardaki her INSERT/UPDATE/DELETE, tetikleyiciyle sayaç
+tablosundaki ilgili anahtarın değerini artırır. Süreç içi cache'ler bu değeri
+okuyarak diğer worker'ların (veya doğrudan SQL'in) yaptığı değişiklikleri
+fark eder.
+
+Kullanım:
+    CATALOG_GENERATION = GenerationTriggers(
+        'esg_catalog_generation', 'id', 'generation',
+        {'gri_indicators': 1, 'tsrs_indicators': 1}, 'esg_catalog_generation')
+
+    existing, tracked = conn.execute(CATALOG_GENERATION.tracking_sql).fetchone()
+    if existing != tracked:
+        CATALOG_GENERATION.install(conn)  # commit çağırana aittir
+"""
+
+from typing import Dict, Set, Tuple, Union
+
+Key = Union[int, str]
+
+
+def _sql_literal(value: Key) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return "'" + value.replace("'", "''") + "'"
+
+
+class GenerationTriggers:
+    """Sayaç tablosu + izlenen tablo başına INSERT/UPDATE/DELETE tetikleyicileri"""
+
+    def __init__(self, counter_table: str, key_column: str, value_column: str,
+                 watched: Dict[str, Key], trigger_tag: str) -> None:
+        """
+        Args:
+            counter_table: Sayaç tablosu (anahtar -> değer)
+            key_column / value_column: Sayaç tablosunun sütunları
+            watched: İzlenen tablo -> artırılacak anahtar
+            trigger_tag: Tetikleyici adı trg_<tablo>_<tag>_<olay>
+        """
+        self.counter_table = counter_table
+        self.key_column = key_column
+        self.value_column = value_column
+        self.watched = dict(watched)
+        self.trigger_tag = trigger_tag
+        self.keys = tuple(dict.fromkeys(self.watched.values()))
+
+        key_type = 'INTEGER' if all(isinstance(key, int) for key in self.keys) else 'TEXT'
+        self.ddl = (
+            f"""CREATE TABLE IF NOT EXISTS {counter_table} (
+                {key_column} {key_type} PRIMARY KEY,
+                {value_column} INTEGER NOT NULL DEFAULT 0
+            )""",
+        )
+        self.values_sql = f"SELECT {key_column}, {value_column} FROM {counter_table}"
+        # Mevcut ve izlenen (tetikleyicisi olan) tablo sayısı
+        self.tracking_sql = (
+            "SELECT (SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN ("
+            + ','.join(_sql_literal(table) for table in self.watched)
+            + ")), "
+            "(SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name IN ("
+            + ','.join(_sql_literal(self.trigger_name(table)) for table in self.watched)
+            + "))"
+        )
+
+    def trigger_name(self, table: str, event: str = 'DELETE') -> str:
+        return f"trg_{table}_{self.trigger_tag}_{event.lower()}"
+
+    def _bump_sql(self, key: Key) -> str:
+        return (f"UPDATE {self.counter_table} SET {self.value_column} = {self.value_column} + 1 "
+                f"WHERE {self.key_column} = {_sql_literal(key)}")
+
+    def trigger_ddl(self, table: str) -> Tuple[str, ...]:
+        return tuple(
+            f"""CREATE TRIGGER IF NOT EXISTS {self.trigger_name(table, event)}
+                AFTER {event} ON {table}
+                BEGIN
+                    {self._bump_sql(self.watched[table])};
+                END"""
+            for event in ('INSERT', 'UPDATE', 'DELETE')
+        )
+
+    def install(self, conn) -> Set[Key]:
+        """
+        Sayaç tablosunu ve mevcut izlenen tabloların tetikleyicilerini kur
+        (commit çağırana aittir). Yeni tetikleyici kurulan anahtarların sayacı
+        artırılır; tablo sonradan oluşturulduysa o anahtarın cache'i geçersizleşir.
+        """
+        for statement in self.ddl:
+            conn.execute(statement)
+        conn.executemany(
+            f"INSERT OR IGNORE INTO {self.counter_table} ({self.key_column}, {self.value_column}) VALUES (?, 0)",
+            [(key,) for key in self.keys],
+        )
+        existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        tracked = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE ?",
+            (f"trg_%_{self.trigger_tag}_delete",),
+        )}
+        changed = set()
+        for table, key in self.watched.items():
+            if table in existing and self.trigger_name(table) not in tracked:
+                for statement in self.trigger_ddl(table):
+                    conn.execute(statement)
+                changed.add(key)
+        for key in changed:
+            conn.execute(self._bump_sql(key))
+        return changed
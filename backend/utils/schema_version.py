@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Schema Version
+Manager'ların oluşturucularındaki DDL yerine ucuz şema sürümü kontrolü.
+
+Şema artık deploy sırasında `modules/database/migration_manager.py` ile bir
+kez kurulur; migrasyon aracı her adımdan sonra `PRAGMA user_version`
+değerini uygulanan son migrasyon numarasına çeker. Manager'lar yalnızca bu
+değeri okur (yazma kilidi almaz):
+
+    from utils.schema_version import ensure_schema
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        ensure_schema(self.db_path, self._init_database)
+
+Veritabanı güncelse DDL metodu hiç çalışmaz. Migrasyonu yapılmamış (yerel,
+test, masaüstü) veritabanlarında eski davranış korunur ve metot çalışır.
+Bir manager'ın DDL'i değiştiğinde yeni bir migrasyon dosyası eklenmelidir.
+"""
+
+import logging
+import os
+from typing import Callable, Optional
+
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
+
+MIGRATIONS_DIR = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', 'modules', 'database', 'migrations'))
+
+_latest_version: Optional[int] = None
+
+
+def migration_files(migrations_dir: str = MIGRATIONS_DIR):
+    """(versiyon, dosya adı) listesi; format: 001_xxx.py"""
+    files = []
+    if not os.path.isdir(migrations_dir):
+        return files
+    for name in os.listdir(migrations_dir):
+        if not name.endswith('.py') or name.startswith('__'):
+            continue
+        try:
+            files.append((int(name.split('_')[0]), name))
+        except ValueError:
+            logging.warning(f"Geçersiz migrasyon dosya adı: {name}")
+    files.sort()
+    return files
+
+
+def latest_schema_version() -> int:
+    """Koddaki en yeni migrasyon numarası (süreç başına bir kez hesaplanır)"""
+    global _latest_version
+    if _latest_version is None:
+        files = migration_files()
+        _latest_version = files[-1][0] if files else 0
+    return _latest_version
+
+
+def get_schema_version(db_path: str) -> int:
+    """Veritabanının `PRAGMA user_version` değeri (okunamazsa 0)"""
+    if not db_path or db_path == ':memory:' or not os.path.exists(db_path):
+        return 0
+    try:
+        conn = db_connect(db_path)
+        try:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            conn.close()
+    except Exception as e:
+        logging.debug(f"Schema version read failed for {db_path}: {e}")
+        return 0
+
+
+def is_schema_current(db_path: str) -> bool:
+    latest = latest_schema_version()
+    return latest > 0 and get_schema_version(db_path) >= latest
+
+
+def ensure_schema(db_path: str, init_fn: Callable[[], None]) -> bool:
+    """
+    Şema güncel değilse `init_fn` (manager'ın eski DDL metodu) çalıştırılır.
+    DDL çalıştıysa True döner.
+    """
+    if is_schema_current(db_path):
+        return False
+    init_fn()
+    return True
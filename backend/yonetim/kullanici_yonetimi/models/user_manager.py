@@ -9,10 +9,15 @@ import json
 import logging
 import os
 import sqlite3
+import threading
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, Iterable, List, Optional
 
 from utils.language_manager import LanguageManager
+from utils.cache import user_permissions_cache
+from utils.db_pool import connect as db_connect
+from utils.schema_version import ensure_schema
 # from services.email_service import EmailService  # Eski/Yanlış import
 try:
     from backend.services.email_service import EmailService
@@ -23,6 +28,31 @@ from yonetim.security.core.crypto import hash_password as secure_hash_password
 from yonetim.security.core.crypto import verify_password_compat as secure_verify_password
 from config.database import DB_PATH
 
+# Yetki cache'i worker'lar arasında nesil sayacıyla tutarlı kalır: yetkiyi
+# etkileyen tablolardaki her değişiklik tetikleyiciyle sayacı artırır, diğer
+# worker'lar en geç PERMISSION_GENERATION_CHECK_INTERVAL saniyede cache'i düşürür.
+PERMISSION_GENERATION_CHECK_INTERVAL = 2.0
+PERMISSION_TABLES = ('user_roles', 'role_permissions', 'user_permissions', 'roles', 'permissions')
+
+PERMISSION_GENERATION_DDL = (
+    """CREATE TABLE IF NOT EXISTS permission_cache_generation (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        generation INTEGER NOT NULL DEFAULT 0
+    )""",
+    "INSERT OR IGNORE INTO permission_cache_generation (id, generation) VALUES (1, 0)",
+) + tuple(
+    f"""CREATE TRIGGER IF NOT EXISTS trg_{table}_permission_generation_{event.lower()}
+        AFTER {event} ON {table}
+        BEGIN
+            UPDATE permission_cache_generation SET generation = generation + 1 WHERE id = 1;
+        END"""
+    for table in PERMISSION_TABLES
+    for event in ('INSERT', 'UPDATE', 'DELETE')
+)
+
+_generation_lock = threading.Lock()
+_permission_generations: Dict[str, tuple] = {}  # db_path -> (generation | None, checked_at)
+
 
 class UserManager:
     """Kullanıcı Yönetimi Manager"""
@@ -36,7 +66,8 @@ class UserManager:
         # print(f"DEBUG: UserManager initialized with db_path: {self.db_path}", flush=True)
         logging.info(f"UserManager initialized with db_path: {self.db_path}")
         self.lm = LanguageManager()
-        self._ensure_schema()
+        ensure_schema(self.db_path, self._ensure_schema)
+        self._install_permission_generation()
         # Email servisini örnek olarak tut (testlerde patch edilebilsin)
         # Pass db_path to allow loading config from DB
         self.email_service = EmailService(db_path=self.db_path)
@@ -75,7 +106,7 @@ class UserManager:
 
     def get_user_company(self, user_id: int) -> Optional[int]:
         """Kullanıcının birincil şirket ID'sini döndür"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         try:
             # Önce birincil şirketi ara
@@ -170,7 +201,7 @@ class UserManager:
 
     def _ensure_schema(self) -> None:
         """Kullanıcı yönetimi şemasını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -540,7 +571,64 @@ class UserManager:
 
     def get_connection(self) -> sqlite3.Connection:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
+
+    # === YETKİ CACHE ===
+
+    def _permission_generation(self) -> Optional[int]:
+        """
+        Paylaşılan yetki nesli; en fazla PERMISSION_GENERATION_CHECK_INTERVAL
+        saniyede bir okunur. Değişmişse bu süreçteki yetki cache'i temizlenir.
+        Sayaç okunamıyorsa None döner ve cache devre dışı kalır.
+        """
+        now = time.monotonic()
+        cached = _permission_generations.get(self.db_path)
+        if cached and now - cached[1] < PERMISSION_GENERATION_CHECK_INTERVAL:
+            return cached[0]
+
+        generation = None
+        conn = self.get_connection()
+        try:
+            row = conn.execute("SELECT generation FROM permission_cache_generation WHERE id = 1").fetchone()
+            generation = row[0] if row else None
+        except sqlite3.Error as e:
+            logging.warning(f"Permission cache generation unavailable: {e}")
+        finally:
+            conn.close()
+
+        with _generation_lock:
+            previous = _permission_generations.get(self.db_path)
+            if previous and previous[0] != generation:
+                user_permissions_cache.clear()
+            _permission_generations[self.db_path] = (generation, now)
+        return generation
+
+    def _install_permission_generation(self) -> None:
+        """Sayaç tablosu ve tetikleyicileri kur (migrasyon öncesi veritabanları için; istek yolunda DDL yok)"""
+        conn = self.get_connection()
+        try:
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE type='trigger' AND name = ?",
+                            (f"trg_{PERMISSION_TABLES[-1]}_permission_generation_delete",)).fetchone():
+                return
+            for statement in PERMISSION_GENERATION_DDL:
+                conn.execute(statement)
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            logging.warning(f"Permission cache generation could not be installed: {e}")
+        finally:
+            conn.close()
+
+    def invalidate_user_permissions(self, user_ids: Optional[Iterable[int]] = None) -> None:
+        """Verilen kullanıcıların (None ise herkesin) yetki cache'ini sil"""
+        if user_ids is None:
+            user_permissions_cache.clear()
+        else:
+            user_permissions_cache.invalidate_users(user_ids, self.db_path)
+
+    def _users_with_role(self, cursor, role_id: int) -> List[int]:
+        cursor.execute("SELECT DISTINCT user_id FROM user_roles WHERE role_id = ?", (role_id,))
+        return [row[0] for row in cursor.fetchall()]
 
     def authenticate(self, username, password) -> Optional[Dict]:
         """Kullanıcı girişi doğrula"""
@@ -1027,6 +1115,7 @@ class UserManager:
             self._log_audit(cursor, updated_by, 'update', 'user', user_id, old_user, new_user, company_id=audit_company_id)
 
             conn.commit()
+            self.invalidate_user_permissions([user_id])
 
             return True
 
@@ -1090,6 +1179,7 @@ class UserManager:
                            {'is_active': True}, {'is_active': False}, company_id=audit_company_id)
 
             conn.commit()
+            self.invalidate_user_permissions([user_id])
 
             return True
 
@@ -1128,6 +1218,7 @@ class UserManager:
                            user, {})
 
             conn.commit()
+            self.invalidate_user_permissions([user_id])
 
             return True
 
@@ -1354,8 +1445,11 @@ class UserManager:
             cid = old_role.get('company_id') if old_role else (new_role.get('company_id') if new_role else None)
             
             self._log_audit(cursor, updated_by, "update", "role", role_id, old_role, new_role, company_id=cid)
-            
+
+            affected_users = self._users_with_role(cursor, role_id)
             conn.commit()
+            # Rol adı/aktifliği de yetki kümesini etkiler (admin rolleri tüm yetkileri alır)
+            self.invalidate_user_permissions(affected_users)
             return True
         except Exception as e:
             conn.rollback()
@@ -1394,8 +1488,10 @@ class UserManager:
                 {"is_active": False},
                 company_id=role.get('company_id')
             )
-            
+
+            affected_users = self._users_with_role(cursor, role_id)
             conn.commit()
+            self.invalidate_user_permissions(affected_users)
             return True
         except Exception as e:
             conn.rollback()
@@ -1441,7 +1537,9 @@ class UserManager:
                     """,
                     (role_id, pid, updated_by),
                 )
+            affected_users = self._users_with_role(cursor, role_id)
             conn.commit()
+            self.invalidate_user_permissions(affected_users)
             self._log_audit(cursor, updated_by, "update_permissions", "role", role_id, None, {"count": len(permission_ids)})
             return True
         except Exception as e:
@@ -1453,6 +1551,25 @@ class UserManager:
 
     def get_user_permissions(self, user_id: int) -> List[str]:
         """Kullanıcının yetkilerini getir"""
+        return sorted(self.get_permission_set(user_id))
+
+    def get_permission_set(self, user_id: int) -> FrozenSet[str]:
+        """Kullanıcının yetki kümesi; süreç içi cache'ten, yoksa veritabanından"""
+        generation = self._permission_generation()
+        if generation is not None:
+            cached = user_permissions_cache.get_permissions(user_id, self.db_path)
+            if cached is not None:
+                return cached
+
+        permissions = self._load_user_permissions(user_id)
+        if permissions is None:
+            # Okuma hatası cache'lenmez
+            return frozenset()
+        if generation is None:
+            return frozenset(permissions)
+        return user_permissions_cache.set_permissions(user_id, permissions, self.db_path)
+
+    def _load_user_permissions(self, user_id: int) -> Optional[List[str]]:
         conn = self.get_connection()
         cursor = conn.cursor()
 
@@ -1509,14 +1626,18 @@ class UserManager:
 
         except Exception as e:
             logging.error(self.lm.tr("log_user_permissions_fetch_error", "Kullanıcı yetkileri getirilirken hata: {}").format(e))
-            return []
+            return None
         finally:
             conn.close()
 
     def has_permission(self, user_id: int, permission_name: str) -> bool:
         """Kullanıcının belirli bir yetkiye sahip olup olmadığını kontrol et"""
-        user_permissions = self.get_user_permissions(user_id)
-        return permission_name in user_permissions
+        return permission_name in self.get_permission_set(user_id)
+
+    def has_permissions(self, user_id: int, permission_names: Iterable[str]) -> Dict[str, bool]:
+        """Birden fazla yetkiyi tek yetki kümesi okumasıyla kontrol et"""
+        permissions = self.get_permission_set(user_id)
+        return {name: name in permissions for name in permission_names}
 
     def get_departments(self) -> List[Dict]:
         """Departmanları getir"""
@@ -1924,7 +2045,7 @@ class UserManager:
 
     def get_all_roles(self) -> List[Dict]:
         """Tüm rolleri getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -1954,7 +2075,7 @@ class UserManager:
 
     def get_role_user_count(self, role_id: int) -> int:
         """Roldeki kullanıcı sayısını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -1973,7 +2094,7 @@ class UserManager:
 
     def get_role_permission_count(self, role_id: int) -> int:
         """Roldeki yetki sayısını getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -1992,7 +2113,7 @@ class UserManager:
 
     def get_role_users(self, role_id: int) -> List[Dict]:
         """Roldeki kullanıcıları getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
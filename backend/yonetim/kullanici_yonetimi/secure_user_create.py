@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import logging
+from utils.db_pool import connect as db_connect
 """
 GÜVENLİ KULLANICI OLUŞTURMA
 - Admin tarafından geçici şifre ile kullanıcı oluşturma
@@ -61,7 +62,7 @@ def audit_log(db_path: str, action: str, **kwargs) -> None:
         'success': kwargs.get('success'),
         'user_id': kwargs.get('user_id'),
     })
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     try:
         write_audit(conn, actor, action, details)
     finally:
@@ -151,7 +152,7 @@ def create_user_with_temp_password(
     # Şifreyi hash'le
     password_hash = hash_password(temp_password)
 
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     cur = conn.cursor()
 
     try:
@@ -1,20 +1,132 @@
 import logging
 import sqlite3
+import threading
+import time
 import jwt
 import uuid
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, Tuple
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 # Configuration (should be in env vars in production)
 JWT_SECRET = "SUSTAINAGE_SDG_LICENSE_SECRET_KEY_2025"
 JWT_ALGORITHM = "HS256"
 
+# Doğrulanmış lisans cache'i (süreç başına). Bir kayıt token'ın exp'ine,
+# LICENSE_CACHE_TTL'e ve paylaşılan nesil sayacına bağlıdır: licenses
+# tablosundaki her INSERT/UPDATE/DELETE tetikleyiciyle sayacı artırır, böylece
+# iptal hangi worker'da (veya doğrudan SQL ile) yapılırsa yapılsın en geç
+# GENERATION_CHECK_INTERVAL saniye içinde tüm worker'larda cache düşer.
+LICENSE_CACHE_TTL = 300
+GENERATION_CHECK_INTERVAL = 2.0
+LICENSE_CACHE_MAX_ENTRIES = 10000
+
+GENERATION_DDL = (
+    """CREATE TABLE IF NOT EXISTS license_cache_generation (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        generation INTEGER NOT NULL DEFAULT 0
+    )""",
+    "INSERT OR IGNORE INTO license_cache_generation (id, generation) VALUES (1, 0)",
+) + tuple(
+    f"""CREATE TRIGGER IF NOT EXISTS trg_licenses_generation_{event.lower()}
+        AFTER {event} ON licenses
+        BEGIN
+            UPDATE license_cache_generation SET generation = generation + 1 WHERE id = 1;
+        END"""
+    for event in ('INSERT', 'UPDATE', 'DELETE')
+)
+
+_cache_lock = threading.Lock()
+_verified = {}      # (db_path, license_key) -> (payload, cached_at, generation)
+_active_keys = {}   # (db_path, company_id) -> (license_key, cached_at, generation)
+_generations = {}   # db_path -> (generation | None, checked_at)
+_cache_stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+
+def invalidate_license_cache(db_path: str = None) -> None:
+    """Bu süreçteki lisans cache'ini sil (diğer worker'lar nesil sayacıyla düşürür)."""
+    with _cache_lock:
+        for store in (_verified, _active_keys):
+            for key in [k for k in store if db_path is None or k[0] == db_path]:
+                del store[key]
+        for key in [k for k in _generations if db_path is None or k == db_path]:
+            del _generations[key]
+        _cache_stats['invalidations'] += 1
+
+
+def get_license_cache_stats() -> Dict[str, Any]:
+    """İzleme sayfası için cache sayaçları"""
+    with _cache_lock:
+        stats = dict(_cache_stats)
+        stats['entries'] = len(_verified) + len(_active_keys)
+    lookups = stats['hits'] + stats['misses']
+    stats['hit_ratio'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+    return stats
+
+
 class LicenseManager:
     def __init__(self, db_path: str):
         self.db_path = db_path
 
     def _get_conn(self):
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
+
+    def _current_generation(self) -> Optional[int]:
+        """
+        Paylaşılan nesil sayacı; en fazla GENERATION_CHECK_INTERVAL saniyede bir okunur.
+        Sayaç tablosu kurulamıyorsa None döner ve cache devre dışı kalır.
+        """
+        now = time.monotonic()
+        cached = _generations.get(self.db_path)
+        if cached and now - cached[1] < GENERATION_CHECK_INTERVAL:
+            return cached[0]
+
+        generation = None
+        conn = self._get_conn()
+        try:
+            try:
+                row = conn.execute("SELECT generation FROM license_cache_generation WHERE id = 1").fetchone()
+            except sqlite3.OperationalError:
+                # Migrasyon öncesi oluşturulmuş veritabanı: sayaç ve tetikleyicileri kur
+                for statement in GENERATION_DDL:
+                    conn.execute(statement)
+                conn.commit()
+                row = conn.execute("SELECT generation FROM license_cache_generation WHERE id = 1").fetchone()
+            generation = row[0] if row else None
+        except sqlite3.Error as e:
+            conn.rollback()
+            logging.warning(f"License cache generation unavailable: {e}")
+        finally:
+            conn.close()
+
+        with _cache_lock:
+            previous = _generations.get(self.db_path)
+            if previous and previous[0] != generation:
+                _cache_stats['invalidations'] += 1
+            _generations[self.db_path] = (generation, now)
+        return generation
+
+    def _cache_get(self, store: Dict, key, generation: Optional[int]):
+        entry = store.get(key)
+        if generation is not None and entry and entry[2] == generation \
+                and time.monotonic() - entry[1] < LICENSE_CACHE_TTL:
+            return entry[0]
+        return None
+
+    def _cache_put(self, store: Dict, key, value, generation: Optional[int]) -> None:
+        if generation is None:
+            return
+        with _cache_lock:
+            if len(store) >= LICENSE_CACHE_MAX_ENTRIES:
+                store.clear()
+            store[key] = (value, time.monotonic(), generation)
+
+    def _count(self, hit: bool) -> None:
+        with _cache_lock:
+            _cache_stats['hits' if hit else 'misses'] += 1
 
     def generate_license(self, company_id: int, duration_days: int = 365, max_users: int = 5) -> Dict[str, Any]:
         """
@@ -42,6 +154,7 @@ class LicenseManager:
                 VALUES (?, ?, ?, ?, ?, 'active')
             """, (company_id, license_key, issued_at, expires_at, max_users))
             conn.commit()
+            invalidate_license_cache(self.db_path)
             
             return {
                 'success': True,
@@ -63,6 +176,14 @@ class LicenseManager:
         if not license_key:
             return False, "License key is missing", {}
 
+        cache_key = (self.db_path, license_key)
+        generation = self._current_generation()
+        payload = self._cache_get(_verified, cache_key, generation)
+        if payload is not None and payload.get('exp', float('inf')) > time.time():
+            self._count(True)
+            return True, "Valid license", dict(payload)
+        self._count(False)
+
         try:
             # 1. Decode and verify signature/expiry
             payload = jwt.decode(license_key, JWT_SECRET, algorithms=[JWT_ALGORITHM])
@@ -85,6 +206,8 @@ class LicenseManager:
             if payload.get('company_id') != db_company_id:
                 return False, "License company mismatch", {}
 
+            # Yalnızca geçerli sonuçlar cache'lenir (rastgele anahtarlar cache'i şişirmesin)
+            self._cache_put(_verified, cache_key, dict(payload), generation)
             return True, "Valid license", payload
             
         except jwt.ExpiredSignatureError:
@@ -97,6 +220,14 @@ class LicenseManager:
 
     def get_active_license(self, company_id: int) -> Optional[str]:
         """Retrieves the active license key for a company."""
+        cache_key = (self.db_path, company_id)
+        generation = self._current_generation()
+        license_key = self._cache_get(_active_keys, cache_key, generation)
+        if license_key is not None:
+            self._count(True)
+            return license_key
+        self._count(False)
+
         conn = self._get_conn()
         cursor = conn.cursor()
         cursor.execute("""
@@ -106,4 +237,6 @@ class LicenseManager:
         """, (company_id,))
         row = cursor.fetchone()
         conn.close()
+        if row:
+            self._cache_put(_active_keys, cache_key, row[0], generation)
         return row[0] if row else None
@@ -10,6 +10,10 @@ DİJİTAL GÜVENLİK VE DİJİTALLEŞME MODÜLÜ
 
 import sqlite3
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 class DigitalSecurityModule:
@@ -20,7 +24,7 @@ class DigitalSecurityModule:
 
     def create_digital_security_tables(self) -> None:
         """Dijital güvenlik tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Dijital güvenlik metrikleri tablosu
@@ -123,7 +127,7 @@ class DigitalSecurityModule:
                                     backup_frequency: str = None,
                                     disaster_recovery_plan: bool = False) -> int:
         """Dijital güvenlik metrikleri ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -153,7 +157,7 @@ class DigitalSecurityModule:
                                          digital_maturity_level: str = None,
                                          sdg_mapping: str = None) -> int:
         """Dijital dönüşüm projesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -177,7 +181,7 @@ class DigitalSecurityModule:
                                   financial_impact: float = None, lessons_learned: str = None,
                                   prevention_measures: str = None) -> int:
         """Siber güvenlik olayı ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -202,7 +206,7 @@ class DigitalSecurityModule:
                                   effectiveness_score: float = None, training_date: str = None,
                                   trainer: str = None) -> int:
         """Siber güvenlik eğitimi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -221,7 +225,7 @@ class DigitalSecurityModule:
 
     def get_digital_security_dashboard(self, company_id: int, period: str = None) -> Dict:
         """Dijital güvenlik dashboard verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Son dönem metrikleri
@@ -304,7 +308,7 @@ class DigitalSecurityModule:
 
     def get_digital_security_trends(self, company_id: int, years: int = 3) -> List[Dict]:
         """Dijital güvenlik trendlerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
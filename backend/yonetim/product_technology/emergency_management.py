@@ -10,6 +10,10 @@ ACİL DURUM VE AFET YÖNETİMİ MODÜLÜ
 
 import sqlite3
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 class EmergencyManagementModule:
@@ -20,7 +24,7 @@ class EmergencyManagementModule:
 
     def create_emergency_management_tables(self) -> None:
         """Acil durum yönetimi tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Acil durum metrikleri tablosu
@@ -141,7 +145,7 @@ class EmergencyManagementModule:
                              recovery_time_objective: float = None,
                              maximum_tolerable_downtime: float = None) -> int:
         """Acil durum metrikleri ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -169,7 +173,7 @@ class EmergencyManagementModule:
                            impact_score: int, mitigation_measures: str = None,
                            responsible_person: str = None, review_date: str = None) -> int:
         """Risk değerlendirmesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Risk seviyesini hesapla
@@ -203,7 +207,7 @@ class EmergencyManagementModule:
                            success_rate: float = None, lessons_learned: str = None,
                            improvement_areas: str = None, next_drill_date: str = None) -> int:
         """Acil durum tatbikatı ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -227,7 +231,7 @@ class EmergencyManagementModule:
                               financial_impact: float = None, lessons_learned: str = None,
                               prevention_measures: str = None) -> int:
         """Acil durum olayı ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -248,7 +252,7 @@ class EmergencyManagementModule:
 
     def get_emergency_management_dashboard(self, company_id: int, period: str = None) -> Dict:
         """Acil durum yönetimi dashboard verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Son dönem metrikleri
@@ -338,7 +342,7 @@ class EmergencyManagementModule:
 
     def get_risk_matrix(self, company_id: int) -> List[Dict]:
         """Risk matrisini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -10,6 +10,10 @@
 
 import sqlite3
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 class InnovationModule:
@@ -20,7 +24,7 @@ class InnovationModule:
 
     def create_innovation_tables(self) -> None:
         """İnovasyon tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # AR-GE metrikleri tablosu
@@ -96,7 +100,7 @@ class InnovationModule:
                               innovation_projects: int = 0,
                               sustainability_innovation_ratio: float = None) -> int:
         """İnovasyon metrikleri ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -123,7 +127,7 @@ class InnovationModule:
                               budget: float = None, sdg_mapping: str = None,
                               sustainability_focus: bool = False) -> int:
         """İnovasyon projesi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -146,7 +150,7 @@ class InnovationModule:
                                  status: str = None, description: str = None,
                                  sdg_mapping: str = None) -> int:
         """Fikri mülkiyet kaydı ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -165,7 +169,7 @@ class InnovationModule:
 
     def get_innovation_dashboard(self, company_id: int, period: str = None) -> Dict:
         """İnovasyon dashboard verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Son dönem metrikleri
@@ -242,7 +246,7 @@ class InnovationModule:
 
     def get_innovation_trends(self, company_id: int, years: int = 3) -> List[Dict]:
         """İnovasyon trendlerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
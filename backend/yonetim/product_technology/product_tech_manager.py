@@ -4,6 +4,7 @@ import sqlite3
 from datetime import datetime
 from typing import Dict, List
 from config.database import DB_PATH
+from utils.db_pool import connect as db_connect
 
 
 class ProductTechManager:
@@ -18,7 +19,7 @@ class ProductTechManager:
 
     def get_connection(self) -> None:
         """Veritabanı bağlantısı"""
-        return sqlite3.connect(self.db_path)
+        return db_connect(self.db_path)
 
     # AR-GE ve İnovasyon Metrikleri
     def save_innovation_metrics(self, company_id: int, rd_investment_ratio: float,
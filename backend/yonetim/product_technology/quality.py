@@ -10,6 +10,10 @@ KALİTE VE MÜŞTERİ MEMNUNİYETİ MODÜLÜ
 
 import sqlite3
 from typing import Dict, List
+try:
+    from utils.db_pool import connect as db_connect
+except ImportError:
+    from backend.utils.db_pool import connect as db_connect
 
 
 class QualityModule:
@@ -20,7 +24,7 @@ class QualityModule:
 
     def create_quality_tables(self) -> None:
         """Kalite tablolarını oluştur"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Kalite metrikleri tablosu
@@ -117,7 +121,7 @@ class QualityModule:
                            first_pass_yield: float = None,
                            supplier_quality_score: float = None) -> int:
         """Kalite metrikleri ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -143,7 +147,7 @@ class QualityModule:
                          issue_date: str = None, expiry_date: str = None,
                          scope: str = None) -> int:
         """Kalite sertifikası ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -167,7 +171,7 @@ class QualityModule:
                            detractor_percentage: float = None,
                            passive_percentage: float = None) -> int:
         """Müşteri anketi ekle"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -186,7 +190,7 @@ class QualityModule:
 
     def get_quality_dashboard(self, company_id: int, period: str = None) -> Dict:
         """Kalite dashboard verilerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Son dönem metrikleri
@@ -270,7 +274,7 @@ class QualityModule:
 
     def get_quality_trends(self, company_id: int, years: int = 3) -> List[Dict]:
         """Kalite trendlerini getir"""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("""
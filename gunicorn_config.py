@@ -1,5 +1,7 @@
 import multiprocessing
 import os
+import subprocess
+import sys
 
 # Gunicorn Configuration for Sustainage
 # Path: /var/www/sustainage/gunicorn_config.py
@@ -33,10 +35,36 @@ limit_request_field_size = 8190
 
 def on_starting(server):
     print("Starting Sustainage Gunicorn Server...")
+    # Şema migrasyonları worker'lar açılmadan master süreçte bir kez:
+    # SUSTAINAGE_MIGRATE_ON_START=1 ise uygulanır, aksi halde bekleyenler raporlanır.
+    command = 'apply' if os.environ.get('SUSTAINAGE_MIGRATE_ON_START') == '1' else 'status'
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          'backend', 'modules', 'database', 'migration_manager.py')
+    result = subprocess.run([sys.executable, script, command], capture_output=True, text=True)
+    for line in result.stdout.splitlines():
+        server.log.info("migrations: %s", line)
+    if result.returncode != 0:
+        server.log.warning("Schema migrations incomplete (exit %s): %s",
+                           result.returncode, result.stderr[-2000:])
+    # Çeviri paketleri (gzip/brotli) worker'lar yerine master'da bir kez sıkıştırılır
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools', 'build_translation_bundles.py')
+    result = subprocess.run([sys.executable, script], capture_output=True, text=True)
+    for line in result.stdout.splitlines():
+        server.log.info("%s", line)
+    if result.returncode != 0:
+        server.log.warning("Translation bundle build failed (exit %s): %s",
+                           result.returncode, result.stderr[-2000:])
 
 def post_fork(server, worker):
     server.log.info("Worker spawned (pid: %s)", worker.pid)
 
+def worker_exit(server, worker):
+    # Kuyrukta bekleyen log/audit kayıtlarını worker kapanmadan yaz
+    for name in ('core.async_db_writer', 'backend.core.async_db_writer'):
+        writer_module = sys.modules.get(name)
+        if writer_module is not None:
+            writer_module.shutdown_writers()
+
 def pre_exec(server):
     server.log.info("Forked child, re-executing.")
 
@@ -5,9 +5,13 @@ import logging
 SDG-GRI-TSRS Eşleştirme Modülü
 """
 
+import hashlib
 import os
+import pickle
 import sqlite3
-from typing import Dict, List
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 # from config.database import DB_PATH
@@ -15,6 +19,205 @@ DB_PATH = 'sustainage.db'
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+_BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+EXCEL_PATH = os.path.join(_BASE_DIR, 'SDG_232.xlsx')
+# Ayrıştırılmış indeksin disk cache'i; anahtar çalışma kitabının mtime/boyut ve SHA-256'sı
+INDEX_CACHE_PATH = os.environ.get(
+    'SUSTAINAGE_SDG_MAPPING_CACHE', os.path.join(_BASE_DIR, 'data', 'cache', 'sdg_mapping_index.pkl')
+)
+INDEX_CACHE_VERSION = 1
+# sdg_indicators referans tablosu çalışma anında nadiren değişir
+INDICATOR_CODES_TTL = 300
+
+_OPTIONAL_FIELDS = {
+    'gri_connection': 'GRI Bağlantısı',
+    'tsrs_connection': 'TSRS Bağlantısı',
+    'responsible_unit': 'Sorumlu Birim/Kişi',
+    'data_source': 'Veri Kaynağı',
+    'measurement_frequency': 'Ölçüm Sıklığı',
+}
+
+
+def _cell(row: Dict, column: str):
+    value = row.get(column)
+    return value if pd.notna(value) else ''
+
+
+class SDGMappingIndex:
+    """
+    SDG_232.xlsx'ten bir kez kurulan değişmez eşleştirme indeksi.
+    Hedef, alt hedef ve gösterge koduna göre O(1) erişim sağlar; sorular ve
+    GRI/TSRS bağlantıları önceden hesaplanır.
+    """
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self.frame = frame
+        self.by_goal: Dict[int, Tuple[int, ...]] = {}
+        self.by_target: Dict[str, Tuple[int, ...]] = {}
+        self.by_indicator: Dict[str, int] = {}
+        self.questions: Tuple[Tuple[Dict, ...], ...] = ()
+        self.gri_links: Tuple[Optional[Dict], ...] = ()
+        if frame.empty or 'SDG No' not in frame.columns:
+            return
+
+        by_goal: Dict[int, List[int]] = {}
+        by_target: Dict[str, List[int]] = {}
+        questions = []
+        gri_links = []
+        question_cols = [f'Soru {i}' if f'Soru {i}' in frame.columns else f'Question {i}' for i in range(1, 4)]
+
+        for pos, row in enumerate(frame.to_dict('records')):
+            sdg_val = row.get('SDG No')
+            sdg_no = int(sdg_val) if pd.notna(sdg_val) else None
+            target_code = row.get('Alt Hedef Kodu', '')
+            indicator_code = row.get('Gösterge Kodu', '')
+            if sdg_no is not None:
+                by_goal.setdefault(sdg_no, []).append(pos)
+            if pd.notna(target_code) and str(target_code).strip():
+                by_target.setdefault(str(target_code).strip(), []).append(pos)
+            if pd.notna(indicator_code) and str(indicator_code).strip():
+                self.by_indicator.setdefault(str(indicator_code).strip(), pos)
+
+            row_questions = []
+            for i, question_col in enumerate(question_cols, start=1):
+                val = row.get(question_col)
+                if pd.notna(val) and str(val).strip():
+                    question = {
+                        'sdg_no': sdg_no,
+                        'sdg_title': row.get('SDG Başlık', ''),
+                        'target_code': target_code,
+                        'target_title': row.get('Alt Hedef Tanımı (TR)', ''),
+                        'indicator_code': indicator_code,
+                        'indicator_title': row.get('Gösterge Tanımı (TR)', ''),
+                        'question_number': i,
+                        'question_text': val,
+                    }
+                    question.update({key: _cell(row, col) for key, col in _OPTIONAL_FIELDS.items()})
+                    row_questions.append(question)
+            questions.append(tuple(row_questions))
+
+            gri_links.append(None if sdg_no is None else {
+                'sdg_no': sdg_no,
+                'sdg_title': row.get('SDG Başlık', ''),
+                'indicator_code': indicator_code,
+                'indicator_title': row.get('Gösterge Tanımı (TR)', ''),
+                'target_code': target_code,
+                'target_title': row.get('Alt Hedef Tanımı (TR)', ''),
+                'gri_connection': _cell(row, 'GRI Bağlantısı'),
+                'tsrs_connection': _cell(row, 'TSRS Bağlantısı'),
+            })
+
+        self.by_goal = {goal: tuple(rows) for goal, rows in by_goal.items()}
+        self.by_target = {code: tuple(rows) for code, rows in by_target.items()}
+        self.questions = tuple(questions)
+        self.gri_links = tuple(gri_links)
+
+    def positions_for_goals(self, goal_ids: List[int]) -> List[int]:
+        """Seçilen hedeflerin satırları, çalışma kitabındaki sırayla"""
+        positions = []
+        for goal_id in dict.fromkeys(goal_ids):
+            try:
+                positions.extend(self.by_goal.get(int(goal_id), ()))
+            except (TypeError, ValueError):
+                continue
+        positions.sort()
+        return positions
+
+    def rows_for_target(self, target_code: str) -> pd.DataFrame:
+        return self.frame.iloc[list(self.by_target.get(str(target_code).strip(), ()))].copy()
+
+    def row_for_indicator(self, indicator_code: str) -> Optional[Dict]:
+        pos = self.by_indicator.get(str(indicator_code).strip())
+        return None if pos is None else self.frame.iloc[pos].to_dict()
+
+
+_index_lock = threading.Lock()
+_index_memo: Dict[str, Tuple[Tuple, SDGMappingIndex]] = {}
+_indicator_codes: Dict[str, Tuple[Dict[int, Tuple[str, ...]], float]] = {}
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_index_cache(cache_path: str, excel_path: str, stamp: Tuple) -> Optional[SDGMappingIndex]:
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.warning(f"SDG eşleştirme cache'i okunamadı: {e}")
+        return None
+    if not isinstance(cached, dict) or cached.get('version') != INDEX_CACHE_VERSION \
+            or cached.get('excel_path') != excel_path:
+        return None
+    if cached.get('stamp') == stamp:
+        return cached['index']
+    # mtime değişmiş ama içerik aynı olabilir (git checkout, kopyalama)
+    if cached.get('sha256') == _file_sha256(excel_path):
+        _write_index_cache(cache_path, excel_path, stamp, cached['sha256'], cached['index'])
+        return cached['index']
+    return None
+
+
+def _write_index_cache(cache_path: str, excel_path: str, stamp: Tuple, sha256: str,
+                       index: SDGMappingIndex) -> None:
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'version': INDEX_CACHE_VERSION, 'excel_path': excel_path, 'stamp': stamp,
+                         'sha256': sha256, 'index': index}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logging.warning(f"SDG eşleştirme cache'i yazılamadı: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def get_mapping_index(excel_path: str = EXCEL_PATH, cache_path: Optional[str] = INDEX_CACHE_PATH) -> SDGMappingIndex:
+    """
+    Süreç genelinde paylaşılan eşleştirme indeksi. Çalışma kitabı değişmedikçe
+    bellekteki indeks döner; yeni süreçler Excel yerine disk cache'inden yükler.
+    """
+    try:
+        st = os.stat(excel_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        logging.info(f"Excel dosyası bulunamadı: {excel_path}")
+        return SDGMappingIndex(pd.DataFrame())
+
+    memo = _index_memo.get(excel_path)
+    if memo and memo[0] == stamp:
+        return memo[1]
+
+    with _index_lock:
+        memo = _index_memo.get(excel_path)
+        if memo and memo[0] == stamp:
+            return memo[1]
+
+        index = _read_index_cache(cache_path, excel_path, stamp) if cache_path else None
+        if index is None:
+            index = SDGMappingIndex(SDGGRIMapping.read_workbook(excel_path))
+            if cache_path and not index.frame.empty:
+                _write_index_cache(cache_path, excel_path, stamp, _file_sha256(excel_path), index)
+        _index_memo[excel_path] = (stamp, index)
+        return index
+
+
+def invalidate_mapping_index() -> None:
+    """Bellekteki indeksleri düşür (disk cache'i anahtarıyla kendini doğrular)"""
+    with _index_lock:
+        _index_memo.clear()
+        _indicator_codes.clear()
+
 
 class SDGGRIMapping:
     """SDG-GRI-TSRS eşleştirme yöneticisi"""
@@ -25,27 +228,20 @@ class SDGGRIMapping:
             db_path = os.path.join(base_dir, db_path)
         self.db_path = db_path
 
-        # Excel dosyasından veri yükle
-        self.excel_data = self.load_excel_data()
+        # Excel her örnekte yeniden okunmaz; paylaşılan indeks kullanılır
+        self.index = get_mapping_index()
+        self.excel_data = self.index.frame
 
     def load_excel_data(self) -> pd.DataFrame:
-        """Excel dosyasından SDG verilerini yükle"""
-        # Proje kökünden SDG_232.xlsx dosyasını hedefle
-        base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-        # Config'den Excel path al
-        try:
-            # from config.app_config import get_config
-            # config = get_config()
-            # excel_path = config.get_excel_path()
-            excel_path = os.path.join(base_dir, 'SDG_232.xlsx')
-        except Exception:
-            # Fallback
-            excel_path = os.path.join(base_dir, 'SDG_232.xlsx')
+        """Excel dosyasından SDG verilerini yükle (paylaşılan indeks üzerinden)"""
+        return get_mapping_index().frame
 
-        # Alternatif olarak mutlak konumdaki dosyayı deneyelim
+    @staticmethod
+    def read_workbook(excel_path: str) -> pd.DataFrame:
+        """Çalışma kitabını ayrıştırıp kolonları normalize et"""
         if not os.path.exists(excel_path):
-             logging.info(f"Excel dosyası bulunamadı: {excel_path}")
-             return pd.DataFrame()
+            logging.info(f"Excel dosyası bulunamadı: {excel_path}")
+            return pd.DataFrame()
 
         # Öncelikle MASTER_232 sayfasını okumayı dene, olmazsa varsayılanı dene
         try:
@@ -58,18 +254,20 @@ class SDGGRIMapping:
                 return pd.DataFrame()
 
         # Kolon adlarını normalize et
-        df = self._normalize_excel_columns(df)
+        df = SDGGRIMapping._normalize_excel_columns(df)
 
         logging.info(f"Excel verisi yüklendi: {len(df)} gösterge")
         return df
 
-    def _find_col(self, df: pd.DataFrame, candidates: List[str]) -> str:
+    @staticmethod
+    def _find_col(df: pd.DataFrame, candidates: List[str]) -> str:
         for c in candidates:
             if c in df.columns:
                 return c
         return ''
 
-    def _normalize_excel_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+    @staticmethod
+    def _normalize_excel_columns(df: pd.DataFrame) -> pd.DataFrame:
         """Excel kolonlarını dahili standart isimlere eşle"""
         if df.empty:
             return df
@@ -123,7 +321,7 @@ class SDGGRIMapping:
 
         rename_map = {}
         for canon, candidates in mapping_candidates.items():
-            found = self._find_col(df, candidates)
+            found = SDGGRIMapping._find_col(df, candidates)
             if found and found != canon:
                 rename_map[found] = canon
 
@@ -161,11 +359,11 @@ class SDGGRIMapping:
         if self.excel_data.empty:
             return pd.DataFrame()
 
+        if self.index.by_goal:
+            return self.excel_data.iloc[self.index.positions_for_goals(selected_goal_ids)].copy()
+
         # Seçilen SDG hedeflerine ait göstergeleri filtrele
-        sdg_col = 'SDG No' if 'SDG No' in self.excel_data.columns else ''
-        if not sdg_col:
-            # En azından bir eş başlık bulmayı dene
-            sdg_col = self._find_col(self.excel_data, ['Sürdürülebilir Kalkınma Hedefi No:', 'Hedef No', 'Goal No', 'SDG'])
+        sdg_col = self._find_col(self.excel_data, ['Sürdürülebilir Kalkınma Hedefi No:', 'Hedef No', 'Goal No', 'SDG'])
         if not sdg_col:
             logging.error("Excel veri hatası: SDG kolonunu bulamadım")
             return pd.DataFrame()
@@ -175,31 +373,10 @@ class SDGGRIMapping:
 
     def get_questions_for_goals(self, selected_goal_ids: List[int]) -> List[Dict]:
         """Seçilen hedefler için soruları getir"""
-        indicators = self.get_indicators_for_selected_goals(selected_goal_ids)
-
         questions = []
-        for _, row in indicators.iterrows():
-            # Her gösterge için 3 soru
-            for i in range(1, 4):
-                question_col = f'Soru {i}' if f'Soru {i}' in indicators.columns else f'Question {i}'
-                val = row.get(question_col)
-                if pd.notna(val) and str(val).strip():
-                    questions.append({
-                        'sdg_no': int(row.get('SDG No')) if pd.notna(row.get('SDG No')) else None,
-                        'sdg_title': row.get('SDG Başlık', ''),
-                        'target_code': row.get('Alt Hedef Kodu', ''),
-                        'target_title': row.get('Alt Hedef Tanımı (TR)', ''),
-                        'indicator_code': row.get('Gösterge Kodu', ''),
-                        'indicator_title': row.get('Gösterge Tanımı (TR)', ''),
-                        'question_number': i,
-                        'question_text': val,
-                        'gri_connection': row.get('GRI Bağlantısı') if pd.notna(row.get('GRI Bağlantısı')) else '',
-                        'tsrs_connection': row.get('TSRS Bağlantısı') if pd.notna(row.get('TSRS Bağlantısı')) else '',
-                        'responsible_unit': row.get('Sorumlu Birim/Kişi') if pd.notna(row.get('Sorumlu Birim/Kişi')) else '',
-                        'data_source': row.get('Veri Kaynağı') if pd.notna(row.get('Veri Kaynağı')) else '',
-                        'measurement_frequency': row.get('Ölçüm Sıklığı') if pd.notna(row.get('Ölçüm Sıklığı')) else ''
-                    })
-
+        for pos in self.index.positions_for_goals(selected_goal_ids):
+            # Her gösterge için en fazla 3 soru, indekste hazır
+            questions.extend(dict(q) for q in self.index.questions[pos])
         return questions
 
     def get_total_questions_count(self, selected_goal_ids: List[int]) -> int:
@@ -209,47 +386,32 @@ class SDGGRIMapping:
 
     def get_gri_mapping_for_goals(self, selected_goal_ids: List[int]) -> Dict:
         """Seçilen hedefler için GRI eşleştirmelerini getir"""
-        indicators = self.get_indicators_for_selected_goals(selected_goal_ids)
-
         gri_mapping = {}
 
-        for _, row in indicators.iterrows():
-            sdg_no_val = row.get('SDG No')
-            try:
-                sdg_no = int(sdg_no_val) if pd.notna(sdg_no_val) else None
-            except Exception:
-                sdg_no = None
-            gri_connection = row.get('GRI Bağlantısı') if pd.notna(row.get('GRI Bağlantısı')) else ''
-            tsrs_connection = row.get('TSRS Bağlantısı') if pd.notna(row.get('TSRS Bağlantısı')) else ''
-
-            if sdg_no is None:
+        for pos in self.index.positions_for_goals(selected_goal_ids):
+            link = self.index.gri_links[pos]
+            if link is None:
                 continue
+            sdg_no = link['sdg_no']
             if sdg_no not in gri_mapping:
                 gri_mapping[sdg_no] = {
-                    'sdg_title': row.get('SDG Başlık', ''),
+                    'sdg_title': link['sdg_title'],
                     'indicators': [],
-                    'gri_standards': set(),
-                    'tsrs_standards': set()
+                    'gri_standards': {},
+                    'tsrs_standards': {}
                 }
 
-            gri_mapping[sdg_no]['indicators'].append({
-                'indicator_code': row.get('Gösterge Kodu', ''),
-                'indicator_title': row.get('Gösterge Tanımı (TR)', ''),
-                'target_code': row.get('Alt Hedef Kodu', ''),
-                'target_title': row.get('Alt Hedef Tanımı (TR)', ''),
-                'gri_connection': gri_connection,
-                'tsrs_connection': tsrs_connection
-            })
-
-            if gri_connection:
-                gri_mapping[sdg_no]['gri_standards'].add(gri_connection)
-            if tsrs_connection:
-                gri_mapping[sdg_no]['tsrs_standards'].add(tsrs_connection)
+            entry = gri_mapping[sdg_no]
+            entry['indicators'].append({key: value for key, value in link.items() if key not in ('sdg_no', 'sdg_title')})
+            if link['gri_connection']:
+                entry['gri_standards'][link['gri_connection']] = None
+            if link['tsrs_connection']:
+                entry['tsrs_standards'][link['tsrs_connection']] = None
 
-        # Set'leri list'e çevir
-        for sdg_no in gri_mapping:
-            gri_mapping[sdg_no]['gri_standards'] = list(gri_mapping[sdg_no]['gri_standards'])
-            gri_mapping[sdg_no]['tsrs_standards'] = list(gri_mapping[sdg_no]['tsrs_standards'])
+        # Tekilleştirilmiş standartları (ilk görülme sırasıyla) listeye çevir
+        for entry in gri_mapping.values():
+            entry['gri_standards'] = list(entry['gri_standards'])
+            entry['tsrs_standards'] = list(entry['tsrs_standards'])
 
         return gri_mapping
 
@@ -343,21 +505,37 @@ class SDGGRIMapping:
         if not goal_ids:
             return []
 
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        codes_by_goal = self._indicator_codes_by_goal()
+        if codes_by_goal is None:
+            return []
+        codes = []
+        for goal_id in dict.fromkeys(goal_ids):
+            codes.extend(codes_by_goal.get(goal_id, ()))
+        return list(dict.fromkeys(codes))
+
+    def _indicator_codes_by_goal(self) -> Optional[Dict[int, Tuple[str, ...]]]:
+        """Hedef -> gösterge kodları; tek sorguyla kurulur, INDICATOR_CODES_TTL boyunca paylaşılır"""
+        cached = _indicator_codes.get(self.db_path)
+        if cached and time.monotonic() - cached[1] < INDICATOR_CODES_TTL:
+            return cached[0]
 
+        conn = self.get_connection()
         try:
-            placeholders = ','.join('?' * len(goal_ids))
-            cursor.execute(f"""
-                SELECT DISTINCT si.code 
+            rows = conn.execute("""
+                SELECT DISTINCT st.goal_id, si.code
                 FROM sdg_indicators si
                 JOIN sdg_targets st ON si.target_id = st.id
-                WHERE st.goal_id IN ({placeholders})
-            """, goal_ids)
-
-            return [row[0] for row in cursor.fetchall()]
+            """).fetchall()
         except Exception as e:
             logging.error(f"SDG gösterge kodları getirilirken hata: {e}")
-            return []
+            return None
         finally:
             conn.close()
+
+        grouped: Dict[int, List[str]] = {}
+        for goal_id, code in rows:
+            grouped.setdefault(goal_id, []).append(code)
+        codes_by_goal = {goal_id: tuple(codes) for goal_id, codes in grouped.items()}
+        with _index_lock:
+            _indicator_codes[self.db_path] = (codes_by_goal, time.monotonic())
+        return codes_by_goal
@@ -0,0 +1,74 @@
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.async_db_writer import AsyncDBWriter
+from core.db_log_handler import DBLogHandler
+from core.enhanced_audit_logger import EnhancedAuditLogger
+from utils.db_pool import connect
+
+
+class TestAsyncDBWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'logs.db')
+        conn = connect(self.db_path)
+        conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v INTEGER NOT NULL)")
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _count(self, sql):
+        conn = connect(self.db_path)
+        value = conn.execute(sql).fetchone()[0]
+        conn.close()
+        return value
+
+    def test_batches_flush_and_bad_rows(self):
+        writer = AsyncDBWriter(self.db_path, batch_size=50, flush_interval=10)
+        for i in range(120):
+            writer.submit("INSERT INTO t (v) VALUES (?)", (i,))
+        writer.submit("INSERT INTO t (v) VALUES (?)", (None,))  # NOT NULL ihlali
+        self.assertTrue(writer.flush())
+
+        self.assertEqual(self._count("SELECT COUNT(*) FROM t"), 120)
+        stats = writer.get_stats()
+        self.assertEqual((stats['submitted'], stats['written'], stats['errors']), (121, 120, 1))
+        self.assertEqual(stats['max_batch'], 50)
+
+        writer.close()
+        self.assertFalse(writer.submit("INSERT INTO t (v) VALUES (?)", (1,)))
+        self.assertEqual(writer.get_stats()['dropped'], 1)
+
+    def test_full_queue_drops(self):
+        writer = AsyncDBWriter(self.db_path, max_queue=1)
+        writer._ensure_thread = lambda: None  # thread başlatılmadan kuyruk dolsun
+        self.assertTrue(writer.submit("INSERT INTO t (v) VALUES (?)", (1,)))
+        self.assertFalse(writer.submit("INSERT INTO t (v) VALUES (?)", (2,)))
+        self.assertEqual(writer.get_stats()['dropped'], 1)
+
+    def test_log_handler_and_audit_logger(self):
+        writer = AsyncDBWriter(self.db_path, flush_interval=10)
+        handler = DBLogHandler(self.db_path, writer=writer)
+        record = logging.LogRecord('app.test', logging.WARNING, __file__, 1, 'disk dolu', None, None)
+        handler.emit(record)
+        handler.flush()
+        self.assertEqual(self._count("SELECT COUNT(*) FROM system_logs WHERE message = 'disk dolu'"), 1)
+
+        audit = EnhancedAuditLogger(self.db_path, writer=writer)
+        self.assertTrue(audit.log('user_delete', actor_username='admin'))
+        logs = audit.get_logs(limit=5)  # bekleyen kayıt da okunur
+        self.assertEqual([(l['action'], l['is_critical']) for l in logs], [('user_delete', 1)])
+        writer.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.modules.analytics.advanced_forecasting import AdvancedForecasting
+from utils.db_pool import connect
+
+YEARS = list(range(2016, 2024))
+
+
+class TestBatchForecasting(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'forecast.db')
+        self.forecasting = AdvancedForecasting(self.db_path)
+
+        rng = np.random.default_rng(7)
+        self.values = rng.normal(100, 20, (6, len(YEARS))) + np.arange(len(YEARS)) * 3
+        self.mask = np.ones_like(self.values, dtype=bool)
+        self.mask[1, [0, 3, 6]] = False          # boşluklu seri
+        self.mask[2, :] = False
+        self.mask[2, [2, 5]] = True              # yalnızca iki gözlem (MA yok)
+        self.mask[3, :] = False                  # hiç veri yok
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _history(self, i):
+        return [{'year': year, 'value': float(self.values[i, j])}
+                for j, year in enumerate(YEARS) if self.mask[i, j]]
+
+    def test_batch_matches_per_metric_methods(self):
+        result = self.forecasting.batch_forecast(self.values, YEARS, self.mask, forecast_years=3)
+
+        for i in range(len(self.values)):
+            history = self._history(i)
+            expected = {
+                'linear_regression': self.forecasting.linear_regression_forecast(history, 3),
+                'moving_average': self.forecasting.moving_average_forecast(history, 3, 3),
+                'exponential_smoothing': self.forecasting.exponential_smoothing_forecast(history, 0.3, 3),
+            }
+            for key, forecasts in expected.items():
+                self.assertEqual(bool(result[key]['valid'][i]), bool(forecasts), f"{key} satır {i}")
+                for h, item in enumerate(forecasts):
+                    self.assertEqual(result['years'][i][h], item['year'])
+                    self.assertAlmostEqual(result[key]['forecast'][i][h], item['forecast_value'], delta=0.006)
+                    if 'confidence_upper' in item:
+                        self.assertAlmostEqual(result[key]['upper'][i][h], item['confidence_upper'], delta=0.006)
+            if history:
+                ensemble = self.forecasting.ensemble_forecast(history, 3)['ensemble_average']
+                for h, item in enumerate(ensemble):
+                    self.assertAlmostEqual(result['ensemble']['forecast'][i][h], item['forecast_value'], delta=0.006)
+
+        self.assertFalse(result['ensemble']['valid'][3])
+        self.assertFalse(result['moving_average']['valid'][2])
+        self.assertTrue(result['linear_regression']['valid'][2])
+
+    def test_forecast_all_metrics_loads_and_saves_in_bulk(self):
+        conn = connect(self.db_path)
+        conn.executemany(
+            "INSERT INTO trend_data (company_id, metric_code, year, actual_value) VALUES (1, ?, ?, ?)",
+            [(f"M{i}", year, float(self.values[i, j]))
+             for i in range(3) for j, year in enumerate(YEARS) if self.mask[i, j]]
+        )
+        conn.commit()
+        conn.close()
+
+        outcome = self.forecasting.forecast_all_metrics(1, forecast_years=2)
+        self.assertEqual(outcome['metric_codes'], ['M0', 'M1', 'M2'])
+        # M0, M1: 4 yöntem; M2: MA yok -> 3 yöntem; her biri 2 yıl
+        self.assertEqual(outcome['saved'], (4 + 4 + 3) * 2)
+
+        conn = connect(self.db_path)
+        rows = conn.execute("""SELECT forecast_method, forecast_value, confidence_interval_lower
+                               FROM forecast_results WHERE metric_code = 'M0' AND forecast_year = 2024""").fetchall()
+        conn.close()
+        methods = {row[0]: row for row in rows}
+        self.assertEqual(set(methods), {'Linear Regression', 'Moving Average (3 yil)',
+                                        'Exponential Smoothing (alpha=0.3)', 'Ensemble (Weighted Average)'})
+        expected = self.forecasting.linear_regression_forecast(self._history(0), 1)[0]
+        self.assertAlmostEqual(methods['Linear Regression'][1], expected['forecast_value'], delta=0.011)
+        self.assertIsNone(methods['Exponential Smoothing (alpha=0.3)'][2])
+
+        # Tekrar çalıştırma aynı satırları günceller
+        self.assertEqual(self.forecasting.forecast_all_metrics(1, forecast_years=2)['saved'], 22)
+        conn = connect(self.db_path)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM forecast_results").fetchone()[0], 22)
+        conn.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.modules.environmental.carbon_calculator import CarbonCalculator, year_range
+from utils.db_pool import connect
+
+
+class TestCarbonSummary(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'carbon.db')
+        self.calc = CarbonCalculator(self.db_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _summary_rows(self):
+        conn = connect(self.db_path)
+        rows = conn.execute("""
+            SELECT company_id, year, scope1_total, scope2_total, scope3_total, total_emissions
+            FROM carbon_summary ORDER BY company_id, year
+        """).fetchall()
+        conn.close()
+        return rows
+
+    def test_incremental_summary_matches_rebuild(self):
+        fuel = self.calc.calculate_scope1_fuel('diesel', 100)          # 268 kg
+        power = self.calc.calculate_scope2_electricity(1000)           # 434 kg
+        id1 = self.calc.save_emission(1, fuel, '2024-03-01', '2024-03-31')
+        id2 = self.calc.save_emission(1, power, '2024-12-01', '2024-12-31')
+        self.calc.save_emission(1, fuel, '2025-01-01', '2025-01-31')
+        self.calc.save_emission(2, power, '2024-06-01')
+
+        self.assertEqual(self.calc.get_company_summary(1, 2024)['total_kg'], 702.0)
+
+        self.assertTrue(self.calc.update_emission(id2, period_start='2025-02-01'))
+        self.assertTrue(self.calc.delete_emission(id1))
+        self.assertFalse(self.calc.delete_emission(id1))
+
+        self.assertEqual(self.calc.get_company_summary(1, 2024)['total_kg'], 0)
+        summary_2025 = self.calc.get_company_summary(1, 2025)
+        self.assertEqual((summary_2025['scope1_kg'], summary_2025['scope2_kg']), (268.0, 434.0))
+
+        incremental = [r for r in self._summary_rows() if r[5]]
+        self.assertEqual(self.calc.rebuild_summary(), 2)
+        self.assertEqual(self._summary_rows(), incremental)
+
+    def test_string_scope_is_counted_like_rebuild(self):
+        fuel = dict(self.calc.calculate_scope1_fuel('diesel', 100), scope='1')   # 268 kg
+        self.calc.save_emission(1, fuel, '2024-03-01')
+        self.calc.save_emission(1, dict(fuel, scope='x'), '2024-04-01')
+
+        summary = self.calc.get_company_summary(1, 2024)
+        self.assertEqual((summary['scope1_kg'], summary['total_kg']), (268.0, 268.0))
+        incremental = self._summary_rows()
+        self.calc.rebuild_summary()
+        self.assertEqual(self._summary_rows(), incremental)
+
+    def test_category_breakdown_uses_year_range(self):
+        self.assertEqual(year_range(2024), ('2024-01-01', '2025-01-01'))
+        fuel = self.calc.calculate_scope1_fuel('diesel', 10)
+        self.calc.save_emission(1, fuel, '2024-12-31')
+        self.calc.save_emission(1, fuel, '2025-01-01')
+
+        breakdown = self.calc.get_category_breakdown(1, 2024)
+        self.assertEqual([b['count'] for b in breakdown], [1])
+
+        conn = connect(self.db_path)
+        plan = ' '.join(str(r) for r in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT SUM(co2e_kg) FROM carbon_emissions "
+            "WHERE company_id = ? AND period_start >= ? AND period_start < ?", (1, *year_range(2024))))
+        conn.close()
+        self.assertIn('idx_carbon_emissions_company_period', plan)
+
+
+if __name__ == '__main__':
+    unittest.main()
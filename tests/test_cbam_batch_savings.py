@@ -0,0 +1,99 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.modules.cbam.cbam_calculator import CBAMCalculator
+from utils.db_pool import connect
+
+SCHEMA = (
+    """CREATE TABLE cbam_products (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, company_id INTEGER NOT NULL, period INTEGER NOT NULL,
+        product_code TEXT NOT NULL, product_name TEXT, cbam_sector TEXT NOT NULL,
+        baseline_emission_intensity REAL NOT NULL, post_innovation_emission_intensity REAL,
+        trade_volume_tons REAL NOT NULL, domestic_carbon_price_eur_per_tco2 REAL DEFAULT 0,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP, UNIQUE(company_id, period, product_code))""",
+    """CREATE TABLE cbam_factors (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, period INTEGER NOT NULL UNIQUE,
+        eu_ets_price_eur_per_tco2 REAL NOT NULL, notes TEXT)""",
+    """CREATE TABLE cbam_innovation_links (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, company_id INTEGER NOT NULL, period INTEGER NOT NULL,
+        product_code TEXT NOT NULL, innovation_share_ratio REAL NOT NULL, attenuation_factor REAL DEFAULT 0.6,
+        UNIQUE(company_id, period, product_code))""",
+    """CREATE TABLE innovation_metrics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, company_id INTEGER, period TEXT, sustainability_innovation_ratio REAL)""",
+)
+
+
+class TestCBAMBatchSavings(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'cbam.db')
+        conn = connect(self.db_path)
+        for statement in SCHEMA:
+            conn.execute(statement)
+        conn.executemany("INSERT INTO cbam_factors (period, eu_ets_price_eur_per_tco2) VALUES (?, ?)",
+                         [(2024, 80.0), (2025, 100.0)])
+        conn.execute("INSERT INTO innovation_metrics (company_id, period, sustainability_innovation_ratio) "
+                     "VALUES (1, '2024', 50)")
+        conn.executemany("""INSERT INTO cbam_products (company_id, period, product_code, cbam_sector,
+                            baseline_emission_intensity, post_innovation_emission_intensity, trade_volume_tons,
+                            domestic_carbon_price_eur_per_tco2) VALUES (1, ?, ?, 'steel', ?, ?, ?, ?)""",
+                         [(2024, '7208', 2.0, None, 100.0, 0.0),
+                          (2024, '7601', 1.0, 0.5, 10.0, 0.2),
+                          (2025, '7208', 2.0, None, 100.0, 0.0),
+                          (2026, '7208', 2.0, None, 100.0, 0.0)])
+        conn.execute("INSERT INTO cbam_innovation_links (company_id, period, product_code, innovation_share_ratio, "
+                     "attenuation_factor) VALUES (1, 2025, '7208', 0.5, 0.8)")
+        conn.commit()
+        conn.close()
+        self.calculator = CBAMCalculator(self.db_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_periods_and_price_scenarios_in_one_run(self):
+        result = self.calculator.compute_cbam_savings_batch(1, [2024, 2025, 2026], eu_ets_prices=[50.0, 100.0])
+
+        p2024 = result['periods'][2024]
+        products = {p['product_code']: p for p in p2024['products']}
+        # Bağlantı yok: şirket oranı 0.5 × 0.6 -> E_post = 2.0 × 0.7
+        self.assertEqual(products['7208']['e_post_innovation'], 1.4)
+        self.assertEqual(products['7208']['saving_eur'], round((2.0 - 1.4) * 80.0 * 100, 2))
+        # Kayıtlı E_post korunur; yurt içi fiyat düşülür
+        self.assertEqual(products['7601']['cbam_cost_post_eur'], round(0.3 * 80.0 * 10, 2))
+        self.assertEqual(p2024['total_saving_eur'], round(4800.0 + 400.0, 2))
+
+        p2025 = result['periods'][2025]['products'][0]
+        self.assertEqual((p2025['innovation_ratio'], p2025['attenuation_factor']), (0.5, 0.8))
+        self.assertEqual(p2025['e_post_innovation'], 1.2)
+        self.assertEqual(result['periods'][2026]['error'], 'EU ETS fiyatı tanımlı değil')
+
+        sensitivity = {(row['period'], row['eu_ets_price']): row for row in result['sensitivity']}
+        self.assertEqual(len(sensitivity), 6)
+        self.assertEqual(sensitivity[(2024, 100.0)]['total_saving_eur'], 6500.0)
+        self.assertEqual(sensitivity[(2024, 50.0)]['total_cost_baseline_eur'], round(200 * 50 + 8 * 50, 2))
+        self.assertEqual(sensitivity[(2026, 50.0)]['total_saving_eur'], 0.0)
+
+        conn = connect(self.db_path)
+        stored = dict(conn.execute("SELECT period || '-' || product_code, post_innovation_emission_intensity "
+                                   "FROM cbam_products").fetchall())
+        conn.close()
+        self.assertAlmostEqual(stored['2024-7208'], 1.4)
+        self.assertAlmostEqual(stored['2025-7208'], 1.2)
+        self.assertIsNone(stored['2026-7208'])
+
+    def test_single_period_matches_batch(self):
+        single = self.calculator.compute_cbam_savings(1, 2024)
+        batch = self.calculator.compute_cbam_savings_batch(1, [2024])
+        self.assertEqual(single, batch['periods'][2024])
+        self.assertEqual(single['product_count'], 2)
+        self.assertEqual(batch['sensitivity'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.modules.dashboard_stats import DashboardStatsManager, invalidate_module_stats
+from utils.db_pool import connect
+
+
+class TestDashboardStats(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'stats.db')
+        conn = connect(self.db_path)
+        conn.execute("CREATE TABLE carbon_emissions (id INTEGER PRIMARY KEY, company_id INTEGER)")
+        conn.execute("CREATE TABLE cdp_scoring (id INTEGER PRIMARY KEY)")  # company_id yok
+        conn.executemany("INSERT INTO carbon_emissions (company_id) VALUES (?)", [(1,), (1,), (2,)])
+        conn.execute("INSERT INTO cdp_scoring DEFAULT VALUES")
+        conn.commit()
+        conn.close()
+        self.manager = DashboardStatsManager(self.db_path)
+
+    def tearDown(self):
+        invalidate_module_stats()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _add_emission(self, company_id):
+        conn = connect(self.db_path)
+        conn.execute("INSERT INTO carbon_emissions (company_id) VALUES (?)", (company_id,))
+        conn.commit()
+        conn.close()
+
+    def test_counts_per_company(self):
+        stats = self.manager.get_module_stats(1)
+        self.assertEqual(stats['carbon'], 50)   # 2 / 4
+        self.assertEqual(stats['cdp'], 100)     # filtresiz sayım
+        self.assertEqual(stats['gri'], 0)       # tablo yok
+        self.assertEqual(set(stats), set(DashboardStatsManager.MODULE_CONFIG))
+        self.assertEqual(self.manager.get_module_stats(2)['carbon'], 25)
+
+    def test_cache_and_invalidation(self):
+        self.assertEqual(self.manager.get_module_stats(1)['carbon'], 50)
+        self._add_emission(1)
+        self.assertEqual(self.manager.get_module_stats(1)['carbon'], 50)  # cache
+
+        invalidate_module_stats(1)
+        self.assertEqual(self.manager.get_module_stats(1)['carbon'], 75)
+
+    def test_schema_change_rebuilds_query(self):
+        self.manager.get_module_stats(1)
+        conn = connect(self.db_path)
+        conn.execute("CREATE TABLE gri_responses (id INTEGER PRIMARY KEY, company_id INTEGER)")
+        conn.executemany("INSERT INTO gri_responses (company_id) VALUES (?)", [(1,)] * 5)
+        conn.commit()
+        conn.close()
+
+        invalidate_module_stats(1)
+        self.assertEqual(self.manager.get_module_stats(1)['gri'], 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
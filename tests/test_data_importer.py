@@ -0,0 +1,154 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+
+from backend.modules.data_import.data_importer import DataImporter
+from backend.modules.data_import.expression import ExpressionError, compile_expression
+from utils.db_pool import connect
+
+
+class TestDataImporterBatch(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'import.db')
+        self.importer = DataImporter(self.db_path)
+        conn = connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE readings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                company_id INTEGER,
+                value REAL NOT NULL,
+                unit TEXT,
+                date TEXT,
+                created_at TEXT
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _write_csv(self, rows):
+        path = os.path.join(self.tmp_dir, 'data.csv')
+        pd.DataFrame(rows, columns=['Değer', 'Birim', 'Tarih']).to_csv(path, index=False)
+        return path
+
+    def test_batched_import_isolates_bad_rows(self):
+        rows = [[i, 'kwh', '2024-01-15'] for i in range(1, 26)]
+        rows[7][0] = None  # NOT NULL ihlali
+        path = self._write_csv(rows)
+        progress = []
+
+        result = self.importer.import_data(
+            company_id=3, file_path=path, import_type='energy',
+            column_mapping={'Değer': 'value', 'Birim': 'unit', 'Tarih': 'date'},
+            target_table='readings',
+            transformation_rules={'value': {'type': 'float', 'formula': 'value * 1000'},
+                                  'unit': {'mapping': {'kwh': 'Wh'}},
+                                  'date': {'type': 'date'}},
+            batch_size=10,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        self.assertEqual(result['total_rows'], 25)
+        self.assertEqual(result['successful'], 24)
+        self.assertEqual(result['failed'], 1)
+        self.assertTrue(result['errors'][0].startswith('Satır 9:'))
+        self.assertEqual(progress, [(10, 25), (20, 25), (25, 25)])
+
+        conn = connect(self.db_path)
+        stored = conn.execute("SELECT company_id, value, unit, date FROM readings ORDER BY id").fetchall()
+        errors = conn.execute("SELECT row_number FROM import_errors WHERE import_id=?",
+                              (result['import_id'],)).fetchall()
+        conn.close()
+        self.assertEqual(len(stored), 24)
+        self.assertEqual(stored[0], (3, 1000.0, 'Wh', '2024-01-15'))
+        self.assertEqual(errors, [(9,)])
+
+    def test_validate_fn_rejects_rows(self):
+        path = self._write_csv([[1, 'kwh', None], [-5, 'kwh', None]])
+        result = self.importer.import_data(
+            company_id=1, file_path=path, import_type='energy',
+            column_mapping={'Değer': 'value', 'Birim': 'unit'},
+            target_table='readings',
+            validate_fn=lambda data, row: (data['value'] >= 0, 'negatif'),
+        )
+        self.assertEqual((result['successful'], result['failed']), (1, 1))
+
+    def test_streaming_xlsx_preview_and_chunks(self):
+        import openpyxl
+
+        path = os.path.join(self.tmp_dir, 'data.xlsx')
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(['Değer', 'Birim'])
+        for i in range(1, 8):
+            sheet.append([i, 'kwh'])
+        other = workbook.create_sheet('Diğer')
+        other.append(['Değer', 'Birim'])
+        other.append([10, 'kwh'])
+        other.append([20, 'kwh'])
+        workbook.save(path)
+
+        self.assertEqual(self.importer.get_excel_sheets(path), ['Sheet', 'Diğer'])
+        preview, columns = self.importer.preview_data(path, rows=2)
+        self.assertEqual(columns, ['Değer', 'Birim'])
+        self.assertEqual(preview['Değer'].tolist(), [1, 2])
+
+        chunks = list(self.importer.iter_chunks(path, chunk_size=3))
+        self.assertEqual([len(c) for c in chunks], [3, 3, 1])
+        self.assertEqual(list(chunks[-1].index), [6])
+
+        progress = []
+        result = self.importer.import_data(
+            company_id=1, file_path=path, import_type='energy',
+            column_mapping={'Değer': 'value', 'Birim': 'unit'},
+            target_table='readings', batch_size=3,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+        self.assertEqual(result['successful'], 7)
+        self.assertEqual(progress[-1], (7, 7))
+
+        # Toplam, içe aktarılan sayfadan tahmin edilir
+        progress = []
+        result = self.importer.import_data(
+            company_id=1, file_path=path, import_type='energy',
+            column_mapping={'Değer': 'value', 'Birim': 'unit'},
+            target_table='readings', sheet_name='Diğer',
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+        self.assertEqual(result['successful'], 2)
+        self.assertEqual(progress, [(2, 2)])
+
+    def test_safe_expression(self):
+        self.assertEqual(compile_expression('round(value / 3, 2)').evaluate(10.0), 3.33)
+        for formula in ("__import__('os').system('id')", 'value.real', 'x * 2', "'a' * 3",
+                        'value + 9 ** 9 ** 9', 'value ** value', 'value ** 11', '2 ** (3 + 1)'):
+            with self.assertRaises(ExpressionError):
+                compile_expression(formula)
+        self.assertEqual(compile_expression('value ** -2 + 1').evaluate(2.0), 1.25)
+
+    def test_formula_keeps_integer_results(self):
+        series = pd.Series([2, '3', 1.5, 'x'], dtype=object)
+        result = self.importer._transform_series(series.copy(), {'formula': 'value * 100 + 1'})
+        self.assertEqual(result.tolist(), [201, 301, 151.0, 'x'])
+        self.assertIsInstance(result[0], int)
+        self.assertIsInstance(result[2], float)
+
+        divided = self.importer._transform_series(series.copy(), {'formula': 'value / 2'})
+        self.assertEqual(divided.tolist()[:3], [1.0, 1.5, 0.75])
+        self.assertIsInstance(divided[0], float)
+        self.assertEqual(self.importer._apply_transformation(4, {'formula': 'value * 3'}), 12)
+        self.assertIsInstance(self.importer._apply_transformation(4, {'formula': 'value * 3'}), int)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import gc
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from flask import Flask
+
+from utils.db_pool import (
+    DatabaseConnectionPool,
+    PooledConnection,
+    connect,
+    get_pool,
+    get_request_connection,
+    release_request_connections,
+)
+
+
+class TestDatabaseConnectionPool(unittest.TestCase):
+    def setUp(self):
+        fd, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        conn = connect(self.db_path)
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, value TEXT)")
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        get_pool(self.db_path).close_all()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.db_path + suffix):
+                os.remove(self.db_path + suffix)
+
+    def _count(self):
+        conn = connect(self.db_path)
+        count = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        conn.close()
+        return count
+
+    def test_close_returns_connection_to_pool(self):
+        conn = connect(self.db_path)
+        self.assertIsInstance(conn, PooledConnection)
+        conn.close()
+        conn.close()  # double close must not enqueue twice
+
+        again = connect(self.db_path)
+        self.assertIs(again, conn)
+        again.close()
+
+        stats = get_pool(self.db_path).get_stats()
+        self.assertEqual(stats['open_connections'], 1)
+        self.assertEqual(stats['in_use_connections'], 0)
+
+    def test_release_discards_uncommitted_work_and_resets_state(self):
+        conn = connect(self.db_path)
+        conn.row_factory = dict
+        conn.execute("INSERT INTO items (value) VALUES ('x')")
+        conn.close()
+
+        self.assertEqual(self._count(), 0)
+        conn = connect(self.db_path)
+        self.assertIsNone(conn.row_factory)
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], 'wal')
+        conn.close()
+
+    def test_concurrent_writers(self):
+        def worker():
+            for _ in range(50):
+                conn = connect(self.db_path)
+                conn.execute("INSERT INTO items (value) VALUES ('t')")
+                conn.commit()
+                conn.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(self._count(), 300)
+        stats = get_pool(self.db_path).get_stats()
+        self.assertLessEqual(stats['peak_connections'], stats['max_connections'])
+        self.assertGreaterEqual(stats['checkouts'], 300)
+
+    def test_request_connection_is_shared_and_released(self):
+        app = Flask(__name__)
+        with app.app_context():
+            outer = get_request_connection(self.db_path)
+            outer.execute("INSERT INTO items (value) VALUES ('a')")
+            inner = get_request_connection(self.db_path)
+            self.assertIs(inner, outer)
+            inner.close()  # nested close keeps the outer transaction
+            self.assertTrue(outer.in_transaction)
+            outer.commit()
+            outer.close()
+            release_request_connections()
+
+        self.assertEqual(self._count(), 1)
+        self.assertEqual(get_pool(self.db_path).get_stats()['in_use_connections'], 0)
+
+    def test_abandoned_connection_is_reused_without_gc(self):
+        pool = DatabaseConnectionPool(self.db_path, max_connections=1, checkout_timeout=5.0)
+        self.addCleanup(pool.close_all)
+        leaked = pool.acquire()
+        leaked.execute("BEGIN")
+        leaked.execute("INSERT INTO items (value) VALUES ('x')")
+        del leaked
+
+        started = time.monotonic()
+        conn = pool.acquire()
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertFalse(conn.in_transaction)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM items").fetchone()[0], 0)
+        conn.close()
+        stats = pool.get_stats()
+        self.assertEqual(stats['leaked_connections'], 1)
+        self.assertEqual(stats['overflow_connections'], 0)
+
+    def test_connection_in_garbage_cycle_is_reclaimed_by_finalizer(self):
+        pool = DatabaseConnectionPool(self.db_path, max_connections=1, checkout_timeout=5.0)
+        self.addCleanup(pool.close_all)
+        holder = {'conn': pool.acquire()}
+        holder['self'] = holder
+        del holder
+
+        # Bekleyen acquire, döngü toplanınca (weakref.finalize) uyanır
+        result = {}
+        waiter = threading.Thread(target=lambda: result.setdefault('conn', pool.acquire()))
+        waiter.start()
+        gc.collect()
+        waiter.join(5)
+        self.assertIn('conn', result)
+        self.assertEqual(pool.get_stats()['leaked_connections'], 1)
+        self.assertEqual(pool.get_stats()['overflow_connections'], 0)
+        result['conn'].close()
+
+    def test_timeout_sets_busy_timeout_for_checkout(self):
+        conn = connect(self.db_path, timeout=2.5)
+        self.assertEqual(conn.execute("PRAGMA busy_timeout").fetchone()[0], 2500)
+        conn.close()
+        conn = connect(self.db_path)
+        self.assertEqual(conn.execute("PRAGMA busy_timeout").fetchone()[0], 30000)
+        conn.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
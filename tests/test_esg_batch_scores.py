@@ -0,0 +1,141 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.modules.esg import esg_manager as esg_module
+from backend.modules.esg.esg_manager import ESGManager
+from utils.db_pool import connect
+
+SCHEMA = (
+    "CREATE TABLE gri_standards (id INTEGER PRIMARY KEY, code TEXT, category TEXT)",
+    "CREATE TABLE gri_indicators (id INTEGER PRIMARY KEY, standard_id INTEGER, code TEXT)",
+    "CREATE TABLE gri_responses (id INTEGER PRIMARY KEY, company_id INTEGER, indicator_id INTEGER, response_value TEXT)",
+    "CREATE TABLE tsrs_standards (id INTEGER PRIMARY KEY, code TEXT, category TEXT)",
+    "CREATE TABLE tsrs_indicators (id INTEGER PRIMARY KEY, standard_id INTEGER, code TEXT)",
+    "CREATE TABLE tsrs_responses (id INTEGER PRIMARY KEY, company_id INTEGER, indicator_id INTEGER, response_value TEXT)",
+    "CREATE TABLE tsrs_materiality_assessment (id INTEGER PRIMARY KEY, company_id INTEGER, is_material INTEGER)",
+    "CREATE TABLE carbon_emissions (id INTEGER PRIMARY KEY, company_id INTEGER)",
+    "CREATE TABLE employees (id INTEGER PRIMARY KEY, company_id INTEGER)",
+    "CREATE TABLE governance_policies (id INTEGER PRIMARY KEY, company_id INTEGER)",
+    "CREATE TABLE sdg_question_responses (id INTEGER PRIMARY KEY, company_id INTEGER, answer_text TEXT, answer_value REAL)",
+)
+
+# Modül veri varlığı bonuslarıyla beklenen skorlar (karbon ve politika verisi
+# olan 1. şirkette E ve G +5 puan; 2. şirketin S'si zaten 100)
+EXPECTED_SCORES = {
+    1: ({'E': 71.7, 'S': 0.0, 'G': 38.3, 'overall': 40.2},
+        {'evidence_bonus': 0.0, 'materiality_bonus': 0.0, 'e_bonus': 0.05, 's_bonus': 0.0, 'g_bonus': 0.05}),
+    2: ({'E': 5.0, 'S': 100.0, 'G': 43.3, 'overall': 45.0},
+        {'evidence_bonus': 0.05, 'materiality_bonus': 0.1, 'e_bonus': 0.0, 's_bonus': 0.05, 'g_bonus': 0.0}),
+    99: ({'E': 0.0, 'S': 0.0, 'G': 0.0, 'overall': 0.0},
+         {'evidence_bonus': 0.0, 'materiality_bonus': 0.0, 'e_bonus': 0.0, 's_bonus': 0.0, 'g_bonus': 0.0}),
+}
+
+
+class TestESGBatchScores(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'esg.db')
+        os.makedirs(os.path.join(self.tmp_dir, 'config'))
+        with open(os.path.join(self.tmp_dir, 'config', 'esg_config.json'), 'w', encoding='utf-8') as f:
+            json.dump({'weights': {'E': 0.4, 'S': 0.3, 'G': 0.3}, 'sources': {'db_path': self.db_path},
+                       'scoring': {'evidence_bonus': 0.05, 'materiality_bonus': 0.1}}, f)
+
+        conn = connect(self.db_path)
+        for statement in SCHEMA:
+            conn.execute(statement)
+        conn.executemany("INSERT INTO gri_standards VALUES (?, ?, ?)",
+                         [(1, 'GRI 2', 'Universal'), (2, 'GRI 302', 'Environmental'), (3, 'GRI 401', 'Social')])
+        conn.executemany("INSERT INTO gri_indicators VALUES (?, ?, ?)",
+                         [(1, 1, '2-1'), (2, 1, '2-2'), (3, 2, '302-1'), (4, 2, '302-2'), (5, 3, '401-1')])
+        conn.executemany("INSERT INTO tsrs_standards VALUES (?, ?, ?)",
+                         [(1, 'TSRS-E1', 'Environmental'), (2, 'TSRS-G1', 'Governance')])
+        conn.executemany("INSERT INTO tsrs_indicators VALUES (?, ?, ?)", [(1, 1, 'E1-1'), (2, 2, 'G1-1')])
+        conn.executemany("INSERT INTO gri_responses (company_id, indicator_id, response_value) VALUES (?, ?, ?)",
+                         [(1, 1, 'x'), (1, 3, 'x'), (1, 5, None), (2, 2, 'x'), (2, 5, 'x')])
+        conn.execute("INSERT INTO tsrs_responses (company_id, indicator_id, response_value) VALUES (1, 1, 'y')")
+        conn.execute("INSERT INTO tsrs_materiality_assessment (company_id, is_material) VALUES (2, 1)")
+        conn.execute("INSERT INTO carbon_emissions (company_id) VALUES (1)")
+        conn.execute("INSERT INTO employees (company_id) VALUES (2)")
+        conn.execute("INSERT INTO governance_policies (company_id) VALUES (1)")
+        conn.execute("INSERT INTO sdg_question_responses (company_id, answer_text) VALUES (2, 'evet')")
+        conn.commit()
+        conn.close()
+
+        esg_module._catalog_totals_cache.clear()
+        self.manager = ESGManager(self.tmp_dir)
+
+    def tearDown(self):
+        esg_module._catalog_totals_cache.clear()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_scores_from_grouped_counts(self):
+        scores = self.manager.compute_scores(1)
+        self.assertEqual(scores['details']['gri']['environmental'], {'answered': 1, 'total': 2})
+        self.assertEqual(scores['details']['gri']['governance'], {'answered': 1, 'total': 2})
+        self.assertEqual(scores['details']['gri']['social'], {'answered': 0, 'total': 1})
+        self.assertEqual(scores['details']['tsrs']['environmental'], {'answered': 1, 'total': 1})
+        self.assertTrue(scores['data_availability']['carbon'])
+        # E: (1 + 1) / (2 + 1) + 0.05 karbon bonusu
+        self.assertEqual(scores['E'], round((2 / 3 + 0.05) * 100, 1))
+
+        batch = self.manager.compute_scores_for_companies([2, 1, 2, 99])
+        self.assertEqual(list(batch), [2, 1, 99])
+        self.assertEqual(batch[1], scores)
+        self.assertEqual(batch[2], self.manager.compute_scores(2))
+        self.assertEqual(batch[2]['details']['bonuses']['materiality_bonus'], 0.1)
+        self.assertEqual(batch[99]['overall'], 0.0)
+
+    def test_module_data_bonuses(self):
+        batch = self.manager.compute_scores_for_companies([1, 2, 99])
+        for cid, (expected, bonuses) in EXPECTED_SCORES.items():
+            self.assertEqual({key: batch[cid][key] for key in expected}, expected, cid)
+            self.assertEqual(batch[cid]['details']['bonuses'], bonuses, cid)
+        self.assertEqual([key for key, value in batch[1]['data_availability'].items() if value],
+                         ['carbon', 'policies'])
+        self.assertEqual([key for key, value in batch[2]['data_availability'].items() if value], ['employees'])
+
+    def test_catalog_totals_cached_until_catalog_changes(self):
+        self.manager.compute_scores(1)
+        generation, _, totals = esg_module._catalog_totals_cache[self.db_path]
+        self.assertIsNotNone(generation)
+        with mock.patch.object(esg_module, 'CATALOG_GENERATION_CHECK_INTERVAL', 0):
+            self.manager.compute_scores(2)
+        self.assertIs(esg_module._catalog_totals_cache[self.db_path][2], totals)
+
+        conn = connect(self.db_path)
+        conn.execute("INSERT INTO gri_indicators VALUES (6, 2, '302-3')")
+        conn.commit()
+        conn.close()
+
+        # Nesil aralık dolmadan okunmaz; dolunca payda yeniden sayılır
+        self.assertEqual(self.manager.compute_scores(1)['details']['gri']['environmental']['total'], 2)
+        with mock.patch.object(esg_module, 'CATALOG_GENERATION_CHECK_INTERVAL', 0):
+            scores = self.manager.compute_scores(1)
+        self.assertEqual(scores['details']['gri']['environmental']['total'], 3)
+
+    def test_catalog_created_after_manager_is_tracked(self):
+        conn = connect(self.db_path)
+        conn.execute("DROP TABLE tsrs_indicators")
+        conn.commit()
+        conn.close()
+        esg_module._catalog_totals_cache.clear()
+        with mock.patch.object(esg_module, 'CATALOG_GENERATION_CHECK_INTERVAL', 0):
+            self.assertEqual(self.manager.compute_scores(1)['details']['tsrs']['environmental']['total'], 0)
+            conn = connect(self.db_path)
+            conn.execute("CREATE TABLE tsrs_indicators (id INTEGER PRIMARY KEY, standard_id INTEGER, code TEXT)")
+            conn.execute("INSERT INTO tsrs_indicators VALUES (1, 1, 'E1-1')")
+            conn.commit()
+            conn.close()
+            self.assertEqual(self.manager.compute_scores(1)['details']['tsrs']['environmental']['total'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
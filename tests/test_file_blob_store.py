@@ -0,0 +1,103 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.modules.file_manager.advanced_file_manager import AdvancedFileManager
+from utils.db_pool import connect
+
+
+class TestFileBlobStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'files.db')
+        self.manager = AdvancedFileManager(self.db_path, os.path.join(self.tmp_dir, 'uploads'))
+        self.sources = []
+        for name, content in (('fatura.pdf', b'A' * 3_000_000), ('kopya.pdf', b'A' * 3_000_000),
+                              ('sayac.jpg', b'meter-photo')):
+            path = os.path.join(self.tmp_dir, name)
+            with open(path, 'wb') as f:
+                f.write(content)
+            self.sources.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _blob_files(self):
+        return sorted(name for _, _, names in os.walk(self.manager.blob_dir) for name in names)
+
+    def test_duplicate_uploads_share_one_blob(self):
+        first = self.manager.upload_file(1, self.sources[0])
+        ids = self.manager.upload_multiple_files(2, self.sources)
+        version = self.manager.create_new_version(first, self.sources[1])
+        self.assertEqual(len(ids), 3)
+        self.assertIsNotNone(version)
+
+        infos = [self.manager.get_file_info(file_id) for file_id in [first] + ids + [version]]
+        self.assertEqual(infos[0]['checksum'], self.manager._calculate_checksum(self.sources[0]))
+        self.assertEqual(len({info['path'] for info in infos}), 2)
+        self.assertEqual(len(self._blob_files()), 2)
+        with open(infos[-1]['path'], 'rb') as f:
+            self.assertEqual(f.read(), b'A' * 3_000_000)
+
+        stats = self.manager.get_blob_stats()
+        self.assertEqual((stats['blobs'], stats['files']), (2, 5))
+        self.assertGreater(stats['dedup_ratio'], 1)
+
+    def test_garbage_collection_removes_unreferenced_blobs(self):
+        keep = self.manager.upload_file(1, self.sources[0])
+        drop = self.manager.upload_file(1, self.sources[2])
+        soft_deleted = self.manager.upload_file(1, self.sources[1])
+        self.manager.delete_file(soft_deleted)
+        stray = os.path.join(self.manager.blob_dir, '.upload-1-1.tmp')
+        with open(stray, 'wb') as f:
+            f.write(b'partial')
+
+        conn = connect(self.db_path)
+        conn.execute("DELETE FROM files WHERE id = ?", (drop,))
+        conn.commit()
+        self.assertEqual(conn.execute("SELECT ref_count FROM file_blobs WHERE digest = "
+                                      "(SELECT checksum FROM files WHERE id = ?)", (keep,)).fetchone()[0], 2)
+        conn.close()
+
+        # Bekleme süresi dolmadan hiçbir şey silinmez
+        self.assertEqual(self.manager.collect_garbage()['blobs_removed'], 0)
+        self.assertEqual(self.manager.collect_garbage(grace_seconds=-1, dry_run=True)['blobs_removed'], 1)
+        self.assertEqual(len(self._blob_files()), 3)
+
+        result = self.manager.collect_garbage(grace_seconds=-1)
+        self.assertEqual((result['blobs_removed'], result['stray_removed']), (1, 1))
+        self.assertEqual(self._blob_files(), [self.manager.get_file_info(keep)['checksum']])
+        self.assertTrue(os.path.exists(self.manager.get_file_info(keep)['path']))
+
+    def test_reused_blob_survives_gc_before_its_row_is_inserted(self):
+        dropped = self.manager.upload_file(1, self.sources[2])
+        blob_path = self.manager.get_file_info(dropped)['path']
+        conn = connect(self.db_path)
+        conn.execute("DELETE FROM files WHERE id = ?", (dropped,))
+        conn.execute("UPDATE file_blobs SET last_used_at = 0")
+        conn.commit()
+        conn.close()
+        os.utime(blob_path, (0, 0))
+
+        # Yükleme blob'u yeniden kullandı ama files satırı henüz eklenmedi
+        blob = self.manager._store_blob(self.sources[2])
+        self.assertEqual(blob[2], blob_path)
+        result = self.manager.collect_garbage(grace_seconds=60)
+        self.assertEqual(result['blobs_removed'], 0)
+        self.assertTrue(os.path.exists(blob_path))
+
+        conn = connect(self.db_path)
+        file_id = self.manager._insert_file(conn.cursor(), 1, None, self.sources[2], blob)
+        conn.commit()
+        conn.close()
+        with open(self.manager.get_file_info(file_id)['path'], 'rb') as f:
+            self.assertEqual(f.read(), b'meter-photo')
+
+
+if __name__ == '__main__':
+    unittest.main()
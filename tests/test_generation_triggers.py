@@ -0,0 +1,51 @@
+import os
+import sqlite3
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.generation_triggers import GenerationTriggers
+
+
+class TestGenerationTriggers(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(':memory:')
+        self.conn.execute("CREATE TABLE a (id INTEGER PRIMARY KEY, v TEXT)")
+        self.conn.execute("CREATE TABLE b (id INTEGER PRIMARY KEY, v TEXT)")
+        self.counters = GenerationTriggers(
+            'test_versions', 'name', 'version', {'a': "o'ne", 'b': 'two', 'c': 'two'}, 'test_version')
+
+    def tearDown(self):
+        self.conn.close()
+
+    def _values(self):
+        return dict(self.conn.execute(self.counters.values_sql))
+
+    def _tracking(self):
+        return self.conn.execute(self.counters.tracking_sql).fetchone()
+
+    def test_install_tracks_existing_tables_and_bumps_their_keys(self):
+        self.assertEqual(self.counters.install(self.conn), {"o'ne", 'two'})
+        self.assertEqual(self._values(), {"o'ne": 1, 'two': 1})
+        self.assertEqual(self._tracking(), (2, 2))
+        self.assertEqual(self.counters.install(self.conn), set())
+
+        self.conn.execute("INSERT INTO a (v) VALUES ('x')")
+        self.conn.execute("UPDATE a SET v = 'y'")
+        self.conn.execute("DELETE FROM b")
+        self.assertEqual(self._values(), {"o'ne": 3, 'two': 1})
+
+    def test_table_created_later_is_reported_until_installed(self):
+        self.counters.install(self.conn)
+        self.conn.execute("CREATE TABLE c (id INTEGER PRIMARY KEY)")
+        self.assertEqual(self._tracking(), (3, 2))
+        self.assertEqual(self.counters.install(self.conn), {'two'})
+        self.assertEqual(self._tracking(), (3, 3))
+        self.conn.execute("INSERT INTO c DEFAULT VALUES")
+        self.assertEqual(self._values(), {"o'ne": 1, 'two': 3})
+
+
+if __name__ == '__main__':
+    unittest.main()
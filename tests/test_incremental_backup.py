@@ -0,0 +1,78 @@
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.modules.database.backup_recovery_manager import BackupRecoveryManager
+
+
+class TestIncrementalBackup(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'live.db')
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE readings (id INTEGER PRIMARY KEY, payload TEXT)")
+        conn.executemany("INSERT INTO readings (payload) VALUES (?)", [('x' * 500,)] * 2000)
+        conn.commit()
+        conn.close()
+        self.manager = BackupRecoveryManager(self.db_path, backup_dir=os.path.join(self.tmp_dir, 'backups'))
+        self.manager.chunk_store.chunk_size = 64 * 1024
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _count(self):
+        conn = sqlite3.connect(self.db_path)
+        count = conn.execute("SELECT COUNT(*) FROM readings").fetchone()[0]
+        conn.close()
+        return count
+
+    def _add_rows(self, n):
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany("INSERT INTO readings (payload) VALUES (?)", [('y' * 500,)] * n)
+        conn.commit()
+        conn.close()
+
+    def test_chain_dedup_verify_and_restore(self):
+        ok, full_path = self.manager.create_backup('incremental', upload_to_cloud=False)
+        self.assertTrue(ok, full_path)
+        full = self.manager.chunk_store.load_manifest(full_path)
+        self.assertEqual(full['kind'], 'full')
+
+        self._add_rows(10)
+        ok, inc_path = self.manager.create_backup('incremental', upload_to_cloud=False)
+        self.assertTrue(ok, inc_path)
+        inc = self.manager.chunk_store.load_manifest(inc_path)
+        self.assertEqual((inc['kind'], inc['parent']), ('incremental', full['name']))
+        self.assertLess(len(inc['chunks']), inc['chunk_count'])  # yalnızca değişen parçalar
+
+        self.assertEqual(self.manager.verify_backup(inc_path, deep=True)[0], True)
+
+        self._add_rows(5)
+        ok, _msg = self.manager.restore_backup(inc_path)
+        self.assertTrue(ok, _msg)
+        self.assertEqual(self._count(), 2010)
+
+        # full'den devralınan bir parçanın kaybı zinciri bozar
+        inherited = next(i for i in full['chunks'] if i not in inc['chunks'])
+        os.remove(self.manager.chunk_store.chunk_path(full['chunks'][inherited]))
+        self.assertFalse(self.manager.verify_backup(inc_path)[0])
+
+    def test_zip_backup_uses_recorded_checksum(self):
+        ok, path = self.manager.create_backup('database_only', include_files=False, upload_to_cloud=False)
+        self.assertTrue(ok, path)
+        self.assertEqual(self.manager.verify_backup(path), (True, "Yedek sağlama toplamı doğrulandı (SHA-256)"))
+        self.assertTrue(self.manager.verify_backup(path, deep=True)[0])
+
+        with open(path, 'ab') as f:
+            f.write(b'corrupt')
+        self.assertFalse(self.manager.verify_backup(path)[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.yonetim import license_manager as lm_module
+from backend.yonetim.license_manager import LicenseManager, get_license_cache_stats, invalidate_license_cache
+from utils.db_pool import connect
+
+
+class TestLicenseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'licenses.db')
+        conn = connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE licenses (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                company_id INTEGER NOT NULL,
+                license_key TEXT UNIQUE NOT NULL,
+                issued_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                expires_at TIMESTAMP,
+                max_users INTEGER DEFAULT 5,
+                status VARCHAR(20) DEFAULT 'active'
+            )
+        """)
+        conn.commit()
+        conn.close()
+        invalidate_license_cache()
+        self.manager = LicenseManager(self.db_path)
+        self.key = self.manager.generate_license(7)['license_key']
+
+    def tearDown(self):
+        invalidate_license_cache()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_hits_skip_decode_and_revocation_bumps_generation(self):
+        self.assertEqual(self.manager.get_active_license(7), self.key)
+        self.assertTrue(self.manager.verify_license_key(self.key)[0])
+        before = get_license_cache_stats()
+
+        with mock.patch.object(lm_module.jwt, 'decode', side_effect=AssertionError('decode çağrılmamalı')):
+            self.assertEqual(self.manager.get_active_license(7), self.key)
+            self.assertTrue(self.manager.verify_license_key(self.key)[0])
+        self.assertEqual(get_license_cache_stats()['hits'], before['hits'] + 2)
+
+        # Başka bir worker'daki iptal: doğrudan SQL, yerel cache'e dokunmadan
+        conn = connect(self.db_path)
+        conn.execute("UPDATE licenses SET status = 'revoked' WHERE license_key = ?", (self.key,))
+        conn.commit()
+        conn.close()
+
+        with mock.patch.object(lm_module, 'GENERATION_CHECK_INTERVAL', 0):
+            is_valid, msg, _payload = self.manager.verify_license_key(self.key)
+        self.assertFalse(is_valid)
+        self.assertIn('revoked', msg)
+        self.assertIsNone(self.manager.get_active_license(7))
+
+
+if __name__ == '__main__':
+    unittest.main()
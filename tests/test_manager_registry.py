@@ -0,0 +1,68 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.manager_registry import ManagerRegistry, parse_warm_up_list
+
+
+class Counter:
+    created = 0
+
+    def __init__(self, db_path):
+        Counter.created += 1
+        self.db_path = db_path
+
+
+class TestManagerRegistry(unittest.TestCase):
+    def setUp(self):
+        Counter.created = 0
+        self.registry = ManagerRegistry(default_factory=lambda cls: cls('test.db'))
+        self.registry.register('counter', __name__, 'Counter')
+
+    def test_lazy_single_instance_across_threads(self):
+        self.assertIn('counter', self.registry)
+        self.assertFalse(self.registry.is_loaded('counter'))
+        self.assertEqual(Counter.created, 0)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.registry.get('counter')))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(Counter.created, 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(results[0].db_path, 'test.db')
+        self.assertEqual(self.registry.get_stats()['loaded'], 1)
+
+    def test_failed_init_returns_none(self):
+        self.registry.register('broken', __name__, 'DoesNotExist')
+        self.assertIsNone(self.registry.get('broken'))
+        self.assertIsNone(self.registry.get('unknown'))
+        self.assertEqual(self.registry.get_stats()['failed'], 1)
+
+    def test_discover_does_not_import(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, 'waste'))
+            with open(os.path.join(tmp, 'waste', 'waste_manager.py'), 'w', encoding='utf-8') as f:
+                f.write("raise RuntimeError('imported')\n\nclass WasteManager:\n    pass\n")
+            self.assertEqual(self.registry.discover(tmp), 1)
+
+        self.assertIn('waste', self.registry)
+        self.assertFalse(self.registry.is_loaded('waste'))
+
+    def test_parse_warm_up_list(self):
+        self.assertEqual(parse_warm_up_list(None), (False, []))
+        self.assertEqual(parse_warm_up_list('*'), (True, []))
+        self.assertEqual(parse_warm_up_list('sdg, gri,'), (False, ['sdg', 'gri']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import importlib.util
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import types
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.modules.database.migration_manager import MigrationManager
+from utils.db_pool import connect
+from utils.schema_version import ensure_schema, get_schema_version, latest_schema_version
+
+MIGRATIONS_DIR = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', 'backend', 'modules', 'database', 'migrations'))
+
+
+def load_migration(filename):
+    spec = importlib.util.spec_from_file_location(filename[:-3], os.path.join(MIGRATIONS_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMigrationManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'migrate.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_apply_reports_and_sets_schema_version(self):
+        manager = MigrationManager(self.db_path)
+        pending = manager.get_pending_migrations()
+        self.assertEqual([v for v, _f in pending][-1], latest_schema_version())
+
+        self.assertTrue(manager.apply_migrations())
+        self.assertEqual(manager.get_pending_migrations(), [])
+        self.assertEqual(get_schema_version(self.db_path), latest_schema_version())
+
+        conn = connect(self.db_path)
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        conn.close()
+        self.assertIn('system_settings', tables)
+
+        # Tekrar çalıştırmak bir şey yapmaz
+        self.assertTrue(manager.apply_migrations())
+
+    def test_fresh_database_has_user_manager_schema(self):
+        self.assertTrue(MigrationManager(self.db_path).apply_migrations())
+
+        conn = connect(self.db_path)
+        try:
+            role_columns = {r[1] for r in conn.execute("PRAGMA table_info(roles)")}
+            user_columns = {r[1] for r in conn.execute("PRAGMA table_info(users)")}
+            roles = {r[0] for r in conn.execute("SELECT name FROM roles")}
+        finally:
+            conn.close()
+        self.assertIn('name', role_columns)
+        self.assertNotIn('role_name', role_columns)
+        self.assertIn('first_name', user_columns)
+        # 003 UserManager'ı çalıştırıp varsayılan rolleri oluşturdu
+        self.assertIn('super_admin', roles)
+
+    def test_manager_schema_error_keeps_migration_pending(self):
+        migration = load_migration('003_manager_schemas.py')
+
+        class BrokenManager:
+            def __init__(self, db_path):
+                raise sqlite3.OperationalError('near "values": syntax error')
+
+        fake = types.ModuleType('tests_fake_broken_manager')
+        fake.BrokenManager = BrokenManager
+        sys.modules[fake.__name__] = fake
+        self.addCleanup(sys.modules.pop, fake.__name__, None)
+        migration.MANAGER_CLASSES = [
+            ('tests_fake_missing_module', 'Missing'),  # ImportError atlanır
+            (fake.__name__, 'BrokenManager'),
+        ]
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with self.assertRaises(RuntimeError) as ctx:
+                migration.up(conn)
+        finally:
+            conn.close()
+        self.assertIn('BrokenManager', str(ctx.exception))
+        self.assertNotIn('Missing', str(ctx.exception))
+
+    def test_manager_modules_reuse_application_import(self):
+        migration = load_migration('003_manager_schemas.py')
+        name = 'core.module_data_collector'
+        self.assertIs(migration._import_manager_module(name), importlib.import_module(name))
+        # Kökteki services paketi aynı adlı farklı bir EmailService içerir
+        email = migration._import_manager_module('services.email_service')
+        backend_dir = os.path.abspath(os.path.join(MIGRATIONS_DIR, '..', '..', '..'))
+        self.assertTrue(os.path.abspath(email.__file__).startswith(backend_dir + os.sep))
+
+    def test_legacy_roles_table_is_migrated(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript("""
+            CREATE TABLE users (id INTEGER PRIMARY KEY, username TEXT, password_hash TEXT);
+            CREATE TABLE roles (id INTEGER PRIMARY KEY AUTOINCREMENT, role_name TEXT UNIQUE NOT NULL, permissions TEXT);
+            CREATE TABLE user_roles (user_id INTEGER, role_id INTEGER REFERENCES roles(id));
+            INSERT INTO roles (id, role_name) VALUES (7, 'auditor');
+            INSERT INTO user_roles VALUES (1, 7);
+        """)
+        with conn:
+            load_migration('017_user_schema_alignment.py').up(conn)
+
+        role = conn.execute("SELECT id, name, display_name FROM roles").fetchone()
+        user_columns = {r[1] for r in conn.execute("PRAGMA table_info(users)")}
+        user_roles_sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'user_roles'").fetchone()[0]
+        conn.close()
+        self.assertEqual(role, (7, 'auditor', 'auditor'))
+        self.assertIn('first_name', user_columns)
+        self.assertIn('REFERENCES roles(id)', user_roles_sql)
+
+    def test_ensure_schema_skips_ddl_when_current(self):
+        calls = []
+        self.assertTrue(ensure_schema(self.db_path, lambda: calls.append(1)))
+
+        conn = connect(self.db_path)
+        conn.execute(f"PRAGMA user_version = {latest_schema_version()}")
+        conn.close()
+
+        self.assertFalse(ensure_schema(self.db_path, lambda: calls.append(1)))
+        self.assertEqual(calls, [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import importlib
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.core.module_data_collector import MODULE_DATA_TABLES, ModuleDataCollector
+from utils.db_pool import connect
+
+
+class TestModuleDataCollector(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'modules.db')
+        conn = connect(self.db_path)
+        conn.execute("CREATE TABLE scope1_emissions (id INTEGER PRIMARY KEY, company_id INTEGER, total_emissions REAL)")
+        conn.execute("CREATE TABLE water_consumption (id INTEGER PRIMARY KEY, company_id INTEGER, amount REAL)")
+        conn.execute("INSERT INTO scope1_emissions (company_id, total_emissions) VALUES (1, 10.0)")
+        conn.execute("INSERT INTO water_consumption (company_id, amount) VALUES (1, 5.0)")
+        conn.commit()
+        conn.close()
+        self.collector = ModuleDataCollector(self.db_path)
+        self.calls = {'carbon': 0, 'water': 0}
+        self.threads = set()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _sum(self, module, table, column):
+        def extract():
+            self.calls[module] += 1
+            self.threads.add(threading.get_ident())
+            conn = connect(self.db_path)
+            try:
+                return {'total': conn.execute(f"SELECT SUM({column}) FROM {table}").fetchone()[0]}
+            finally:
+                conn.close()
+        return extract
+
+    def _collect(self, period='2024'):
+        return self.collector.collect(1, period, {
+            'carbon': self._sum('carbon', 'scope1_emissions', 'total_emissions'),
+            'water': self._sum('water', 'water_consumption', 'amount'),
+        })
+
+    def test_only_changed_module_is_requeried(self):
+        self.assertEqual(self._collect(), {'carbon': {'total': 10.0}, 'water': {'total': 5.0}})
+        self.assertEqual(self._collect(), {'carbon': {'total': 10.0}, 'water': {'total': 5.0}})
+        self.assertEqual(self.calls, {'carbon': 1, 'water': 1})
+
+        conn = connect(self.db_path)
+        conn.execute("UPDATE water_consumption SET amount = 7.5 WHERE company_id = 1")
+        conn.commit()
+        conn.close()
+
+        self.assertEqual(self._collect(), {'carbon': {'total': 10.0}, 'water': {'total': 7.5}})
+        self.assertEqual(self.calls, {'carbon': 1, 'water': 2})
+
+        # Farklı dönem ayrı önbellek girdisi
+        self._collect('2025')
+        self.assertEqual(self.calls, {'carbon': 2, 'water': 3})
+
+    def test_extractors_run_concurrently_and_errors_are_not_cached(self):
+        results = self.collector.collect(1, '2024', {
+            'carbon': self._sum('carbon', 'scope1_emissions', 'total_emissions'),
+            'water': self._sum('water', 'water_consumption', 'amount'),
+            'energy': lambda: 1 / 0,
+        })
+        self.assertIsNone(results['energy'])
+        self.assertNotIn(threading.get_ident(), self.threads)
+
+        attempts = []
+        self.collector.collect(1, '2024', {'energy': lambda: attempts.append(1) or []})
+        self.assertEqual(attempts, [1])
+        self.assertEqual(self.collector.get_stats()['errors'], 1)
+
+    def test_table_created_later_invalidates_its_module(self):
+        self.collector.collect(1, '2024', {'energy': lambda: 'empty'})
+        conn = connect(self.db_path)
+        conn.execute("CREATE TABLE energy_consumption (id INTEGER PRIMARY KEY, company_id INTEGER)")
+        conn.commit()
+        conn.close()
+
+        loads = []
+        self.collector.collect(1, '2024', {'energy': lambda: loads.append(1) or 'loaded'})
+        self.assertEqual(loads, [1])
+        self.collector.collect(1, '2024', {'energy': lambda: loads.append(1) or 'loaded'})
+        self.assertEqual(loads, [1])
+
+    def test_write_to_every_mapped_table_invalidates_its_module(self):
+        conn = connect(self.db_path)
+        for tables in MODULE_DATA_TABLES.values():
+            for table in tables:
+                conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY, company_id INTEGER)")
+        conn.commit()
+        conn.close()
+
+        loads = {module: 0 for module in MODULE_DATA_TABLES}
+
+        def extractors():
+            def load(module):
+                loads[module] += 1
+                return module
+            return {module: (lambda module=module: load(module)) for module in MODULE_DATA_TABLES}
+
+        self.collector.collect(1, '2024', extractors())
+        for module, tables in MODULE_DATA_TABLES.items():
+            for table in tables:
+                before = dict(loads)
+                conn = connect(self.db_path)
+                conn.execute(f"INSERT INTO {table} (company_id) VALUES (1)")
+                conn.commit()
+                conn.close()
+
+                self.collector.collect(1, '2024', extractors())
+                expected = dict(before, **{module: before[module] + 1})
+                self.assertEqual(loads, expected, f"{table} -> {module}")
+
+    def test_manager_reads_stay_within_module_tables(self):
+        """Çıkarıcıların kullandığı manager metotları yalnızca modülün tablolarını okur"""
+        cases = [
+            ('water', 'backend.modules.environmental.water_manager', 'WaterManager', 'calculate_water_kpis', (1, 2024)),
+            ('energy', 'backend.modules.environmental.energy_manager', 'EnergyManager', 'get_dashboard_stats', (1,)),
+            ('waste', 'backend.modules.environmental.waste_manager', 'WasteManager', 'calculate_waste_metrics', (1, 2024)),
+            ('biodiversity', 'backend.modules.environmental.biodiversity_manager', 'BiodiversityManager',
+             'get_dashboard_stats', (1,)),
+            ('social', 'backend.modules.social.social_manager', 'SocialManager', 'get_dashboard_stats', (1,)),
+            ('governance', 'backend.modules.governance.corporate_governance', 'CorporateGovernanceManager',
+             'get_dashboard_stats', (1,)),
+        ]
+        # Manager'lar kendi şemalarını kurar (setUp'taki sade tablolar kullanılmaz)
+        db_path = os.path.join(self.tmp_dir, 'managers.db')
+        for module, module_path, class_name, method, args in cases:
+            manager_module = importlib.import_module(module_path)
+            manager = getattr(manager_module, class_name)(db_path)
+            reads = set()
+
+            def traced_connect(*a, **kw):
+                conn = sqlite3.connect(db_path)
+
+                def authorizer(action, table, _column, _db, trigger):
+                    if action == sqlite3.SQLITE_READ and table and not trigger and not table.startswith('sqlite_'):
+                        reads.add(table)
+                    return sqlite3.SQLITE_OK
+                conn.set_authorizer(authorizer)
+                return conn
+
+            with mock.patch.object(manager_module, 'db_connect', traced_connect):
+                getattr(manager, method)(*args)
+            self.assertTrue(reads, module)
+            self.assertLessEqual(reads, set(MODULE_DATA_TABLES[module]), module)
+
+    def test_returned_values_do_not_share_cached_objects(self):
+        first = self._collect()
+        first['carbon']['total'] = -1
+        self.assertEqual(self._collect()['carbon'], {'total': 10.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
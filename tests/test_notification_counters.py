@@ -0,0 +1,64 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.modules.notification import notification_manager as notification_module
+from backend.modules.notification.notification_manager import NotificationManager
+from utils.db_pool import connect
+
+
+class TestNotificationCounters(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'notifications.db')
+        self.manager = NotificationManager(self.db_path)
+        self.other_worker = NotificationManager(self.db_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_counter_follows_writes_and_is_cached(self):
+        first = self.manager.create_notification(7, 'Rapor', 'Hazır')
+        self.manager.create_notification(7, 'Onay', 'Bekliyor')
+        self.manager.create_notification(8, 'Diğer', 'Kullanıcı')
+        self.assertEqual(self.manager.get_unread_count(7), 2)
+
+        self.manager.mark_as_read(first)
+        self.assertEqual(self.manager.get_unread_count(7), 1)
+        _, version = self.manager.get_unread_state(7)
+
+        with mock.patch.object(notification_module, 'db_connect', side_effect=AssertionError('sorgu yapılmamalı')):
+            self.assertEqual(self.manager.get_unread_count(7), 1)
+
+        # Başka worker'daki yazma TTL dolana kadar görünmez; fresh okuma hemen görür
+        self.assertEqual(self.other_worker.get_unread_count(7), 1)
+        self.manager.mark_all_as_read(7)
+        self.assertEqual(self.other_worker.get_unread_count(7), 1)
+        count, new_version = self.other_worker.get_unread_state(7, fresh=True)
+        self.assertEqual(count, 0)
+        self.assertGreater(new_version, version)
+        self.assertEqual(self.manager.get_unread_count(8), 1)
+
+    def test_backfill_matches_count_query(self):
+        conn = connect(self.db_path)
+        conn.executemany("INSERT INTO notifications (user_id, title, message, is_read) VALUES (?, 't', 'm', ?)",
+                         [(1, 0), (1, 0), (1, 1), (2, 1)])
+        # Migrasyon öncesi veritabanı: sayaçlar boş
+        conn.execute("DELETE FROM notification_counters")
+        notification_module.install_notification_counters(conn)
+        conn.commit()
+        conn.execute("DELETE FROM notifications WHERE user_id = 1 AND is_read = 0 AND id = 1")
+        conn.commit()
+        rows = dict(conn.execute("SELECT user_id, unread_count FROM notification_counters").fetchall())
+        conn.close()
+        self.assertEqual(rows, {1: 1, 2: 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
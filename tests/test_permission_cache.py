@@ -0,0 +1,68 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+
+from utils.cache import user_permissions_cache
+from yonetim.kullanici_yonetimi.models import user_manager as user_manager_module
+from yonetim.kullanici_yonetimi.models.user_manager import UserManager
+
+
+class TestPermissionCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'users.db')
+        self.manager = UserManager(self.db_path)
+        user_permissions_cache.clear()
+
+        perms = {p['name']: p['id'] for p in self.manager.get_permissions()}
+        self.read_id, self.update_id = perms['sdg.read'], perms['sdg.update']
+        conn = self.manager.get_connection()
+        self.role_id = conn.execute(
+            "INSERT INTO roles (name, display_name, is_system_role, is_active) VALUES ('perm_cache_role', 'Yetki Cache Rolü', 0, 1)"
+        ).lastrowid
+        conn.executemany("INSERT INTO role_permissions (role_id, permission_id) VALUES (?, ?)",
+                         [(self.role_id, self.read_id), (self.role_id, self.update_id)])
+        cur = conn.execute(
+            "INSERT INTO users (username, email, password_hash, first_name, last_name) "
+            "VALUES ('analyst1', 'a@example.com', 'x', 'A', 'B')")
+        self.user_id = cur.lastrowid
+        conn.execute("INSERT INTO user_roles (user_id, role_id) VALUES (?, ?)", (self.user_id, self.role_id))
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        user_permissions_cache.clear()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_batch_check_uses_single_load_and_role_change_invalidates(self):
+        with mock.patch.object(self.manager, '_load_user_permissions',
+                               wraps=self.manager._load_user_permissions) as load:
+            result = self.manager.has_permissions(self.user_id, ['sdg.read', 'sdg.update', 'sdg.delete'])
+            for _ in range(10):
+                self.manager.has_permission(self.user_id, 'sdg.read')
+            self.assertEqual(load.call_count, 1)
+        self.assertEqual(result, {'sdg.read': True, 'sdg.update': True, 'sdg.delete': False})
+        self.assertIsInstance(self.manager.get_permission_set(self.user_id), frozenset)
+
+        self.assertTrue(self.manager.set_role_permissions(self.role_id, [self.read_id], updated_by=1))
+        self.assertFalse(self.manager.has_permission(self.user_id, 'sdg.update'))
+
+    def test_change_from_other_worker_bumps_generation(self):
+        self.assertTrue(self.manager.has_permission(self.user_id, 'sdg.update'))
+        conn = self.manager.get_connection()
+        conn.execute("DELETE FROM role_permissions WHERE role_id = ? AND permission_id = ?",
+                     (self.role_id, self.update_id))
+        conn.commit()
+        conn.close()
+
+        with mock.patch.object(user_manager_module, 'PERMISSION_GENERATION_CHECK_INTERVAL', 0):
+            self.assertFalse(self.manager.has_permission(self.user_id, 'sdg.update'))
+
+
+if __name__ == '__main__':
+    unittest.main()
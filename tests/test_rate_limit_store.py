@@ -0,0 +1,88 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from multiprocessing import get_context
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.rate_limit_store import RATE_LIMIT_DB_PATH, SharedRateLimitStore, storage_uri
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter
+from backend.modules.super_admin.components.rate_limiter import RateLimiter
+
+
+def _hammer(path, attempts, results):
+    store = SharedRateLimitStore(path, cleanup_interval=0)
+    results.put(sum(store.consume('login', '10.0.0.1', 10, 60)[0] for _ in range(attempts)))
+
+
+class TestRateLimitStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'rate.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_token_bucket_is_shared_across_processes(self):
+        ctx = get_context('spawn')
+        results = ctx.Queue()
+        workers = [ctx.Process(target=_hammer, args=(self.path, 6, results)) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+        # 3 süreç x 6 deneme; kova kapasitesi 10
+        self.assertEqual(sum(results.get(timeout=5) for _ in workers), 10)
+
+    def test_rate_limiter_refill_stats_and_cleanup(self):
+        limiter = RateLimiter(store_path=self.path)
+        first = limiter.check_rate_limit('api', 'u1', max_requests=2, window_seconds=1)
+        self.assertEqual((first['allowed'], first['current_count']), (True, 1))
+        self.assertTrue(limiter.check_rate_limit('api', 'u1', 2, 1)['allowed'])
+        blocked = limiter.check_rate_limit('api', 'u1', 2, 1)
+        self.assertFalse(blocked['allowed'])
+        self.assertTrue(blocked['blocked'])
+        self.assertEqual(limiter.get_rate_limit_stats()[0]['blocked'], True)
+
+        time.sleep(0.6)  # yarım pencerede bir jeton dolar
+        self.assertTrue(limiter.check_rate_limit('api', 'u1', 2, 1)['allowed'])
+
+        time.sleep(1.1)
+        self.assertEqual(limiter.cleanup_old_records(), 1)
+        self.assertEqual(limiter.get_rate_limit_stats(), [])
+
+    def test_flask_limiter_storage(self):
+        storage = storage_from_string(storage_uri(self.path))
+        strategy = FixedWindowRateLimiter(storage)
+        limit = parse('3 per minute')
+        self.assertEqual([strategy.hit(limit, 'ip') for _ in range(4)], [True, True, True, False])
+        self.assertTrue(storage.check())
+        self.assertEqual(storage.get(limit.key_for('ip')), 4)
+        strategy.clear(limit, 'ip')
+        self.assertTrue(strategy.hit(limit, 'ip'))
+
+    def test_flask_limiter_3_incr_signature(self):
+        """limits 3.x: incr(key, expiry, elastic_expiry=False, amount=1)"""
+        storage = storage_from_string(storage_uri(self.path))
+        self.assertEqual(storage.incr('k', 60, elastic_expiry=False, amount=2), 2)
+        first_expiry = storage.get_expiry('k')
+        time.sleep(0.05)
+        self.assertEqual(storage.incr('k', 60, False), 3)
+        self.assertEqual(storage.get_expiry('k'), first_expiry)
+        # Elastik pencere her artışta uzar
+        self.assertEqual(storage.incr('k', 60, True, amount=1), 4)
+        self.assertGreater(storage.get_expiry('k'), first_expiry)
+
+    def test_default_store_is_temporary_under_tests(self):
+        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        self.assertFalse(os.path.abspath(RATE_LIMIT_DB_PATH).startswith(project_root + os.sep))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.modules.realtime.realtime_manager import RealTimeMonitoringManager, invalidate_device_cache
+from utils.db_pool import connect
+
+
+class TestRealtimeIngest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'iot.db')
+        self.manager = RealTimeMonitoringManager(self.db_path)
+        self.meter = self.manager.add_device(5, 'Sayaç', 'energy', 'kWh', threshold_value=10)
+        self.probe = self.manager.add_device(5, 'Sensör', 'water', 'm3')
+
+    def tearDown(self):
+        invalidate_device_cache()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _query(self, sql, params=()):
+        conn = connect(self.db_path)
+        rows = conn.execute(sql, params).fetchall()
+        conn.close()
+        return rows
+
+    def test_batch_alerts_and_rollups(self):
+        result = self.manager.add_readings([
+            (self.meter, 4, '2024-05-01 10:00:05'),
+            (self.meter, 12, '2024-05-01 10:00:40'),
+            {'device_id': self.meter, 'value': 20, 'timestamp': '2024-05-01T10:01:10'},
+            (self.probe, 99, '2024-05-01 10:00:00'),  # eşiksiz cihaz
+        ])
+        self.assertEqual(result, {'inserted': 4, 'alerts': 2})
+        self.assertEqual(self._query("SELECT company_id FROM iot_alerts GROUP BY company_id"), [(5,)])
+
+        minutes = self.manager.get_readings(self.meter, granularity='minute')
+        self.assertEqual([(r['timestamp'], r['value'], r['count']) for r in minutes],
+                         [('2024-05-01 10:01:00', 20.0, 1), ('2024-05-01 10:00:00', 8.0, 2)])
+
+        self.manager.add_reading(self.meter, 2, '2024-05-01 23:59:59')
+        day = self.manager.get_readings(self.meter, granularity='day')[0]
+        self.assertEqual((day['count'], day['min_value'], day['max_value']), (4, 2.0, 20.0))
+
+        before = self._query("SELECT * FROM iot_reading_rollups ORDER BY 1, 2, 3")
+        self.manager.rebuild_rollups()
+        self.assertEqual(self._query("SELECT * FROM iot_reading_rollups ORDER BY 1, 2, 3"), before)
+
+    def test_threshold_cache_invalidation(self):
+        self.manager.add_reading(self.probe, 50)
+        self.assertEqual(self._query("SELECT COUNT(*) FROM iot_alerts")[0][0], 0)
+
+        self.assertTrue(self.manager.update_threshold(self.probe, 5, 40))
+        self.manager.add_reading(self.probe, 50)
+        self.assertEqual(self._query("SELECT COUNT(*) FROM iot_alerts")[0][0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
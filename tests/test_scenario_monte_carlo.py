@@ -0,0 +1,153 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from backend.modules.scenario_analysis.scenario_engine import (
+    SIMULATION_METRICS, ScenarioEngine, simulate_paths,
+)
+from utils.db_pool import connect
+
+
+class TestScenarioMonteCarlo(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.engine = ScenarioEngine(os.path.join(self.tmp_dir, 'scenario.db'))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_deterministic_scenario_matches_yearly_formulas(self):
+        scenario_id = self.engine.create_tcfd_scenario(1, '2C', 2024, 2030, 1000.0)
+        conn = connect(self.engine.db_path)
+        try:
+            rows = conn.execute(
+                """SELECT e.year, e.total_emissions, f.carbon_cost, f.capex_investment, f.roi_percentage
+                   FROM emission_projections e JOIN financial_impact_simulation f
+                     ON f.scenario_id = e.scenario_id AND f.year = e.year
+                   WHERE e.scenario_id = ? ORDER BY e.year""", (scenario_id,)).fetchall()
+        finally:
+            conn.close()
+
+        self.assertEqual([row[0] for row in rows], list(range(2024, 2031)))
+        for year, emissions, carbon_cost, capex, roi in rows:
+            progress = (year - 2024) / 6
+            expected_emissions = 1000.0 * (1 - 0.50 * progress)
+            self.assertEqual(emissions, expected_emissions)
+            self.assertEqual(carbon_cost, expected_emissions * (140 * progress))
+            self.assertEqual(capex, 20000000 * progress)
+            if capex > 0:
+                saving = 50000000 * (0.60 * progress) * 0.20
+                self.assertAlmostEqual(roi, (saving - carbon_cost) / capex * 100)
+
+    def test_zero_volatility_bands_collapse_to_deterministic_path(self):
+        scenario_id = self.engine.create_tcfd_scenario(1, '1_5C', 2024, 2050, 5000.0)
+        zero = {'carbon_price': 0, 'renewable_share': 0, 'capex': 0, 'reduction': 0}
+        result = self.engine.simulate_tcfd_scenario(
+            1, '1_5C', 2024, 2050, 5000.0, n_paths=200, volatility=zero, seed=1, scenario_id=scenario_id)
+
+        conn = connect(self.engine.db_path)
+        try:
+            costs = [row[0] for row in conn.execute(
+                "SELECT carbon_cost FROM financial_impact_simulation WHERE scenario_id = ? ORDER BY year",
+                (scenario_id,))]
+        finally:
+            conn.close()
+        for band, cost in zip(result['bands']['carbon_cost'], costs):
+            self.assertAlmostEqual(band['p5'], cost, places=4)
+            self.assertAlmostEqual(band['p95'], cost, places=4)
+            self.assertAlmostEqual(band['std'], 0.0, places=4)
+
+    def test_simulation_is_reproducible_and_persisted(self):
+        first = self.engine.simulate_tcfd_scenario(1, '2C', 2024, 2050, 8000.0, n_paths=3000, seed=42)
+        second = self.engine.simulate_tcfd_scenario(1, '2C', 2024, 2050, 8000.0, n_paths=3000, seed=42)
+        self.assertEqual(first['bands'], second['bands'])
+        self.assertNotEqual(first['scenario_id'], second['scenario_id'])
+
+        for band in first['bands']['net_financial_impact'][1:]:
+            self.assertLessEqual(band['p5'], band['p50'])
+            self.assertLessEqual(band['p50'], band['p95'])
+
+        stored = self.engine.get_simulation_summary(first['simulation_id'])
+        self.assertEqual(stored['n_paths'], 3000)
+        self.assertEqual(stored['years'], list(range(2024, 2051)))
+        self.assertEqual(set(stored['bands']), set(SIMULATION_METRICS))
+        self.assertAlmostEqual(stored['bands']['roi_percentage'][-1]['p50'],
+                               first['bands']['roi_percentage'][-1]['p50'])
+        self.assertEqual(stored['summary'], first['summary'])
+
+    def test_chunked_statistics_match_single_pass(self):
+        engine_module = sys.modules[ScenarioEngine.__module__]
+        original = engine_module.SIMULATION_CHUNK_PATHS
+        engine_module.SIMULATION_CHUNK_PATHS = 1000
+        try:
+            chunked = self.engine.simulate_tcfd_scenario(1, '4C', 2024, 2030, 2000.0, n_paths=4000, seed=3)
+        finally:
+            engine_module.SIMULATION_CHUNK_PATHS = original
+
+        # Aynı parça tohumlarıyla tek seferde üretilen yolların kesin ortalaması
+        params = self.engine._scenario_parameters('4C', 2030, 2000.0)
+        _, progress = self.engine._projection_years(2024, 2030)
+        seeds = np.random.SeedSequence(3).spawn(4)
+        volatility = chunked['volatility']
+        costs = np.vstack([simulate_paths(params, progress, 1000, volatility, s)['carbon_cost'] for s in seeds])
+        means = [band['mean'] for band in chunked['bands']['carbon_cost']]
+        np.testing.assert_allclose(means, costs.mean(axis=0), rtol=1e-9)
+
+    def _with_engine_constants(self, **constants):
+        engine_module = sys.modules[ScenarioEngine.__module__]
+        originals = {name: getattr(engine_module, name) for name in constants}
+        for name, value in constants.items():
+            setattr(engine_module, name, value)
+        self.addCleanup(lambda: [setattr(engine_module, name, value) for name, value in originals.items()])
+
+    def test_chunked_percentiles_match_pooled_paths(self):
+        self._with_engine_constants(SIMULATION_CHUNK_PATHS=5000)
+        chunked = self.engine.simulate_tcfd_scenario(1, '2C', 2024, 2030, 2000.0, n_paths=20000, seed=5)
+
+        # Parça yüzdelikleri ortalanmaz: sonuç birleşik yolların kesin yüzdeliğine yakın olmalı
+        params = self.engine._scenario_parameters('2C', 2030, 2000.0)
+        _, progress = self.engine._projection_years(2024, 2030)
+        seeds = np.random.SeedSequence(5).spawn(4)
+        volatility = chunked['volatility']
+        for metric in ('carbon_cost', 'net_financial_impact'):
+            values = np.vstack([simulate_paths(params, progress, 5000, volatility, s)[metric] for s in seeds])
+            exact = np.percentile(values, [5, 50, 95], axis=0)
+            tolerance = 2 * (values.max(axis=0) - values.min(axis=0)) / 4096 + 1e-9
+            for i, band in enumerate(chunked['bands'][metric]):
+                for row, key in enumerate(('p5', 'p50', 'p95')):
+                    self.assertLessEqual(abs(band[key] - exact[row][i]), tolerance[i])
+
+    def test_percentiles_do_not_depend_on_chunk_size(self):
+        self._with_engine_constants(SIMULATION_CHUNK_PATHS=1000)
+        small = self.engine.simulate_tcfd_scenario(1, '4C', 2024, 2030, 2000.0, n_paths=4000, seed=8)
+        self._with_engine_constants(SIMULATION_CHUNK_PATHS=2000)
+        large = self.engine.simulate_tcfd_scenario(1, '4C', 2024, 2030, 2000.0, n_paths=4000, seed=8)
+        width = [(band['p95'] - band['p5']) for band in small['bands']['carbon_cost']]
+        for a, b, w in zip(small['bands']['carbon_cost'], large['bands']['carbon_cost'], width):
+            # Farklı tohum dağılımı → yalnızca örnekleme gürültüsü kadar fark
+            self.assertAlmostEqual(a['p50'], b['p50'], delta=0.1 * w + 1e-9)
+
+    def test_process_pool_branch_matches_serial(self):
+        self._with_engine_constants(SIMULATION_CHUNK_PATHS=500, PROCESS_POOL_MIN_PATHS=1000)
+        engine_module = sys.modules[ScenarioEngine.__module__]
+        with mock.patch.object(engine_module, 'ProcessPoolExecutor',
+                               wraps=engine_module.ProcessPoolExecutor) as pool_class:
+            pooled = self.engine.simulate_tcfd_scenario(
+                1, '1_5C', 2024, 2030, 3000.0, n_paths=2000, seed=11, max_workers=2)
+        pool_class.assert_called_once_with(max_workers=2)
+        serial = self.engine.simulate_tcfd_scenario(
+            1, '1_5C', 2024, 2030, 3000.0, n_paths=2000, seed=11, max_workers=1)
+        self.assertEqual(pooled['bands'], serial['bands'])
+        self.assertEqual(pooled['summary'], serial['summary'])
+
+
+if __name__ == '__main__':
+    unittest.main()
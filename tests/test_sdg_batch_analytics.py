@@ -0,0 +1,116 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.modules.sdg.sdg_advanced_analytics import SDGAdvancedAnalytics
+from utils.db_pool import connect
+
+SOURCE_DDL = (
+    """CREATE TABLE sdg_indicator_status (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, company_id INTEGER NOT NULL, sdg_no INTEGER NOT NULL,
+        indicator_code TEXT NOT NULL, indicator_title TEXT NOT NULL,
+        total_questions INTEGER DEFAULT 3, answered_questions INTEGER DEFAULT 0,
+        completion_percentage REAL DEFAULT 0.0, last_updated TEXT DEFAULT CURRENT_TIMESTAMP)""",
+    """CREATE TABLE sdg_progress_trends (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, company_id INTEGER NOT NULL, sdg_no INTEGER NOT NULL,
+        measurement_date TEXT NOT NULL, completion_percentage REAL NOT NULL,
+        answered_questions INTEGER NOT NULL, total_questions INTEGER NOT NULL)""",
+)
+
+
+def _seed(db_path):
+    now = datetime.now()
+    conn = connect(db_path)
+    for statement in SOURCE_DDL:
+        conn.execute(statement)
+    indicators, trends = [], []
+    for sdg_no in range(1, 18):
+        if sdg_no == 17:
+            continue  # göstergesi olmayan hedef
+        for k in range(sdg_no % 4 + 1):
+            answered = (sdg_no + k) % 4
+            stamp = (now - timedelta(days=(sdg_no * 7 + k) % 120)).isoformat() if k != 2 else 'geçersiz'
+            indicators.append((1, sdg_no, f"{sdg_no}.{k}", f"Gösterge {sdg_no}.{k}", 3,
+                               answered, answered / 3 * 100, stamp if sdg_no != 5 else None))
+        for d in range(sdg_no % 5):
+            trends.append((1, sdg_no, (now - timedelta(days=20 - d)).isoformat(),
+                           (sdg_no * 3 + d * (sdg_no % 3 - 1) * 4) % 100, d, 3))
+    indicators.append((2, 1, '1.x', 'Başka firma', 3, 3, 100.0, now.isoformat()))
+    conn.executemany("""INSERT INTO sdg_indicator_status (company_id, sdg_no, indicator_code, indicator_title,
+                        total_questions, answered_questions, completion_percentage, last_updated)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)""", indicators)
+    conn.executemany("""INSERT INTO sdg_progress_trends (company_id, sdg_no, measurement_date,
+                        completion_percentage, answered_questions, total_questions)
+                        VALUES (?, ?, ?, ?, ?, ?)""", trends)
+    conn.commit()
+    conn.close()
+
+
+def _count(db_path, table):
+    conn = connect(db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table} WHERE company_id = 1").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestSDGBatchAnalytics(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.batch_db = os.path.join(self.tmp_dir, 'batch.db')
+        self.loop_db = os.path.join(self.tmp_dir, 'loop.db')
+        for path in (self.batch_db, self.loop_db):
+            _seed(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_batch_matches_per_goal_analysis(self):
+        batch = SDGAdvancedAnalytics(self.batch_db).analyze_all_goals(1)
+        loop = SDGAdvancedAnalytics(self.loop_db)
+
+        self.assertEqual(sorted(batch), list(range(1, 18)))
+        for sdg_no in range(1, 18):
+            expected = loop.get_comprehensive_analysis(1, sdg_no)
+            actual = batch[sdg_no]
+            for key in ('overall_status', 'overall_score', 'performance_analysis', 'indicator_analytics',
+                        'trend_analysis', 'metrics_analysis', 'risk_analysis', 'recommendations'):
+                self.assertEqual(actual[key], expected[key], f"SDG {sdg_no}: {key}")
+
+        for table in ('sdg_goal_performance_scores', 'sdg_indicator_analytics',
+                      'sdg_trend_analysis', 'sdg_risk_analysis'):
+            self.assertEqual(_count(self.batch_db, table), _count(self.loop_db, table), table)
+
+    def test_goal_subset_and_missing_sources(self):
+        empty_db = os.path.join(self.tmp_dir, 'empty.db')
+        result = SDGAdvancedAnalytics(empty_db).analyze_all_goals(1, sdg_numbers=[13, 3])
+        self.assertEqual(sorted(result), [3, 13])
+        self.assertEqual(result[3]['overall_status'], 'needs_improvement')
+        self.assertEqual(result[3]['trend_analysis']['trend_type'], 'insufficient_data')
+
+        subset = SDGAdvancedAnalytics(self.batch_db).analyze_all_goals(1, sdg_numbers=[2])
+        self.assertEqual(list(subset), [2])
+        self.assertEqual(_count(self.batch_db, 'sdg_goal_performance_scores'), 1)
+
+    def test_timeliness_matches_per_indicator_rules(self):
+        analytics = SDGAdvancedAnalytics(self.batch_db)
+        now = datetime.now()
+        stamps = [None, '', 'geçersiz', (now + timedelta(hours=12)).isoformat(),
+                  (now + timedelta(days=1, hours=1)).isoformat(), (now - timedelta(days=20)).isoformat(),
+                  (now - timedelta(days=200)).isoformat()]
+        rows = [(1, f"1.{i}", 'G', 1, 3, 33.3, stamp) for i, stamp in enumerate(stamps)]
+        scored = analytics._score_indicators_batch(rows, {1: 0}, now)['results']
+        # Gelecekteki (ör. UTC CURRENT_TIMESTAMP) tarih tarihsiz sayılmaz
+        self.assertEqual([r['timeliness_score'] for r in scored],
+                         [analytics._calculate_timeliness_score(stamp) for stamp in stamps])
+        self.assertEqual(scored[3]['timeliness_score'], 100.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
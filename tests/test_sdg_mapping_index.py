@@ -0,0 +1,72 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+
+from mapping import sdg_gri_mapping as mapping_module
+from mapping.sdg_gri_mapping import get_mapping_index, invalidate_mapping_index
+
+
+class TestSDGMappingIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.excel_path = os.path.join(self.tmp_dir, 'SDG_232.xlsx')
+        self.cache_path = os.path.join(self.tmp_dir, 'cache', 'index.pkl')
+        self._write_workbook([
+            [7, 'Enerji', '7.1', '7.1.1', 'Soru A', None, 'GRI 302-1', None],
+            [13, 'İklim', '13.2', '13.2.2', 'Soru B', 'Soru C', 'GRI 305-1', 'TSRS 2'],
+            [7, 'Enerji', '7.2', '7.2.1', None, None, 'GRI 302-1', None],
+        ])
+        invalidate_mapping_index()
+
+    def tearDown(self):
+        invalidate_mapping_index()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _write_workbook(self, rows):
+        columns = ['Sürdürülebilir Kalkınma Hedefi No:', 'SDG Başlık', 'Alt Hedef Kodu', 'Gösterge Kodu',
+                   'Soru 1', 'Soru 2', 'GRI Bağlantısı', 'TSRS Bağlantısı']
+        pd.DataFrame(rows, columns=columns).to_excel(self.excel_path, sheet_name='MASTER_232', index=False)
+
+    def test_index_lookups_and_disk_cache(self):
+        index = get_mapping_index(self.excel_path, self.cache_path)
+        self.assertEqual(index.by_goal, {7: (0, 2), 13: (1,)})
+        self.assertEqual(index.positions_for_goals([13, 7]), [0, 1, 2])
+        self.assertEqual(index.row_for_indicator('13.2.2')['SDG No'], 13)
+        self.assertEqual(len(index.rows_for_target('7.2')), 1)
+        self.assertEqual([len(q) for q in index.questions], [1, 2, 0])
+        self.assertTrue(os.path.exists(self.cache_path))
+
+        # Aynı süreçte bellekten, yeni süreçte (memo yok) diskten; Excel okunmaz
+        self.assertIs(get_mapping_index(self.excel_path, self.cache_path), index)
+        invalidate_mapping_index()
+        with mock.patch.object(mapping_module.pd, 'read_excel', side_effect=AssertionError('Excel okunmamalı')):
+            cached = get_mapping_index(self.excel_path, self.cache_path)
+        self.assertEqual(cached.by_goal, index.by_goal)
+
+        # Çalışma kitabı değişince indeks yeniden kurulur
+        self._write_workbook([[3, 'Sağlık', '3.1', '3.1.1', 'Soru D', None, None, None]])
+        os.utime(self.excel_path, ns=(0, 10 ** 18))
+        self.assertEqual(get_mapping_index(self.excel_path, self.cache_path).by_goal, {3: (0,)})
+
+    def test_gri_mapping_deduplicates_standards(self):
+        mapper = mapping_module.SDGGRIMapping.__new__(mapping_module.SDGGRIMapping)
+        mapper.index = get_mapping_index(self.excel_path, self.cache_path)
+        mapper.excel_data = mapper.index.frame
+
+        gri = mapper.get_gri_mapping_for_goals([7])
+        self.assertEqual(gri[7]['gri_standards'], ['GRI 302-1'])
+        self.assertEqual(len(gri[7]['indicators']), 2)
+        self.assertEqual([q['question_text'] for q in mapper.get_questions_for_goals([13, 7])],
+                         ['Soru A', 'Soru B', 'Soru C'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.services import settings_service as settings_module
+from backend.services.settings_service import SettingsService
+from utils.db_pool import connect
+
+
+class TestSettingsService(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'settings.db')
+        self.service = SettingsService(self.db_path)
+        self.other_worker = SettingsService(self.db_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_snapshot_served_from_memory_until_version_changes(self):
+        self.service.save(1, {'sec_session_timeout_minutes': '45', 'sec_lockout_seconds': 'abc'},
+                          'security', 'Güvenlik ayarı')
+        self.service.save(2, {'sec_session_timeout_minutes': '10'}, 'security', 'Güvenlik ayarı')
+
+        self.assertEqual(self.other_worker.get_int(1, 'sec_session_timeout_minutes', 30), 45)
+        self.assertEqual(self.other_worker.get_int(1, 'sec_lockout_seconds', 900), 900)
+        self.assertEqual(self.other_worker.get_many(2, ['sec_session_timeout_minutes', 'missing']),
+                         {'sec_session_timeout_minutes': '10', 'missing': ''})
+        loads = self.other_worker.get_stats()['loads']
+
+        with mock.patch.object(settings_module, 'db_connect', side_effect=AssertionError('sorgu yapılmamalı')):
+            self.assertEqual(self.other_worker.get_int(1, 'sec_session_timeout_minutes', 30), 45)
+        self.assertEqual(self.other_worker.get_stats()['loads'], loads)
+
+        # Başka worker'daki (veya doğrudan SQL ile) yazma sürümü artırır
+        conn = connect(self.db_path)
+        conn.execute("UPDATE system_settings SET value='60' WHERE key='sec_session_timeout_minutes' AND company_id=1")
+        conn.commit()
+        conn.close()
+        self.assertEqual(self.other_worker.get_int(1, 'sec_session_timeout_minutes', 30), 45)
+        with mock.patch.object(settings_module, 'VERSION_CHECK_INTERVAL', 0):
+            self.assertEqual(self.other_worker.get_int(1, 'sec_session_timeout_minutes', 30), 60)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.modules.stakeholder.stakeholder_engagement import StakeholderEngagement, survey_token_of
+from core.async_db_writer import get_writer
+from utils.db_pool import connect
+
+
+class TestSurveyToken(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'survey.db')
+        self.engagement = StakeholderEngagement(self.db_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _analytics(self, survey_id):
+        conn = connect(self.db_path)
+        try:
+            return dict(conn.execute(
+                "SELECT sdg_id, total_score FROM sdg_survey_analytics WHERE survey_id = ?", (survey_id,)
+            ).fetchall())
+        finally:
+            conn.close()
+
+    def test_submit_uses_token_and_batches_analytics(self):
+        link = self.engagement.create_online_survey(1, 'Anket', '', ['calisan'], [{'question': 'Q'}])
+        token = survey_token_of(link)
+        survey = self.engagement.find_survey_by_token(token)
+        self.assertEqual(survey['survey_token'], token)
+
+        # Tam URL, yol ve çıplak token aynı anketi bulur
+        for ref in (link, f"/survey/{token}", token):
+            self.assertTrue(self.engagement.submit_survey_response(ref, {'answers': {'SDG1': '4', 'SDG2': 'x'}}))
+        self.assertFalse(self.engagement.submit_survey_response('yok', {'answers': {'SDG1': '4'}}))
+
+        self.assertEqual(self._analytics(survey['id']), {'SDG1': 12})
+        self.assertEqual(self.engagement.find_survey_by_token(token)['response_count'], 3)
+
+        deferred = StakeholderEngagement(self.db_path, defer_analytics=True)
+        self.assertTrue(deferred.submit_survey_response(token, {'answers': {'SDG1': '3'}}))
+        self.assertTrue(get_writer(self.db_path).flush())
+        self.assertEqual(self._analytics(survey['id']), {'SDG1': 15})
+
+    def test_backfill_migration_and_trigger(self):
+        conn = connect(self.db_path)
+        conn.execute("DROP INDEX idx_online_surveys_survey_token")
+        conn.execute("DROP TRIGGER trg_online_surveys_token_insert")
+        conn.execute("UPDATE online_surveys SET survey_token = NULL")
+        conn.executemany(
+            "INSERT INTO online_surveys (company_id, survey_title, target_groups, survey_link) VALUES (1, 't', '[]', ?)",
+            [('https://survey.example.com/abc',), ('/survey/abc',), ('/survey/def',)],
+        )
+        conn.commit()
+
+        migration = importlib.import_module('backend.modules.database.migrations.011_survey_token')
+        migration.up(conn)
+        conn.commit()
+        rows = dict(conn.execute("SELECT survey_link, survey_token FROM online_surveys").fetchall())
+        # Çakışan eski bağlantılardan yalnızca en yenisi token alır
+        self.assertEqual(rows, {'https://survey.example.com/abc': None, '/survey/abc': 'abc', '/survey/def': 'def'})
+
+        # survey_token yazmayan INSERT yolu için tetikleyici doldurur
+        conn.execute("INSERT INTO online_surveys (company_id, survey_title, target_groups, survey_link) "
+                     "VALUES (1, 't', '[]', 'https://x.example.com/s/ghi')")
+        conn.commit()
+        self.assertEqual(conn.execute(
+            "SELECT survey_token FROM online_surveys WHERE survey_link LIKE '%ghi'").fetchone()[0], 'ghi')
+        plan = conn.execute("EXPLAIN QUERY PLAN SELECT id FROM online_surveys WHERE survey_token = 'ghi'").fetchall()
+        self.assertIn('idx_online_surveys_survey_token', ' '.join(str(row[-1]) for row in plan))
+        conn.close()
+
+    def test_links_without_token_stay_null(self):
+        conn = connect(self.db_path)
+        # 011'in NULLIF'siz tetikleyicisini ve yazdığı boş token'ı taklit et
+        conn.execute("DROP TRIGGER trg_online_surveys_token_insert")
+        conn.execute("""CREATE TRIGGER trg_online_surveys_token_insert AFTER INSERT ON online_surveys
+                        WHEN NEW.survey_token IS NULL BEGIN
+                            UPDATE online_surveys SET survey_token = '' WHERE id = NEW.id;
+                        END""")
+        conn.execute("INSERT INTO online_surveys (company_id, survey_title, target_groups, survey_link) "
+                     "VALUES (1, 't', '[]', 'https://x.example.com/s/')")
+        conn.commit()
+
+        migration = importlib.import_module('backend.modules.database.migrations.018_survey_token_empty')
+        migration.up(conn)
+        conn.commit()
+        # '/' ile biten eski bağlantılar indeksi ihlal etmeden yazılabilir
+        conn.executemany(
+            "INSERT INTO online_surveys (company_id, survey_title, target_groups, survey_link) VALUES (1, 't', '[]', ?)",
+            [('https://y.example.com/s/',), ('/survey/',)],
+        )
+        conn.execute("UPDATE online_surveys SET survey_link = 'https://z.example.com/' WHERE survey_link = '/survey/'")
+        conn.commit()
+        self.assertEqual(conn.execute(
+            "SELECT COUNT(*) FROM online_surveys WHERE survey_token IS NULL").fetchone()[0], 3)
+        conn.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.core import translation_bundles
+from backend.core.translation_bundles import TranslationBundleStore, UnknownNamespaceError
+
+TRANSLATIONS = {'tr': {'cbam_title': 'CBAM', 'gri_title': 'GRI', 'sdg_title': 'SKA', 'home': 'Ana sayfa'}}
+
+
+class TestTranslationBundles(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.store = TranslationBundleStore(TRANSLATIONS, cache_dir=self.cache_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_unknown_namespace_is_rejected(self):
+        with self.assertRaises(UnknownNamespaceError):
+            self.store.get('tr', ['cbam', 'nope'])
+        self.assertEqual(self.store.get('tr', ['cbam']).raw.count(b'CBAM'), 1)
+
+    def test_only_full_bundle_is_persisted(self):
+        full = self.store.get('tr')
+        self.store.get('tr', ['cbam'])
+        self.store.get('tr', ['gri', 'sdg'])
+        self.assertEqual({name.split('.', 1)[0] for name in os.listdir(self.cache_dir)}, {full.digest})
+
+    def test_sub_bundle_cache_is_bounded(self):
+        original = translation_bundles.MAX_SUB_BUNDLES
+        translation_bundles.MAX_SUB_BUNDLES = 2
+        try:
+            for selection in (['cbam'], ['gri'], ['sdg'], ['cbam', 'gri']):
+                self.store.get('tr', selection)
+        finally:
+            translation_bundles.MAX_SUB_BUNDLES = original
+        self.assertEqual(len(self.store._sub_bundles), 2)
+
+    def test_etag_differs_per_encoding(self):
+        bundle = self.store.get('tr')
+        etags = {bundle.etag_for(bundle.body_for(accept)[1]) for accept in ('br, gzip', 'gzip', '')}
+        self.assertEqual(len(etags), 3 if bundle.br is not None else 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -135,5 +135,36 @@ class TestTranslations(unittest.TestCase):
             self.assertIn('lang', data, f"Key 'lang' missing in response: {data}")
             self.assertEqual(data['lang'], 'fr')
 
+    def test_api_translations_etag_encoding_and_namespaces(self):
+        """Paket ETag/304, önceden sıkıştırılmış gövde ve ad alanı filtresi"""
+        import gzip
+        headers = {'X-License-Key': 'mock-key'}
+        with self.client.session_transaction() as sess:
+            sess['lang'] = 'tr'
+
+        response = self.client.get('/api/v1/translations', headers={**headers, 'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers.get('Content-Encoding'), 'gzip')
+        etag = response.headers['ETag']
+        data = json.loads(gzip.decompress(response.data))
+        self.assertEqual(data['translations'], language_manager.get_all_translations('tr'))
+
+        response = self.client.get('/api/v1/translations',
+                                   headers={**headers, 'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+
+        # Sıkıştırılmamış gövdenin ETag'i farklıdır; gzip ETag'i onu doğrulamaz
+        response = self.client.get('/api/v1/translations', headers={**headers, 'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+        response = self.client.get('/api/v1/translations?ns=cbam,gri', headers=headers)
+        data = response.get_json()
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(data['namespaces'], ['cbam', 'gri'])
+        self.assertTrue(data['translations'])
+        self.assertTrue(all(k.split('_')[0] in ('cbam', 'gri') for k in data['translations']))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,91 @@
+"""
+SDG gelişmiş analitik: hedef bazlı döngü ile toplu analizi karşılaştırır.
+
+Geçici bir veritabanına sentetik gösterge durumları ve trend ölçümleri yazılır;
+aynı veri üzerinde 17 hedef için get_comprehensive_analysis döngüsü ve
+analyze_all_goals ayrı kopyalarda çalıştırılıp süreleri yazdırılır.
+
+Kullanım:
+    python tools/benchmark_sdg_analytics.py [--indicators 12] [--trend-points 25] [--repeat 3]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from modules.sdg.sdg_advanced_analytics import SDGAdvancedAnalytics
+from utils.db_pool import connect
+
+COMPANY_ID = 1
+
+
+def seed(db_path, indicators_per_goal, trend_points):
+    now = datetime.now()
+    conn = connect(db_path)
+    conn.execute("""CREATE TABLE IF NOT EXISTS sdg_indicator_status (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, company_id INTEGER NOT NULL, sdg_no INTEGER NOT NULL,
+        indicator_code TEXT NOT NULL, indicator_title TEXT NOT NULL,
+        total_questions INTEGER DEFAULT 3, answered_questions INTEGER DEFAULT 0,
+        completion_percentage REAL DEFAULT 0.0, last_updated TEXT DEFAULT CURRENT_TIMESTAMP)""")
+    conn.execute("""CREATE TABLE IF NOT EXISTS sdg_progress_trends (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, company_id INTEGER NOT NULL, sdg_no INTEGER NOT NULL,
+        measurement_date TEXT NOT NULL, completion_percentage REAL NOT NULL,
+        answered_questions INTEGER NOT NULL, total_questions INTEGER NOT NULL)""")
+    conn.executemany(
+        """INSERT INTO sdg_indicator_status (company_id, sdg_no, indicator_code, indicator_title,
+           total_questions, answered_questions, completion_percentage, last_updated)
+           VALUES (?, ?, ?, ?, 3, ?, ?, ?)""",
+        [(COMPANY_ID, sdg_no, f"{sdg_no}.{k}", f"Gösterge {sdg_no}.{k}", (sdg_no + k) % 4,
+          (sdg_no + k) % 4 / 3 * 100, (now - timedelta(days=(sdg_no + k) * 5)).isoformat())
+         for sdg_no in range(1, 18) for k in range(indicators_per_goal)]
+    )
+    conn.executemany(
+        """INSERT INTO sdg_progress_trends (company_id, sdg_no, measurement_date, completion_percentage,
+           answered_questions, total_questions) VALUES (?, ?, ?, ?, ?, 3)""",
+        [(COMPANY_ID, sdg_no, (now - timedelta(days=29, minutes=-d)).isoformat(),
+          min(100.0, sdg_no * 2 + d * 1.5), d % 4)
+         for sdg_no in range(1, 18) for d in range(trend_points)]
+    )
+    conn.commit()
+    conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='SDG analitik: hedef bazlı ve toplu analiz karşılaştırması')
+    parser.add_argument('--indicators', type=int, default=12, help='Hedef başına gösterge sayısı')
+    parser.add_argument('--trend-points', type=int, default=25, help='Hedef başına trend ölçümü')
+    parser.add_argument('--repeat', type=int, default=3, help='Tekrar sayısı (en iyi süre alınır)')
+    args = parser.parse_args(argv)
+
+    tmp_dir = tempfile.mkdtemp(prefix='sdg_bench_')
+    try:
+        timings = {'per_goal': [], 'batch': []}
+        for run in range(args.repeat):
+            for mode in timings:
+                db_path = os.path.join(tmp_dir, f"{mode}_{run}.sqlite")
+                seed(db_path, args.indicators, args.trend_points)
+                analytics = SDGAdvancedAnalytics(db_path)
+                started = time.perf_counter()
+                if mode == 'per_goal':
+                    for sdg_no in range(1, 18):
+                        analytics.get_comprehensive_analysis(COMPANY_ID, sdg_no)
+                else:
+                    analytics.analyze_all_goals(COMPANY_ID)
+                timings[mode].append(time.perf_counter() - started)
+
+        per_goal, batch = min(timings['per_goal']), min(timings['batch'])
+        print(f"17 hedef x {args.indicators} gösterge: hedef bazlı {per_goal * 1000:.1f} ms, "
+              f"toplu {batch * 1000:.1f} ms ({per_goal / batch:.1f}x)")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""
+/api/v1/translations için dil paketlerini en yüksek sıkıştırma kalitesinde
+önceden üretir (gzip 9 / brotli 11) ve eski paket dosyalarını temizler.
+
+Paketler içerik özetine göre data/cache/translations altına yazılır; worker'lar
+aynı özeti bulduğunda yeniden sıkıştırmaz. Gunicorn on_starting kancası bu
+komutu her başlangıçta çalıştırır; değişmemiş diller yalnızca özetlenir.
+
+Kullanım:
+    python tools/build_translation_bundles.py [--lang tr --lang en] [--no-prune]
+"""
+import argparse
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from core.language_manager import LanguageManager
+from core.translation_bundles import TranslationBundleStore
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Çeviri paketlerini önceden üret')
+    parser.add_argument('--lang', action='append', default=None, help='Yalnızca bu dil(ler) (varsayılan: tümü)')
+    parser.add_argument('--no-prune', action='store_true', help='Eski paket dosyalarını silme')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    store = TranslationBundleStore(LanguageManager().translations, gzip_level=9, brotli_quality=11)
+    count = store.warm(args.lang)
+    removed = 0 if (args.no_prune or args.lang) else store.prune()
+    elapsed = time.perf_counter() - start
+    print(f"translation bundles: {count} dil, {removed} eski dosya silindi ({elapsed:.1f} sn)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
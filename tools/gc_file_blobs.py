@@ -0,0 +1,42 @@
+"""
+Dosya yöneticisinin blob deposundaki sahipsiz içerikleri temizler.
+
+Referans sayıları files tablosundan yeniden hesaplanır; hiçbir files
+satırının göstermediği ve bekleme süresi dolmuş blob'lar ile yarım kalmış
+yükleme dosyaları silinir. Soft delete edilmiş dosyalar blob'larını korur.
+
+Kullanım:
+    python tools/gc_file_blobs.py [--db PATH] [--upload-dir DIR] [--grace SN] [--dry-run]
+"""
+import argparse
+import os
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from config.database import DB_PATH
+from modules.file_manager.advanced_file_manager import BLOB_GC_GRACE_SECONDS, AdvancedFileManager
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Sahipsiz dosya blob temizliği')
+    parser.add_argument('--db', dest='db_path', default=DB_PATH, help='Veritabanı yolu')
+    parser.add_argument('--upload-dir', default=None, help='Yükleme klasörü (varsayılan: proje uploads/)')
+    parser.add_argument('--grace', type=float, default=BLOB_GC_GRACE_SECONDS,
+                        help='Bu kadar saniyedir kullanılmayan blob silinir')
+    parser.add_argument('--dry-run', action='store_true', help='Yalnızca raporla, silme')
+    args = parser.parse_args(argv)
+
+    manager = AdvancedFileManager(args.db_path, args.upload_dir)
+    result = manager.collect_garbage(grace_seconds=args.grace, dry_run=args.dry_run)
+    stats = manager.get_blob_stats()
+    prefix = '[dry-run] ' if args.dry_run else ''
+    print(f"{prefix}file blobs: {result['blobs_removed']} blob ({result['bytes_freed']} bayt), "
+          f"{result['stray_removed']} sahipsiz dosya silindi")
+    print(f"depo: {stats['blobs']} blob / {stats['files']} dosya, tekilleştirme oranı {stats['dedup_ratio']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
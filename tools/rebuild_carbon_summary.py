@@ -0,0 +1,32 @@
+"""
+carbon_summary tablosunu carbon_emissions kayıtlarından yeniden oluşturur.
+
+Özet, kayıt ekleme/güncelleme/silmede artımlı güncellenir; bu komut
+doğrudan SQL ile yapılan değişikliklerden sonra onarım içindir.
+
+Kullanım:
+    python tools/rebuild_carbon_summary.py [--company ID] [--db PATH]
+"""
+import argparse
+import os
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from modules.environmental.carbon_calculator import CarbonCalculator
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='carbon_summary yeniden oluşturma')
+    parser.add_argument('--company', type=int, default=None, help='Yalnızca bu firma (varsayılan: tümü)')
+    parser.add_argument('--db', dest='db_path', default=None, help='Veritabanı yolu')
+    args = parser.parse_args(argv)
+
+    written = CarbonCalculator(args.db_path).rebuild_summary(args.company)
+    print(f"carbon_summary: {written} satır yeniden hesaplandı")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
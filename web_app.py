@@ -50,25 +50,25 @@ from yonetim.security.core.auth import (
     set_force_2fa as core_set_force_2fa,
 )
 from core.db_log_handler import DBLogHandler
+from core.async_db_writer import get_writer_stats
+from core.rate_limit_store import get_store as get_rate_limit_store, storage_uri as rate_limit_storage_uri
+from utils.db_pool import (
+    connect as db_connect,
+    get_request_connection,
+    release_request_connections,
+)
 from core.audit_manager import AuditManager
+from core.manager_registry import ManagerRegistry, parse_warm_up_list
+from backend.core.module_access import get_session_permissions, set_permission_resolver
 from backend.core.language_manager import LanguageManager
-from yonetim.license_manager import LicenseManager
+from backend.core.translation_bundles import TranslationBundleStore, UnknownNamespaceError
+from yonetim.license_manager import LicenseManager, get_license_cache_stats, invalidate_license_cache
+from backend.services.settings_service import SettingsService
 from backend.security.captcha_manager import CaptchaManager
 from backend.security.alert_system import report_violation
 from backend.security.core.super_user_protection import _check_two_stage_approval
 
 from mapping.sdg_gri_mapping import SDGGRIMapping
-from backend.modules.database.backup_recovery_manager import BackupRecoveryManager
-from backend.modules.data_import.data_importer import DataImporter
-from backend.modules.lca.lca_manager import LCAManager
-from backend.modules.supply_chain.supply_chain_manager import SupplyChainManager
-from backend.modules.realtime.realtime_manager import RealTimeMonitoringManager
-from backend.modules.environmental.biodiversity_manager import BiodiversityManager
-from backend.modules.social.social_manager import SocialManager
-from backend.modules.environmental.carbon_manager import CarbonManager
-from backend.modules.environmental.water_manager import WaterManager
-from backend.modules.environmental.waste_manager import WasteManager
-from backend.modules.governance.corporate_governance import CorporateGovernanceManager
 from config.database import DB_PATH
 # FORCE DB_PATH for remote environment to ensure correct DB is used
 if os.path.exists('/var/www/sustainage/backend/data/sdg_desktop.sqlite'):
@@ -77,6 +77,7 @@ if os.path.exists('/var/www/sustainage/backend/data/sdg_desktop.sqlite'):
 # Initialize Managers
 audit_manager = AuditManager(DB_PATH)
 language_manager = LanguageManager()
+translation_bundles = TranslationBundleStore(language_manager.translations)
 license_manager = LicenseManager(DB_PATH)
 captcha_manager = CaptchaManager()
 
@@ -149,7 +150,7 @@ COMPANY_INFO_FIELDS = [
 
 
 def ensure_company_info_table() -> None:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_connect(DB_PATH)
     cur = conn.cursor()
     cur.execute(
         """
@@ -190,10 +191,10 @@ except Exception as e:
     USER_MANAGER_AVAILABLE = False
 
 try:
-    from modules.super_admin.components.rate_limiter import RateLimiter
-    from modules.super_admin.components.ip_manager import IPManager
-    from modules.super_admin.components.monitoring_dashboard import MonitoringDashboard
-    from modules.super_admin.components.license_generator import LicenseGenerator
+    from backend.modules.super_admin.components.rate_limiter import RateLimiter
+    from backend.modules.super_admin.components.ip_manager import IPManager
+    from backend.modules.super_admin.components.monitoring_dashboard import MonitoringDashboard
+    from backend.modules.super_admin.components.license_generator import LicenseGenerator
     rate_limiter = RateLimiter(DB_PATH)
     IP_MANAGER_AVAILABLE = True
     MONITORING_AVAILABLE = True
@@ -241,6 +242,7 @@ def require_company_context(f):
     return decorated_function
 
 app = Flask(__name__)
+app.teardown_appcontext(release_request_connections)
 # Enable Gzip Compression
 Compress(app)
 
@@ -266,11 +268,12 @@ def verify_server_identity():
             pass
 
 # 2. RATE LIMITING (Brute-Force Protection)
+# Sayaçlar tüm gunicorn worker'larınca paylaşılan WAL SQLite dosyasında tutulur
 limiter = Limiter(
     get_remote_address,
     app=app,
     default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://"
+    storage_uri=rate_limit_storage_uri()
 )
 
 # 3. HTTP SECURITY HEADERS (CSP, HSTS, XSS)
@@ -381,23 +384,19 @@ def inject_version():
 
 @app.context_processor
 def inject_notifications():
-    if 'user_id' not in session:
-        return {'unread_notifications': [], 'unread_notification_count': 0}
-    
+    # Yalnızca worker cache'indeki sayaç; liste /api/notifications/summary ile istemcide yüklenir
+    user_id = session.get('user_id')
+    if not user_id:
+        return {'unread_notification_count': 0}
+
     try:
-        user_id = session.get('user_id')
-        if not user_id:
-            return {'unread_notifications': [], 'unread_notification_count': 0}
-            
         nm = MANAGERS.get('notification')
         if nm:
-            unread = nm.get_unread_notifications(user_id, limit=5)
-            count = nm.get_unread_count(user_id)
-            return {'unread_notifications': unread, 'unread_notification_count': count}
+            return {'unread_notification_count': nm.get_unread_count(user_id)}
     except Exception as e:
         logging.error(f"Context processor error: {e}")
-        
-    return {'unread_notifications': [], 'unread_notification_count': 0}
+
+    return {'unread_notification_count': 0}
 
 # Add DB log handler
 try:
@@ -469,6 +468,17 @@ def add_security_headers(response):
     
     return response
 
+from backend.modules.dashboard_stats import invalidate_module_stats
+
+@app.after_request
+def invalidate_dashboard_stats(response):
+    # Veri yazan başarılı istekler şirketin modül tamamlanma cache'ini siler
+    if request.method in ('POST', 'PUT', 'PATCH', 'DELETE') and response.status_code < 400:
+        company_id = getattr(g, 'company_id', None) or session.get('company_id')
+        if company_id:
+            invalidate_module_stats(company_id)
+    return response
+
 # Enable Jinja2 Bytecode Cache (if not already enabled by default)
 # Note: Jinja2 in Flask usually uses an in-memory cache, but we can be explicit if needed.
 # For now, relying on default environment behavior is often sufficient, 
@@ -532,12 +542,56 @@ def api_translations():
     # Ensure it defaults to 'tr' if invalid
     if current_lang not in language_manager.translations:
         current_lang = 'tr'
-        
-    translations = language_manager.get_all_translations(current_lang)
-    return jsonify({
-        'lang': current_lang,
-        'translations': translations
-    })
+
+    # ?ns=cbam,gri -> yalnızca bu modül öneklerindeki anahtarlar
+    namespaces = [ns.strip() for value in request.args.getlist('ns') for ns in value.split(',') if ns.strip()]
+    try:
+        bundle = translation_bundles.get(current_lang, namespaces)
+    except UnknownNamespaceError as e:
+        return jsonify({'error': str(e)}), 400
+
+    body, encoding = bundle.body_for(request.headers.get('Accept-Encoding', ''))
+    # Her kodlamanın baytları farklı: ETag de kodlamaya göre ayrılır
+    etag = bundle.etag_for(encoding)
+    if request.if_none_match.contains(etag):
+        response = make_response('', 304)
+    else:
+        response = make_response(body)
+        response.mimetype = 'application/json'
+        if encoding:
+            # Flask-Compress Content-Encoding olan yanıtı yeniden sıkıştırmaz
+            response.headers['Content-Encoding'] = encoding
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    response.vary.add('Accept-Encoding')
+    response.vary.add('Cookie')
+    return response
+
+@app.route('/api/notifications/summary')
+def api_notifications_summary():
+    """Okunmamış sayısı ve son bildirimler; sürüme dayalı ETag ile koşullu GET"""
+    user_id = session.get('user_id')
+    if not user_id:
+        return jsonify({'error': 'Authentication required'}), 401
+    nm = MANAGERS.get('notification')
+    if not nm:
+        return jsonify({'unread_count': 0, 'version': 0, 'notifications': []})
+
+    limit = min(max(request.args.get('limit', 5, type=int) or 5, 1), 50)
+    count, version = nm.get_unread_state(user_id, fresh=True)
+    etag = f"n{user_id}-{version}-{limit}"
+    if request.if_none_match.contains(etag):
+        response = make_response('', 304)
+    else:
+        response = jsonify({
+            'unread_count': count,
+            'version': version,
+            'notifications': nm.get_unread_notifications(user_id, limit=limit) if count else [],
+        })
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    response.vary.add('Cookie')
+    return response
 
 @app.route('/api/v1/login', methods=['POST'])
 def api_login():
@@ -658,51 +712,50 @@ def api_dashboard_stats():
         'modules': module_data
     })
 
-from backend.modules.environmental.carbon_manager import CarbonManager
-from backend.modules.environmental.carbon_reporting import CarbonReporting
-from backend.modules.environmental.energy_manager import EnergyManager
-from backend.modules.environmental.energy_reporting import EnergyReporting
-from backend.modules.environmental.water_manager import WaterManager
-from backend.modules.environmental.water_reporting import WaterReporting
-from backend.modules.environmental.waste_manager import WasteManager
-from backend.modules.environmental.waste_reporting import WasteReporting
-from backend.modules.social.social_manager import SocialManager
-from backend.modules.social.social_reporting import SocialReporting
-from backend.modules.governance.corporate_governance import CorporateGovernanceManager
-from backend.modules.governance.governance_reporting import GovernanceReporting
-from backend.modules.company.company_manager import CompanyManager
-from backend.modules.reporting.report_generator import ReportGenerator
-from backend.modules.reporting.advanced_report_manager import AdvancedReportManager
-from backend.modules.stakeholder.stakeholder_engagement import StakeholderEngagement
-
-# Manager Initialization (Lazy Loading or Global)
-MANAGERS = {
-    'sdg': None,
-    'gri': None,
-    'carbon': None,
-    'energy': None,
-    'water': None,
-    'waste': None,
-    'biodiversity': None,
-    'social': None,
-    'governance': None,
-    'supply_chain': None,
-    'economic': None,
-    'esg': None,
-    'cbam': None,
-    'csrd': None,
-    'taxonomy': None,
-    'issb': None,
-    'iirc': None,
-    'esrs': None,
-    'tcfd': None,
-    'tnfd': None,
-    'cdp': None,
-    'product_technology': None,
-    'benchmark': None,
-    'regulation': None,
-    'notification': None
-}
+# Manager Registry (Lazy Loading)
+# Manager'lar ilk kullanımda import edilip oluşturulur; her worker yalnızca
+# gerçekten kullandığı modüllerin import ve DDL maliyetini öder.
+MANAGERS = ManagerRegistry(default_factory=lambda cls: cls(DB_PATH))
+
+for _key, _module, _class in (
+    ('sdg', 'modules.sdg.sdg_manager', 'SDGManager'),
+    ('gri', 'modules.gri.gri_manager', 'GRIManager'),
+    ('carbon', 'modules.environmental.carbon_manager', 'CarbonManager'),
+    ('energy', 'modules.environmental.energy_manager', 'EnergyManager'),
+    ('water', 'modules.environmental.water_manager', 'WaterManager'),
+    ('waste', 'modules.environmental.waste_manager', 'WasteManager'),
+    ('biodiversity', 'modules.environmental.biodiversity_manager', 'BiodiversityManager'),
+    ('social', 'modules.social.social_manager', 'SocialManager'),
+    ('governance', 'modules.governance.corporate_governance', 'CorporateGovernanceManager'),
+    ('supply_chain', 'modules.supply_chain.supply_chain_manager', 'SupplyChainManager'),
+    ('economic', 'modules.economic.economic_manager', 'EconomicManager'),
+    ('cbam', 'modules.cbam.cbam_manager', 'CBAMManager'),
+    ('csrd', 'modules.csrd.csrd_compliance_manager', 'CSRDComplianceManager'),
+    ('taxonomy', 'modules.eu_taxonomy.taxonomy_manager', 'EUTaxonomyManager'),
+    ('issb', 'modules.issb.issb_manager', 'ISSBManager'),
+    ('iirc', 'modules.iirc.iirc_manager', 'IIRCManager'),
+    ('esrs', 'modules.esrs.esrs_manager', 'ESRSManager'),
+    ('tcfd', 'modules.tcfd.tcfd_manager', 'TCFDManager'),
+    ('tnfd', 'modules.tnfd.tnfd_manager', 'TNFDManager'),
+    ('cdp', 'modules.cdp.cdp_manager', 'CDPManager'),
+    ('product_technology', 'yonetim.product_technology.product_tech_manager', 'ProductTechManager'),
+    ('benchmark', 'modules.analytics.sector_benchmark_database', 'SectorBenchmarkDatabase'),
+    ('stakeholder', 'modules.stakeholder.stakeholder_engagement', 'StakeholderEngagement'),
+    ('notification', 'modules.notification.notification_manager', 'NotificationManager'),
+    ('training', 'modules.training.training_manager', 'TrainingManager'),
+    ('lca', 'modules.lca.lca_manager', 'LCAManager'),
+    ('realtime', 'modules.realtime.realtime_manager', 'RealTimeMonitoringManager'),
+    ('company', 'modules.company.company_manager', 'CompanyManager'),
+    ('report_generator', 'modules.reporting.report_generator', 'ReportGenerator'),
+    ('advanced_report', 'modules.reporting.advanced_report_manager', 'AdvancedReportManager'),
+    ('data_importer', 'modules.data_import.data_importer', 'DataImporter'),
+):
+    MANAGERS.register(_key, _module, _class)
+
+MANAGERS.register('esg', 'modules.esg.esg_manager', 'ESGManager',
+                  factory=lambda cls: cls(BACKEND_DIR))
+MANAGERS.register('regulation', 'modules.regulation.regulation_manager', 'RegulationManager',
+                  post_init=lambda manager: manager.populate_initial_data())
 
 # Register Supplier Portal Blueprint
 # DISABLED for security: Contains hardcoded credentials (supplier/supplier). Enable only after implementing proper auth.
@@ -721,190 +774,10 @@ try:
 except Exception as e:
     logging.error(f"Failed to register Role API blueprint: {e}")
 
-def _init_managers():
-    global MANAGERS
-    try:
-        from modules.sdg.sdg_manager import SDGManager
-        MANAGERS['sdg'] = SDGManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"SDGManager init: {e}")
-    try:
-        from modules.gri.gri_manager import GRIManager
-        MANAGERS['gri'] = GRIManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"GRIManager init: {e}")
-    try:
-        from modules.social.social_manager import SocialManager
-        MANAGERS['social'] = SocialManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"SocialManager init: {e}")
-    try:
-        from modules.governance.corporate_governance import CorporateGovernanceManager
-        MANAGERS['governance'] = CorporateGovernanceManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"CorporateGovernanceManager init: {e}")
-    try:
-        from modules.environmental.carbon_manager import CarbonManager
-        MANAGERS['carbon'] = CarbonManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"CarbonManager init: {e}")
-    try:
-        from modules.environmental.energy_manager import EnergyManager
-        MANAGERS['energy'] = EnergyManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"EnergyManager init: {e}")
-    try:
-        from modules.esg.esg_manager import ESGManager
-        MANAGERS['esg'] = ESGManager(BACKEND_DIR)
-    except Exception as e:
-        logging.error(f"ESGManager init: {e}")
-    try:
-        from modules.cbam.cbam_manager import CBAMManager
-        MANAGERS['cbam'] = CBAMManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"CBAMManager init: {e}")
-    try:
-        from modules.csrd.csrd_compliance_manager import CSRDComplianceManager
-        MANAGERS['csrd'] = CSRDComplianceManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"CSRDComplianceManager init: {e}")
-    try:
-        from modules.eu_taxonomy.taxonomy_manager import EUTaxonomyManager
-        MANAGERS['taxonomy'] = EUTaxonomyManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"EUTaxonomyManager init: {e}")
-    try:
-        from modules.environmental.waste_manager import WasteManager
-        MANAGERS['waste'] = WasteManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"WasteManager init: {e}")
-    try:
-        from modules.environmental.water_manager import WaterManager
-        MANAGERS['water'] = WaterManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"WaterManager init: {e}")
-    try:
-        from modules.environmental.biodiversity_manager import BiodiversityManager
-        MANAGERS['biodiversity'] = BiodiversityManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"BiodiversityManager init: {e}")
-    try:
-        from modules.economic.economic_manager import EconomicManager
-        MANAGERS['economic'] = EconomicManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"EconomicManager init: {e}")
-    try:
-        from modules.issb.issb_manager import ISSBManager
-        MANAGERS['issb'] = ISSBManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"ISSBManager init: {e}")
-    try:
-        from modules.iirc.iirc_manager import IIRCManager
-        MANAGERS['iirc'] = IIRCManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"IIRCManager init: {e}")
-    try:
-        from modules.esrs.esrs_manager import ESRSManager
-        MANAGERS['esrs'] = ESRSManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"ESRSManager init: {e}")
-    try:
-        from modules.tcfd.tcfd_manager import TCFDManager
-        MANAGERS['tcfd'] = TCFDManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"TCFDManager init: {e}")
-    try:
-        from modules.tnfd.tnfd_manager import TNFDManager
-        MANAGERS['tnfd'] = TNFDManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"TNFDManager init: {e}")
-    try:
-        from modules.cdp.cdp_manager import CDPManager
-        MANAGERS['cdp'] = CDPManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"CDPManager init: {e}")
-    try:
-        from modules.supply_chain.supply_chain_manager import SupplyChainManager
-        MANAGERS['supply_chain'] = SupplyChainManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"SupplyChainManager init: {e}")
-    try:
-        from modules.cdp.cdp_manager import CDPManager
-        MANAGERS['cdp'] = CDPManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"CDPManager init: {e}")
-    try:
-        from modules.issb.issb_manager import ISSBManager
-        MANAGERS['issb'] = ISSBManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"ISSBManager init: {e}")
-    try:
-        from modules.iirc.iirc_manager import IIRCManager
-        MANAGERS['iirc'] = IIRCManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"IIRCManager init: {e}")
-    try:
-        from modules.esrs.esrs_manager import ESRSManager
-        MANAGERS['esrs'] = ESRSManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"ESRSManager init: {e}")
-    try:
-        from modules.tcfd.tcfd_manager import TCFDManager
-        MANAGERS['tcfd'] = TCFDManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"TCFDManager init: {e}")
-    try:
-        from modules.tnfd.tnfd_manager import TNFDManager
-        MANAGERS['tnfd'] = TNFDManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"TNFDManager init: {e}")
-    try:
-        from yonetim.product_technology.product_tech_manager import ProductTechManager
-        MANAGERS['product_technology'] = ProductTechManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"ProductTechManager init: {e}")
-
-    try:
-        from modules.analytics.sector_benchmark_database import SectorBenchmarkDatabase
-        MANAGERS['benchmark'] = SectorBenchmarkDatabase(DB_PATH)
-    except Exception as e:
-        logging.error(f"BenchmarkManager init: {e}")
-
-    try:
-        from modules.regulation.regulation_manager import RegulationManager
-        MANAGERS['regulation'] = RegulationManager(DB_PATH)
-        MANAGERS['regulation'].populate_initial_data()
-    except Exception as e:
-        logging.error(f"RegulationManager init: {e}")
-
-    try:
-        from modules.stakeholder.stakeholder_engagement import StakeholderEngagement
-        MANAGERS['stakeholder'] = StakeholderEngagement(DB_PATH)
-    except Exception as e:
-        logging.error(f"StakeholderEngagement init: {e}")
-
-    try:
-        from modules.notification.notification_manager import NotificationManager
-        MANAGERS['notification'] = NotificationManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"NotificationManager init: {e}")
-
-    try:
-        from modules.environmental.biodiversity_manager import BiodiversityManager
-        MANAGERS['biodiversity'] = BiodiversityManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"BiodiversityManager init: {e}")
-
-    try:
-        from modules.training.training_manager import TrainingManager
-        MANAGERS['training'] = TrainingManager(DB_PATH)
-    except Exception as e:
-        logging.error(f"TrainingManager init: {e}")
-
-_init_managers()
 
 def get_db() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
+    """İsteğe bağlı (flask.g) havuz bağlantısı; close() istek sonuna kadar no-op."""
+    conn = get_request_connection(DB_PATH)
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -936,26 +809,13 @@ def ensure_report_registry_table():
 
 ensure_report_registry_table()
 
+settings_service = SettingsService(DB_PATH)
+
+
 def _get_system_setting_int(key: str, default: int) -> int:
+    # Şirketin ayarları SettingsService snapshot'ından okunur; istek başına
+    # sorgu yok, admin kayıtları sürüm satırıyla tüm worker'lara yansır.
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cur = conn.cursor()
-        # Schema check/update is done via scripts now to avoid overhead here
-        # But for safety in dev:
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS system_settings (
-                key TEXT,
-                value TEXT,
-                category TEXT,
-                description TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                company_id INTEGER,
-                PRIMARY KEY (key, company_id)
-            )
-            """
-        )
-        
         # Determine company_id from context
         company_id = None
         # Check g first (request context)
@@ -964,22 +824,11 @@ def _get_system_setting_int(key: str, default: int) -> int:
         # Check session second (if outside request context but in session context)
         elif has_request_context() and session and 'company_id' in session:
             company_id = session['company_id']
-            
+
         if company_id is None:
             return default
 
-        # Try to get company-specific setting
-        cur.execute("SELECT value FROM system_settings WHERE key=? AND company_id=?", (key, company_id))
-        row = cur.fetchone()
-        
-        conn.close()
-        if row and row[0] is not None:
-            try:
-                val = int(str(row[0]).strip())
-                if val > 0:
-                    return val
-            except ValueError:
-                pass
+        return settings_service.get_int(company_id, key, default)
     except Exception as e:
         logging.error(f"System setting read error for {key}: {e}")
     return default
@@ -1038,6 +887,25 @@ if USER_MANAGER_AVAILABLE:
         logging.error(f"UserManager init error: {e}")
         user_manager = None
 
+if user_manager:
+    # require_permission ve şablon yardımcıları aynı yetki cache'ini kullanır
+    set_permission_resolver(user_manager.get_permission_set)
+
+
+def _current_permissions() -> frozenset:
+    # İstek başına tek yetki kümesi okuması
+    if '_permission_set' not in g:
+        g._permission_set = get_session_permissions(session) if 'user' in session else frozenset()
+    return g._permission_set
+
+
+@app.context_processor
+def inject_permission_helpers():
+    return {
+        'has_permission': lambda name: name in _current_permissions(),
+        'has_permissions': lambda names: {name: name in _current_permissions() for name in names},
+    }
+
 def admin_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -1710,8 +1578,7 @@ def dashboard():
     social_stats = {}
     social_chart_data = [0, 0, 0, 0, 0]
     try:
-        from backend.modules.social.social_manager import SocialManager
-        sm = SocialManager(DB_PATH)
+        sm = MANAGERS['social']
         social_stats = sm.get_social_dashboard_stats(g.company_id)
         
         # Normalize data for Radar Chart (0-100 scale)
@@ -1738,8 +1605,7 @@ def dashboard():
         # Emission Trend Stats (Monthly)
         emission_trend_data = [0] * 12
         try:
-            from backend.modules.environmental.carbon_manager import CarbonManager
-            cm = CarbonManager(DB_PATH)
+            cm = MANAGERS['carbon']
             current_year = datetime.now().year
             emission_trend_data = cm.get_monthly_emission_stats(g.company_id, current_year)
             
@@ -1875,7 +1741,7 @@ def super_admin_audit_logs():
     total_pages = 1
     
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = db_connect(DB_PATH)
         cursor = conn.cursor()
         
         # Ensure tables exist
@@ -2077,6 +1943,7 @@ def super_admin_backup():
     if 'user' not in session:
         return redirect(url_for('login'))
     backup_dir = os.path.join(BACKEND_DIR, 'data', 'backups')
+    from modules.database.backup_recovery_manager import BackupRecoveryManager
     manager = BackupRecoveryManager(DB_PATH, backup_dir=backup_dir)
     if request.method == 'POST':
         action = request.form.get('action')
@@ -2178,6 +2045,7 @@ def super_admin_backup_download(backup_id: int):
     if 'user' not in session:
         return redirect(url_for('login'))
     backup_dir = os.path.join(BACKEND_DIR, 'data', 'backups')
+    from modules.database.backup_recovery_manager import BackupRecoveryManager
     manager = BackupRecoveryManager(DB_PATH, backup_dir=backup_dir)
     backups = []
     try:
@@ -2193,6 +2061,13 @@ def super_admin_backup_download(backup_id: int):
         flash('Yedek dosyası bulunamadı.', 'danger')
         return redirect(url_for('super_admin_backup'))
     try:
+        if backup_path.endswith('.json'):
+            # Artımlı yedek: zincir tek bir SQLite dosyasına çıkarılıp gönderilir
+            restored_db = manager.materialize_backup(backup_path)
+            response = send_file(restored_db, as_attachment=True,
+                                 download_name=os.path.basename(backup_path)[:-5] + '.sqlite')
+            response.call_on_close(lambda: os.path.exists(restored_db) and os.remove(restored_db))
+            return response
         filename = os.path.basename(backup_path)
         return send_file(backup_path, as_attachment=True, download_name=filename)
     except Exception as e:
@@ -2378,7 +2253,7 @@ def super_admin_twofa():
                 elif action == "save_force":
                     value = request.form.get("force_2fa") == "1"
                     try:
-                        conn = sqlite3.connect(DB_PATH)
+                        conn = db_connect(DB_PATH)
                         core_set_force_2fa(conn, bool(value))
                         force_2fa = core_is_force_2fa(conn)
                         conn.close()
@@ -2390,7 +2265,7 @@ def super_admin_twofa():
                 logging.error(f"2FA management error: {e}")
                 flash(f"2FA işlemi sırasında hata: {e}", "danger")
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = db_connect(DB_PATH)
         cur = conn.cursor()
         cur.execute("PRAGMA table_info(users)")
         cols = [c[1] for c in cur.fetchall()]
@@ -2510,39 +2385,12 @@ def super_admin_rate():
             values = {}
             for k in keys:
                 values[k] = request.form.get(k, '').strip()
+            for k, val in values.items():
+                if val and not str(val).isdigit():
+                    flash(f"Geçersiz sayı: {k} = {val}", 'danger')
+                    return redirect(url_for('super_admin_rate'))
             try:
-                import sqlite3
-                conn = sqlite3.connect(DB_PATH)
-                cur = conn.cursor()
-                cur.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS system_settings (
-                        key TEXT,
-                        value TEXT,
-                        category TEXT,
-                        description TEXT,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        company_id INTEGER,
-                        PRIMARY KEY (key, company_id)
-                    )
-                    """
-                )
-                for k, val in values.items():
-                    if k.endswith('_limit') or k.endswith('_window'):
-                        if val and not str(val).isdigit():
-                            conn.close()
-                            flash(f"Geçersiz sayı: {k} = {val}", 'danger')
-                            return redirect(url_for('super_admin_rate'))
-                    cur.execute(
-                        """
-                        INSERT INTO system_settings (key, value, category, description, company_id)
-                        VALUES (?, ?, 'rate_limit', 'Rate limit ayarı', ?)
-                        ON CONFLICT(key, company_id) DO UPDATE SET value=excluded.value, updated_at=CURRENT_TIMESTAMP
-                        """,
-                        (k, val, company_id),
-                    )
-                conn.commit()
-                conn.close()
+                settings_service.save(company_id, values, 'rate_limit', 'Rate limit ayarı')
                 flash('Rate limit kuralları güncellendi.', 'success')
             except Exception as e:
                 logging.error(f"Save rate rules error: {e}")
@@ -2555,31 +2403,8 @@ def super_admin_rate():
         logging.error(f"Get rate stats error: {e}")
     current_rules = {}
     try:
-        import sqlite3
-        conn = sqlite3.connect(DB_PATH)
-        cur = conn.cursor()
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS system_settings (
-                key TEXT,
-                value TEXT,
-                category TEXT,
-                description TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                company_id INTEGER,
-                PRIMARY KEY (key, company_id)
-            )
-            """
-        )
         keys = ['rl_login_limit', 'rl_login_window', 'rl_api_limit', 'rl_api_window', 'rl_report_limit', 'rl_report_window', 'rl_export_limit', 'rl_export_window']
-        for k in keys:
-            cur.execute("SELECT value FROM system_settings WHERE key=? AND company_id=?", (k, company_id))
-            row = cur.fetchone()
-            if row and row[0] is not None:
-                current_rules[k] = str(row[0])
-            else:
-                current_rules[k] = ''
-        conn.close()
+        current_rules = settings_service.get_many(company_id, keys)
     except Exception as e:
         logging.error(f"Load rate rules error: {e}")
     return render_template(
@@ -2603,13 +2428,28 @@ def super_admin_monitoring():
     events = dashboard.get_recent_events(50)
     login_activity = dashboard.get_chart_data('login_activity', 24)
     failed_logins = dashboard.get_chart_data('failed_logins', 24)
+    perf_counters = dashboard.get_performance_counters()
+    perf_counters['Manager Registry'] = MANAGERS.get_stats()
+    perf_counters['Manager Load Cost (ms)'] = {
+        row['key']: round(row['import_ms'] + row['init_ms'], 2)
+        for row in MANAGERS.get_startup_report()
+    }
+    for name, stats in get_writer_stats().items():
+        perf_counters[f'DB Log Writer ({name})'] = stats
+    perf_counters['License Cache'] = get_license_cache_stats()
+    perf_counters['Settings Cache'] = settings_service.get_stats()
+    perf_counters['Rate Limit Store'] = get_rate_limit_store().get_stats()
+    notification_manager = MANAGERS.get('notification')
+    if notification_manager:
+        perf_counters['Notification Cache'] = notification_manager.get_cache_stats()
     return render_template(
         'super_admin_monitoring.html',
         title='Monitoring Dashboard',
         live_stats=live_stats,
         events=events,
         login_activity=login_activity,
-        failed_logins=failed_logins
+        failed_logins=failed_logins,
+        perf_counters=perf_counters
     )
 
 
@@ -2634,68 +2474,19 @@ def super_admin_performance():
             values: Dict[str, str] = {}
             for k in performance_keys:
                 values[k] = request.form.get(k, '').strip()
+            for k in ('perf_list_page_size', 'perf_dashboard_limit'):
+                if values[k] and not str(values[k]).isdigit():
+                    flash(f"Geçersiz sayı: {k} = {values[k]}", "danger")
+                    return redirect(url_for('super_admin_performance'))
             try:
-                conn = sqlite3.connect(DB_PATH)
-                cur = conn.cursor()
-                cur.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS system_settings (
-                        key TEXT,
-                        value TEXT,
-                        category TEXT,
-                        description TEXT,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        company_id INTEGER,
-                        PRIMARY KEY (key, company_id)
-                    )
-                    """
-                )
-                for k, val in values.items():
-                    if k in ('perf_list_page_size', 'perf_dashboard_limit'):
-                        if val and not str(val).isdigit():
-                            conn.close()
-                            flash(f"Geçersiz sayı: {k} = {val}", "danger")
-                            return redirect(url_for('super_admin_performance'))
-                    cur.execute(
-                        """
-                        INSERT INTO system_settings (key, value, category, description, company_id)
-                        VALUES (?, ?, 'performance', 'Performans ayarı', ?)
-                        ON CONFLICT(key, company_id) DO UPDATE SET value=excluded.value, updated_at=CURRENT_TIMESTAMP
-                        """,
-                        (k, val, company_id),
-                    )
-                conn.commit()
-                conn.close()
+                settings_service.save(company_id, values, 'performance', 'Performans ayarı')
                 flash("Performans ayarları güncellendi.", "success")
             except Exception as e:
                 logging.error(f"Save performance settings error: {e}")
                 flash("Performans ayarları kaydedilemedi.", "danger")
         return redirect(url_for('super_admin_performance'))
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cur = conn.cursor()
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS system_settings (
-                key TEXT,
-                value TEXT,
-                category TEXT,
-                description TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                company_id INTEGER,
-                PRIMARY KEY (key, company_id)
-            )
-            """
-        )
-        for k in performance_keys:
-            cur.execute("SELECT value FROM system_settings WHERE key=? AND company_id=?", (k, company_id))
-            row = cur.fetchone()
-            if row and row[0] is not None:
-                current_settings[k] = str(row[0])
-            else:
-                # No fallback to company_id=1. Strict isolation.
-                current_settings[k] = ''
-        conn.close()
+        current_settings = settings_service.get_many(company_id, performance_keys)
     except Exception as e:
         logging.error(f"Load performance settings error: {e}")
     metrics: Dict[str, object] = {
@@ -2709,7 +2500,7 @@ def super_admin_performance():
         if os.path.exists(DB_PATH):
             db_size = os.path.getsize(DB_PATH)
             metrics['db_size_mb'] = round(db_size / (1024 * 1024), 2)
-        conn = sqlite3.connect(DB_PATH)
+        conn = db_connect(DB_PATH)
         cur = conn.cursor()
         cur.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table'")
         metrics['table_count'] = cur.fetchone()[0]
@@ -2784,6 +2575,8 @@ def super_admin_licenses():
             license_id = int(request.form.get('license_id') or 0)
             reason = request.form.get('reason', '').strip()
             if license_id and manager.deactivate_license(license_id, reason):
+                # Diğer worker'lar licenses tetikleyicisinin artırdığı nesil sayacıyla düşürür
+                invalidate_license_cache(DB_PATH)
                 flash('Lisans devre dışı bırakıldı.', 'success')
             else:
                 flash('Lisans devre dışı bırakılamadı.', 'danger')
@@ -2791,6 +2584,7 @@ def super_admin_licenses():
             license_id = int(request.form.get('license_id') or 0)
             additional_days = int(request.form.get('additional_days') or 0)
             if license_id and additional_days > 0 and manager.renew_license(license_id, additional_days):
+                invalidate_license_cache(DB_PATH)
                 flash('Lisans süresi uzatıldı.', 'success')
             else:
                 flash('Lisans süresi uzatılamadı.', 'danger')
@@ -2824,7 +2618,7 @@ def super_admin_system_logs():
         return redirect(url_for('login'))
     logs: list[Dict[str, str]] = []
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = db_connect(DB_PATH)
         cur = conn.cursor()
         def table_exists(cursor: sqlite3.Cursor, name: str) -> bool:
             try:
@@ -2982,61 +2776,14 @@ def super_admin_settings():
                 else:
                     values[k] = (request.form.get(k) or '').strip()
             try:
-                conn = sqlite3.connect(DB_PATH)
-                cur = conn.cursor()
-                cur.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS system_settings (
-                        key TEXT,
-                        value TEXT,
-                        category TEXT,
-                        description TEXT,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        company_id INTEGER,
-                        PRIMARY KEY (key, company_id)
-                    )
-                    """
-                )
-                for k, val in values.items():
-                    cur.execute(
-                        """
-                        INSERT INTO system_settings (key, value, category, description, company_id)
-                        VALUES (?, ?, 'system', 'Sistem genel ayarı', ?)
-                        ON CONFLICT(key, company_id) DO UPDATE SET value=excluded.value, updated_at=CURRENT_TIMESTAMP
-                        """,
-                        (k, val, company_id),
-                    )
-                conn.commit()
-                conn.close()
+                settings_service.save(company_id, values, 'system', 'Sistem genel ayarı')
                 flash('Sistem ayarları güncellendi.', 'success')
             except Exception as e:
                 logging.error(f"Save system settings error: {e}")
                 flash('Sistem ayarları kaydedilemedi.', 'danger')
             return redirect(url_for('super_admin_settings'))
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cur = conn.cursor()
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS system_settings (
-                key TEXT,
-                value TEXT,
-                category TEXT,
-                description TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                company_id INTEGER,
-                PRIMARY KEY (key, company_id)
-            )
-            """
-        )
-        for k in setting_keys:
-            cur.execute("SELECT value FROM system_settings WHERE key=? AND company_id=?", (k, company_id))
-            row = cur.fetchone()
-            if row and row[0] is not None:
-                current_settings[k] = str(row[0])
-            else:
-                current_settings[k] = ''
-        conn.close()
+        current_settings = settings_service.get_many(company_id, setting_keys)
     except Exception as e:
         logging.error(f"Load system settings error: {e}")
     return render_template(
@@ -3075,61 +2822,14 @@ def super_admin_security():
                 else:
                     values[k] = (request.form.get(k) or '').strip()
             try:
-                conn = sqlite3.connect(DB_PATH)
-                cur = conn.cursor()
-                cur.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS system_settings (
-                        key TEXT,
-                        value TEXT,
-                        category TEXT,
-                        description TEXT,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        company_id INTEGER,
-                        PRIMARY KEY (key, company_id)
-                    )
-                    """
-                )
-                for k, val in values.items():
-                    cur.execute(
-                        """
-                        INSERT INTO system_settings (key, value, category, description, company_id)
-                        VALUES (?, ?, 'security', 'Güvenlik ayarı', ?)
-                        ON CONFLICT(key, company_id) DO UPDATE SET value=excluded.value, updated_at=CURRENT_TIMESTAMP
-                        """,
-                        (k, val, company_id),
-                    )
-                conn.commit()
-                conn.close()
+                settings_service.save(company_id, values, 'security', 'Güvenlik ayarı')
                 flash('Güvenlik ayarları güncellendi.', 'success')
             except Exception as e:
                 logging.error(f"Save security settings error: {e}")
                 flash('Güvenlik ayarları kaydedilemedi.', 'danger')
             return redirect(url_for('super_admin_security'))
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cur = conn.cursor()
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS system_settings (
-                key TEXT,
-                value TEXT,
-                category TEXT,
-                description TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                company_id INTEGER,
-                PRIMARY KEY (key, company_id)
-            )
-            """
-        )
-        for k in setting_keys:
-            cur.execute("SELECT value FROM system_settings WHERE key=? AND company_id=?", (k, company_id))
-            row = cur.fetchone()
-            if row and row[0] is not None:
-                current_settings[k] = str(row[0])
-            else:
-                current_settings[k] = ''
-        conn.close()
+        current_settings = settings_service.get_many(company_id, setting_keys)
     except Exception as e:
         logging.error(f"Load security settings error: {e}")
     return render_template(
@@ -3154,7 +2854,7 @@ def super_admin_maintenance():
         if os.path.exists(DB_PATH):
             db_size = os.path.getsize(DB_PATH)
             metrics['db_size_mb'] = round(db_size / (1024 * 1024), 2)
-        conn = sqlite3.connect(DB_PATH)
+        conn = db_connect(DB_PATH)
         cur = conn.cursor()
         cur.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table'")
         metrics['table_count'] = cur.fetchone()[0]
@@ -3282,11 +2982,9 @@ def stakeholder_survey_public(token: str):
         """
         SELECT id, company_id, survey_title, survey_description
         FROM online_surveys
-        WHERE survey_link LIKE ? AND is_active = 1
-        ORDER BY created_at DESC
-        LIMIT 1
+        WHERE survey_token = ? AND is_active = 1
         """,
-        (f"%/{token}",),
+        (token,),
     )
     survey = cur.fetchone()
 
@@ -3302,7 +3000,7 @@ def stakeholder_survey_public(token: str):
     if not survey:
         return render_template("stakeholder_survey.html", company=None, sdg_questions=[], demographic_questions=[], submitted=False), 404
 
-    engagement = StakeholderEngagement(DB_PATH)
+    engagement = MANAGERS['stakeholder']
     sdg_questions = engagement.get_general_sdg_survey_questions()
     demographic_questions = engagement.get_demographic_questions()
 
@@ -4268,14 +3966,10 @@ def public_survey(token):
         logging.info(f"Public survey requested with token: {token}")
         conn = get_db()
         
-        # Anket var mı kontrol et
-        # Check for both exact path and full URL match (ending with token)
-        query = "SELECT * FROM online_surveys WHERE (survey_link = ? OR survey_link LIKE ?) AND is_active = 1"
-        param1 = f"/survey/{token}"
-        param2 = f"%/{token}"
-        logging.info(f"Executing query: {query} with params: {param1}, {param2}")
-        
-        row = conn.execute(query, (param1, param2)).fetchone()
+        # Anket var mı kontrol et (tekil survey_token indeksi)
+        row = conn.execute(
+            "SELECT * FROM online_surveys WHERE survey_token = ? AND is_active = 1", (token,)
+        ).fetchone()
         
         if not row:
             logging.warning(f"Survey not found for token: {token}")
@@ -4399,8 +4093,7 @@ def public_survey(token):
 @app.route('/stakeholder-portal/<token>')
 def stakeholder_portal(token):
     try:
-        from backend.modules.stakeholder.stakeholder_engagement import StakeholderEngagement
-        engagement = StakeholderEngagement(DB_PATH)
+        engagement = MANAGERS['stakeholder']
         
         stakeholder = engagement.verify_portal_access(token)
         if not stakeholder:
@@ -5070,7 +4763,7 @@ def company_stakeholder_survey(company_id: int):
         is_active=bool(row['is_active']),
     )
 
-    engagement = StakeholderEngagement(DB_PATH)
+    engagement = MANAGERS['stakeholder']
 
     cur = conn.execute(
         """
@@ -5091,7 +4784,7 @@ def company_stakeholder_survey(company_id: int):
     else:
         title = "Genel Paydaş Sürdürülebilirlik Anketi (SDG 1-17)"
         description = "Şirketin sürdürülebilirlik performansını 17 Sürdürülebilir Kalkınma Amacı çerçevesinde değerlendiren genel paydaş anketi."
-        target_groups = list(StakeholderEngagement.STAKEHOLDER_GROUPS.values())
+        target_groups = list(MANAGERS.get_class('stakeholder').STAKEHOLDER_GROUPS.values())
         questions = engagement.get_general_sdg_survey_questions()
         survey_url = engagement.create_online_survey(company_id, title, description, target_groups, questions, duration_days=365)
 
@@ -5194,7 +4887,7 @@ def company_delete(company_id):
         return redirect(url_for('login'))
 
     try:
-        manager = CompanyManager(DB_PATH)
+        manager = MANAGERS['company']
         if not manager.hard_delete_company(company_id):
             flash('Şirket silinemedi.', 'danger')
         else:
@@ -5343,28 +5036,29 @@ def report_add():
                     generated = {}
 
                     if module_code == 'carbon':
-                        cm = CarbonManager(DB_PATH)
-                        cr = CarbonReporting(cm)
+                        from modules.environmental.carbon_reporting import CarbonReporting
+                        cr = CarbonReporting(MANAGERS['carbon'])
                         generated = cr.generate_carbon_report(company_id, period, formats=formats)
                     elif module_code == 'energy':
-                        em = EnergyManager(DB_PATH)
-                        er = EnergyReporting(em)
+                        from modules.environmental.energy_reporting import EnergyReporting
+                        er = EnergyReporting(MANAGERS['energy'])
                         generated = er.generate_energy_report(company_id, period, formats=formats)
                     elif module_code == 'water':
-                        wm = WaterManager(DB_PATH)
-                        wr = WaterReporting(wm)
+                        from modules.environmental.water_reporting import WaterReporting
+                        wr = WaterReporting(MANAGERS['water'])
                         generated = wr.generate_water_report(company_id, period, formats=formats)
                     elif module_code == 'waste':
-                        wm = WasteManager(DB_PATH)
-                        wr = WasteReporting(wm)
+                        from modules.environmental.waste_reporting import WasteReporting
+                        wr = WasteReporting(MANAGERS['waste'])
                         generated = wr.generate_waste_report(company_id, period, formats=formats)
                     elif module_code == 'social':
                         # SocialReporting direkt db_path alabilir veya default path kullanır
+                        from modules.social.social_reporting import SocialReporting
                         sr = SocialReporting(DB_PATH)
                         generated = sr.generate_social_report(company_id, period, formats=formats)
                     elif module_code == 'governance':
-                        gm = CorporateGovernanceManager(DB_PATH)
-                        gr = GovernanceReporting(gm)
+                        from modules.governance.governance_reporting import GovernanceReporting
+                        gr = GovernanceReporting(MANAGERS['governance'])
                         generated = gr.generate_governance_report(company_id, period, formats=formats)
                     elif module_code == 'cbam':
                         from backend.modules.cbam.cbam_manager import CBAMManager
@@ -5461,7 +5155,7 @@ def generate_sustainability_md_report():
         report_name = request.form.get('report_name') or f"Sürdürülebilirlik Raporu {reporting_period}"
         report_format = (request.form.get('format') or 'docx').lower()
 
-        generator = ReportGenerator(DB_PATH)
+        generator = MANAGERS['report_generator']
 
         output_dir = os.path.join(BACKEND_DIR, 'uploads', 'reports', f"company_{company_id}")
         os.makedirs(output_dir, exist_ok=True)
@@ -5492,7 +5186,7 @@ def generate_sustainability_md_report():
             return redirect(url_for('reports'))
 
         try:
-            manager = AdvancedReportManager(DB_PATH)
+            manager = MANAGERS['advanced_report']
             manager.register_existing_file(
                 company_id=company_id,
                 module_code="esg",
@@ -5680,8 +5374,7 @@ def unified_report():
                         
                         totals = {r['topic_code']: (r['avg_imp'] or 0) for r in rows}
                         
-                        from backend.modules.stakeholder.stakeholder_engagement import StakeholderEngagement
-                        questions_map = {q["id"]: q for q in StakeholderEngagement.SDG17_QUESTION_SET}
+                        questions_map = {q["id"]: q for q in MANAGERS.get_class('stakeholder').SDG17_QUESTION_SET}
                         
                         for code, avg_score in totals.items():
                             q_def = questions_map.get(code)
@@ -6005,7 +5698,7 @@ def unified_report():
                 if has_answer:
                     total_responses += 1
             if totals:
-                questions_map = {q["id"]: q for q in StakeholderEngagement.SDG17_QUESTION_SET}
+                questions_map = {q["id"]: q for q in MANAGERS.get_class('stakeholder').SDG17_QUESTION_SET}
                 questions_summary = []
                 for qid, agg in totals.items():
                     meta = questions_map.get(qid, {})
@@ -9369,7 +9062,7 @@ def data_edit_module():
 def data_import_module():
     if 'user' not in session: return redirect(url_for('login'))
     
-    importer = DataImporter(DB_PATH)
+    importer = MANAGERS['data_importer']
     stats = {}
     records = []
     
@@ -10062,6 +9755,7 @@ def add_survey():
                 survey_description TEXT,
                 target_groups TEXT NOT NULL,
                 survey_link TEXT UNIQUE NOT NULL,
+                survey_token TEXT,
                 start_date DATE,
                 end_date DATE,
                 total_questions INTEGER DEFAULT 0,
@@ -10075,9 +9769,9 @@ def add_survey():
         cursor = conn.execute("""
             INSERT INTO online_surveys (
                 company_id, survey_title, survey_description, target_groups, 
-                survey_link, is_active, created_at
-            ) VALUES (?, ?, ?, ?, ?, 1, datetime('now'))
-        """, (company_id, title, desc, target, link))
+                survey_link, survey_token, is_active, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, 1, datetime('now'))
+        """, (company_id, title, desc, target, link, token))
         
         survey_id = cursor.lastrowid
         
@@ -11088,60 +10782,33 @@ except ImportError:
         logging.error("Could not import UniversalManagerWrapper")
         UniversalManagerWrapper = None
 
-import importlib.util
-import inspect
+def _auto_factory(cls):
+    """Otomatik bulunan manager'lar DB_PATH almıyorsa argümansız oluşturulur"""
+    try:
+        return cls(DB_PATH)
+    except TypeError:
+        return cls()
 
 def _auto_load_managers():
     """
-    Dynamically finds and loads Manager classes from backend/modules
-    and adds them to the global MANAGERS dictionary.
+    Finds Manager classes under backend/modules and registers them lazily
+    in MANAGERS (modules are imported on first use, not at startup).
     """
-    global MANAGERS
     modules_dir = os.path.join(BACKEND_DIR, 'modules')
-    
-    # Map of specific module names to Manager classes (overrides)
-    # or heuristics
-    
-    for root, dirs, files in os.walk(modules_dir):
-        for file in files:
-            if (file.endswith('_manager.py') or file.endswith('Manager.py') or 'manager' in file.lower()) and file.endswith('.py'):
-                if file.startswith('__'): continue
-                
-                full_path = os.path.join(root, file)
-                module_name_guess = os.path.splitext(file)[0]
-                
-                # Try to import
-                try:
-                    spec = importlib.util.spec_from_file_location(module_name_guess, full_path)
-                    mod = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(mod)
-                    
-                    # Find Manager class
-                    for name, obj in inspect.getmembers(mod):
-                        if inspect.isclass(obj) and 'Manager' in name and name != 'Manager':
-                            # Found a manager class
-                            # Determine key for MANAGERS dict
-                            # e.g. WasteManager -> waste
-                            key = name.lower().replace('manager', '').replace('enhanced', '')
-                            if key not in MANAGERS or MANAGERS[key] is None:
-                                try:
-                                    instance = obj(DB_PATH)
-                                    MANAGERS[key] = instance
-                                    logging.info(f"Auto-loaded {name} as {key}")
-                                except Exception as e:
-                                    # Maybe it doesn't take DB_PATH or other init args
-                                    try:
-                                        instance = obj()
-                                        MANAGERS[key] = instance
-                                        logging.info(f"Auto-loaded {name} as {key} (no args)")
-                                    except Exception as e2:
-                                        pass
-                except Exception as e:
-                    logging.warning(f"Failed to auto-load {file}: {e}")
+    found = MANAGERS.discover(modules_dir, factory=_auto_factory)
+    logging.info(f"Manager registry: {found} auto-discovered, {len(MANAGERS)} registered")
 
 # Run auto-loader
 _auto_load_managers()
 
+# SUSTAINAGE_WARM_MANAGERS="sdg,gri,carbon" (veya "*") ile seçilen manager'lar
+# worker açılışında önceden yüklenir.
+_warm_all, _warm_keys = parse_warm_up_list(os.environ.get('SUSTAINAGE_WARM_MANAGERS'))
+if _warm_all or _warm_keys:
+    MANAGERS.warm_up(None if _warm_all else _warm_keys)
+    for _row in MANAGERS.get_startup_report()[:10]:
+        logging.info(f"Manager warm-up {_row['key']}: import {_row['import_ms']} ms, init {_row['init_ms']} ms")
+
 # List of templates that were "under construction" and now need routes
 UNDER_CONSTRUCTION_MODULES = [
     'advanced_calculation', 'advanced_inventory', 'advanced_reporting', 'ai', 'ai_reports', 
@@ -11172,9 +10839,9 @@ def register_dynamic_routes():
             
             # 2. Fuzzy match
             if not manager:
-                for k, v in MANAGERS.items():
+                for k in MANAGERS:
                     if k in route_key or route_key in k:
-                        manager = v
+                        manager = MANAGERS.get(k)
                         break
             
             data = {}
@@ -11260,7 +10927,7 @@ except Exception as e:
 @require_company_context
 def lca_module():
     if 'user' not in session: return redirect(url_for('login'))
-    manager = LCAManager(DB_PATH)
+    manager = MANAGERS['lca']
     products = manager.get_products(g.company_id)
     return render_template('lca.html', products=products)
 
@@ -11272,7 +10939,7 @@ def lca_add_product():
     description = request.form.get('description')
     unit = request.form.get('unit')
     
-    manager = LCAManager(DB_PATH)
+    manager = MANAGERS['lca']
     manager.add_product(g.company_id, name, description, unit)
     flash('Ürün başarıyla eklendi.', 'success')
     return redirect(url_for('lca_module'))
@@ -11281,7 +10948,7 @@ def lca_add_product():
 @require_company_context
 def lca_product_detail(product_id):
     if 'user' not in session: return redirect(url_for('login'))
-    manager = LCAManager(DB_PATH)
+    manager = MANAGERS['lca']
     assessments = manager.get_assessments(product_id, g.company_id)
     conn = manager.get_connection()
     cursor = conn.cursor()
@@ -11302,7 +10969,7 @@ def lca_add_assessment(product_id):
     name = request.form.get('name')
     date = request.form.get('date')
     
-    manager = LCAManager(DB_PATH)
+    manager = MANAGERS['lca']
     manager.add_assessment(product_id, g.company_id, name, date)
     flash('Analiz oluşturuldu.', 'success')
     return redirect(url_for('lca_product_detail', product_id=product_id))
@@ -11311,7 +10978,7 @@ def lca_add_assessment(product_id):
 @require_company_context
 def lca_assessment_detail(assessment_id):
     if 'user' not in session: return redirect(url_for('login'))
-    manager = LCAManager(DB_PATH)
+    manager = MANAGERS['lca']
     assessment = manager.get_assessment_details(assessment_id, g.company_id)
     if not assessment:
         flash('Analiz bulunamadı.', 'error')
@@ -11326,7 +10993,7 @@ def lca_assessment_detail(assessment_id):
 @require_company_context
 def lca_add_entry(assessment_id):
     if 'user' not in session: return redirect(url_for('login'))
-    manager = LCAManager(DB_PATH)
+    manager = MANAGERS['lca']
     
     data = {
         'stage': request.form.get('stage'),
@@ -11347,7 +11014,7 @@ def lca_add_entry(assessment_id):
 @require_company_context
 def lca_delete_entry(assessment_id, entry_id):
     if 'user' not in session: return redirect(url_for('login'))
-    manager = LCAManager(DB_PATH)
+    manager = MANAGERS['lca']
     manager.delete_entry(entry_id, g.company_id)
     flash('Veri silindi.', 'success')
     return redirect(url_for('lca_assessment_detail', assessment_id=assessment_id))
@@ -11358,7 +11025,7 @@ def lca_delete_entry(assessment_id, entry_id):
 @require_company_context
 def supply_chain_module():
     if 'user' not in session: return redirect(url_for('login'))
-    manager = SupplyChainManager(DB_PATH)
+    manager = MANAGERS['supply_chain']
     
     # Pagination & Filtering
     page = request.args.get('page', 1, type=int)
@@ -11446,7 +11113,7 @@ def supply_chain_import_risks():
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         file.save(filepath)
         
-        manager = SupplyChainManager(DB_PATH)
+        manager = MANAGERS['supply_chain']
         result = manager.import_risks_from_excel(g.company_id, filepath)
         
         # Cleanup
@@ -11470,7 +11137,7 @@ def supply_chain_import_risks():
 @require_company_context
 def supply_chain_add_supplier():
     if 'user' not in session: return redirect(url_for('login'))
-    manager = SupplyChainManager(DB_PATH)
+    manager = MANAGERS['supply_chain']
     
     manager.add_supplier(
         g.company_id,
@@ -11486,7 +11153,7 @@ def supply_chain_add_supplier():
 @require_company_context
 def supply_chain_profile(supplier_id):
     if 'user' not in session: return redirect(url_for('login'))
-    manager = SupplyChainManager(DB_PATH)
+    manager = MANAGERS['supply_chain']
     
     # Use the new scorecard function which aggregates everything
     scorecard = manager.get_supplier_scorecard(supplier_id, g.company_id)
@@ -11514,7 +11181,7 @@ def supply_chain_profile(supplier_id):
 @require_company_context
 def supply_chain_add_assessment(supplier_id):
     if 'user' not in session: return redirect(url_for('login'))
-    manager = SupplyChainManager(DB_PATH)
+    manager = MANAGERS['supply_chain']
     
     details = {
         'env_score': int(request.form.get('env_score') or 0),
@@ -11544,7 +11211,7 @@ def supply_chain_add_assessment(supplier_id):
 @require_company_context
 def supply_chain_add_audit(supplier_id):
     if 'user' not in session: return redirect(url_for('login'))
-    manager = SupplyChainManager(DB_PATH)
+    manager = MANAGERS['supply_chain']
     
     manager.add_audit(
         supplier_id,
@@ -11563,7 +11230,7 @@ def supply_chain_add_audit(supplier_id):
 @require_company_context
 def supply_chain_add_risk(supplier_id):
     if 'user' not in session: return redirect(url_for('login'))
-    manager = SupplyChainManager(DB_PATH)
+    manager = MANAGERS['supply_chain']
     
     manager.add_risk(
         supplier_id,
@@ -11583,7 +11250,7 @@ def supply_chain_add_risk(supplier_id):
 @require_company_context
 def realtime_module():
     if 'user' not in session: return redirect(url_for('login'))
-    manager = RealTimeMonitoringManager(DB_PATH)
+    manager = MANAGERS['realtime']
     devices = manager.get_devices(g.company_id)
     alerts = manager.get_alerts(g.company_id)
     return render_template('realtime.html', devices=devices, alerts=alerts)
@@ -11592,7 +11259,7 @@ def realtime_module():
 @require_company_context
 def realtime_add_device():
     if 'user' not in session: return redirect(url_for('login'))
-    manager = RealTimeMonitoringManager(DB_PATH)
+    manager = MANAGERS['realtime']
     
     threshold = request.form.get('threshold_value')
     if threshold:
@@ -11614,21 +11281,23 @@ def realtime_add_device():
 @require_company_context
 def realtime_device_detail(device_id):
     if 'user' not in session: return redirect(url_for('login'))
-    manager = RealTimeMonitoringManager(DB_PATH)
+    manager = MANAGERS['realtime']
     
     device = manager.get_device(device_id, g.company_id)
     if not device:
         flash('Cihaz bulunamadı.', 'error')
         return redirect(url_for('realtime_module'))
         
-    readings = manager.get_readings(device_id)
-    return render_template('realtime_device.html', device=device, readings=readings)
+    # Varsayılan: dakikalık özetler (ham satırlar yerine önceden toplanmış kovalar)
+    granularity = request.args.get('granularity', 'minute')
+    readings = manager.get_readings(device_id, granularity=granularity)
+    return render_template('realtime_device.html', device=device, readings=readings, granularity=granularity)
 
 @app.route('/realtime/device/<int:device_id>/add_reading', methods=['POST'])
 @require_company_context
 def realtime_add_reading(device_id):
     if 'user' not in session: return redirect(url_for('login'))
-    manager = RealTimeMonitoringManager(DB_PATH)
+    manager = MANAGERS['realtime']
     
     value = float(request.form.get('value'))
     manager.add_reading(device_id, value)
@@ -11640,12 +11309,20 @@ def realtime_add_reading(device_id):
 @app.route('/api/iot/ingest', methods=['POST'])
 def api_iot_ingest():
     data = request.json
-    if not data or 'device_id' not in data or 'value' not in data:
+    # Tek okuma: {"device_id", "value"}; toplu: {"readings": [...]} veya doğrudan liste
+    readings = data.get('readings') if isinstance(data, dict) and 'readings' in data else data
+    if isinstance(readings, dict):
+        readings = [readings]
+    if not readings or not isinstance(readings, list) or \
+            not all(isinstance(r, dict) and 'device_id' in r and 'value' in r for r in readings):
         return jsonify({'error': 'Invalid data'}), 400
     
-    manager = RealTimeMonitoringManager(DB_PATH)
+    manager = MANAGERS['realtime']
     # Note: In a real scenario, we would validate the device token/secret here
-    manager.add_reading(data['device_id'], float(data['value']))
+    try:
+        result = manager.add_readings(readings)
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Invalid data'}), 400
     
-    return jsonify({'status': 'success', 'message': 'Data ingested'}), 201
+    return jsonify({'status': 'success', 'message': 'Data ingested', **result}), 201
 